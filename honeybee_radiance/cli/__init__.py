@@ -3,36 +3,77 @@ import click
 import sys
 import logging
 import json
+import importlib
 
 from honeybee.cli import main
 from ..config import folders
-from .setconfig import set_config
-from .edit import edit
-from .translate import translate
-from .lib import lib
-from .sky import sky
-from .grid import grid
-from .view import view
-from .sunpath import sunpath
-from .octree import octree
-from .raytrace import raytrace
-from .rpict import rpict
-from .dc import dc
-from .viewfactor import view_factor
-from .postprocess import post_process
-from .mtx import mtxop
-from .multiphase import multi_phase
-from .glare import dcglare
-from .schedule import schedule
-from .study import study
-from .modifier import modifier
 
 
 _logger = logging.getLogger(__name__)
 
 
+class LazyGroup(click.Group):
+    """A click Group that imports the module of a sub-command only when it is used.
+
+    Importing all of the command modules drags in most of the library, which is
+    slow compared to running a small command. The sub-commands of this group
+    are instead given as import paths and each module is imported upon the first
+    time that its command is invoked or listed in the help.
+
+    Args:
+        lazy_subcommands: A dictionary with the names of the sub-commands as keys
+            and the import paths of the commands as values. Import paths are
+            formatted as "module:attribute" (eg. "honeybee_radiance.cli.sky:sky").
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.lazy_subcommands = kwargs.pop('lazy_subcommands', {})
+        super(LazyGroup, self).__init__(*args, **kwargs)
+
+    def list_commands(self, ctx):
+        commands = super(LazyGroup, self).list_commands(ctx)
+        return sorted(commands + list(self.lazy_subcommands.keys()))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands:
+            return self._load_command(cmd_name)
+        return super(LazyGroup, self).get_command(ctx, cmd_name)
+
+    def _load_command(self, cmd_name):
+        """Import the module of a sub-command and get the command from it."""
+        module_name, attr_name = self.lazy_subcommands[cmd_name].split(':')
+        module = importlib.import_module(module_name)
+        return getattr(module, attr_name)
+
+
+# sub-commands of radiance, which are only imported when they are used
+_SUBCOMMANDS = {
+    'set-config': 'honeybee_radiance.cli.setconfig:set_config',
+    'edit': 'honeybee_radiance.cli.edit:edit',
+    'translate': 'honeybee_radiance.cli.translate:translate',
+    'lib': 'honeybee_radiance.cli.lib:lib',
+    'sky': 'honeybee_radiance.cli.sky:sky',
+    'grid': 'honeybee_radiance.cli.grid:grid',
+    'view': 'honeybee_radiance.cli.view:view',
+    'sunpath': 'honeybee_radiance.cli.sunpath:sunpath',
+    'octree': 'honeybee_radiance.cli.octree:octree',
+    'raytrace': 'honeybee_radiance.cli.raytrace:raytrace',
+    'rpict': 'honeybee_radiance.cli.rpict:rpict',
+    'dc': 'honeybee_radiance.cli.dc:dc',
+    'view-factor': 'honeybee_radiance.cli.viewfactor:view_factor',
+    'post-process': 'honeybee_radiance.cli.postprocess:post_process',
+    'mtxop': 'honeybee_radiance.cli.mtx:mtxop',
+    'multi-phase': 'honeybee_radiance.cli.multiphase:multi_phase',
+    'dcglare': 'honeybee_radiance.cli.glare:dcglare',
+    'schedule': 'honeybee_radiance.cli.schedule:schedule',
+    'study': 'honeybee_radiance.cli.study:study',
+    'modifier': 'honeybee_radiance.cli.modifier:modifier'
+}
+
+
 # command group for all radiance extension commands.
-@click.group(help='honeybee radiance commands.')
+@click.group(cls=LazyGroup, lazy_subcommands=_SUBCOMMANDS,
+             help='honeybee radiance commands.')
 @click.version_option()
 def radiance():
     pass
@@ -62,27 +103,5 @@ def config(output_file):
         sys.exit(0)
 
 
-# add sub-commands to radiance
-radiance.add_command(set_config, name='set-config')
-radiance.add_command(edit)
-radiance.add_command(translate)
-radiance.add_command(lib)
-radiance.add_command(sky)
-radiance.add_command(grid)
-radiance.add_command(view)
-radiance.add_command(sunpath)
-radiance.add_command(octree)
-radiance.add_command(raytrace)
-radiance.add_command(rpict)
-radiance.add_command(dc)
-radiance.add_command(view_factor)
-radiance.add_command(post_process, name='post-process')
-radiance.add_command(mtxop)
-radiance.add_command(multi_phase)
-radiance.add_command(dcglare)
-radiance.add_command(schedule)
-radiance.add_command(study)
-radiance.add_command(modifier)
-
 # add radiance sub-commands to honeybee CLI
 main.add_command(radiance)
@@ -106,6 +106,9 @@ def reset_resource_ids(
               'interpreted in the honeybee model units. Note that this option has '
               'no effect unless the value is more than half of the grid-size.',
               type=str, default='0m', show_default=True)
+@click.option('--cpu-count', help='An integer for the number of processes '
+              'used to generate the grids of the rooms in parallel.',
+              type=int, default=1, show_default=True)
 @click.option('--room', '-r', multiple=True, help='Room identifier(s) to specify the '
               'room(s) for which sensor grids should be generated. By default, all '
               'rooms will get sensor grids.')
@@ -113,7 +116,7 @@ def reset_resource_ids(
               'string of the new model. By default this will be printed out '
               'to stdout', type=click.File('w'), default='-', show_default=True)
 def add_room_sensors(model_file, grid_size, offset, include_mesh, keep_out, wall_offset,
-                     room, output_file):
+                     cpu_count, room, output_file):
     """Add SensorGrids to a honeybee model generated from the Room's floors.
 
     The grids will have the rooms referenced in their room_identifier property.
@@ -131,14 +134,10 @@ def add_room_sensors(model_file, grid_size, offset, include_mesh, keep_out, wall
         offset = parse_distance_string(offset, model.units)
         wall_offset = parse_distance_string(wall_offset, model.units)
 
-        # loop through the rooms and generate sensor grids
-        sensor_grids = []
-        remove_out = not keep_out
-        for room in rooms:
-            sg = room.properties.radiance.generate_sensor_grid(
-                grid_size, offset=offset, remove_out=remove_out, wall_offset=wall_offset)
-            if sg is not None:
-                sensor_grids.append(sg)
+        # generate the sensor grids of the rooms
+        sensor_grids = model.properties.radiance.generate_room_sensor_grids(
+            grid_size, offset=offset, remove_out=not keep_out,
+            wall_offset=wall_offset, rooms=rooms, cpu_count=cpu_count)
         if not include_mesh:
             for sg in sensor_grids:
                 sg.mesh = None
@@ -195,6 +194,9 @@ def add_room_sensors(model_file, grid_size, offset, include_mesh, keep_out, wall
               'of the meshes generated around each sensor. If unspecified, it will be '
               'equal to 45 percent of the grid-size. Set to zero to ensure no mesh is '
               'added to the resulting sensor grids.', type=float, default=None)
+@click.option('--cpu-count', help='An integer for the number of processes '
+              'used to generate the grids of the rooms in parallel.',
+              type=int, default=1, show_default=True)
 @click.option('--room', '-r', multiple=True, help='Room identifier(s) to specify the '
               'room(s) for which sensor grids should be generated. By default, all '
               'rooms will get sensor grids.')
@@ -203,7 +205,7 @@ def add_room_sensors(model_file, grid_size, offset, include_mesh, keep_out, wall
               'to stdout', type=click.File('w'), default='-', show_default=True)
 def add_room_radial_sensors(
         model_file, grid_size, offset, include_mesh, keep_out, wall_offset,
-        dir_count, start_vector, mesh_radius, room, output_file):
+        dir_count, start_vector, mesh_radius, cpu_count, room, output_file):
     """Add SensorGrids to a honeybee model generated from the Room's floors.
 
     The grids will have the rooms referenced in their room_identifier property.
@@ -223,15 +225,11 @@ def add_room_radial_sensors(
         vec = [float(v) for v in start_vector.split()]
         st_vec = Vector3D(*vec)
 
-        # loop through the rooms and generate sensor grids
-        sensor_grids = []
-        remove_out = not keep_out
-        for room in rooms:
-            sg = room.properties.radiance.generate_sensor_grid_radial(
-                grid_size, offset=offset, remove_out=remove_out, wall_offset=wall_offset,
-                dir_count=dir_count, start_vector=st_vec, mesh_radius=mesh_radius)
-            if sg is not None:
-                sensor_grids.append(sg)
+        # generate the sensor grids of the rooms
+        sensor_grids = model.properties.radiance.generate_room_sensor_grids_radial(
+            grid_size, offset=offset, remove_out=not keep_out,
+            wall_offset=wall_offset, dir_count=dir_count, start_vector=st_vec,
+            mesh_radius=mesh_radius, rooms=rooms, cpu_count=cpu_count)
         if not include_mesh:
             for sg in sensor_grids:
                 sg.mesh = None
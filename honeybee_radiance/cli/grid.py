@@ -14,6 +14,7 @@ from honeybee.units import parse_distance_string
 from honeybee.typing import clean_rad_string, clean_and_id_rad_string
 
 from honeybee_radiance.sensorgrid import SensorGrid
+from honeybee_radiance.reader import build_line_index
 from honeybee_radiance_folder.gridutil import redistribute_sensors, \
     restore_original_distribution
 
@@ -65,7 +66,11 @@ def split_grid(grid_file, count, folder, log_file):
 @click.argument('extension', default='.pts', type=str)
 @click.option('--folder', help='Optional output folder.', default='.', show_default=True)
 @click.option('--name', help='Optional output filename. Default is base-name.')
-def merge_grid(input_folder, base_name, extension, folder, name):
+@click.option('--index/--no-index', help='Flag to note whether a line index '
+              'should be written next to the merged file. The index makes it possible '
+              'to read a range of lines from the file without reading all of the '
+              'lines before it.', default=False, show_default=True)
+def merge_grid(input_folder, base_name, extension, folder, name, index):
     """Merge several radiance files into a single file.
 
     This command removes headers from file if it exist.
@@ -78,7 +83,7 @@ def merge_grid(input_folder, base_name, extension, folder, name):
         extension: File extension. [Default: .pts]
     """
     try:
-        pattern = r'{}_\d+{}'.format(base_name, extension)
+        pattern = r'{}_\d+{}$'.format(base_name, extension)
         grids = sorted(f for f in os.listdir(input_folder) if re.match(pattern, f))
         if len(grids) == 0:
             raise ValueError('Found no file to merge.')
@@ -105,6 +110,8 @@ def merge_grid(input_folder, base_name, extension, folder, name):
                     # add rest of the file to outfile
                     for line in inf:
                         outf.write(line)
+        if index:
+            build_line_index(output_file)
     except Exception:
         _logger.exception('Failed to merge grid files.')
         sys.exit(1)
@@ -112,6 +119,34 @@ def merge_grid(input_folder, base_name, extension, folder, name):
         sys.exit(0)
 
 
+@grid.command('index')
+@click.argument('input-file', type=click.Path(
+    exists=True, file_okay=True, dir_okay=False, resolve_path=True))
+@click.option('--step', '-s', help='Number of lines between two offsets in the index. '
+              'Smaller numbers make the index larger but make it faster to move to '
+              'a line.', type=int, default=1000, show_default=True)
+def index_grid(input_file, step):
+    """Write a line index next to a sensor grid or a result file.
+
+    The index is written to a file with the same name as the input file and an
+    additional .idx extension. It is used to read a range of lines from the file
+    (eg. when loading a part of a sensor grid or the results of a subset of sensors)
+    without reading all of the lines before it. The index is ignored once the
+    input file is modified.
+
+    \b
+    Args:
+        input-file: Full path to a sensor grid file or an ASCII result file.
+    """
+    try:
+        build_line_index(input_file, step)
+    except Exception:
+        _logger.exception('Failed to index file.')
+        sys.exit(1)
+    else:
+        sys.exit(0)
+
+
 @grid.command('split-folder')
 @click.argument(
     'input-folder',
@@ -354,6 +389,9 @@ def mirror_grid(grid_file, vector, name, suffix, folder, log_file):
               'interpreted in the honeybee model units. Note that this option has '
               'no effect unless the value is more than half of the grid-size.',
               type=str, default='0m', show_default=True)
+@click.option('--cpu-count', help='An integer for the number of processes '
+              'used to generate the grids of the rooms in parallel.',
+              type=int, default=1, show_default=True)
 @click.option('--room', '-r', multiple=True, help='Room identifier to specify the '
               'room for which sensor grids should be generated. You can pass multiple '
               'rooms (each preceded by -r). By default, all rooms get sensor grids.')
@@ -369,7 +407,7 @@ def mirror_grid(grid_file, vector, name, suffix, folder, log_file):
               'string of the sensor grids. By default this will be printed '
               'to stdout', type=click.File('w'), default='-', show_default=True)
 def from_rooms(model_file, grid_size, offset, include_mesh, keep_out, wall_offset,
-               room, write_json, folder, output_file):
+               cpu_count, room, write_json, folder, output_file):
     """Generate SensorGrids from the Room floors of a honeybee model.
 
     \b
@@ -385,14 +423,10 @@ def from_rooms(model_file, grid_size, offset, include_mesh, keep_out, wall_offse
         offset = parse_distance_string(offset, model.units)
         wall_offset = parse_distance_string(wall_offset, model.units)
 
-        # loop through the rooms and generate sensor grids
-        sensor_grids = []
-        remove_out = not keep_out
-        for room in rooms:
-            sg = room.properties.radiance.generate_sensor_grid(
-                grid_size, offset=offset, remove_out=remove_out, wall_offset=wall_offset)
-            if sg is not None:
-                sensor_grids.append(sg)
+        # generate the sensor grids of the rooms
+        sensor_grids = model.properties.radiance.generate_room_sensor_grids(
+            grid_size, offset=offset, remove_out=not keep_out,
+            wall_offset=wall_offset, rooms=rooms, cpu_count=cpu_count)
         if not include_mesh:
             for sg in sensor_grids:
                 sg.mesh = None
@@ -459,6 +493,9 @@ def from_rooms(model_file, grid_size, offset, include_mesh, keep_out, wall_offse
               'of the meshes generated around each sensor. If unspecified, it will be '
               'equal to 45 percent of the grid-size. Set to zero to ensure no mesh is '
               'added to the resulting sensor grids.', type=float, default=None)
+@click.option('--cpu-count', help='An integer for the number of processes '
+              'used to generate the grids of the rooms in parallel.',
+              type=int, default=1, show_default=True)
 @click.option('--room', '-r', multiple=True, help='Room identifier to specify the '
               'room for which sensor grids should be generated. You can pass multiple '
               'rooms (each preceded by -r). By default, all rooms get sensor grids.')
@@ -475,7 +512,8 @@ def from_rooms(model_file, grid_size, offset, include_mesh, keep_out, wall_offse
               'to stdout', type=click.File('w'), default='-', show_default=True)
 def from_rooms_radial(
         model_file, grid_size, offset, include_mesh, keep_out, wall_offset,
-        dir_count, start_vector, mesh_radius, room, write_json, folder, output_file):
+        dir_count, start_vector, mesh_radius, cpu_count, room, write_json, folder,
+        output_file):
     """Generate SensorGrids of radial directions around positions from room floors.
 
     \b
@@ -493,15 +531,11 @@ def from_rooms_radial(
         vec = [float(v) for v in start_vector.split()]
         st_vec = Vector3D(*vec)
 
-        # loop through the rooms and generate sensor grids
-        sensor_grids = []
-        remove_out = not keep_out
-        for room in rooms:
-            sg = room.properties.radiance.generate_sensor_grid_radial(
-                grid_size, offset=offset, remove_out=remove_out, wall_offset=wall_offset,
-                dir_count=dir_count, start_vector=st_vec, mesh_radius=mesh_radius)
-            if sg is not None:
-                sensor_grids.append(sg)
+        # generate the sensor grids of the rooms
+        sensor_grids = model.properties.radiance.generate_room_sensor_grids_radial(
+            grid_size, offset=offset, remove_out=not keep_out,
+            wall_offset=wall_offset, dir_count=dir_count, start_vector=st_vec,
+            mesh_radius=mesh_radius, rooms=rooms, cpu_count=cpu_count)
         if not include_mesh:
             for sg in sensor_grids:
                 sg.mesh = None
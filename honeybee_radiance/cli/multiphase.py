@@ -4,7 +4,6 @@ import logging
 import os
 import traceback
 import json
-import math
 from collections import OrderedDict
 import click
 
@@ -21,7 +20,9 @@ from honeybee_radiance.reader import sensor_count_from_file
 from honeybee_radiance.sensorgrid import SensorGrid
 from honeybee_radiance.reader import parse_from_file
 from honeybee_radiance.geometry.polygon import Polygon
-from honeybee_radiance.dynamic.multiphase import automatic_aperture_grouping
+from honeybee_radiance.dynamic.multiphase import automatic_aperture_grouping, \
+    aperture_view_factor_mean, _rmse_from_vectors, _flatten, \
+    _agglomerative_clustering_complete
 from honeybee_radiance.dynamic import StateGeometry, RadianceSubFaceState
 from honeybee_radiance.modifier.material.trans import Trans
 
@@ -289,96 +290,6 @@ def dmtx_group_command(
         rflux_sky: Path to rflux sky file.
     """
 
-    def _index_and_min(distance_matrix):
-        """Return the minimum value of the distance matrix, as well as the index [j, i] of
-        the minimum value of the distance matrix."""
-        min_value = min([min(sublist) for sublist in distance_matrix])
-        for i, _i in enumerate(distance_matrix):
-            for j, _j in enumerate(distance_matrix):
-                if distance_matrix[i][j] == min_value:
-                    index = [j, i]
-                    break
-        return min_value, index
-
-    def _pairwise_maximum(array1, array2):
-        """Return an array of the pairwise maximum of two arrays."""
-        pair_array = [array1, array2]
-        max_array = list(map(max, zip(*pair_array)))
-        return max_array
-
-    def _tranpose_matrix(matrix):
-        """Transposes the distance matrix."""
-        matrix = list(map(list, zip(*matrix)))
-        return matrix
-
-    def _rmse_from_matrix(input):
-        """Calculates RMSE."""
-        rmse = []
-        for i, predicted in enumerate(input):
-            r_list = []
-            for j, observed in enumerate(input):
-                error = [(p - o) for p, o in zip(predicted, observed)]
-                square_error = [e ** 2 for e in error]
-                mean_square_error = sum(square_error) / len(square_error)
-                root_mean_square_error = mean_square_error ** 0.5
-                r_list.append(root_mean_square_error)
-            rmse.append(r_list)
-        return rmse
-
-    def _flatten(container):
-        """Flatten an array."""
-        if not isinstance(container, list):
-            container = [container]
-        for i in container:
-            if isinstance(i, (list, tuple)):
-                for j in _flatten(i):
-                    yield j
-            else:
-                yield i
-
-    def _agglomerative_clustering_complete(distance_matrix, ap_name, threshold=0.001):
-        """Cluster apertures based on the threshold."""
-
-        # Fill the diagonal with 9999 so a diagonal of zeros will NOT be stored as min_value.
-        for i in range(len(distance_matrix)):
-            distance_matrix[i][i] = 9999
-
-        # Create starting list of aperture groups. Each aperture starts as its own group.
-        ap_groups = ap_name
-
-        # Set the number of samples and the minimum value of the distance matrix.
-        n_samples = len(distance_matrix)
-
-        # Set the minimum value of the distance matrix and find the indices of the minimum
-        # value in the distance matrix.
-        min_value, index = _index_and_min(distance_matrix)
-
-        while n_samples > 1 and min_value < threshold:
-            # Combine the two groups and place it at index 0, and remove item at index 1.
-            ap_groups[index[0]] = [ap_groups[index[0]], ap_groups[index[1]]]
-            ap_groups.pop(index[1])
-
-            # Update the values in the distance matrix. We need the maximum values between
-            # the new cluster and all the remaining apertures or clusters still in the
-            # distance matrix.
-            distance_matrix[index[0]] = \
-                _pairwise_maximum(distance_matrix[index[0]], distance_matrix[index[1]])
-            distance_matrix = _tranpose_matrix(distance_matrix)
-            distance_matrix[index[0]] = \
-                _pairwise_maximum(distance_matrix[index[0]], distance_matrix[index[1]])
-
-            # Remove the values at index 1 along both axes.
-            distance_matrix.pop(index[1])
-            distance_matrix = _tranpose_matrix(distance_matrix)
-            distance_matrix.pop(index[1])
-
-            # Update the number of samples that are left in the distance matrix.
-            n_samples -= 1
-            # Update the minimum value and the indices.
-            min_value, index = _index_and_min(distance_matrix)
-
-        return ap_groups
-
     def _aperture_view_factor(
             project_folder, apertures, size=0.2, ambient_division=1000,
             receiver='rflux_sky.sky', octree='scene.oct',
@@ -455,34 +366,11 @@ def dmtx_group_command(
             receiver=rflux_sky, octree=octree, calc_folder=output_folder
         )
 
-        view_factor = []
-        # Read view factor file, convert to one channel output, and divide by Pi.
-        with open(mtx_file) as mtx_data:
-            for sensor in mtx_data:
-                sensor_split = sensor.strip().split()
-                if len(sensor_split) % 3 == 0:
-                    one_channel = sensor_split[::3]
-
-                    def convert_to_vf(x):
-                        return float(x) / math.pi
-                    view_factor.append(list(map(convert_to_vf, one_channel)))
-
-        ap_view_factor = []
-        # Split the view factor file by the aperture sensor count.
-        for aperture in ap_dict.values():
-            sensor_count = aperture['sensor_count']
-            ap_vf, view_factor = view_factor[:sensor_count], view_factor[sensor_count:]
-            ap_view_factor.append(ap_vf)
-
-        ap_view_factor_mean = []
         # Get the mean view factor per sky patch for each aperture.
-        for aperture in ap_view_factor:
-            ap_t = _tranpose_matrix(aperture)
-            ap_view_factor_mean.append(
-                [sum(sky_patch) / len(sky_patch) for sky_patch in ap_t])
+        ap_view_factor_mean = list(aperture_view_factor_mean(mtx_file, ap_dict).values())
 
         # Calculate RMSE between all combinations of averaged aperture view factors.
-        rmse = _rmse_from_matrix(ap_view_factor_mean)
+        rmse = _rmse_from_vectors(ap_view_factor_mean)
 
         ap_name = list(ap_dict.keys())
         # Cluster the apertures by the 'complete method'.
@@ -23,7 +23,11 @@ from honeybee_radiance.postprocess.annualirradiance import annual_irradiance_to_
 from honeybee_radiance.postprocess.electriclight import daylight_control_schedules
 from honeybee_radiance.postprocess.leed import leed_illuminance_to_folder
 from honeybee_radiance.postprocess.solartracking import post_process_solar_tracking
-from honeybee_radiance.cli.util import get_compare_func, remove_header
+from honeybee_radiance.postprocess.pipeline import annual_bundle_to_folder, \
+    AnnualDaylightReducer, EN17037Reducer, DaylightControlReducer, \
+    AnnualIrradianceReducer
+from honeybee_radiance.postprocess.matrix import matrix_rows
+from honeybee_radiance.cli.util import get_compare_func
 
 _logger = logging.getLogger(__name__)
 
@@ -69,8 +73,8 @@ def convert_matrix_to_binary(
 
     \b
     This command is useful for translating Radiance results to outputs like sunlight
-    hours. Input matrix must be in ASCII format. The header in the input file will be
-    ignored.
+    hours. Input matrix can be in ASCII, float or double format. The header in the
+    input file will be ignored.
 
     """
 
@@ -78,17 +82,10 @@ def convert_matrix_to_binary(
     minimum = float(minimum)
     maximum = float(maximum)
     try:
-        first_line, input_file = remove_header(input_matrix)
-        values = [
-            '1' if compare(float(v), minimum, maximum) else '0'
-            for v in first_line.split()
-        ]
-        output.write('\t'.join(values) + '\n')
-        for line in input_file:
+        for row in matrix_rows(input_matrix):
             # write binary values to new file
             values = [
-                '1' if compare(float(v), minimum, maximum) else '0'
-                for v in line.split()
+                '1' if compare(v, minimum, maximum) else '0' for v in row
             ]
             output.write('\t'.join(values) + '\n')
     except Exception:
@@ -96,8 +93,6 @@ def convert_matrix_to_binary(
         sys.exit(1)
     else:
         sys.exit(0)
-    finally:
-        input_file.close()
 
 
 @post_process.command('count')
@@ -136,33 +131,23 @@ def count_values(
 
     \b
     This command is useful for post processing results like the number of sensors
-    which receive more than X lux at any timestep.
+    which receive more than X lux at any timestep. Input matrix can be in ASCII,
+    float or double format.
 
     """
     compare = get_compare_func(include_min, include_max, comply)
     minimum = float(minimum)
     maximum = float(maximum)
     try:
-        first_line, input_file = remove_header(input_matrix)
-        value = sum(
-            1 if compare(float(v), minimum, maximum) else 0
-            for v in first_line.split()
-        )
-        output.write('%d\n' % value)
-        for line in input_file:
-            # write binary values to new file
-            value = sum(
-                1 if compare(float(v), minimum, maximum) else 0
-                for v in line.split()
-            )
+        for row in matrix_rows(input_matrix):
+            # write the count of values to new file
+            value = sum(1 if compare(v, minimum, maximum) else 0 for v in row)
             output.write('%d\n' % value)
     except Exception:
         _logger.exception('Failed to convert the input file to binary format.')
         sys.exit(1)
     else:
         sys.exit(0)
-    finally:
-        input_file.close()
 
 
 @post_process.command('sum-row')
@@ -184,24 +169,19 @@ def sum_matrix_rows(input_matrix, divisor, output):
 
     \b
     This command is useful for translating Radiance results to outputs like radiation
-    to total radiation. Input matrix must be in ASCII format. The header in the input
-    file will be ignored.
+    to total radiation. Input matrix can be in ASCII, float or double format. The
+    header in the input file will be ignored.
     """
     try:
-        first_line, input_file = remove_header(input_matrix)
-        value = sum(float(v) for v in first_line.split()) / divisor
-        output.write('%s\n' % value)
-        for line in input_file:
+        for row in matrix_rows(input_matrix):
             # write sum to a new file
-            value = sum(float(v) for v in line.split()) / divisor
+            value = sum(row) / divisor
             output.write('%s\n' % value)
     except Exception:
         _logger.exception('Failed to sum numbers in each row.')
         sys.exit(1)
     else:
         sys.exit(0)
-    finally:
-        input_file.close()
 
 
 @post_process.command('average-row')
@@ -217,30 +197,18 @@ def average_matrix_rows(input_matrix, output):
 
     \b
     This command is useful for translating Radiance results to outputs like radiation
-    to average radiation. Input matrix must be in ASCII format. The header in the input
-    file will be ignored.
+    to average radiation. Input matrix can be in ASCII, float or double format. The
+    header in the input file will be ignored.
     """
     try:
-        first_line, input_file = remove_header(input_matrix)
-
-        # calculate the values for the first line
-        values = [float(v) for v in first_line.split()]
-        count = len(values)
-        output.write('%s\n' % sum(values) / count)
-
-        # write rest of the lines
-        for line in input_file:
-            # write sum to a new file
-            value = sum(float(v) for v in line.split())
-            output.write('%s\n' % value / count)
-
+        for row in matrix_rows(input_matrix):
+            # write average to a new file
+            output.write('%s\n' % (sum(row) / len(row)))
     except Exception:
         _logger.exception('Failed to average the numbers in each row.')
         sys.exit(1)
     else:
         sys.exit(0)
-    finally:
-        input_file.close()
 
 
 @post_process.command('cumulative-radiation')
@@ -264,7 +232,7 @@ def cumulative_radiation(average_irradiance, wea, timestep, output):
     \b
     Args:
         average_irradiance: A single-column matrix of average irradiance values.
-            This input matrix must be in ASCII format.
+            This input matrix can be in ASCII, float or double format.
         wea: The .wea file that was used in the irradiance simulation. This
             will be used to determine the duration of the analysis for computing
             cumulative radiation. This can also be an .epw file.
@@ -278,19 +246,13 @@ def cumulative_radiation(average_irradiance, wea, timestep, output):
             wea = Wea.from_epw_file(wea, timestep).write(_wea_file)
         # parse the Wea and the average_irradiance matrix
         conversion = Wea.count_timesteps(wea) / (timestep * 1000)
-        first_line, input_file = remove_header(average_irradiance)
-        # calculate the value for the first line
-        output.write('%s\n' % (float(first_line) * conversion))
-        # write rest of the lines
-        for line in input_file:
-            output.write('%s\n' % (float(line) * conversion))
+        for row in matrix_rows(average_irradiance):
+            output.write('%s\n' % (row[0] * conversion))
     except Exception:
         _logger.exception('Failed to compute cumulative radiation.')
         sys.exit(1)
     else:
         sys.exit(0)
-    finally:
-        input_file.close()
 
 
 @post_process.command('annual-irradiance')
@@ -310,7 +272,11 @@ def cumulative_radiation(average_irradiance, wea, timestep, output):
     '--sub-folder', '-sf', help='Optional relative path for subfolder to write output '
     'metric files.', default='metrics'
 )
-def annual_irradiance(folder, wea, timestep, sub_folder):
+@click.option(
+    '--cpu-count', help='An integer for the number of processes used to '
+    'post-process the grids in parallel.', default=1, type=int, show_default=True
+)
+def annual_irradiance(folder, wea, timestep, sub_folder, cpu_count):
     """Compute irradiance metrics in a folder and write them in a subfolder.
 
     \b
@@ -333,7 +299,7 @@ def annual_irradiance(folder, wea, timestep, sub_folder):
         if not is_wea:
             _wea_file = os.path.join(os.path.dirname(wea), 'epw_to_wea.wea')
             wea = Wea.from_epw_file(wea, timestep).write(_wea_file)
-        annual_irradiance_to_folder(folder, wea, timestep, sub_folder)
+        annual_irradiance_to_folder(folder, wea, timestep, sub_folder, cpu_count)
     except Exception:
         _logger.exception('Failed to compute irradiance metrics.')
         sys.exit(1)
@@ -373,9 +339,13 @@ def annual_irradiance(folder, wea, timestep, sub_folder):
     '--sub_folder', '-sf', help='Optional relative path for subfolder to write output '
     'metric files.', default='metrics'
 )
+@click.option(
+    '--cpu-count', help='An integer for the number of processes used to '
+    'post-process the grids in parallel.', default=1, type=int, show_default=True
+)
 def annual_metrics(
     folder, schedule, threshold, lower_threshold, upper_threshold, grids_filter,
-    sub_folder
+    sub_folder, cpu_count
 ):
     """Compute annual metrics in a folder and write them in a subfolder.
 
@@ -404,7 +374,7 @@ def annual_metrics(
     try:
         metrics_to_folder(
             folder, schedule, threshold, lower_threshold, upper_threshold,
-            grids_filter, sub_folder
+            grids_filter, sub_folder, cpu_count
         )
     except Exception:
         _logger.exception('Failed to calculate annual metrics.')
@@ -430,8 +400,12 @@ def annual_metrics(
     '--sub_folder', '-sf', help='Optional relative path for subfolder to write output '
     'metric files.', default='metrics'
 )
+@click.option(
+    '--cpu-count', help='An integer for the number of processes used to '
+    'post-process the grids in parallel.', default=1, type=int, show_default=True
+)
 def annual_en17037_metrics(
-    folder, schedule, grids_filter, sub_folder
+    folder, schedule, grids_filter, sub_folder, cpu_count
 ):
     """Compute annual EN 17037 metrics in a folder and write them in a subfolder.
 
@@ -452,7 +426,7 @@ def annual_en17037_metrics(
     with open(schedule) as hourly_schedule:
         schedule = [int(float(v)) for v in hourly_schedule]
     try:
-        en17037_to_folder(folder, schedule, grids_filter, sub_folder)
+        en17037_to_folder(folder, schedule, grids_filter, sub_folder, cpu_count)
     except Exception:
         _logger.exception('Failed to calculate annual EN 17037 metrics.')
         sys.exit(1)
@@ -483,8 +457,12 @@ def annual_en17037_metrics(
     '--sub_folder', '-sf', help='Optional relative path for subfolder to write output '
     'metric files.', default='metrics'
 )
+@click.option(
+    '--cpu-count', help='An integer for the number of processes used to '
+    'post-process the grids in parallel.', default=1, type=int, show_default=True
+)
 def annual_glare(
-    folder, schedule, glare_threshold, grids_filter, sub_folder
+    folder, schedule, glare_threshold, grids_filter, sub_folder, cpu_count
 ):
     """Compute annual glare autonomy in a folder and write them in a subfolder.
 
@@ -508,7 +486,7 @@ def annual_glare(
 
     try:
         glare_autonomy_to_folder(
-            folder, schedule, glare_threshold, grids_filter, sub_folder
+            folder, schedule, glare_threshold, grids_filter, sub_folder, cpu_count
         )
     except Exception:
         _logger.exception('Failed to calculate annual glare autonomy.')
@@ -517,6 +495,153 @@ def annual_glare(
         sys.exit(0)
 
 
+@post_process.command('annual-bundle')
+@click.argument(
+    'folder',
+    type=click.Path(exists=True, file_okay=False, dir_okay=True, resolve_path=True)
+)
+@click.option(
+    '--annual-daylight/--no-annual-daylight', ' /-nad', help='Flag to note whether '
+    'annual daylight metrics should be computed.', default=True, show_default=True
+)
+@click.option(
+    '--schedule', '-sch', help='Path to an annual schedule file for the annual '
+    'daylight metrics. Values should be 0-1 separated by new line. If not provided '
+    'an 8-5 annual schedule will be created.',
+    type=click.Path(exists=False, file_okay=True, dir_okay=False, resolve_path=True)
+)
+@click.option(
+    '--threshold', '-t', help='Threshold illuminance level for daylight autonomy.',
+    default=300, type=int, show_default=True
+)
+@click.option(
+    '--lower-threshold', '-lt',
+    help='Minimum threshold for useful daylight illuminance.', default=100, type=int,
+    show_default=True
+)
+@click.option(
+    '--upper-threshold', '-ut',
+    help='Maximum threshold for useful daylight illuminance.', default=3000, type=int,
+    show_default=True
+)
+@click.option(
+    '--en17037-schedule', help='Path to a daylight hours schedule file. If provided, '
+    'the EN 17037 metrics will be computed using this schedule.',
+    type=click.Path(exists=True, file_okay=True, dir_okay=False, resolve_path=True)
+)
+@click.option(
+    '--electric-lighting/--no-electric-lighting', help='Flag to note whether '
+    'electric lighting schedules with daylight controls should be generated.',
+    default=False, show_default=True
+)
+@click.option(
+    '--base-schedule', help='Path to a CSV file for the lighting schedule without '
+    'any daylight controls. If unspecified, a schedule from 9AM to 5PM on weekdays '
+    'will be used.',
+    type=click.Path(exists=False, file_okay=True, dir_okay=False, resolve_path=True)
+)
+@click.option(
+    '--ill-setpoint', help='A number for the illuminance setpoint in lux beyond '
+    'which electric lights are dimmed if there is sufficient daylight.',
+    default=300, type=int, show_default=True
+)
+@click.option(
+    '--min-power-in', help='A number between 0 and 1 for the the lowest power the '
+    'lighting system can dim down to, expressed as a fraction of maximum input power.',
+    default=0.3, type=float, show_default=True
+)
+@click.option(
+    '--min-light-out', help='A number between 0 and 1 the lowest lighting output the '
+    'lighting system can dim down to, expressed as a fraction of maximum light output.',
+    default=0.2, type=float, show_default=True
+)
+@click.option(
+    '--on-at-min/--off-at-min', help='Flag to note whether lights should switch off '
+    'completely when they get to the minimum power input.',
+    default=True, show_default=True
+)
+@click.option(
+    '--wea', help='The .wea file that was used in the simulation. If provided, '
+    'irradiance metrics will be computed from the results.',
+    type=click.Path(exists=True, file_okay=True, dir_okay=False, resolve_path=True)
+)
+@click.option(
+    '--timestep', type=int, default=1, help='The timestep of the Wea file, which '
+    'is used to ensure the summed row of irradiance yields cumulative radiation over '
+    'the time period of the Wea.'
+)
+@click.option(
+    '--grids-filter', '-gf', help='A pattern to filter the grids.', default='*',
+    show_default=True
+)
+@click.option(
+    '--sub-folder', '-sf', help='Optional relative path for subfolder to write output '
+    'metric folders.', default='metrics'
+)
+@click.option(
+    '--cpu-count', help='An integer for the number of processes used to '
+    'post-process the grids in parallel.', default=1, type=int, show_default=True
+)
+def annual_bundle(
+    folder, annual_daylight, schedule, threshold, lower_threshold, upper_threshold,
+    en17037_schedule, electric_lighting, base_schedule, ill_setpoint, min_power_in,
+    min_light_out, on_at_min, wea, timestep, grids_filter, sub_folder, cpu_count
+):
+    """Compute several annual metrics with a single read of each result file.
+
+    \b
+    Each requested metric is written into its own folder inside the sub-folder.
+        annual_daylight -> da, cda, udi, udi_lower and udi_upper
+        en17037 -> EN 17037 daylight autonomy for each level of recommendation
+        electric_lighting -> schedules.csv with a schedule for each grid
+        annual_irradiance -> average_irradiance, peak_irradiance, cumulative_radiation
+
+    \b
+    Args:
+        folder: Results folder. This folder is an output folder of an annual
+            recipe. Folder should include grids_info.json and sun-up-hours.txt.
+            The command uses the list in grids_info.json to find the result files
+            for each sensor grid.
+    """
+    try:
+        reducers = []
+        if annual_daylight:
+            if schedule and os.path.isfile(schedule):
+                with open(schedule) as hourly_schedule:
+                    schedule = [int(float(v)) for v in hourly_schedule]
+            else:
+                schedule = None
+            reducers.append(AnnualDaylightReducer(
+                schedule, threshold, lower_threshold, upper_threshold))
+        if en17037_schedule:
+            with open(en17037_schedule) as hourly_schedule:
+                en_schedule = [int(float(v)) for v in hourly_schedule]
+            reducers.append(EN17037Reducer(en_schedule))
+        if electric_lighting:
+            if base_schedule and os.path.isfile(base_schedule):
+                with open(base_schedule) as hourly_schedule:
+                    base_schedule = [float(v) for v in hourly_schedule]
+            else:
+                base_schedule = None
+            reducers.append(DaylightControlReducer(
+                base_schedule, ill_setpoint, min_power_in, min_light_out,
+                not on_at_min))
+        if wea:
+            with open(wea) as inf:
+                first_word = inf.read(5)
+            if first_word != 'place':
+                _wea_file = os.path.join(os.path.dirname(wea), 'epw_to_wea.wea')
+                wea = Wea.from_epw_file(wea, timestep).write(_wea_file)
+            reducers.append(AnnualIrradianceReducer(wea, timestep))
+
+        annual_bundle_to_folder(folder, reducers, grids_filter, sub_folder, cpu_count)
+    except Exception:
+        _logger.exception('Failed to calculate the annual metrics.')
+        sys.exit(1)
+    else:
+        sys.exit(0)
+
+
 @post_process.command('electric-lighting')
 @click.argument(
     'folder',
@@ -560,9 +685,13 @@ def annual_glare(
     'By default this will be printed out to stdout',
     type=click.File('w'), default='-', show_default=True
 )
+@click.option(
+    '--cpu-count', help='An integer for the number of processes used to '
+    'post-process the grids in parallel.', default=1, type=int, show_default=True
+)
 def electric_lighting(
     folder, base_schedule, ill_setpoint, min_power_in, min_light_out, on_at_min,
-    output_file
+    output_file, cpu_count
 ):
     """Generate electric lighting schedules from annual daylight results.
 
@@ -595,7 +724,8 @@ def electric_lighting(
 
         off_at_min = not on_at_min
         schedules, _ = daylight_control_schedules(
-            folder, schedule, ill_setpoint, min_power_in, min_light_out, off_at_min
+            folder, schedule, ill_setpoint, min_power_in, min_light_out, off_at_min,
+            cpu_count
         )
 
         for line in zip(*schedules):
@@ -168,9 +168,16 @@ def three_phase_rmtxop(
     '--result-mapper-name', '-rn', help='Output file name for results mapper file.',
     type=click.STRING, default='3phase_results_info', show_default=True
 )
+@click.option(
+    '--output-format', help='Format of the combinations file. Choose json to write '
+    'a single JSON array or ndjson to write one compact JSON object per line to a '
+    '.ndjson file, which can be read one combination at a time.',
+    type=click.Choice(['json', 'ndjson']), default='json', show_default=True,
+    show_choices=True
+)
 def three_phase_combinations(
     sender_info, receiver_info, states_info, folder, combinations_name,
-    result_mapper_name
+    result_mapper_name, output_format
 ):
     """Matrix multiplication for view matrix, transmission matrix, daylight matrix and
     sky matrix.
@@ -193,59 +200,47 @@ def three_phase_combinations(
         send_data = _read_json_content(sender_info)
         states = _read_json_content(states_info)
 
+        # map each aperture group to the first sender that includes it
+        sender_index = {}
+        for group in send_data:
+            for apt in group['aperture_groups']:
+                sender_index.setdefault(apt, group['identifier'])
+
         dmtx_info = {}
 
         grid_mapper = {}
         for grid in rec_data:
             grid_mapper[grid['full_id']] = {}
             for apt in grid['aperture_groups']:
-                for group in send_data:
-                    if apt in group['aperture_groups']:
-                        dmtx_info[apt] = group['identifier']
-                        break
-                else:
+                try:
+                    dmtx_info[apt] = sender_index[apt]
+                except KeyError:
                     # this should never happen for a valid radiance folder
                     raise ValueError('Unrecognizable aperture group: %s' % apt)
 
                 grid_mapper[grid['full_id']][apt] = \
                     [s['identifier'] for s in states[apt]]
 
-        # create all the possible combinations
-        # TODO: find a more generic approach to created the names. Using white_glow
-        # is assuming that we will never change the modifier.
-        matrix_combinations = []
-        for grid in rec_data:
-            for apt in grid['aperture_groups']:
-                vmtx = '%s..white_glow_%s.vtmx' % (grid['identifier'], apt)
-                dmtx = '%s.dmtx' % dmtx_info[apt]
-                for info in states[apt]:
-                    matrix_combinations.append(
-                        dict(
-                            # create an identifier from the mix of grid and state
-                            identifier='%s..%s' % (
-                                grid['full_id'], info['identifier']
-                            ),
-                            light_path=apt,
-                            grid_id=grid['full_id'],
-                            state_id=info['identifier'],
-                            tmtx=info['tmtx'],
-                            vmtx=vmtx,
-                            dmtx=dmtx
-                        )
-                    )
-
         # write the files to folder
         if not os.path.isdir(folder):
             os.mkdir(folder)
 
-        comb_file = os.path.join(folder, '%s.json' % combinations_name)
-        res_file = os.path.join(folder, '%s.json' % result_mapper_name)
-
-        with open(comb_file, 'w') as outf:
-            json.dump(matrix_combinations, outf, indent=2)
+        # write all the possible combinations without keeping them in memory
+        matrix_combinations = _matrix_combinations(rec_data, states, dmtx_info)
+        if output_format == 'ndjson':
+            comb_file = os.path.join(folder, '%s.ndjson' % combinations_name)
+            with open(comb_file, 'w') as outf:
+                for combination in matrix_combinations:
+                    outf.write(json.dumps(combination, separators=(',', ':')))
+                    outf.write('\n')
+        else:
+            comb_file = os.path.join(folder, '%s.json' % combinations_name)
+            with open(comb_file, 'w') as outf:
+                _write_json_array(matrix_combinations, outf)
 
+        res_file = os.path.join(folder, '%s.json' % result_mapper_name)
         with open(res_file, 'w') as outf:
-            json.dump(grid_mapper, outf, indent=2)
+            outf.write(json.dumps(grid_mapper))
 
     except Exception:
         _logger.exception(
@@ -253,3 +248,40 @@ def three_phase_combinations(
         sys.exit(1)
     else:
         sys.exit(0)
+
+
+def _matrix_combinations(rec_data, states, dmtx_info):
+    """Yield the matrix combinations for each grid, aperture group and state."""
+    # TODO: find a more generic approach to created the names. Using white_glow
+    # is assuming that we will never change the modifier.
+    for grid in rec_data:
+        for apt in grid['aperture_groups']:
+            vmtx = '%s..white_glow_%s.vtmx' % (grid['identifier'], apt)
+            dmtx = '%s.dmtx' % dmtx_info[apt]
+            for info in states[apt]:
+                yield dict(
+                    # create an identifier from the mix of grid and state
+                    identifier='%s..%s' % (
+                        grid['full_id'], info['identifier']
+                    ),
+                    light_path=apt,
+                    grid_id=grid['full_id'],
+                    state_id=info['identifier'],
+                    tmtx=info['tmtx'],
+                    vmtx=vmtx,
+                    dmtx=dmtx
+                )
+
+
+def _write_json_array(items, outf):
+    """Write the items of an iterable to a file as a JSON array with one item per line.
+
+    The items are written one at a time such that the full list is never in memory.
+    """
+    outf.write('[')
+    separator = '\n'
+    for item in items:
+        outf.write(separator)
+        outf.write(json.dumps(item))
+        separator = ',\n'
+    outf.write('\n]' if separator == ',\n' else ']')
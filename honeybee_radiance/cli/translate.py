@@ -71,13 +71,23 @@ def translate():
     'This will only create sensor grids for rooms if there are no sensor grids '
     'in the model.'
 )
+@click.option(
+    '--cpu-count', help='An integer for the number of processes used to '
+    'translate the static geometry of the model in parallel.', default=1,
+    type=int, show_default=True)
+@click.option(
+    '--incremental/--overwrite', help='Flag to note whether an existing Radiance '
+    'folder should be updated incrementally, in which case only the geometry that '
+    'changed since the previous export is translated to Radiance strings and only '
+    'the files with content that changed are rewritten.',
+    default=False, show_default=True)
 @click.option(
     '--log-file', help='Optional log file to output the path of the radiance '
     'folder generated from the model. By default this will be printed '
     'to stdout', type=click.File('w'), default='-')
 def model_to_rad_folder_cli(
         model_file, folder, view, grid, full_match, config_file, minimal,
-        no_grid_check, no_view_check, create_grids, log_file):
+        no_grid_check, no_view_check, create_grids, cpu_count, incremental, log_file):
     """Translate a Model file into a Radiance Folder.
 
     \b
@@ -92,7 +102,8 @@ def model_to_rad_folder_cli(
         view_check = not no_view_check
         model_to_rad_folder(
             model_file, folder, view, grid, full_match, config_file,
-            minimal, grid_check, view_check, log_file, create_grids=create_grids)
+            minimal, grid_check, view_check, log_file, create_grids=create_grids,
+            cpu_count=cpu_count, incremental=incremental)
     except Exception as e:
         _logger.exception('Model translation failed.\n{}'.format(e))
         sys.exit(1)
@@ -104,7 +115,7 @@ def model_to_rad_folder(
         model_file, folder=None, view=None, grid=None, full_match=False, config_file=None,
         minimal=False, grid_check=False, view_check=False, log_file=None,
         no_full_match=True, maximal=True, no_grid_check=False, no_view_check=False,
-        create_grids=False):
+        create_grids=False, cpu_count=1, incremental=False):
     """Translate a Model file into a Radiance Folder.
 
     Args:
@@ -142,6 +153,15 @@ def model_to_rad_folder(
             an explicit error will be raised. (Default: False).
         log_file: Optional log file to output the path of the radiance folder
             generated from the model. If None, it will be returned from this method.
+        create_grids: Boolean to note whether sensor grids should be created for
+            the rooms if the model has no sensor grids. (Default: False).
+        cpu_count: An integer for the number of processes used to translate the
+            static geometry of the model in parallel. (Default: 1).
+        incremental: Boolean to note whether an existing Radiance folder should
+            be updated incrementally, in which case only the static geometry
+            that changed since the previous export is translated to Radiance
+            strings and only the files with content that changed are
+            rewritten. (Default: False).
     """
     # set the default folder if it's not specified
     if folder is None:
@@ -199,7 +219,7 @@ def model_to_rad_folder(
         # translate the model to a radiance folder
         rad_fold = model.to.rad_folder(
             model, folder, config_file, minimal, views=view, grids=grid,
-            full_match=full_match
+            full_match=full_match, cpu_count=cpu_count, incremental=incremental
         )
 
         if log_file is None:
@@ -4,11 +4,11 @@ import os
 import sys
 import logging
 import math
-from itertools import islice
 
 from honeybee_radiance.config import folders
 from honeybee_radiance.geometry import Polygon
 from honeybee_radiance.modifier.material import Plastic
+from honeybee_radiance.postprocess.viewfactor import view_factors_to_files
 
 from honeybee_radiance_command.oconv import Oconv
 from honeybee_radiance_command.rcontrib import Rcontrib, RcontribOptions
@@ -228,6 +228,18 @@ def create_view_factor_modifiers(
     help='The number of rays to be equally distributed over a sphere to compute '
     'the view factor for each of the input sensors.'
 )
+@click.option(
+    '--binary/--ascii', default=False, show_default=True,
+    help='Flag to note whether the matrix of ray contributions should be written '
+    'in binary (double) format with a header instead of ASCII. Binary matrices '
+    'are post-processed without any text parsing, which is much faster for '
+    'large numbers of sensors and modifiers.'
+)
+@click.option(
+    '--npy/--no-npy', default=False, show_default=True,
+    help='Flag to note whether the view factors should also be written into a '
+    'NumPy file (.npy) alongside the CSV. This requires NumPy to be installed.'
+)
 @click.option(
     '--rad-params', show_default=True, help='Radiance parameters.'
 )
@@ -244,8 +256,8 @@ def create_view_factor_modifiers(
     'rebuilt sensor-grid, the matrix and the resulting CSV with view factors.'
 )
 def rcontrib_command_with_view_postprocess(
-        octree, sensor_grid, modifiers, ray_count, rad_params, rad_params_locked,
-        folder, name
+        octree, sensor_grid, modifiers, ray_count, binary, npy, rad_params,
+        rad_params_locked, folder, name
 ):
     """Run rcontrib to get spherical view factors from a sensor grid.
 
@@ -273,12 +285,11 @@ def rcontrib_command_with_view_postprocess(
         with open(sensor_grid) as sg_file:
             with open(ray_file, 'w') as r_file:
                 for line in sg_file:
-                    for ray in ray_str:
-                        try:
-                            r_file.write(' '.join(line.split()[:3]) + ray)
-                            total_rays += 1
-                        except Exception:
-                            pass  # we are at the end of the file
+                    position = ' '.join(line.split()[:3])
+                    if not position:
+                        continue  # an empty line, probably at the end of the file
+                    r_file.write(''.join(position + ray for ray in ray_str))
+                    total_rays += len(ray_str)
 
         # set up the Rcontrib options
         options = RcontribOptions()
@@ -294,28 +305,18 @@ def rcontrib_command_with_view_postprocess(
         mtx_file = os.path.abspath(os.path.join(folder, '{}.mtx'.format(name)))
         rcontrib = Rcontrib(options=options, octree=octree, sensors=ray_file)
         cmd = rcontrib.to_radiance().replace('\\', '/')
-        cmd = '{} | rmtxop -fa - -c .333 .333 .334'.format(cmd)
-        cmd = '{}  | getinfo - > "{}"'.format(cmd, mtx_file.replace('\\', '/'))
+        if binary:  # keep the header, which is needed to read the binary values
+            cmd = '{} | rmtxop -fd - -c .333 .333 .334'.format(cmd)
+            cmd = '{} > "{}"'.format(cmd, mtx_file.replace('\\', '/'))
+        else:
+            cmd = '{} | rmtxop -fa - -c .333 .333 .334'.format(cmd)
+            cmd = '{}  | getinfo - > "{}"'.format(cmd, mtx_file.replace('\\', '/'))
         run_command(cmd, env=folders.env)
 
-        # load the resulting matrix and process the results into view factors
-        view_fac_mtx = []
-        with open(mtx_file) as mtx_data:
-            while True:
-                sens_lines = list(islice(mtx_data, ray_count))
-                if not sens_lines:
-                    break
-                sens_mtx = ((float(v) for v in ln.strip().split()) for ln in sens_lines)
-                s_facs = []
-                for sens_facs in zip(*sens_mtx):
-                    s_facs.append(sum(sens_facs) / (math.pi * ray_count))
-                view_fac_mtx.append(s_facs)
-
-        # write the final view factors into a CSV file
+        # process the matrix into view factors and write them into a CSV file
         view_file = os.path.join(folder, '{}.csv'.format(name))
-        with open(view_file, 'w') as v_file:
-            for facs in view_fac_mtx:
-                v_file.write(','.join((str(v) for v in facs)) + '\n')
+        npy_file = os.path.join(folder, '{}.npy'.format(name)) if npy else None
+        view_factors_to_files(mtx_file, ray_count, view_file, npy_file)
     except Exception:
         _logger.exception('Failed to compute view factor contributions.')
         sys.exit(1)
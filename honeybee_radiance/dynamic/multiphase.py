@@ -5,6 +5,7 @@ import os
 import math
 import json
 from collections import OrderedDict
+from itertools import islice
 
 from ladybug_geometry.geometry3d.mesh import Mesh3D
 from ladybug.futil import write_to_file_by_name
@@ -17,46 +18,47 @@ from honeybee_radiance_command.rfluxmtx import RfluxmtxOptions, Rfluxmtx
 from honeybee_radiance.config import folders
 from honeybee_radiance.sensorgrid import SensorGrid
 from honeybee_radiance.lightsource.sky.skydome import SkyDome
+from honeybee_radiance.postprocess.matrix import matrix_rows, matrix_array_chunks
 
-
-def _index_and_min(distance_matrix):
-    """Return the minimum value of the distance matrix, as well as the index [j, i] of
-    the minimum value of the distance matrix."""
-    min_value = min([min(sublist) for sublist in distance_matrix])
-    for i, _i in enumerate(distance_matrix):
-        for j, _j in enumerate(distance_matrix):
-            if distance_matrix[i][j] == min_value:
-                index = [j, i]
-                break
-    return min_value, index
+try:
+    import numpy as np
+except ImportError:  # numpy is not available; use the pure Python functions
+    np = None
 
 
-def _pairwise_maximum(array1, array2):
-    """Return an array of the pairwise maximum of two arrays."""
-    pair_array = [array1, array2]
-    max_array = list(map(max, zip(*pair_array)))
-    return max_array
+def _rmse_from_vectors(vectors):
+    """Calculate the RMSE between all combinations of a list of vectors.
 
+    Args:
+        vectors: A list of lists where each sub-list is a vector of values. All
+            vectors must have the same length.
 
-def _transpose_matrix(matrix):
-    """Transposes the distance matrix."""
-    matrix = list(map(list, zip(*matrix)))
-    return matrix
+    Returns:
+        A list of lists for the symmetric matrix of RMSE between the vectors.
+    """
+    if np is None:
+        rmse = [[0.0] * len(vectors) for _ in vectors]
+        for i, predicted in enumerate(vectors):
+            for j in range(i + 1, len(vectors)):
+                error = [(p - o) for p, o in zip(predicted, vectors[j])]
+                square_error = [e * e for e in error]
+                mean_square_error = sum(square_error) / len(square_error)
+                rmse[i][j] = rmse[j][i] = math.sqrt(mean_square_error)
+        return rmse
+
+    values = np.asarray(vectors, dtype=float)
+    rmse = np.zeros((len(values), len(values)))
+    for i in range(len(values) - 1):
+        square_error = (values[i] - values[i + 1:]) ** 2
+        # cumsum adds the errors in order, which matches the rounding of sum
+        mean_square_error = np.cumsum(square_error, axis=1)[:, -1] / values.shape[1]
+        rmse[i, i + 1:] = rmse[i + 1:, i] = np.sqrt(mean_square_error)
+    return rmse.tolist()
 
 
 def _rmse_from_matrix(vf_matrix_dict):
     """Calculates RMSE."""
-    rmse = []
-    for predicted in vf_matrix_dict.values():
-        r_list = []
-        for observed in vf_matrix_dict.values():
-            error = [(p - o) for p, o in zip(predicted, observed)]
-            square_error = [e ** 2 for e in error]
-            mean_square_error = sum(square_error) / len(square_error)
-            root_mean_square_error = mean_square_error ** 0.5
-            r_list.append(root_mean_square_error)
-        rmse.append(r_list)
-    return rmse
+    return _rmse_from_vectors(list(vf_matrix_dict.values()))
 
 
 def _flatten(container):
@@ -71,52 +73,152 @@ def _flatten(container):
             yield i
 
 
+def _complete_linkage_merges(distance_matrix, threshold):
+    """Get the merges of agglomerative clustering with complete linkage.
+
+    The two closest clusters are merged until the distance between the closest
+    clusters is not below the threshold. The distance between two clusters is the
+    maximum distance between their members. Each cluster is identified by the
+    lowest index of its members and, when several pairs of clusters have the
+    same distance, the pair with the highest index is merged first.
+
+    Instead of searching the whole distance matrix after each merge, the minimum
+    distance of each row is kept along with the number of columns at this minimum.
+    A row only has to be searched again once all of its columns at the minimum
+    have been merged into a larger distance. This makes each merge O(n).
+
+    Args:
+        distance_matrix: A symmetric matrix as a list of lists (or a 2D NumPy array)
+            with the distances between the items to be clustered.
+        threshold: A number for the distance below which clusters are merged.
+
+    Returns:
+        A list of tuples with the indices (a, b) of the clusters that are merged in
+        order, where b is merged into a. The index a is always lower than b.
+    """
+    if np is None:
+        return _complete_linkage_merges_python(distance_matrix, threshold)
+
+    dist = np.array(distance_matrix, dtype=float)
+    count = len(dist)
+    if count < 2:
+        return []
+    np.fill_diagonal(dist, np.inf)
+    active = np.ones(count, dtype=bool)
+    row_min = dist.min(axis=1)
+    min_count = np.count_nonzero(dist == row_min[:, None], axis=1)
+
+    merges = []
+    while len(merges) < count - 1:
+        active_min = np.where(active, row_min, np.inf)
+        min_value = active_min.min()
+        if not min_value < threshold:
+            break
+        b = np.flatnonzero(active_min == min_value)[-1]
+        a = np.flatnonzero(dist[b] == min_value)[0]
+        merges.append((a, b))
+
+        # the distance to the merged cluster is the maximum distance of its members
+        col_a, col_b = dist[a].copy(), dist[b].copy()
+        new_col = np.maximum(col_a, col_b)
+        active[b] = False
+        dist[b, :] = dist[:, b] = np.inf
+        dist[a, :] = dist[:, a] = new_col
+        dist[a, a] = np.inf
+
+        # update the number of columns at the minimum of each row
+        min_count -= (col_a == row_min).astype(int) + (col_b == row_min) - \
+            (new_col == row_min)
+        update = active & (min_count <= 0)
+        update[a] = True
+        update_rows = np.flatnonzero(update)
+        row_min[update_rows] = dist[update_rows].min(axis=1)
+        min_count[update_rows] = np.count_nonzero(
+            dist[update_rows] == row_min[update_rows, None], axis=1)
+    return [(int(a), int(b)) for a, b in merges]
+
+
+def _complete_linkage_merges_python(distance_matrix, threshold):
+    """Get the merges of complete linkage clustering without using NumPy."""
+    inf = float('inf')
+    dist = [list(row) for row in distance_matrix]
+    count = len(dist)
+    for i in range(count):
+        dist[i][i] = inf
+    row_min = [min(row) if row else inf for row in dist]
+    min_count = [row.count(r_min) for row, r_min in zip(dist, row_min)]
+    active = list(range(count))
+
+    merges = []
+    while len(merges) < count - 1:
+        min_value = min(row_min[k] for k in active)
+        if not min_value < threshold:
+            break
+        b = max(k for k in active if row_min[k] == min_value)
+        row_a, row_b = None, dist[b]
+        for k in active:
+            if row_b[k] == min_value:
+                a, row_a = k, dist[k]
+                break
+        merges.append((a, b))
+        active.remove(b)
+
+        # the distance to the merged cluster is the maximum distance of its members
+        for k in active:
+            if k == a:
+                continue
+            old_a, old_b = row_a[k], row_b[k]
+            new_dist = old_a if old_a > old_b else old_b
+            row_a[k] = dist[k][a] = new_dist
+            dist[k][b] = inf
+            # update the number of columns at the minimum of the row
+            r_min = row_min[k]
+            min_count[k] -= (old_a == r_min) + (old_b == r_min) - (new_dist == r_min)
+            if min_count[k] <= 0:
+                row_min[k] = min(dist[k])
+                min_count[k] = dist[k].count(row_min[k])
+        row_a[b] = inf
+        row_min[a] = min(row_a)
+        min_count[a] = row_a.count(row_min[a])
+    return merges
+
+
 def _agglomerative_clustering_complete(distance_matrix, apertures, threshold=0.001):
-    """Cluster apertures based on the threshold."""
-
-    # Fill the diagonal with 9999 so a diagonal of zeros will NOT be stored
-    # as min_value.
-    for i in range(len(distance_matrix)):
-        distance_matrix[i][i] = 9999
-
-    # Create starting list of aperture groups. Each aperture starts as its
-    # own group.
-    ap_groups = apertures
-
-    # Set the number of samples and the minimum value of the distance
-    # matrix.
-    n_samples = len(distance_matrix)
-
-    # Set the minimum value of the distance matrix and find the indices of
-    # the minimum value in the distance matrix.
-    min_value, index = _index_and_min(distance_matrix)
-
-    while n_samples > 1 and min_value < threshold:
-        # Combine the two groups and place it at index 0, and remove item
-        # at index 1.
-        ap_groups[index[0]] = [ap_groups[index[0]], ap_groups[index[1]]]
-        ap_groups.pop(index[1])
-
-        # Update the values in the distance matrix. We need the maximum
-        # values between the new cluster and all the remaining apertures or
-        # clusters still in the distance matrix.
-        distance_matrix[index[0]] = \
-            _pairwise_maximum(distance_matrix[index[0]], distance_matrix[index[1]])
-        distance_matrix = _transpose_matrix(distance_matrix)
-        distance_matrix[index[0]] = \
-            _pairwise_maximum(distance_matrix[index[0]], distance_matrix[index[1]])
-
-        # Remove the values at index 1 along both axes.
-        distance_matrix.pop(index[1])
-        distance_matrix = _transpose_matrix(distance_matrix)
-        distance_matrix.pop(index[1])
-
-        # Update the number of samples that are left in the distance matrix.
-        n_samples -= 1
-        # Update the minimum value and the indices.
-        min_value, index = _index_and_min(distance_matrix)
+    """Cluster apertures based on the threshold.
 
-    return ap_groups
+    Args:
+        distance_matrix: A symmetric matrix as a list of lists with the distances
+            between the apertures.
+        apertures: A list of apertures (or aperture identifiers) to be clustered.
+        threshold: A number for the distance below which apertures are clustered.
+
+    Returns:
+        A list of clusters. Each cluster is either a single aperture or a list
+        of two clusters that have been combined.
+    """
+    ap_groups = list(apertures)
+    merged = [False] * len(ap_groups)
+    for a, b in _complete_linkage_merges(distance_matrix, threshold):
+        ap_groups[a] = [ap_groups[a], ap_groups[b]]
+        merged[b] = True
+    return [cluster for cluster, is_merged in zip(ap_groups, merged) if not is_merged]
+
+
+def _vertical_groups(ap_groups, vertical_tolerance):
+    """Split groups of apertures such that each group is within a vertical tolerance.
+    """
+    vertical_groups = []
+    for ap_group in ap_groups:
+        heights = [ap.center.z for ap in ap_group]
+        if np is not None:
+            heights = np.array(heights)
+            vert_dist_matrix = np.abs(heights[:, None] - heights[None, :])
+        else:
+            vert_dist_matrix = [[abs(z_1 - z_2) for z_2 in heights] for z_1 in heights]
+        _ap_groups = _agglomerative_clustering_complete(
+            vert_dist_matrix, ap_group, vertical_tolerance)
+        vertical_groups.extend([list(_flatten(cluster)) for cluster in _ap_groups])
+    return vertical_groups
 
 
 def aperture_view_factor(
@@ -178,33 +280,71 @@ def aperture_view_factor(
     return mtx_file, ap_dict
 
 
-def aperture_view_factor_postprocess(mtx_file, ap_dict, room_apertures, room_based=True):
-    view_factor = []
-    # Read view factor file, convert to one channel output, and divide by
-    # Pi.
-    with open(mtx_file) as mtx_data:
-        for sensor in mtx_data:
-            sensor_split = sensor.strip().split()
-            if len(sensor_split) % 3 == 0:
-                one_channel = sensor_split[::3]
-
-                def convert_to_vf(x):
-                    return float(x) / math.pi
-                view_factor.append(list(map(convert_to_vf, one_channel)))
-
-    ap_view_factor = OrderedDict()
-    # Split the view factor file by the aperture sensor count.
-    for ap_id, value in ap_dict.items():
-        sensor_count = value['sensor_count']
-        ap_vf, view_factor = view_factor[:sensor_count], view_factor[sensor_count:]
-        ap_view_factor[ap_id] = ap_vf
+def aperture_view_factor_mean(mtx_file, ap_dict):
+    """Get the mean view factor to each sky patch for each aperture.
+
+    The matrix is read one chunk of rows at a time and the view factors of the
+    sensors are added to the sums of their aperture such that the whole matrix
+    is never loaded into memory.
+
+    Args:
+        mtx_file: Path to the RGB matrix output of rfluxmtx with one row for each
+            sensor. The matrix can be in ASCII, float or double format. Only the
+            first channel of each sky patch is used.
+        ap_dict: An OrderedDict with aperture identifiers as keys. Each value is
+            a dictionary with a sensor_count key for the number of rows of the
+            aperture in the matrix. The rows of the apertures must follow one
+            another in the same order as the dictionary.
 
+    Returns:
+        An OrderedDict with aperture identifiers as keys and lists of the mean
+        view factor to each sky patch as values.
+    """
+    if np is None:
+        return _aperture_view_factor_mean_python(mtx_file, ap_dict)
+
+    ap_view_factor_mean = OrderedDict()
+    chunks = matrix_array_chunks(mtx_file)
+    chunk, position = None, 0
+    for ap_id, value in ap_dict.items():
+        remaining, row_count, patch_sums = value['sensor_count'], 0, None
+        while remaining > 0:
+            if chunk is None or position == len(chunk):
+                chunk, position = next(chunks, None), 0
+                if chunk is None:  # the matrix has fewer rows than sensors
+                    break
+            view_factor = chunk[position:position + remaining, ::3] / math.pi
+            position += len(view_factor)
+            remaining -= len(view_factor)
+            row_count += len(view_factor)
+            if patch_sums is not None:
+                view_factor = np.vstack((patch_sums, view_factor))
+            # cumsum adds the sensors in order, which matches the rounding of sum
+            patch_sums = np.cumsum(view_factor, axis=0)[-1]
+        ap_view_factor_mean[ap_id] = [] if patch_sums is None \
+            else (patch_sums / row_count).tolist()
+    return ap_view_factor_mean
+
+
+def _aperture_view_factor_mean_python(mtx_file, ap_dict):
+    """Get the mean view factor to each sky patch for each aperture without NumPy."""
     ap_view_factor_mean = OrderedDict()
+    rows = matrix_rows(mtx_file)
+    for ap_id, value in ap_dict.items():
+        row_count, patch_sums = 0, None
+        for row in islice(rows, value['sensor_count']):
+            view_factor = [val / math.pi for val in row[::3]]
+            patch_sums = view_factor if patch_sums is None else \
+                [p_sum + vf for p_sum, vf in zip(patch_sums, view_factor)]
+            row_count += 1
+        ap_view_factor_mean[ap_id] = [] if patch_sums is None \
+            else [p_sum / row_count for p_sum in patch_sums]
+    return ap_view_factor_mean
+
+
+def aperture_view_factor_postprocess(mtx_file, ap_dict, room_apertures, room_based=True):
     # Get the mean view factor per sky patch for each aperture.
-    for ap_id, ap_vf in ap_view_factor.items():
-        ap_t = _transpose_matrix(ap_vf)
-        ap_view_factor_mean[ap_id] = \
-            [sum(sky_patch) / len(sky_patch) for sky_patch in ap_t]
+    ap_view_factor_mean = aperture_view_factor_mean(mtx_file, ap_dict)
 
     if room_based:  # Restructure ap_view_factor_mean.
         _ap_view_factor_mean = {}
@@ -242,21 +382,8 @@ def cluster_view_factor(rmse, room_apertures, apertures, threshold,
             grouped_apertures = [list(_flatten(cluster)) for cluster in _room_ap_groups]
             if vertical_tolerance:
                 # Check groups by vertical tolerance.
-                vertical_groups = []
-                for ap_group in grouped_apertures:
-                    vert_dist_matrix = []
-                    for ap_1 in ap_group:
-                        vert_dist_list = []
-                        for ap_2 in ap_group:
-                            vert_dist = abs(ap_1.center.z - ap_2.center.z)
-                            vert_dist_list.append(vert_dist)
-                        vert_dist_matrix.append(vert_dist_list)
-                    _ap_groups = _agglomerative_clustering_complete(
-                        vert_dist_matrix, ap_group, vertical_tolerance
-                    )
-                    _ap_groups = [list(_flatten(cluster)) for cluster in _ap_groups]
-                    vertical_groups.extend(_ap_groups)
-                grouped_apertures = vertical_groups
+                grouped_apertures = _vertical_groups(
+                    grouped_apertures, vertical_tolerance)
 
             ap_groups[room_id]['aperture_groups'] = grouped_apertures
             ap_groups[room_id]['display_name'] = room_apertures[room_id]['display_name']
@@ -267,20 +394,7 @@ def cluster_view_factor(rmse, room_apertures, apertures, threshold,
         ap_groups = [list(_flatten(cluster)) for cluster in ap_groups]
         if vertical_tolerance:
             # Check groups by vertical tolerance.
-            vertical_groups = []
-            for ap_group in ap_groups:
-                vert_dist_matrix = []
-                for ap_1 in ap_group:
-                    vert_dist_list = []
-                    for ap_2 in ap_group:
-                        vert_dist = abs(ap_1.center.z - ap_2.center.z)
-                        vert_dist_list.append(vert_dist)
-                    vert_dist_matrix.append(vert_dist_list)
-                _ap_groups = _agglomerative_clustering_complete(
-                    vert_dist_matrix, ap_group, vertical_tolerance)
-                _ap_groups = [list(_flatten(cluster)) for cluster in _ap_groups]
-                vertical_groups.extend(_ap_groups)
-            ap_groups = vertical_groups
+            ap_groups = _vertical_groups(ap_groups, vertical_tolerance)
 
     return ap_groups
 
@@ -306,21 +420,8 @@ def cluster_orientation(room_apertures, apertures, room_based=True, vertical_tol
                 grouped_apertures[group_index].append(ap)
             if vertical_tolerance:
                 # Check groups by vertical tolerance.
-                vertical_groups = []
-                for ap_group in grouped_apertures:
-                    vert_dist_matrix = []
-                    for ap_1 in ap_group:
-                        vert_dist_list = []
-                        for ap_2 in ap_group:
-                            vert_dist = abs(ap_1.center.z - ap_2.center.z)
-                            vert_dist_list.append(vert_dist)
-                        vert_dist_matrix.append(vert_dist_list)
-                    _ap_groups = _agglomerative_clustering_complete(
-                        vert_dist_matrix, ap_group, vertical_tolerance
-                    )
-                    _ap_groups = [list(_flatten(cluster)) for cluster in _ap_groups]
-                    vertical_groups.extend(_ap_groups)
-                grouped_apertures = vertical_groups
+                grouped_apertures = _vertical_groups(
+                    grouped_apertures, vertical_tolerance)
 
             ap_groups[room_id]['aperture_groups'] = grouped_apertures
             ap_groups[room_id]['display_name'] = data['display_name']
@@ -342,20 +443,7 @@ def cluster_orientation(room_apertures, apertures, room_based=True, vertical_tol
         ap_groups = grouped_apertures
         if vertical_tolerance:
             # Check groups by vertical tolerance.
-            vertical_groups = []
-            for ap_group in ap_groups:
-                vert_dist_matrix = []
-                for ap_1 in ap_group:
-                    vert_dist_list = []
-                    for ap_2 in ap_group:
-                        vert_dist = abs(ap_1.center.z - ap_2.center.z)
-                        vert_dist_list.append(vert_dist)
-                    vert_dist_matrix.append(vert_dist_list)
-                _ap_groups = _agglomerative_clustering_complete(
-                    vert_dist_matrix, ap_group, vertical_tolerance)
-                _ap_groups = [list(_flatten(cluster)) for cluster in _ap_groups]
-                vertical_groups.extend(_ap_groups)
-            ap_groups = vertical_groups
+            ap_groups = _vertical_groups(ap_groups, vertical_tolerance)
 
     return ap_groups
 
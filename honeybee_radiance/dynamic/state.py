@@ -5,7 +5,7 @@ from __future__ import division
 from .stategeo import StateGeometry
 from ..geometry import Polygon
 from ..modifier import Modifier
-from ..mutil import dict_to_modifier
+from ..mutil import dict_to_modifier, modifier_assignment_changed
 from ..lib.modifiers import white_glow
 
 from ladybug_geometry.geometry3d.face import Face3D
@@ -56,6 +56,7 @@ class _RadianceState(object):
                 'Expected Modifier for RadianceState. Got {}'.format(type(value))
             value.lock()  # lock editing in case modifier has multiple references
         self._modifier = value
+        modifier_assignment_changed()
 
     @property
     def shades(self):
@@ -75,6 +76,7 @@ class _RadianceState(object):
                                 'Got  {}.'.format(type(value)))
         else:
             self._shades = []
+        modifier_assignment_changed()
 
     @property
     def modifier_direct(self):
@@ -97,6 +99,7 @@ class _RadianceState(object):
                 'Expected Modifier for RadianceState. Got {}'.format(type(value))
             value.lock()  # lock editing in case modifier has multiple references
         self._modifier_direct = value
+        modifier_assignment_changed()
 
     @property
     def parent(self):
@@ -113,6 +116,7 @@ class _RadianceState(object):
         for shade in self._shades:
             shade._parent = None
         self._shades = []
+        modifier_assignment_changed()
 
     def add_shades(self, shades):
         """Add an array of Shade objects to this state.
@@ -122,6 +126,7 @@ class _RadianceState(object):
         """
         for shade in shades:
             self._shades.append(self._check_shade(shade))
+        modifier_assignment_changed()
 
     def add_shade(self, shade):
         """Add a Shade object to this state.
@@ -130,6 +135,7 @@ class _RadianceState(object):
             shade: A Shade object to add to the this state.
         """
         self._shades.append(self._check_shade(shade))
+        modifier_assignment_changed()
 
     def move(self, moving_vec):
         """Move all shades assigned to this state along a vector.
@@ -403,6 +409,7 @@ class RadianceSubFaceState(_RadianceState):
                 'Expected Modifier for RadianceState. Got {}'.format(type(value))
             value.lock()  # lock editing in case modifier has multiple references
         self._modifier_direct = value
+        modifier_assignment_changed()
 
     @property
     def vmtx_geometry(self):
@@ -2,7 +2,7 @@
 """Dynamic geometry that can be assigned to individual states."""
 from ..modifier import Modifier
 from ..geometry import Polygon
-from ..mutil import dict_to_modifier  # imports all modifiers classes
+from ..mutil import dict_to_modifier, modifier_assignment_changed  # all modifiers
 from ..lib.modifiers import black, generic_exterior_shade
 
 from honeybee.typing import valid_rad_string
@@ -183,6 +183,7 @@ class StateGeometry(object):
                 'Expected Radiance Modifier for shade. Got {}'.format(type(value))
             value.lock()  # lock editing in case modifier has multiple references
         self._modifier = value
+        modifier_assignment_changed()
 
     @property
     def modifier_direct(self):
@@ -206,6 +207,7 @@ class StateGeometry(object):
                 'Expected Radiance Modifier. Got {}'.format(type(value))
             value.lock()  # lock editing in case modifier has multiple references
         self._modifier_direct = value
+        modifier_assignment_changed()
 
     @property
     def is_opaque(self):
@@ -0,0 +1,189 @@
+"""Lazy loading and on-disk caching of the objects in the standards library.
+
+The objects of the library are kept as dictionaries and are only turned into Python
+objects when they are looked up for the first time. The dictionaries of all objects
+are cached in a JSON file such that later processes do not have to parse the files
+of the standards library again as long as these files have not changed.
+"""
+import os
+import json
+import hashlib
+import tempfile
+
+try:
+    from collections.abc import MutableMapping
+except ImportError:
+    from collections import MutableMapping  # python 2
+
+CACHE_VERSION = 1
+
+
+class LazyLibrary(MutableMapping):
+    """A dictionary of library objects that creates each object on its first lookup.
+
+    Args:
+        load_object: A function that takes the dictionary of an object and
+            returns the Python object.
+        dump_object: A function that takes a Python object and returns a
+            dictionary that can be used with load_object to re-create it.
+
+    Usage:
+
+    .. code-block:: python
+
+        lib = LazyLibrary(modifier_from_dict, modifier_to_dict)
+        lib.add_dict('generic_wall', {'type': 'Plastic', ...})
+        wall = lib['generic_wall']  # the object is only created here
+    """
+    __slots__ = ('_load_object', '_dump_object', '_items', '_unloaded')
+
+    def __init__(self, load_object, dump_object):
+        self._load_object = load_object
+        self._dump_object = dump_object
+        self._items = {}
+        self._unloaded = set()
+
+    def add_dict(self, identifier, obj_dict):
+        """Add the dictionary of an object to be loaded on its first lookup.
+
+        Args:
+            identifier: Text for the identifier of the object.
+            obj_dict: A dictionary of the object.
+        """
+        self._items[identifier] = obj_dict
+        self._unloaded.add(identifier)
+
+    def is_loaded(self, identifier):
+        """Check whether the Python object of an identifier has already been created.
+        """
+        return identifier in self._items and identifier not in self._unloaded
+
+    def to_dicts(self):
+        """Get a list of [identifier, dictionary] for all of the objects in the library.
+        """
+        return [[identifier, self._items[identifier]] if identifier in self._unloaded
+                else [identifier, self._dump_object(self._items[identifier])]
+                for identifier in self._items]
+
+    def __getitem__(self, identifier):
+        obj = self._items[identifier]
+        if identifier in self._unloaded:
+            obj = self._load_object(obj)
+            self._items[identifier] = obj
+            self._unloaded.discard(identifier)
+        return obj
+
+    def __setitem__(self, identifier, obj):
+        self._items[identifier] = obj
+        self._unloaded.discard(identifier)
+
+    def __delitem__(self, identifier):
+        del self._items[identifier]
+        self._unloaded.discard(identifier)
+
+    def __contains__(self, identifier):
+        return identifier in self._items
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __repr__(self):
+        return 'LazyLibrary: [{} objects, {} loaded]'.format(
+            len(self._items), len(self._items) - len(self._unloaded))
+
+
+def library_signature(paths):
+    """Get a signature for the state of the files of a library.
+
+    The signature changes whenever a file is added, removed or modified.
+
+    Args:
+        paths: A list of paths to files or folders from which the library
+            is loaded. For folders, all of the files inside the folder are used.
+
+    Returns:
+        A list with the path, size and modification time of each file.
+    """
+    signature = [CACHE_VERSION]
+    for path in paths:
+        if os.path.isdir(path):
+            file_paths = [os.path.join(path, f) for f in sorted(os.listdir(path))]
+        else:
+            file_paths = [path]
+        for f_path in file_paths:
+            try:
+                f_stat = os.stat(f_path)
+            except OSError:  # the file does not exist
+                signature.append([f_path, None, None])
+                continue
+            if os.path.isfile(f_path):
+                signature.append([f_path, f_stat.st_size, f_stat.st_mtime])
+    return signature
+
+
+def cache_file_path(name, paths):
+    """Get the path to the cache file of a library.
+
+    Args:
+        name: Text for the name of the library (eg. modifiers).
+        paths: A list of paths to files or folders from which the library is loaded.
+            Different paths get different cache files.
+    """
+    paths_hash = hashlib.md5(json.dumps(paths).encode('utf-8')).hexdigest()
+    file_name = 'honeybee_radiance_{}_{}.json'.format(name, paths_hash[:16])
+    return os.path.join(tempfile.gettempdir(), file_name)
+
+
+def read_cache(cache_file, signature):
+    """Read the data of a library from a cache file.
+
+    Args:
+        cache_file: Path to the cache file.
+        signature: The current signature of the library from library_signature.
+
+    Returns:
+        A dictionary with the cached data. None if the cache file does not
+        exist, cannot be read or was written for a different signature.
+    """
+    try:
+        with open(cache_file) as inf:
+            data = json.load(inf)
+    except (IOError, OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get('signature') != signature:
+        return None
+    return data
+
+
+def write_cache(cache_file, signature, data):
+    """Write the data of a library to a cache file.
+
+    The file is first written under a temporary name and then renamed such that
+    other processes never read a partially written cache. Failing to write the
+    cache is not an error since the library is simply parsed again next time.
+
+    Args:
+        cache_file: Path to the cache file.
+        signature: The current signature of the library from library_signature.
+        data: A dictionary of data to be cached, which can be serialized to JSON.
+    """
+    data = dict(data)
+    data['signature'] = signature
+    temp_file = '{}.{}.tmp'.format(cache_file, os.getpid())
+    try:
+        with open(temp_file, 'w') as outf:
+            json.dump(data, outf)
+        try:
+            os.replace(temp_file, cache_file)
+        except AttributeError:  # python 2
+            if os.path.isfile(cache_file):
+                os.remove(cache_file)
+            os.rename(temp_file, cache_file)
+    except (IOError, OSError, TypeError, ValueError):
+        try:
+            os.remove(temp_file)
+        except OSError:
+            pass
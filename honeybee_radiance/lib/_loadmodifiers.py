@@ -3,26 +3,31 @@ from honeybee_radiance.config import folders
 from honeybee_radiance.reader import string_to_dicts
 from honeybee_radiance.mutil import dict_to_modifier, modifier_class_from_type_string
 
+from ._lazylib import LazyLibrary, library_signature, cache_file_path, \
+    read_cache, write_cache
+
 import os
 import json
 
 
-# empty dictionary to hold loaded modifiers
-_loaded_modifiers = {}
-
-
-# first load the honeybee defaults
-with open(folders.defaults_file) as json_file:
-    default_data = json.load(json_file)['modifiers']
-for mod_dict in default_data:
+def _modifier_from_dict(mod_dict):
+    """Get a locked modifier from a dictionary of the library."""
     m_class = modifier_class_from_type_string(mod_dict['type'])
     mod = m_class.from_dict(mod_dict)
     mod.lock()
-    _loaded_modifiers[mod_dict['identifier']] = mod
-_default_mods = set(list(_loaded_modifiers.keys()))
+    return mod
+
 
+def _modifier_to_dict(mod):
+    """Get a dictionary of a modifier in the library."""
+    return mod.to_dict()
 
-# then load modifiers from the user-supplied files
+
+# dictionary to hold the modifiers, which are only created upon their first lookup
+_loaded_modifiers = LazyLibrary(_modifier_from_dict, _modifier_to_dict)
+
+
+# the modifiers from user-supplied files
 def load_modifier_object(mod_dict, user_modifiers):
     """Load a modifier object from a dictionary and add it to the library dict."""
     try:
@@ -68,5 +73,27 @@ def load_modifiers_from_folder(modifier_lib_folder):
     return user_modifiers
 
 
-user_mods = load_modifiers_from_folder(folders.modifier_lib)
-_loaded_modifiers.update(user_mods)
+# load the modifiers from the cache if the library files have not changed
+_lib_paths = [folders.defaults_file, folders.modifier_lib]
+_cache_file = cache_file_path('modifiers', _lib_paths)
+_signature = library_signature(_lib_paths)
+_cache_data = read_cache(_cache_file, _signature)
+if _cache_data is not None:
+    for mod_id, mod_dict in _cache_data['modifiers']:
+        _loaded_modifiers.add_dict(mod_id, mod_dict)
+    _default_mods = set(_cache_data['default_modifiers'])
+else:
+    # first load the honeybee defaults
+    with open(folders.defaults_file) as json_file:
+        default_data = json.load(json_file)['modifiers']
+    for mod_dict in default_data:
+        _loaded_modifiers.add_dict(mod_dict['identifier'], mod_dict)
+    _default_mods = set(list(_loaded_modifiers.keys()))
+
+    # then load modifiers from the user-supplied files
+    user_mods = load_modifiers_from_folder(folders.modifier_lib)
+    _loaded_modifiers.update(user_mods)
+    write_cache(_cache_file, _signature, {
+        'default_modifiers': sorted(_default_mods),
+        'modifiers': _loaded_modifiers.to_dicts()
+    })
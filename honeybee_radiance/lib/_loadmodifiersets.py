@@ -4,25 +4,40 @@ from honeybee_radiance.modifierset import ModifierSet
 
 from ._loadmodifiers import _loaded_modifiers
 
+from ._lazylib import LazyLibrary, library_signature, cache_file_path, \
+    read_cache, write_cache
+
 import os
 import json
 
 
-# empty dictionary to hold loaded modifier sets
-_loaded_modifier_sets = {}
+def _modifier_set_from_dict(mset_dict):
+    """Get a locked modifier set from a dictionary of the library."""
+    if mset_dict['type'] == 'ModifierSetAbridged':
+        modifierset = ModifierSet.from_dict_abridged(mset_dict, _loaded_modifiers)
+    else:
+        modifierset = ModifierSet.from_dict(mset_dict)
+    modifierset.lock()
+    return modifierset
+
 
+def _modifier_set_to_dict(modifierset):
+    """Get a dictionary of a modifier set in the library.
+
+    The dictionary is abridged when all of the modifiers of the set are in the
+    modifier library such that the loaded set uses the same modifier instances.
+    """
+    abridged = all(
+        _loaded_modifiers.get(mod.identifier) is mod
+        for mod in modifierset.modified_modifiers_unique)
+    return modifierset.to_dict(abridged=abridged)
 
-# first load the honeybee defaults
-with open(folders.defaults_file) as json_file:
-    default_data = json.load(json_file)['modifier_sets']
-for mset_dict in default_data:
-    modifierset = ModifierSet.from_dict_abridged(mset_dict, _loaded_modifiers)
-    modifierset.lock()
-    _loaded_modifier_sets[mset_dict['identifier']] = modifierset
-_default_mod_sets = set(list(_loaded_modifier_sets.keys()))
 
+# dictionary to hold the modifier sets, which are only created upon their first lookup
+_loaded_modifier_sets = LazyLibrary(_modifier_set_from_dict, _modifier_set_to_dict)
 
-# then load modifier sets from the user-supplied files
+
+# the modifier sets from user-supplied files
 def load_modifier_set_object(mset_dict, load_mods, mod_sets, misc_mods):
     """Load a modifier set object from a dictionary and add it to the lib dict."""
     try:
@@ -64,6 +79,28 @@ def load_modifiersets_from_folder(modifierset_lib_folder, loaded_modifiers):
     return mod_sets, misc_mods
 
 
-loaded_m_sets, misc_m = \
-    load_modifiersets_from_folder(folders.modifierset_lib, _loaded_modifiers)
-_loaded_modifier_sets.update(loaded_m_sets)
+# load the modifier sets from the cache if the library files have not changed
+_lib_paths = [folders.defaults_file, folders.modifier_lib, folders.modifierset_lib]
+_cache_file = cache_file_path('modifiersets', _lib_paths)
+_signature = library_signature(_lib_paths)
+_cache_data = read_cache(_cache_file, _signature)
+if _cache_data is not None:
+    for mset_id, mset_dict in _cache_data['modifier_sets']:
+        _loaded_modifier_sets.add_dict(mset_id, mset_dict)
+    _default_mod_sets = set(_cache_data['default_modifier_sets'])
+else:
+    # first load the honeybee defaults
+    with open(folders.defaults_file) as json_file:
+        default_data = json.load(json_file)['modifier_sets']
+    for mset_dict in default_data:
+        _loaded_modifier_sets.add_dict(mset_dict['identifier'], mset_dict)
+    _default_mod_sets = set(list(_loaded_modifier_sets.keys()))
+
+    # then load modifier sets from the user-supplied files
+    loaded_m_sets, misc_m = \
+        load_modifiersets_from_folder(folders.modifierset_lib, _loaded_modifiers)
+    _loaded_modifier_sets.update(loaded_m_sets)
+    write_cache(_cache_file, _signature, {
+        'default_modifier_sets': sorted(_default_mod_sets),
+        'modifier_sets': _loaded_modifier_sets.to_dicts()
+    })
@@ -18,6 +18,65 @@ import sys
 if (sys.version_info >= (3, 0)):
     xrange = range
 
+try:
+    import numpy as np
+except ImportError:  # numpy is not available; use the pure Python functions
+    np = None
+
+WHTEFFICACY = 179.0  # luminous efficacy of uniform white light
+SOLAR_CONSTANT_E = 1367  # solar constant W/m^2
+SOLAR_CONSTANT_L = 127500  # solar constant lux
+# solid angle of the solar source
+SUN_SOLID_ANGLE = 2 * math.pi * (1 - math.cos(0.2665 * math.pi / 180))
+
+COEFF_PEREZ = (
+    1.3525, -0.2576, -0.2690, -1.4366, -0.7670, 0.0007, 1.2734, -0.1233, 2.8000,
+    0.6004, 1.2375, 1.000, 1.8734, 0.6297, 0.9738, 0.2809, 0.0356, -0.1246,
+    -0.5718, 0.9938, -1.2219, -0.7730, 1.4148, 1.1016, -0.2054, 0.0367, -3.9128,
+    0.9156, 6.9750, 0.1774, 6.4477, -0.1239, -1.5798, -0.5081, -1.7812, 0.1080,
+    0.2624, 0.0672, -0.2190, -0.4285, -1.1000, -0.2515, 0.8952, 0.0156, 0.2782,
+    -0.1812, -4.5000, 1.1766, 24.7219, -13.0812, -37.7000, 34.8438, -5.0000, 1.5218,
+    3.9229, -2.6204, -0.0156, 0.1597, 0.4199, -0.5562, -0.5484, -0.6654, -0.2672,
+    0.7117, 0.7234, -0.6219, -5.6812, 2.6297, 33.3389, -18.3000, -62.2500, 52.0781,
+    -3.5000, 0.0016, 1.1477, 0.1062, 0.4659, -0.3296, -0.0876, -0.0329, -0.6000,
+    -0.3566, -2.5000, 2.3250, 0.2937, 0.0496, -5.6812, 1.8415, 21.0000, -4.7656,
+    -21.5906, 7.2492, -3.5000, -0.1554, 1.4062, 0.3988, 0.0032, 0.0766, -0.0656,
+    -0.1294, -1.0156, -0.3670, 1.0078, 1.4051, 0.2875, -0.5328, -3.8500, 3.3750,
+    14.0000, -0.9999, -7.1406, 7.5469, -3.4000, -0.1078, -1.0750, 1.5702, -0.0672,
+    0.4016, 0.3017, -0.4844, -1.0000, 0.0211, 0.5025, -0.5119, -0.3000, 0.1922,
+    0.7023, -1.6317, 19.0000, -5.0000, 1.2438, -1.9094, -4.0000, 0.0250, 0.3844,
+    0.2656, 1.0468, -0.3788, -2.4517, 1.4656, -1.0500, 0.0289, 0.4260, 0.3590,
+    -0.3250, 0.1156, 0.7781, 0.0025, 31.0625, -14.5000, -46.1148, 55.3750, -7.2312,
+    0.4050, 13.3500, 0.6234, 1.5000, -0.6426, 1.8564, 0.5636)
+
+DEFANGLE_THETA = (
+    84, 84, 84, 84, 84, 84, 84, 84, 84, 84, 84, 84, 84, 84, 84, 84, 84, 84, 84, 84,
+    84, 84, 84, 84, 84, 84, 84, 84, 84, 84, 72, 72, 72, 72, 72, 72, 72, 72, 72, 72,
+    72, 72, 72, 72, 72, 72, 72, 72, 72, 72, 72, 72, 72, 72, 72, 72, 72, 72, 72, 72,
+    60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60,
+    60, 60, 60, 60, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48,
+    48, 48, 48, 48, 48, 48, 48, 48, 36, 36, 36, 36, 36, 36, 36, 36, 36, 36, 36, 36,
+    36, 36, 36, 36, 36, 36, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 12, 12,
+    12, 12, 12, 12, 0)
+
+DEFANGLE_PHI = (
+    0, 12, 24, 36, 48, 60, 72, 84, 96, 108, 120, 132, 144, 156, 168, 180, 192, 204,
+    216, 228, 240, 252, 264, 276, 288, 300, 312, 324, 336, 348, 0, 12, 24, 36, 48,
+    60, 72, 84, 96, 108, 120, 132, 144, 156, 168, 180, 192, 204, 216, 228, 240, 252,
+    264, 276, 288, 300, 312, 324, 336, 348, 0, 15, 30, 45, 60, 75, 90, 105, 120, 135,
+    150, 165, 180, 195, 210, 225, 240, 255, 270, 285, 300, 315, 330, 345, 0, 15, 30,
+    45, 60, 75, 90, 105, 120, 135, 150, 165, 180, 195, 210, 225, 240, 255, 270, 285,
+    300, 315, 330, 345, 0, 20, 40, 60, 80, 100, 120, 140, 160, 180, 200, 220, 240,
+    260, 280, 300, 320, 340, 0, 30, 60, 90, 120, 150, 180, 210, 240, 270, 300, 330,
+    0, 60, 120, 180, 240, 300, 0)
+
+# clearness bounds and coefficients of the Perez direct normal efficacy model
+CATEGORY_BOUNDS = (1, 1.065, 1.230, 1.500, 1.950, 2.800, 4.500, 6.200, 12.01)
+DIRECT_EFFI_A = (57.20, 98.99, 109.83, 110.34, 106.36, 107.19, 105.75, 101.18)
+DIRECT_EFFI_B = (-4.55, -3.46, -4.90, -5.84, -3.97, -1.25, 0.77, 1.58)
+DIRECT_EFFI_C = (-2.98, -1.21, -1.71, -1.99, -1.75, -1.51, -1.26, -1.10)
+DIRECT_EFFI_D = (117.12, 12.38, -8.81, -4.56, -6.16, -26.73, -34.44, -8.29)
+
 
 def gendaylit(altitude, hoy, directirradiance, diffuseirradiance,
               output_type=0, is_leap_year=False):
@@ -33,56 +92,6 @@ def gendaylit(altitude, hoy, directirradiance, diffuseirradiance,
     Returns:
         solarradiance -- solar irradiance.
     """
-    #
-    coeff_perez = [
-        1.3525, -0.2576, -0.2690, -1.4366, -0.7670, 0.0007, 1.2734, -0.1233, 2.8000,
-        0.6004, 1.2375, 1.000, 1.8734, 0.6297, 0.9738, 0.2809, 0.0356, -0.1246,
-        -0.5718, 0.9938, -1.2219, -0.7730, 1.4148, 1.1016, -0.2054, 0.0367, -3.9128,
-        0.9156, 6.9750, 0.1774, 6.4477, -0.1239, -1.5798, -0.5081, -1.7812, 0.1080,
-        0.2624, 0.0672, -0.2190, -0.4285, -1.1000, -0.2515, 0.8952, 0.0156, 0.2782,
-        -0.1812, -4.5000, 1.1766, 24.7219, -13.0812, -37.7000, 34.8438, -5.0000, 1.5218,
-        3.9229, -2.6204, -0.0156, 0.1597, 0.4199, -0.5562, -0.5484, -0.6654, -0.2672,
-        0.7117, 0.7234, -0.6219, -5.6812, 2.6297, 33.3389, -18.3000, -62.2500, 52.0781,
-        -3.5000, 0.0016, 1.1477, 0.1062, 0.4659, -0.3296, -0.0876, -0.0329, -0.6000,
-        -0.3566, -2.5000, 2.3250, 0.2937, 0.0496, -5.6812, 1.8415, 21.0000, -4.7656,
-        -21.5906, 7.2492, -3.5000, -0.1554, 1.4062, 0.3988, 0.0032, 0.0766, -0.0656,
-        -0.1294, -1.0156, -0.3670, 1.0078, 1.4051, 0.2875, -0.5328, -3.8500, 3.3750,
-        14.0000, -0.9999, -7.1406, 7.5469, -3.4000, -0.1078, -1.0750, 1.5702, -0.0672,
-        0.4016, 0.3017, -0.4844, -1.0000, 0.0211, 0.5025, -0.5119, -0.3000, 0.1922,
-        0.7023, -1.6317, 19.0000, -5.0000, 1.2438, -1.9094, -4.0000, 0.0250, 0.3844,
-        0.2656, 1.0468, -0.3788, -2.4517, 1.4656, -1.0500, 0.0289, 0.4260, 0.3590,
-        -0.3250, 0.1156, 0.7781, 0.0025, 31.0625, -14.5000, -46.1148, 55.3750, -7.2312,
-        0.4050, 13.3500, 0.6234, 1.5000, -0.6426, 1.8564, 0.5636]
-
-    defangle_theta = [
-        84, 84, 84, 84, 84, 84, 84, 84, 84, 84, 84, 84, 84, 84, 84, 84, 84, 84, 84, 84,
-        84, 84, 84, 84, 84, 84, 84, 84, 84, 84, 72, 72, 72, 72, 72, 72, 72, 72, 72, 72,
-        72, 72, 72, 72, 72, 72, 72, 72, 72, 72, 72, 72, 72, 72, 72, 72, 72, 72, 72, 72,
-        60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60,
-        60, 60, 60, 60, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48,
-        48, 48, 48, 48, 48, 48, 48, 48, 36, 36, 36, 36, 36, 36, 36, 36, 36, 36, 36, 36,
-        36, 36, 36, 36, 36, 36, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 12, 12,
-        12, 12, 12, 12, 0]
-
-    defangle_phi = [
-        0, 12, 24, 36, 48, 60, 72, 84, 96, 108, 120, 132, 144, 156, 168, 180, 192, 204,
-        216, 228, 240, 252, 264, 276, 288, 300, 312, 324, 336, 348, 0, 12, 24, 36, 48,
-        60, 72, 84, 96, 108, 120, 132, 144, 156, 168, 180, 192, 204, 216, 228, 240, 252,
-        264, 276, 288, 300, 312, 324, 336, 348, 0, 15, 30, 45, 60, 75, 90, 105, 120, 135,
-        150, 165, 180, 195, 210, 225, 240, 255, 270, 285, 300, 315, 330, 345, 0, 15, 30,
-        45, 60, 75, 90, 105, 120, 135, 150, 165, 180, 195, 210, 225, 240, 255, 270, 285,
-        300, 315, 330, 345, 0, 20, 40, 60, 80, 100, 120, 140, 160, 180, 200, 220, 240,
-        260, 280, 300, 320, 340, 0, 30, 60, 90, 120, 150, 180, 210, 240, 270, 300, 330,
-        0, 60, 120, 180, 240, 300, 0]
-
-    WHTEFFICACY = 179.0  # luminous efficacy of uniform white light
-
-    # calculate solar direction
-    # daynumber = datetime(2017, month, day, int(hour)).timetuple().tm_yday
-
-    # print '# Solar altitude and azimuth: %.2f %.2f' % (sun.altitude, sun.azimuth - 180)
-    # print '# Day number: %d' % daynumber
-    # print -1 * sun.sun_vector
     daynumber = int(hoy / 24) + 1
     total_days = 365 if not is_leap_year else 365 + 24
     day_angle = 2 * math.pi * (daynumber - 1) / total_days
@@ -93,7 +102,6 @@ def gendaylit(altitude, hoy, directirradiance, diffuseirradiance,
 
     sunzenith = 90 - altitude
 
-    # print '#Zenith: %f' % sunzenith
     if directirradiance + diffuseirradiance == 0 or altitude <= 0:
         return 0
 
@@ -105,8 +113,6 @@ def gendaylit(altitude, hoy, directirradiance, diffuseirradiance,
 
     skyclearness, skybrightness = check_parametrization(skyclearness, skybrightness)
 
-    # print '# clearness: %f, brighness: %f' % (skyclearness, skybrightness)
-
     # diffuse horizontal illuminance
     diffuseilluminance = diffuseirradiance * \
         glob_h_diffuse_effi_perez(skyclearness, skybrightness, sunzenith)
@@ -117,58 +123,149 @@ def gendaylit(altitude, hoy, directirradiance, diffuseirradiance,
     directilluminance, diffuseilluminance = \
         check_input_values(directilluminance, diffuseilluminance, altitude)
 
-    # print '# Illuminance direct %f, diffuse %f' \
-    # % (directilluminance, diffuseilluminance)
+    # the luminance distribution of the sky only affects the normalization of the
+    # diffuse sky, which is not part of the output. see sky_luminance_perez for it.
 
-    # calculate sky
-    #  read the angles * \
-    half_sun_angle = 0.2665
-    theta_o = defangle_theta
-    phi_o = defangle_phi
-    lv_mod = []  # 145 illuminance values
+    #  calculation for the solar source * \
+    if output_type == 0:
+        solarradiance = directilluminance / SUN_SOLID_ANGLE / WHTEFFICACY
+    elif output_type == 1:
+        solarradiance = directirradiance / SUN_SOLID_ANGLE
+    else:
+        solarradiance = directilluminance / SUN_SOLID_ANGLE
 
-    #  parameters for the perez model * \
-    skybrightness = \
-        coeff_lum_perez(radians(sunzenith), skyclearness, skybrightness, coeff_perez)
+    return solarradiance
 
-    # calculation of the modelled luminance * \
-    for j in xrange(145):
-        dzeta, gamma = theta_phi_to_dzeta_gamma(
-            radians(theta_o[j]), radians(phi_o[j]), radians(sunzenith)
-        )
 
-        v = calc_rel_lum_perez(
-            dzeta, gamma, radians(sunzenith), skyclearness, skybrightness, coeff_perez
-        )
+def gendaylit_batch(altitudes, hoys, directirradiances, diffuseirradiances,
+                    output_type=0, is_leap_year=False):
+    """Get the solar irradiance for several sun positions at once.
 
-        lv_mod.append(v)
-        # print "theta, phi, lv_mod %f\t %f\t %f\n" % (theta_o[j], phi_o[j], lv_mod[j])
+    The output is identical to calling gendaylit for each sun position but the
+    calculation is vectorized when NumPy is available.
 
-    #   integration of luminance for the normalization factor, diffuse part of the sky
-    diffnormalization = integ_lv(lv_mod, theta_o)
+    Args:
+        altitudes: A list of sun altitudes in degrees.
+        hoys: A list of hours of the year that align with the altitudes.
+        directirradiances: A list of direct irradiance values.
+        diffuseirradiances: A list of diffuse irradiance values.
+        output_type: An integer between 0-2. 0=output in W/m^2/sr visible,
+            1=output in W/m^2/sr solar, 2=output in candela/m^2 (default: 0).
+        is_leap_year: Set to True if the hoys are for a leap year (default: False).
+
+    Returns:
+        A list of solar irradiance values with one value for each sun position.
+    """
+    if np is None:
+        return [
+            gendaylit(alt, hoy, dir_irr, diff_irr, output_type, is_leap_year)
+            for alt, hoy, dir_irr, diff_irr in
+            zip(altitudes, hoys, directirradiances, diffuseirradiances)
+        ]
+
+    altitude = np.minimum(np.asarray(altitudes, dtype=np.float64), 87.0)
+    hoy = np.asarray(hoys, dtype=np.float64)
+    directirradiance = np.asarray(directirradiances, dtype=np.float64)
+    diffuseirradiance = np.asarray(diffuseirradiances, dtype=np.float64)
+    assert altitude.shape == hoy.shape == directirradiance.shape == \
+        diffuseirradiance.shape, 'The length of the input lists must be the same.'
+    solarradiance = np.zeros(altitude.shape)
+    sun_up = (directirradiance + diffuseirradiance != 0) & (altitude > 0)
+    if not sun_up.any():
+        return solarradiance.tolist()
+    sunzenith = 90 - altitude[sun_up]
+    daynumber = np.floor(hoy[sun_up] / 24) + 1
+    total_days = 365 if not is_leap_year else 365 + 24
+    day_angle = 2 * math.pi * (daynumber - 1) / total_days
+
+    directirradiance, diffuseirradiance = _check_input_values_array(
+        directirradiance[sun_up], diffuseirradiance[sun_up])
+
+    # NumPy's exp and log can differ from the math module in the last digit
+    # so the math module is used to get the same results as gendaylit
+    skybrightness = diffuseirradiance * _math_map(air_mass, sunzenith) / \
+        (SOLAR_CONSTANT_E * _math_map(get_eccentricity, day_angle))
+    skyclearness = sky_clearness(diffuseirradiance, directirradiance, sunzenith)
+
+    skyclearness = np.where(skyclearness < 1.0, 1.0, skyclearness)
+    skyclearness = np.where(skyclearness > 12.01, 12.01 - 0.001, skyclearness)
+    skybrightness = np.clip(skybrightness, 0.01, 0.6)
+
+    # the diffuse illuminance is always larger than zero and does not affect the
+    # direct illuminance. only the direct illuminance is needed for the output.
+    category = np.searchsorted(CATEGORY_BOUNDS[1:8], skyclearness, side='right')
+    zenith_exp = _math_map(
+        lambda z: math.exp(5.73 * z * math.pi / 180 - 5), sunzenith)
+    directeffi = np.take(DIRECT_EFFI_A, category) + \
+        np.take(DIRECT_EFFI_B, category) * 2 + \
+        np.take(DIRECT_EFFI_C, category) * zenith_exp + \
+        np.take(DIRECT_EFFI_D, category) * skybrightness
+    directilluminance = directirradiance * np.where(directeffi < 0, 0, directeffi)
+    if (directilluminance > SOLAR_CONSTANT_L).any():
+        raise ValueError("Warning: direct illuminance exceeds solar constant\n")
 
-    # normalization coefficient in lumen or in watt * \
     if output_type == 0:
-        diffnormalization = diffuseilluminance / diffnormalization / WHTEFFICACY
+        solarradiance[sun_up] = directilluminance / SUN_SOLID_ANGLE / WHTEFFICACY
     elif output_type == 1:
-        diffnormalization = diffuseirradiance / diffnormalization
-    elif output_type == 2:
-        diffnormalization = diffuseilluminance / diffnormalization
+        solarradiance[sun_up] = directirradiance / SUN_SOLID_ANGLE
+    else:
+        solarradiance[sun_up] = directilluminance / SUN_SOLID_ANGLE
 
-    #  calculation for the solar source * \
-    if output_type == 0:
-        solarradiance = directilluminance / \
-            (2 * math.pi * (1 - math.cos(half_sun_angle * math.pi / 180))) / WHTEFFICACY
+    return solarradiance.tolist()
 
-    elif output_type == 1:
-        solarradiance = directirradiance / \
-            (2 * math.pi * (1 - math.cos(half_sun_angle * math.pi / 180)))
 
-    else:
-        solarradiance = directilluminance / \
-            (2 * math.pi * (1 - math.cos(half_sun_angle * math.pi / 180)))
+def _check_input_values_array(directilluminance, diffuseilluminance):
+    """Validity of the direct and diffuse components for arrays of sun-up values."""
+    directilluminance = np.where(directilluminance < 0, 0.0, directilluminance)
+    diffuseilluminance = np.where(diffuseilluminance < 0, 0.0, diffuseilluminance)
+
+    if (directilluminance + diffuseilluminance == 0).any():
+        raise ValueError("Warning: zero illuminance at sun altitude > 0\n")
+
+    if (directilluminance > SOLAR_CONSTANT_L).any():
+        raise ValueError("Warning: direct illuminance exceeds solar constant\n")
+
+    diffuseilluminance = np.where(
+        (directilluminance != 0) & (diffuseilluminance == 0),
+        0.00000001, diffuseilluminance)
+
+    return directilluminance, diffuseilluminance
+
+
+def _math_map(function, values):
+    """Apply a function from the math module to each item of a 1D array."""
+    return np.array([function(v) for v in values.tolist()], dtype=np.float64)
 
-    return solarradiance
+
+def sky_luminance_perez(sunzenith, skyclearness, skybrightness):
+    """Get the relative luminance of the 145 patches of the Perez sky.
+
+    Args:
+        sunzenith: Sun zenith angle in degrees.
+        skyclearness: Perez sky's clearness after check_parametrization.
+        skybrightness: Perez sky's brightness after check_parametrization.
+
+    Returns:
+        A tuple with the list of 145 relative luminance values and the integration
+        of these values that is used to normalize the diffuse sky.
+    """
+    #  parameters for the perez model * \
+    skybrightness = coeff_lum_perez(
+        radians(sunzenith), skyclearness, skybrightness, COEFF_PEREZ)
+
+    # calculation of the modelled luminance * \
+    lv_mod = []  # 145 illuminance values
+    for j in xrange(145):
+        dzeta, gamma = theta_phi_to_dzeta_gamma(
+            radians(DEFANGLE_THETA[j]), radians(DEFANGLE_PHI[j]), radians(sunzenith)
+        )
+        v = calc_rel_lum_perez(
+            dzeta, gamma, radians(sunzenith), skyclearness, skybrightness, COEFF_PEREZ
+        )
+        lv_mod.append(v)
+
+    #   integration of luminance for the normalization factor, diffuse part of the sky
+    return lv_mod, integ_lv(lv_mod, DEFANGLE_THETA)
 
 
 def radians(degres):
@@ -283,10 +380,9 @@ def sky_clearness(diffuseirradiance, directirradiance, sunzenith):
 
 
 def sky_brightness(diffuseirradiance, sunzenith, day_angle):
-    solar_constant_e = 1367    # solar constant W/m^2
     """Perez sky's brightness"""
     brighness = diffuseirradiance * \
-        air_mass(sunzenith) / (solar_constant_e * get_eccentricity(day_angle))
+        air_mass(sunzenith) / (SOLAR_CONSTANT_E * get_eccentricity(day_angle))
     return brighness
 
 
@@ -385,26 +481,17 @@ def glob_h_diffuse_effi_perez(skyclearness, skybrightness, sunzenith):
 def direct_n_effi_perez(skyclearness, skybrightness, sunzenith):
     """Direct normal efficacy model, according to PEREZ."""
     atm_preci_water = 2
-    # #  initialize category bounds(clearness index bounds) * \
-    category_bounds = (1, 1.065, 1.230, 1.500, 1.950, 2.800, 4.500, 6.200, 12.01)
-
-    # #  initialize model coefficients * \
-    a = (57.20, 98.99, 109.83, 110.34, 106.36, 107.19, 105.75, 101.18)
-
-    b = (-4.55, -3.46, -4.90, -5.84, -3.97, -1.25, 0.77, 1.58)
-
-    c = (-2.98, -1.21, -1.71, -1.99, -1.75, -1.51, -1.26, -1.10)
-
-    d = (117.12, 12.38, -8.81, -4.56, -6.16, -26.73, -34.44, -8.29)
 
     category_number = -1
     for i in xrange(1, 8):
-        if category_bounds[i - 1] <= skyclearness < category_bounds[i]:
+        if CATEGORY_BOUNDS[i - 1] <= skyclearness < CATEGORY_BOUNDS[i]:
             category_number = i - 1
 
-    value = a[category_number] + b[category_number] * atm_preci_water + \
-        c[category_number] * math.exp(5.73 * sunzenith * math.pi / 180 - 5) + \
-        d[category_number] * skybrightness
+    value = DIRECT_EFFI_A[category_number] + \
+        DIRECT_EFFI_B[category_number] * atm_preci_water + \
+        DIRECT_EFFI_C[category_number] * \
+        math.exp(5.73 * sunzenith * math.pi / 180 - 5) + \
+        DIRECT_EFFI_D[category_number] * skybrightness
 
     if value < 0:
         value = 0
@@ -414,7 +501,6 @@ def direct_n_effi_perez(skyclearness, skybrightness, sunzenith):
 
 def check_input_values(directilluminance, diffuseilluminance, altitude):
     """Validity of the direct and diffuse components."""
-    solar_constant_l = 127500   # solar constant lux
     if directilluminance < 0:
         directilluminance = 0.0
     if diffuseilluminance < 0:
@@ -423,7 +509,7 @@ def check_input_values(directilluminance, diffuseilluminance, altitude):
     if directilluminance + diffuseilluminance == 0 and altitude > 0:
         raise ValueError("Warning: zero illuminance at sun altitude > 0\n")
 
-    if directilluminance > solar_constant_l:
+    if directilluminance > SOLAR_CONSTANT_L:
         raise ValueError("Warning: direct illuminance exceeds solar constant\n")
 
     if directilluminance != 0 and diffuseilluminance == 0:
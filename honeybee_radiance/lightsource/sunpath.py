@@ -12,14 +12,24 @@ non climate-based sunpath for solar access studies.
 
 from ..modifier.material import Light
 from ..geometry import Source
-from ._gendaylit import gendaylit
+from ._gendaylit import gendaylit_batch, _math_map
 
 from ladybug.sunpath import Sunpath as LBSunpath
+from ladybug.dt import DateTime
+from ladybug_geometry.geometry3d.pointvector import Vector3D
 from ladybug.location import Location
 from ladybug.wea import Wea
 
 import os
+import math
 import warnings
+from array import array
+from collections import OrderedDict
+
+try:
+    import numpy as np
+except ImportError:  # numpy is not available; use the pure Python functions
+    np = None
 
 try:
     from itertools import izip as zip
@@ -28,6 +38,21 @@ except ImportError:
     # python 3
     writemode = 'w'
 
+# cache of the sun altitudes and vectors for the most recent locations and timesteps
+_SUN_POSITIONS_CACHE = OrderedDict()
+# maximum number of values kept in the cache, which is the altitude and the three
+# vector coordinates of two annual sunpaths at a 1-minute timestep (~34 MB)
+SUN_POSITIONS_CACHE_SIZE = 2 * 4 * 527040
+
+# the timesteps per hour that are supported by ladybug
+TIMESTEPS = (1, 2, 3, 4, 5, 6, 10, 12, 15, 20, 30, 60)
+
+# the day fraction that ladybug uses for the solar geometry and the float hour of
+# each minute of the day
+_DAY_MINUTES = tuple(
+    (round(minute / 1440.0, 2), minute // 60 + (minute % 60) / 60.0)
+    for minute in range(1440))
+
 
 class Sunpath(object):
     """A Radiance-based sun-path.
@@ -70,37 +95,41 @@ class Sunpath(object):
     def _solar_calc(self, hoys, wea, output_type, leap_year=False,
                     reverse_vectors=False):
         """Calculate sun vectors and radiance values from the properties."""
-        solar_calc = LBSunpath.from_location(self.location, self.north)
-        solar_calc.is_leap_year = leap_year
-
         if not hoys:
             # set hours to an annual hourly sunpath
             hoys = range(8760) if not leap_year else range(8760 + 24)
+        hoys = list(hoys)
 
+        all_altitudes, all_vectors = \
+            sun_positions(self.location, self.north, hoys, leap_year)
         sun_up_hours = []
         sun_vectors = []
         radiance_values = []
         altitudes = []
-        for hour in hoys:
-            sun = solar_calc.calculate_sun_from_hoy(hour)
-            if sun.altitude < 0:
+        for hour, altitude, vector in zip(hoys, all_altitudes, all_vectors):
+            if altitude < 0:
                 continue
-            sun_vectors.append(sun.sun_vector)
+            sun_vectors.append(vector)
             sun_up_hours.append(hour)
-            altitudes.append(sun.altitude)
+            altitudes.append(altitude)
         # calculate irradiance value
         if wea:
             # this is a climate_based sunpath. Get the values from wea
             assert isinstance(wea, Wea), 'Expected Wea not %s' % type(wea)
 
-            for altitude, hoy in zip(altitudes, sun_up_hours):
-                dnr, dhr = wea.get_irradiance_value_for_hoy(hoy)
-                if dnr == 0:
-                    radiance_value = 0
-                else:
-                    radiance_value = gendaylit(
-                        altitude, hoy, dnr, dhr, output_type, leap_year)
-                radiance_values.append(int(radiance_value))
+            irradiance = [wea.get_irradiance_value_for_hoy(hoy) for hoy in sun_up_hours]
+            # suns without direct normal irradiance have a value of 0
+            sun_indices = [i for i, irr in enumerate(irradiance) if irr[0] != 0]
+            radiance_values = [0] * len(sun_up_hours)
+            sun_values = gendaylit_batch(
+                [altitudes[i] for i in sun_indices],
+                [sun_up_hours[i] for i in sun_indices],
+                [irradiance[i][0] for i in sun_indices],
+                [irradiance[i][1] for i in sun_indices],
+                output_type, leap_year
+            )
+            for i, radiance_value in zip(sun_indices, sun_values):
+                radiance_values[i] = int(radiance_value)
         else:
             radiance_values = [1e6] * len(sun_up_hours)
 
@@ -245,3 +274,230 @@ class Sunpath(object):
     def __repr__(self):
         """Sunpath representation."""
         return "Sunpath: %s" % self.location.city
+
+
+def sun_positions(location, north=0, hoys=None, leap_year=False):
+    """Get the altitudes and sun vectors for a list of hours of the year.
+
+    The result is identical to calling ladybug's Sunpath.calculate_sun_from_hoy for
+    each hour but the declination and the equation of time are only calculated once
+    for each day fraction and the altitudes and vectors of all of the hours are
+    calculated together. The altitudes and vector coordinates of the most recent
+    locations and timesteps are cached such that repeated calls do not recalculate
+    them. Use clear_sun_positions_cache to release the memory of the cache.
+
+    Hours that are not on a whole minute or that are outside of the year are not
+    cached and are calculated with ladybug.
+
+    Args:
+        location: A Ladybug location.
+        north: Sunpath north angle. (Default: 0).
+        hoys: A list of hours of the year. By default all the hours of the year
+            are used.
+        leap_year: Set to True if hoys are for a leap year (default: False).
+
+    Returns:
+        A tuple with two items.
+
+        -   altitudes: A tuple of sun altitudes in degrees for each hour.
+
+        -   sun_vectors: A tuple of ladybug_geometry Vector3D for each hour. The
+            vectors go from the sun towards the ground.
+    """
+    if hoys is None:
+        hoys = range(8760) if not leap_year else range(8760 + 24)
+    moys = [int(round(hoy * 60)) for hoy in hoys]
+    hour_count = 8760 + 24 if leap_year else 8760
+    cached = [0 <= moy < hour_count * 60 and abs(hoy * 60 - moy) < 1e-6
+              for hoy, moy in zip(hoys, moys)]
+    # use the coarsest timestep that includes all of the cached hours
+    timestep = next(
+        t for t in TIMESTEPS
+        if all(moy % (60 // t) == 0 for moy, c in zip(moys, cached) if c))
+    step = 60 // timestep
+
+    key = (location.latitude, location.longitude, location.time_zone, north,
+           timestep, leap_year)
+    try:
+        positions = _SUN_POSITIONS_CACHE.pop(key)
+    except KeyError:
+        count = hour_count * timestep
+        positions = tuple(array('d', [float('nan')]) * count for _ in range(4))
+    altitudes, xs, ys, zs = positions
+
+    # calculate the positions that are not in the cache
+    solar_calc = LBSunpath.from_location(location, north)
+    solar_calc.is_leap_year = leap_year
+    missing = sorted(set(
+        moy for moy, c in zip(moys, cached)
+        if c and math.isnan(altitudes[moy // step])))
+    if missing:
+        calculated = _calculate_sun_positions(solar_calc, missing, leap_year)
+        for moy, alt, x, y, z in zip(missing, *calculated):
+            i = moy // step
+            altitudes[i], xs[i], ys[i], zs[i] = alt, x, y, z
+
+    _SUN_POSITIONS_CACHE[key] = positions
+    _trim_sun_positions_cache()
+
+    sun_alts, sun_vectors = [], []
+    for hoy, moy, c in zip(hoys, moys, cached):
+        if c:
+            i = moy // step
+            sun_alts.append(altitudes[i])
+            sun_vectors.append(Vector3D(xs[i], ys[i], zs[i]))
+        else:
+            sun = solar_calc.calculate_sun_from_hoy(hoy)
+            sun_alts.append(sun.altitude)
+            sun_vectors.append(sun.sun_vector)
+    return tuple(sun_alts), tuple(sun_vectors)
+
+
+def clear_sun_positions_cache():
+    """Remove all of the sun positions that are cached by sun_positions."""
+    _SUN_POSITIONS_CACHE.clear()
+
+
+def _trim_sun_positions_cache():
+    """Remove the oldest sun positions until the cache fits SUN_POSITIONS_CACHE_SIZE.
+    """
+    size = sum(len(alts) * 4 for alts, _, _, _ in _SUN_POSITIONS_CACHE.values())
+    while size > SUN_POSITIONS_CACHE_SIZE and _SUN_POSITIONS_CACHE:
+        alts = _SUN_POSITIONS_CACHE.popitem(last=False)[1][0]
+        size -= len(alts) * 4
+
+
+def _calculate_sun_positions(solar_calc, moys, leap_year):
+    """Calculate the altitudes and sun vectors for a list of minutes of the year.
+
+    This follows the steps of ladybug's Sunpath.calculate_sun_from_date_time and
+    Sun.sun_vector. The declination and the equation of time are calculated with
+    ladybug once for each date and rounded day fraction that ladybug uses and the
+    rest of the steps are calculated for all of the minutes together, with NumPy
+    when it is available.
+
+    Args:
+        solar_calc: A ladybug Sunpath for the location and north angle.
+        moys: A list of integers for minutes of the year.
+        leap_year: Set to True if moys are for a leap year.
+
+    Returns:
+        A tuple of four lists for the altitudes and the x, y and z coordinates of
+        the sun vectors.
+    """
+    sin_lat, cos_lat = math.sin(solar_calc._latitude), math.cos(solar_calc._latitude)
+    longitude_minutes = 4 * math.degrees(solar_calc._longitude)
+    time_zone_minutes = 60 * solar_calc.time_zone
+
+    # solar time in minutes and the declination terms of each minute
+    geometries = {}
+    sol_times, sin_decs, cos_decs = [], [], []
+    for moy in moys:
+        doy, minute = divmod(moy, 1440)
+        fraction, hour = _DAY_MINUTES[minute]
+        key = (doy, fraction)
+        try:
+            sin_dec, cos_dec, eq_of_time = geometries[key]
+        except KeyError:
+            sol_dec, eq_of_time = solar_calc._calculate_solar_geometry(
+                DateTime.from_moy(moy, leap_year))
+            sin_dec, cos_dec = math.sin(sol_dec), math.cos(sol_dec)
+            geometries[key] = sin_dec, cos_dec, eq_of_time
+        sol_times.append(((hour * 60 + eq_of_time + longitude_minutes -
+                           time_zone_minutes) % 1440) / 60 * 60)
+        sin_decs.append(sin_dec)
+        cos_decs.append(cos_dec)
+
+    north = math.radians(solar_calc.north_angle)
+    if np is None:
+        return _sun_positions_python(
+            sol_times, sin_decs, cos_decs, sin_lat, cos_lat, north)
+    return _sun_positions_numpy(
+        np.array(sol_times), np.array(sin_decs), np.array(cos_decs),
+        sin_lat, cos_lat, north)
+
+
+def _sun_positions_python(sol_times, sin_decs, cos_decs, sin_lat, cos_lat, north):
+    """Calculate the altitudes and sun vectors with pure Python."""
+    sin_north, cos_north = math.sin(north), math.cos(north)
+    altitudes, xs, ys, zs = [], [], [], []
+    for sol_time, sin_dec, cos_dec in zip(sol_times, sin_decs, cos_decs):
+        hour_angle = sol_time / 4 + 180 if sol_time < 0 else sol_time / 4 - 180
+        zenith = math.acos(sin_lat * sin_dec +
+                           cos_lat * cos_dec * math.cos(math.radians(hour_angle)))
+        altitude = 90 - math.degrees(zenith)
+        altitude += _atmospheric_refraction(altitude) / 3600
+
+        az_init = ((sin_lat * math.cos(zenith)) - sin_dec) / \
+            (cos_lat * math.sin(zenith))
+        try:
+            if hour_angle > 0:
+                azimuth = (math.degrees(math.acos(az_init)) + 180) % 360
+            else:
+                azimuth = (540 - math.degrees(math.acos(az_init))) % 360
+        except ValueError:  # perfect solar noon yields math domain error
+            azimuth = 180
+
+        alt_rad, az_rad = math.radians(altitude), -math.radians(azimuth)
+        cos_alt = math.cos(alt_rad)
+        x, y = -(math.sin(az_rad) * cos_alt), math.cos(az_rad) * cos_alt
+        if north != 0:
+            x, y = cos_north * x - sin_north * y, sin_north * x + cos_north * y
+        altitudes.append(altitude)
+        xs.append(-x)
+        ys.append(-y)
+        zs.append(-math.sin(alt_rad))
+    return altitudes, xs, ys, zs
+
+
+def _sun_positions_numpy(sol_times, sin_decs, cos_decs, sin_lat, cos_lat, north):
+    """Calculate the altitudes and sun vectors with NumPy arrays.
+
+    NumPy's arccos and tan do not always round the same way as the math module and
+    they are applied to each item with math.acos and math.tan.
+    """
+    hour_angles = np.where(sol_times < 0, sol_times / 4 + 180, sol_times / 4 - 180)
+    zeniths = _math_map(
+        math.acos,
+        sin_lat * sin_decs + cos_lat * cos_decs * np.cos(np.radians(hour_angles)))
+    altitudes = 90 - np.degrees(zeniths)
+    altitudes += _math_map(_atmospheric_refraction, altitudes) / 3600
+
+    az_init = ((sin_lat * np.cos(zeniths)) - sin_decs) / (cos_lat * np.sin(zeniths))
+    az_angles = _math_map(_acos_degrees, az_init)
+    azimuths = np.where(
+        np.isnan(az_angles), 180,
+        np.where(hour_angles > 0, (az_angles + 180) % 360, (540 - az_angles) % 360))
+
+    alt_rads, az_rads = np.radians(altitudes), -np.radians(azimuths)
+    cos_alts = np.cos(alt_rads)
+    xs, ys = -(np.sin(az_rads) * cos_alts), np.cos(az_rads) * cos_alts
+    if north != 0:
+        sin_north, cos_north = math.sin(north), math.cos(north)
+        xs, ys = cos_north * xs - sin_north * ys, sin_north * xs + cos_north * ys
+    return (altitudes.tolist(), (-xs).tolist(), (-ys).tolist(),
+            (-np.sin(alt_rads)).tolist())
+
+
+def _atmospheric_refraction(altitude):
+    """Get the approximate atmospheric refraction in arc seconds for an altitude."""
+    if altitude > 85:
+        return 0
+    elif altitude > 5:
+        return 58.1 / math.tan(math.radians(altitude)) - \
+            0.07 / (math.tan(math.radians(altitude))) ** 3 + \
+            0.000086 / (math.tan(math.radians(altitude))) ** 5
+    elif altitude > -0.575:
+        return 1735 + altitude * \
+            (-518.2 + altitude * (103.4 + altitude * (-12.79 + altitude * 0.711)))
+    else:
+        return -20.772 / math.tan(math.radians(altitude))
+
+
+def _acos_degrees(value):
+    """Get the arc cosine of a value in degrees or NaN if it is out of the domain."""
+    try:
+        return math.degrees(math.acos(value))
+    except ValueError:
+        return float('nan')
+
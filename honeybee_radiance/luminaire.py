@@ -2,11 +2,19 @@
 import os
 import io
 import math
+import json
+import hashlib
 
 from honeybee.typing import clean_rad_string
 from ladybug_geometry.geometry3d import Vector3D, Point3D
 from honeybee_radiance_command.ies2rad import Ies2rad, Ies2radOptions
 from honeybee_radiance.config import folders
+from honeybee_radiance.parallel import run_in_parallel
+
+try:
+    import numpy as np
+except ImportError:  # numpy is not available; use the pure Python functions
+    np = None
 
 
 class Luminaire(object):
@@ -129,7 +137,7 @@ class Luminaire(object):
         if isinstance(ies_input, str) and os.path.isfile(ies_input):
             self._ies_path = ies_input
             with io.open(ies_input, 'r', encoding='utf-8', errors='ignore') as f:
-                self._ies_content = f.read()
+                self.ies_content = f.read()
             return
 
         # IES content as a string
@@ -137,7 +145,7 @@ class Luminaire(object):
             text = ies_input.lstrip()
             if text.upper().startswith('IESNA'):
                 self._ies_path = ies_input
-                self._ies_content = ies_input
+                self.ies_content = ies_input
                 return
 
         raise IOError(
@@ -152,6 +160,10 @@ class Luminaire(object):
     @ies_content.setter
     def ies_content(self, content):
         self._ies_content = content
+        # the photometric data is parsed again from the new content when it is used
+        self._vertical_angles = None
+        self._horizontal_angles = None
+        self._candela_values = None
 
     @property
     def identifier(self):
@@ -354,33 +366,7 @@ class Luminaire(object):
         outname = outname or self.identifier
         options.o = outname
 
-        if units is None:
-            units = 'm'
-        units = str(units).strip().lower()
-        unit_map = {
-            'm': 'm',
-            'meter': 'm',
-            'meters': 'm',
-            'mm': 'm/1000',
-            'millimeter': 'm/1000',
-            'millimeters': 'm/1000',
-            'cm': 'm/100',
-            'centimeter': 'm/100',
-            'centimeters': 'm/100',
-            'ft': 'f',
-            'foot': 'f',
-            'feet': 'f',
-            'in': 'i',
-            'inch': 'i',
-            'inches': 'i'
-        }
-        if units not in unit_map:
-            raise ValueError(
-                "Invalid units '{}'. Valid options are: {}"
-                .format(units, ', '.join(sorted(unit_map.keys())))
-            )
-
-        options.d = unit_map[units]
+        options.d = self._ies2rad_units(units)
 
         multiplier = self.light_loss_factor * self.candela_multiplier
 
@@ -410,28 +396,12 @@ class Luminaire(object):
         if multiplier != 1:
             options.m = multiplier
 
+        libdir, prefdir = self._ies2rad_folders(libdir, prefdir)
         if libdir:
-            libdir = os.path.normpath(libdir).replace('\\', '/')
-            if not os.path.isabs(libdir) and not libdir.startswith('.'):
-                libdir = './' + libdir
             options.l = libdir
-
         if prefdir:
-            prefdir = os.path.normpath(prefdir).replace('\\', '/')
-
-            if libdir and prefdir.startswith('./'):
-                prefdir = prefdir[2:]
-            elif not libdir and not prefdir.startswith('.'):
-                prefdir = './' + prefdir
-
-            if not prefdir.startswith('.'):
-                prefdir = './' + prefdir
-
             options.p = prefdir
-
-        rad_path = os.path.join(prefdir or '.', '{}.rad'.format(outname)).replace('\\', '/')
-        if not os.path.isabs(rad_path) and not rad_path.startswith('.'):
-            rad_path = './' + rad_path
+        rad_path = self._ies2rad_rad_path(prefdir, outname)
 
         command.options = options
 
@@ -444,7 +414,10 @@ class Luminaire(object):
         """Create a combined scene description of LuminaireZone and Luminaire.
 
         This method will create a scene description where there scene from ies2rad
-        is added in the correct location via xform.
+        is added in the correct location via xform. The output of ies2rad is named
+        after the ies2rad_outname of the luminaire such that the output of an
+        earlier export or of another luminaire with the same IES content, units
+        and lamp is reused instead of running ies2rad again.
         
         Args:
             libdir: Set the library directory.
@@ -461,12 +434,15 @@ class Luminaire(object):
             Combined Radiance scene description of LuminaireZone and Luminaire.
         """
         assert self.luminaire_zone is not None, 'Luminaire zone is required to generate scene.'
-        luminaire_rad_path = self.ies2rad(
-            libdir=libdir,
-            prefdir=prefdir,
-            outname='__{}__'.format(self.identifier),
-            units=units
-        )
+        outname = self.ies2rad_outname(prefdir, units)
+        luminaire_rad_path = self._existing_ies2rad_output(libdir, prefdir, outname)
+        if luminaire_rad_path is None:
+            luminaire_rad_path = self.ies2rad(
+                libdir=libdir,
+                prefdir=prefdir,
+                outname=outname,
+                units=units
+            )
 
         scene_dir = os.path.join(libdir or '.', prefdir or '').replace('\\', '/')
         scene_path = os.path.join(scene_dir, '{}.rad'.format(self.identifier)).replace('\\', '/')
@@ -481,6 +457,30 @@ class Luminaire(object):
 
         return scene_path
 
+    def ies2rad_outname(self, prefdir=None, units=None):
+        """Get the name of the ies2rad output of this luminaire for generate_scene.
+
+        The name is a hash of all of the inputs that affect the output of ies2rad,
+        which includes the IES content, the units, the multipliers and the
+        custom lamp. Luminaires with the same name produce the same ies2rad output.
+
+        Args:
+            prefdir: The library subdirectory.
+            units: Units for the output. If None, meters are used.
+        """
+        lamp = self.custom_lamp
+        if lamp is None:
+            lamp_key = None
+        elif lamp.is_white:
+            lamp_key = [lamp.name, list(lamp.white_xy), lamp.depreciation_factor]
+        else:
+            lamp_key = [list(lamp.rgb), lamp.depreciation_factor]
+        key = json.dumps([
+            self._ies_content, self._ies2rad_units(units), self.light_loss_factor,
+            self.candela_multiplier, lamp_key, self._ies2rad_folders('', prefdir)[1]
+        ])
+        return '__ies_{}__'.format(hashlib.md5(key.encode('utf-8')).hexdigest()[:16])
+
     def write_ies(self, folder, filename=None):
         """Write the stored IES content back to disk."""
         filename = filename or '{}.ies'.format(self.identifier)
@@ -527,9 +527,9 @@ class Luminaire(object):
                     continue
 
             if data_started:
-                line = [float(v) for v in line.split()]
-                tokens.extend(line)
+                tokens.extend(line.split())
 
+        tokens = [float(v) for v in tokens]
         if not tokens:
             raise RuntimeError('Failed to parse numeric IES data.')
 
@@ -599,11 +599,14 @@ class Luminaire(object):
         self._unit_type = data['unit_type']
         self._unit_scale = data['unit_scale']
 
-    def generate_photometric_web(self, normalize=True):
+    def generate_photometric_web(self, normalize=True, as_coordinates=False):
         """Generate a photometric web geometry.
 
         Args:
             normalize: If set to True the geometry is normalized to unit dimensions.
+            as_coordinates: If set to True the points are returned as tuples of
+                (x, y, z) coordinates instead of Point3D objects. This is much
+                faster for IES files with high resolution grids. (Default: False).
 
         Returns:
             dict with keys:
@@ -614,38 +617,51 @@ class Luminaire(object):
         """
         self._ensure_parsed()
 
-        horz_deg, candela = self._expand_horizontal_angles(
-            self.horizontal_angles,
-            self.candela_values
-        )
-
+        horz_deg, rows = self._expand_horizontal_indices(self.horizontal_angles)
         vert_deg = self.vertical_angles
 
         horz = [math.radians(h) for h in horz_deg]
         vert = [math.radians(v) for v in vert_deg]
-
-        if normalize:
-            max_cd = self.max_candela or 1.0
-            candela = [
-                [v / max_cd for v in row]
-                for row in candela
-            ]
-
+        max_cd = (self.max_candela or 1.0) if normalize else None
         scale = max(abs(self.width_m), abs(self.length_m))
 
-        points = []
-
-        for h_idx, h_ang in enumerate(horz):
-            row = []
-            for v_idx, v_ang in enumerate(vert):
-                cd = scale * candela[h_idx][v_idx]
-
-                x = cd * math.sin(v_ang) * math.cos(h_ang)
-                y = cd * math.sin(v_ang) * math.sin(h_ang)
-                z = -cd * math.cos(v_ang)
-
-                row.append(Point3D(x, y, z))
-            points.append(row)
+        # compute the sine and cosine of each angle once for the whole web
+        sin_h = [math.sin(h) for h in horz]
+        cos_h = [math.cos(h) for h in horz]
+        sin_v = [math.sin(v) for v in vert]
+        cos_v = [math.cos(v) for v in vert]
+
+        candela_values = self.candela_values
+        if np is not None and all(len(row) == len(vert) for row in candela_values):
+            candela = np.array(candela_values, dtype=np.float64).reshape(
+                len(candela_values), len(vert))[rows]
+            if normalize:
+                candela = candela / max_cd
+            cd = scale * candela
+            xs = (cd * np.array(sin_v)) * np.array(cos_h)[:, None]
+            ys = (cd * np.array(sin_v)) * np.array(sin_h)[:, None]
+            zs = -cd * np.array(cos_v)
+            points = [
+                list(zip(x_row, y_row, z_row)) if as_coordinates else
+                [Point3D(x, y, z) for x, y, z in zip(x_row, y_row, z_row)]
+                for x_row, y_row, z_row in zip(xs.tolist(), ys.tolist(), zs.tolist())
+            ]
+        else:
+            points = []
+            for h_idx, row_idx in enumerate(rows):
+                cd_row = candela_values[row_idx]
+                if normalize:
+                    cd_row = [v / max_cd for v in cd_row]
+                row = []
+                for v_idx in range(len(vert)):
+                    cd = scale * cd_row[v_idx]
+
+                    x = cd * sin_v[v_idx] * cos_h[h_idx]
+                    y = cd * sin_v[v_idx] * sin_h[h_idx]
+                    z = -cd * cos_v[v_idx]
+
+                    row.append((x, y, z) if as_coordinates else Point3D(x, y, z))
+                points.append(row)
 
         return {
             'points': points,
@@ -664,13 +680,27 @@ class Luminaire(object):
         Returns:
             Tuple with (horizontal angles, candela values).
         """
+        horz, rows = self._expand_horizontal_indices(horizontal_angles)
+        return horz, [list(candela_values[i]) for i in rows]
+
+    @staticmethod
+    def _expand_horizontal_indices(horizontal_angles):
+        """Expand IES horizontal symmetry to full 0-360 coverage.
+
+        Args:
+            horizontal_angles: A list of horizontal angles.
+
+        Returns:
+            Tuple with (horizontal angles, indices) where the indices are the
+            index of the candela row of the IES file for each horizontal angle.
+        """
         horz = list(horizontal_angles)
-        candelas = [list(row) for row in candela_values]
+        rows = list(range(len(horz)))
 
         if len(horz) == 1:
             horz = list(range(0, 361, 10))
-            candelas = candelas * len(horz)
-            return horz, candelas
+            rows = rows * len(horz)
+            return horz, rows
 
         counter = 0
 
@@ -686,7 +716,7 @@ class Luminaire(object):
             ]
 
             horz.extend(new_angles)
-            candelas.extend(list(reversed(candelas))[1:])
+            rows.extend(list(reversed(rows))[1:])
 
             if counter > 4:
                 raise ValueError('Horizontal angles are not symmetric or ordered.')
@@ -704,18 +734,74 @@ class Luminaire(object):
                 if horz[-1] + (horz[-1] - horz[-1 - idx]) <= 360
             ]
 
-            c0 = candelas[1:len(zerolimit) + 1][::-1]
-            c1 = candelas[-len(maxlimit) - 1:-1][::-1]
+            r0 = rows[1:len(zerolimit) + 1][::-1]
+            r1 = rows[-len(maxlimit) - 1:-1][::-1]
 
             horz = zerolimit + horz + maxlimit
-            candelas = c0 + candelas + c1
+            rows = r0 + rows + r1
 
-        return horz, candelas
+        return horz, rows
 
     def _ensure_parsed(self):
-        if self._vertical_angles is None:
+        if self._candela_values is None:
             self.parse_photometric_data()
 
+    def _existing_ies2rad_output(self, libdir, prefdir, outname):
+        """Get the path to the .rad file of an existing ies2rad output.
+
+        Returns None if the .rad or the .dat file of the output does not exist.
+        """
+        norm_libdir, norm_prefdir = self._ies2rad_folders(libdir, prefdir)
+        rad_path = self._ies2rad_rad_path(norm_prefdir, outname)
+        full_rad_path = os.path.join(libdir or '.', rad_path)
+        if os.path.isfile(full_rad_path) and \
+                os.path.isfile(full_rad_path[:-4] + '.dat'):
+            return rad_path
+        return None
+
+    @staticmethod
+    def _ies2rad_units(units):
+        """Get the ies2rad -d option for the input units."""
+        if units is None:
+            units = 'm'
+        units = str(units).strip().lower()
+        if units not in IES2RAD_UNITS:
+            raise ValueError(
+                "Invalid units '{}'. Valid options are: {}"
+                .format(units, ', '.join(sorted(IES2RAD_UNITS.keys())))
+            )
+        return IES2RAD_UNITS[units]
+
+    @staticmethod
+    def _ies2rad_folders(libdir, prefdir):
+        """Get the library directory and subdirectory in the format for ies2rad."""
+        if libdir:
+            libdir = os.path.normpath(libdir).replace('\\', '/')
+            if not os.path.isabs(libdir) and not libdir.startswith('.'):
+                libdir = './' + libdir
+
+        if prefdir:
+            prefdir = os.path.normpath(prefdir).replace('\\', '/')
+
+            if libdir and prefdir.startswith('./'):
+                prefdir = prefdir[2:]
+            elif not libdir and not prefdir.startswith('.'):
+                prefdir = './' + prefdir
+
+            if not prefdir.startswith('.'):
+                prefdir = './' + prefdir
+
+        return libdir, prefdir
+
+    @staticmethod
+    def _ies2rad_rad_path(prefdir, outname):
+        """Get the path to the .rad file of ies2rad relative to the library directory.
+        """
+        rad_path = os.path.join(prefdir or '.', '{}.rad'.format(outname)).replace('\\', '/')
+        if not os.path.isabs(rad_path) and not rad_path.startswith('.'):
+            rad_path = './' + rad_path
+        return rad_path
+
     def _ensure_ies_file(self, folder=None):
         """Ensure an IES file exists on disk and return its path.
         Writes the file if the original path no longer exists.
@@ -881,6 +967,50 @@ class Luminaire(object):
         return 'Luminaire: {} [LuminaireZone: {}]'.format(self.identifier, n_luminaires)
 
 
+def generate_scenes(luminaires, libdir=None, prefdir=None, units=None, cpu_count=1):
+    """Create the scene descriptions of several luminaires.
+
+    ies2rad is only executed once for each group of luminaires with the same
+    ies2rad_outname and only if its output does not exist from an earlier export.
+    The unique ies2rad conversions can be executed in parallel.
+
+    Args:
+        luminaires: A list of Luminaire objects with luminaire zones.
+        libdir: Set the library directory.
+        prefdir: Set the library subdirectory.
+        units: Units for the output. If None, meters are used (default in ies2rad).
+        cpu_count: An integer for the number of processes used to run the
+            unique ies2rad conversions in parallel. (Default: 1).
+
+    Returns:
+        A list with the path to the scene description of each luminaire.
+    """
+    conversions = {}
+    for luminaire in luminaires:
+        outname = luminaire.ies2rad_outname(prefdir, units)
+        if outname not in conversions and \
+                luminaire._existing_ies2rad_output(libdir, prefdir, outname) is None:
+            conversions[outname] = (luminaire, libdir, prefdir, outname, units)
+
+    if conversions:
+        # create the folders before the conversions run in parallel
+        for folder in (os.path.join(libdir or '.', prefdir or ''), prefdir or '.'):
+            if not os.path.isdir(folder):
+                os.makedirs(folder)
+        arguments = [conversions[outname] for outname in sorted(conversions)]
+        run_in_parallel(_luminaire_ies2rad, arguments, cpu_count)
+
+    return [
+        luminaire.generate_scene(libdir=libdir, prefdir=prefdir, units=units)
+        for luminaire in luminaires
+    ]
+
+
+def _luminaire_ies2rad(luminaire, libdir, prefdir, outname, units):
+    """Run ies2rad for a luminaire inside a worker process."""
+    return luminaire.ies2rad(libdir=libdir, prefdir=prefdir, outname=outname, units=units)
+
+
 class LuminaireZone(object):
     """A collection of luminaire instances defining a lighting layout.
 
@@ -1366,8 +1496,7 @@ class CustomLamp(object):
             raise ValueError("The color temperature value should be between 1000 and 25000.")
 
         # convert CCT to xy using the legacy function
-        wavelengths = {wavelength:wavelength*(10**-9) for wavelength in range(360,831)}
-        x, y = calc_xy_1931_from_cct(color_temperature, wavelengths, CMFS)
+        x, y = calc_xy_1931_from_cct(color_temperature, WAVELENGTHS, CMFS)
 
         # compute color coordinates (u, v) for 1960 and 1976 standards
         cor = color_coordinates(x, y, 1931)
@@ -1491,8 +1620,7 @@ class CustomLamp(object):
         cct_default = 3200
 
         # convert to xy using helper
-        wavelengths = {wavelength: wavelength * 1e-9 for wavelength in range(360, 831)}
-        x, y = calc_xy_1931_from_cct(cct_default, wavelengths, CMFS)
+        x, y = calc_xy_1931_from_cct(cct_default, WAVELENGTHS, CMFS)
         cor = color_coordinates(x, y, 1931)
 
         # extract coordinates for different color spaces
@@ -1759,35 +1887,56 @@ def calc_xy_1931_from_cct(cct, wavelengths, cmfs):
     return round(x, 8), round(y, 8)
 
 
-def planckian_table(u_src, v_src, min_temp=1000, max_temp=100000, growth=1.01):
-    """Build a table of Planckian temperatures along with (u, v) coordinates and distances.
+def planckian_locus(min_temp=1000, max_temp=100000, growth=1.01):
+    """Get the temperatures along the Planckian locus with their (u, v) coordinates.
+
+    The locus only depends on the input temperatures and it is therefore calculated
+    once and cached for all of the later calls with the same inputs.
 
     Args:
-        u_src, v_src: Reference u,v coordinates (CIE 1960) to compare against.
         min_temp: Starting temperature (K). Default 1000 K.
         max_temp: Maximum temperature (K). Default 100,000 K.
         growth: Multiplicative growth factor per step. Default 1.01 (~1% step).
 
     Returns:
-        List of tuples: (temperature, u, v, distance_to_ref, counter)
+        Tuple of tuples: (temperature, u, v) with u, v in CIE 1960.
     """
-    table = []
+    key = (min_temp, max_temp, growth)
+    try:
+        return _PLANCKIAN_LOCI[key]
+    except KeyError:
+        pass
+    locus = []
     temp = min_temp
-    counter = 1
-
-    wavelengths = {wavelength:wavelength*(10**-9) for wavelength in range(360,831)}
     while temp < max_temp:
         temp *= growth
-        # compute 1931 xy from temp
-        x, y = calc_xy_1931_from_cct(temp, wavelengths, CMFS)
-        # convert to 1960 uv
+        # compute 1931 xy from temp and convert it to 1960 uv
+        x, y = calc_xy_1931_from_cct(temp, WAVELENGTHS, CMFS)
         u, v = color_coordinates(x, y, 1931)[1960]
-        # distance to reference point
-        dist = math.sqrt((u_src - u) ** 2 + (v_src - v) ** 2)
-        table.append((temp, u, v, dist, counter))
-        counter += 1
+        locus.append((temp, u, v))
+    locus = tuple(locus)
+    _PLANCKIAN_LOCI[key] = locus
+    return locus
+
+
+def planckian_table(u_src, v_src, min_temp=1000, max_temp=100000, growth=1.01):
+    """Build a table of Planckian temperatures along with (u, v) coordinates and distances.
+
+    Args:
+        u_src, v_src: Reference u,v coordinates (CIE 1960) to compare against.
+        min_temp: Starting temperature (K). Default 1000 K.
+        max_temp: Maximum temperature (K). Default 100,000 K.
+        growth: Multiplicative growth factor per step. Default 1.01 (~1% step).
 
-    return table
+    Returns:
+        List of tuples: (temperature, u, v, distance_to_ref, counter)
+    """
+    sqrt = math.sqrt
+    return [
+        (temp, u, v, sqrt((u_src - u) ** 2 + (v_src - v) ** 2), counter)
+        for counter, (temp, u, v) in
+        enumerate(planckian_locus(min_temp, max_temp, growth), 1)
+    ]
 
 
 def calc_cct(a, b, year):
@@ -1803,11 +1952,10 @@ def calc_cct(a, b, year):
     # convert input coordinates to CIE 1960 uv
     u, v = color_coordinates(a, b, year)[1960]
     
-    # build Planckian table
-    table = planckian_table(u, v)
-
-    # distance extraction
-    distances = [row[3] for row in table]
+    # distances to the cached Planckian locus
+    locus = planckian_locus()
+    sqrt = math.sqrt
+    distances = [sqrt((u - l_u) ** 2 + (v - l_v) ** 2) for _, l_u, l_v in locus]
     min_dist = min(distances)
     min_idx = distances.index(min_dist)
 
@@ -1815,9 +1963,9 @@ def calc_cct(a, b, year):
     sign = lambda x: -1 if x < 0 else 1
 
     try:
-        pt_minus1 = table[min_idx - 1]
-        pt = table[min_idx]
-        pt_plus1 = table[min_idx + 1]
+        pt_minus1 = locus[min_idx - 1] + (distances[min_idx - 1],)
+        pt = locus[min_idx] + (distances[min_idx],)
+        pt_plus1 = locus[min_idx + 1] + (distances[min_idx + 1],)
     except IndexError:
         # edge case: CCT too high or too low
         return 10000, 0.1
@@ -1855,6 +2003,25 @@ def calc_cct(a, b, year):
         return tx, duv
 
 
+# the ies2rad -d option for each of the accepted units
+IES2RAD_UNITS = {
+    'm': 'm',
+    'meter': 'm',
+    'meters': 'm',
+    'mm': 'm/1000',
+    'millimeter': 'm/1000',
+    'millimeters': 'm/1000',
+    'cm': 'm/100',
+    'centimeter': 'm/100',
+    'centimeters': 'm/100',
+    'ft': 'f',
+    'foot': 'f',
+    'feet': 'f',
+    'in': 'i',
+    'inch': 'i',
+    'inches': 'i'
+}
+
 LAMPNAMES = {
     'clear metal halide': (0.396, 0.39, 0.8),
     'cool white deluxe': (0.376, 0.368, 0.85),
@@ -1874,6 +2041,12 @@ LAMPNAMES = {
 }
 
 
+# wavelengths in meters for each wavelength in nm used for the CIE 1931 integration
+WAVELENGTHS = {wavelength: wavelength * 1e-9 for wavelength in range(360, 831)}
+
+# cache of the Planckian locus for each set of planckian_locus inputs
+_PLANCKIAN_LOCI = {}
+
 CMFS = {
     360: (0.000130, 0.000004, 0.000606), 361: (0.000146, 0.000004, 0.000681), 362: (0.000164, 0.000005, 0.000765),
     363: (0.000184, 0.000006, 0.000860), 364: (0.000207, 0.000006, 0.000967), 365: (0.000232, 0.000007, 0.001086),
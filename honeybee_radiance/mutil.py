@@ -7,6 +7,9 @@ from honeybee_radiance.primitive import Primitive, Void
 
 _MAPPER = {'bsdf': 'BSDF', 'absdf': 'aBSDF', 'brtdfunc': 'BRTDfunc'}
 
+# counter for the changes to the modifiers assigned to geometry objects and states
+_ASSIGNMENT_VERSION = 0
+
 
 def modifier_class_from_type_string(type_string):
     """Get the class of any modifier using its 'type' string.
@@ -58,3 +61,77 @@ def dict_to_modifier(mdict):
         return mod_class.from_primitive_dict(mdict)
     else:
         return mod_class.from_dict(mdict)
+
+
+class InstanceSet(object):
+    """An ordered set of object instances where instances are compared by identity.
+
+    Checking whether an instance is in the set uses the id() of the instance. This
+    is much faster than testing inclusion in a list (which uses the == operator
+    on each item) and, unlike the builtin set, it keeps the order in which the
+    instances were added.
+
+    Args:
+        instances: An optional iterable of instances to be added to the set.
+    """
+    __slots__ = ('_ids', '_instances')
+
+    def __init__(self, instances=None):
+        self._ids = set()
+        self._instances = []  # keeps the instances alive so their ids are not reused
+        if instances is not None:
+            self.update(instances)
+
+    def add(self, instance):
+        """Add an instance to the set if it is not already in it."""
+        key = id(instance)
+        if key not in self._ids:
+            self._ids.add(key)
+            self._instances.append(instance)
+
+    def update(self, instances):
+        """Add several instances to the set."""
+        for instance in instances:
+            self.add(instance)
+
+    def unique_values(self):
+        """Get a list of the instances in order without any equivalent instances.
+
+        Instances that are equal to a previous instance (using the == operator)
+        are removed from the list. This matches the instances that are kept by
+        converting a list to the builtin set.
+        """
+        seen = set()
+        unique = []
+        for instance in self._instances:
+            if instance not in seen:
+                seen.add(instance)
+                unique.append(instance)
+        return unique
+
+    def __contains__(self, instance):
+        return id(instance) in self._ids
+
+    def __iter__(self):
+        return iter(self._instances)
+
+    def __len__(self):
+        return len(self._instances)
+
+    def __repr__(self):
+        return 'InstanceSet: [{} instances]'.format(len(self._instances))
+
+
+def modifier_assignment_changed():
+    """Record that a modifier assigned to a geometry object or a state has changed.
+
+    This invalidates the modifiers that are cached by ModelRadianceProperties.
+    """
+    global _ASSIGNMENT_VERSION
+    _ASSIGNMENT_VERSION += 1
+
+
+def modifier_assignment_version():
+    """Get an integer that changes every time the assignment of a modifier changes.
+    """
+    return _ASSIGNMENT_VERSION
@@ -0,0 +1,47 @@
+"""Utilities to run a function over a pool of processes."""
+try:
+    import multiprocessing
+except ImportError:  # multiprocessing is not available (eg. IronPython)
+    multiprocessing = None
+
+
+def _call_with_arguments(function_arguments):
+    """Call a function with a tuple of positional arguments inside a worker."""
+    function, arguments = function_arguments
+    return function(*arguments)
+
+
+def run_in_parallel(function, arguments, cpu_count=1):
+    """Run a function once for each set of arguments using a pool of processes.
+
+    The results are always returned in the same order as the input arguments such
+    that the output of the parallel run is the same as calling the function
+    serially. If multiprocessing is not available or the cpu_count is 1, the
+    function will simply be called serially in the current process.
+
+    Args:
+        function: The function to be called. This must be defined at the top level
+            of a module such that it can be sent to other processes.
+        arguments: A list of tuples where each tuple contains the positional
+            arguments for one call of the function.
+        cpu_count: An integer for the number of processes to be used. If None,
+            all of the CPUs of the machine will be used. (Default: 1).
+
+    Returns:
+        A list with the result of each call of the function.
+    """
+    arguments = [tuple(args) for args in arguments]
+    if multiprocessing is not None and cpu_count is None:
+        cpu_count = multiprocessing.cpu_count()
+    if multiprocessing is None or cpu_count is None or cpu_count <= 1 \
+            or len(arguments) <= 1:
+        return [function(*args) for args in arguments]
+
+    pool = multiprocessing.Pool(min(cpu_count, len(arguments)))
+    try:
+        results = pool.map(
+            _call_with_arguments, [(function, args) for args in arguments])
+    finally:
+        pool.close()
+        pool.join()
+    return results
@@ -9,6 +9,13 @@ from ladybug.datatype.fraction import Fraction
 from ladybug.legend import LegendParameters
 
 from .annual import filter_schedule_by_hours, _process_input_folder
+from .matrix import matrix_rows, matrix_array_chunks
+from ..parallel import run_in_parallel
+
+try:
+    import numpy as np
+except ImportError:  # numpy is not available; use the pure Python functions
+    np = None
 
 
 def _metrics(values, occ_pattern, threshold, min_t, max_t, total_hours,
@@ -61,16 +68,92 @@ def _metrics(values, occ_pattern, threshold, min_t, max_t, total_hours,
         _percentage(udi_upper, total_hours)
 
 
+def _metrics_array(values, occ_pattern, threshold, min_t, max_t, total_hours,
+                   sun_down_occ_hours):
+    """Calculate annual metrics for several sensors at once using NumPy.
+
+    The results are identical to calling _metrics for each row of the array.
+
+    Args:
+        values: A 2D NumPy array of illuminance values where each row is a sensor
+            and each column is a sun-up hour.
+        occ_pattern: A list of 0 and 1 values for hours of occupancy.
+        threshold: Threshold value for daylight autonomy.
+        min_t: Minimum threshold for useful daylight illuminance.
+        max_t: Maximum threshold for useful daylight illuminance.
+        total_hours: An integer for the total number of occupied hours.
+        sun_down_occ_hours: An integer for the total number of occupied hours where
+            the sun is down.
+
+    Returns:
+        A list of tuples with one tuple for each sensor. Each tuple contains
+        daylight autonomy, continuous daylight autonomy, lower useful daylight
+        illuminance, useful daylight illuminance, higher useful daylight illuminance.
+    """
+    def _percentage(in_v, occ_hours):
+        return round(100.0 * in_v / occ_hours, 2)
+
+    # only keep the occupied hours (zip in _metrics ignores any extra values)
+    hour_count = min(values.shape[1], len(occ_pattern))
+    occ = np.asarray(occ_pattern[:hour_count]) != 0
+    values = values[:, :hour_count][:, occ]
+    sensor_count, occ_count = values.shape
+
+    above = values > threshold
+    da = np.count_nonzero(above, axis=1)
+    if occ_count == 0:
+        cda = np.zeros(sensor_count)
+    else:
+        # cumsum adds the values in order, which matches the rounding of _metrics
+        cda = np.cumsum(np.where(above, 1.0, values / threshold), axis=1)[:, -1]
+    lower = values < min_t
+    udi_lower = np.count_nonzero(lower, axis=1)
+    udi_upper = np.count_nonzero(~lower & (values > max_t), axis=1)
+    udi = occ_count - udi_lower - udi_upper
+    udi_lower = udi_lower + sun_down_occ_hours
+
+    return [
+        (_percentage(da_v, total_hours), _percentage(cda_v, total_hours),
+         _percentage(udi_lower_v, total_hours), _percentage(udi_v, total_hours),
+         _percentage(udi_upper_v, total_hours))
+        for da_v, cda_v, udi_lower_v, udi_v, udi_upper_v in zip(
+            da.tolist(), cda.tolist(), udi_lower.tolist(), udi.tolist(),
+            udi_upper.tolist())
+    ]
+
+
+def _metrics_by_sensor(ill_file, occ_pattern, threshold, min_t, max_t, total_hours,
+                       sun_down_occ_hours):
+    """Yield a tuple of annual metrics for each sensor in an ill file.
+
+    If NumPy is available, the sensors will be loaded and computed in chunks
+    of rows. Otherwise, the pure Python _metrics function will be used.
+    """
+    if np is None:
+        for values in matrix_rows(ill_file):
+            yield _metrics(
+                values, occ_pattern, threshold, min_t, max_t,
+                total_hours, sun_down_occ_hours
+            )
+        return
+    for values in matrix_array_chunks(ill_file):
+        values = np.asarray(values, dtype=float)
+        for pt_metrics in _metrics_array(
+                values, occ_pattern, threshold, min_t, max_t,
+                total_hours, sun_down_occ_hours):
+            yield pt_metrics
+
+
 def metrics(ill_file, occ_pattern, threshold=300, min_t=100, max_t=3000,
             total_hours=None, sun_down_occ_hours=0):
     """Compute annual metrics for a given result file.
 
     Args:
-        ill_file: Path to an ill file generated by Radiance. The ill file should be
-            tab separated and shot NOT have a header. The results for each sensor point
-            should be available in a row and and each column should be the illuminance
-            value for a sun_up_hour. The number of columns should match the number of
-            sun up hours.
+        ill_file: Path to an ill file generated by Radiance. The ill file can be
+            in ASCII, float or double format and binary files must have a header.
+            The results for each sensor point should be available in a row and
+            and each column should be the illuminance value for a sun_up_hour. The
+            number of columns should match the number of sun up hours.
         occ_pattern: A list of 0 and 1 values for hours of occupancy.
         threshold: Threshold illuminance level for daylight autonomy. Default: 300.
         min_t: Minimum threshold for useful daylight illuminance. Default: 100.
@@ -96,18 +179,14 @@ def metrics(ill_file, occ_pattern, threshold=300, min_t=100, max_t=3000,
     udi_lower = []
     udi_upper = []
     total_occupied_hours = sum(occ_pattern) if total_hours is None else total_hours
-    with open(ill_file) as results:
-        for pt_res in results:
-            values = (float(res) for res in pt_res.split())
-            da_v, cda_v, udi_lower_v, udi_v, udi_upper_v = _metrics(
-                values, occ_pattern, threshold, min_t, max_t,
-                total_occupied_hours, sun_down_occ_hours
-            )
-            da.append(da_v)
-            cda.append(cda_v)
-            udi_lower.append(udi_lower_v)
-            udi.append(udi_v)
-            udi_upper.append(udi_upper_v)
+    for da_v, cda_v, udi_lower_v, udi_v, udi_upper_v in _metrics_by_sensor(
+            ill_file, occ_pattern, threshold, min_t, max_t,
+            total_occupied_hours, sun_down_occ_hours):
+        da.append(da_v)
+        cda.append(cda_v)
+        udi_lower.append(udi_lower_v)
+        udi.append(udi_v)
+        udi_upper.append(udi_upper_v)
 
     return da, cda, udi_lower, udi, udi_upper
 
@@ -122,11 +201,11 @@ def metrics_to_files(ill_file, occ_pattern, output_folder, threshold=300,
     higher than useful daylight illuminance.
 
     Args:
-        ill_file: Path to an ill file generated by Radiance. The ill file should be
-            tab separated and shot NOT have a header. The results for each sensor point
-            should be available in a row and and each column should be the illuminance
-            value for a sun_up_hour. The number of columns should match the number of
-            sun up hours.
+        ill_file: Path to an ill file generated by Radiance. The ill file can be
+            in ASCII, float or double format and binary files must have a header.
+            The results for each sensor point should be available in a row and
+            and each column should be the illuminance value for a sun_up_hour. The
+            number of columns should match the number of sun up hours.
         occ_pattern: A list of 0 and 1 values for hours of occupancy.
         output_folder: An output folder where the results will be written to. The folder
             will be created if not exist.
@@ -166,15 +245,12 @@ def metrics_to_files(ill_file, occ_pattern, output_folder, threshold=300,
 
     total_occupied_hours = sum(occ_pattern) if total_hours is None else total_hours
 
-    with open(ill_file) as results, open(da, 'w') as daf, open(cda, 'w') as cdaf, \
+    with open(da, 'w') as daf, open(cda, 'w') as cdaf, \
             open(udi, 'w') as udif, open(udi_lower, 'w') as udi_lowerf, \
             open(udi_upper, 'w') as udi_upperf:
-        for pt_res in results:
-            values = (float(res) for res in pt_res.split())
-            dar, cdar, udi_lowerr, udir, udi_upperr = _metrics(
-                values, occ_pattern, threshold, min_t, max_t,
-                total_occupied_hours, sun_down_occ_hours
-            )
+        for dar, cdar, udi_lowerr, udir, udi_upperr in _metrics_by_sensor(
+                ill_file, occ_pattern, threshold, min_t, max_t,
+                total_occupied_hours, sun_down_occ_hours):
             daf.write(str(dar) + '\n')
             cdaf.write(str(cdar) + '\n')
             udi_lowerf.write(str(udi_lowerr) + '\n')
@@ -186,7 +262,7 @@ def metrics_to_files(ill_file, occ_pattern, output_folder, threshold=300,
 
 # TODO - support a list of schedules/schedule folder to match the input grids
 def metrics_from_folder(results_folder, schedule=None, threshold=300,
-                        min_t=100, max_t=3000, grids_filter='*'):
+                        min_t=100, max_t=3000, grids_filter='*', cpu_count=1):
     """Compute annual metrics for a folder.
 
     This folder is an output folder of annual daylight recipe. Folder should include
@@ -201,6 +277,9 @@ def metrics_from_folder(results_folder, schedule=None, threshold=300,
         max_t: Maximum threshold for useful daylight illuminance. Default: 3000.
         grids_filter: A pattern to filter the grids. By default all the grids will be
             processed.
+        cpu_count: An integer for the number of processes used to compute the
+            metrics of the grids in parallel. If None, all of the CPUs of the
+            machine will be used. (Default: 1).
 
     Returns:
         Tuple[Tuple] - There will be a tuple for each input sensor grid which is a
@@ -220,11 +299,13 @@ def metrics_from_folder(results_folder, schedule=None, threshold=300,
     occ_pattern, total_occ, sun_down_occ_hours = \
         filter_schedule_by_hours(sun_up_hours=sun_up_hours, schedule=schedule)
 
-    for grid in grids:
-        ill_file = os.path.join(results_folder, '%s.ill' % grid['full_id'])
-        da_r, cda_r, udi_lower_r, udi_r, udi_upper_r = \
-            metrics(ill_file, occ_pattern, threshold, min_t, max_t,
-                    total_occ, sun_down_occ_hours)
+    grid_args = [
+        (os.path.join(results_folder, '%s.ill' % grid['full_id']), occ_pattern,
+         threshold, min_t, max_t, total_occ, sun_down_occ_hours)
+        for grid in grids
+    ]
+    for da_r, cda_r, udi_lower_r, udi_r, udi_upper_r in \
+            run_in_parallel(metrics, grid_args, cpu_count):
         da.append(da_r)
         cda.append(cda_r)
         udi_lower.append(udi_lower_r)
@@ -237,7 +318,7 @@ def metrics_from_folder(results_folder, schedule=None, threshold=300,
 # TODO - support a list of schedules/schedule folder to match the input grids
 def metrics_to_folder(
     results_folder, schedule=None, threshold=300, min_t=100, max_t=3000,
-    grids_filter='*', sub_folder='metrics'
+    grids_filter='*', sub_folder='metrics', cpu_count=1
 ):
     """Compute annual metrics in a folder and write them in a subfolder.
 
@@ -255,6 +336,10 @@ def metrics_to_folder(
             processed.
         sub_folder: An optional relative path for subfolder to copy results files.
             Default: metrics
+        cpu_count: An integer for the number of processes used to compute the
+            metrics of the grids in parallel. The output files are the same as
+            those of a serial run. If None, all of the CPUs of the machine will
+            be used. (Default: 1).
 
     Returns:
         str -- Path to results folder.
@@ -264,16 +349,20 @@ def metrics_to_folder(
     occ_pattern, total_occ, sun_down_occ_hours = \
         filter_schedule_by_hours(sun_up_hours=sun_up_hours, schedule=schedule)
 
+    # create all of the folders before the grids are processed in parallel
     metrics_folder = os.path.join(results_folder, sub_folder)
-    if not os.path.isdir(metrics_folder):
-        os.makedirs(metrics_folder)
-
-    for grid in grids:
-        ill_file = os.path.join(results_folder, '%s.ill' % grid['full_id'])
-        metrics_to_files(
-            ill_file, occ_pattern, metrics_folder, threshold, min_t,
-            max_t, grid['full_id'], total_occ, sun_down_occ_hours
-        )
+    for folder_name in ['da', 'cda', 'udi_lower', 'udi', 'udi_upper']:
+        folder = os.path.join(metrics_folder, folder_name)
+        if not os.path.isdir(folder):
+            os.makedirs(folder)
+
+    grid_args = [
+        (os.path.join(results_folder, '%s.ill' % grid['full_id']), occ_pattern,
+         metrics_folder, threshold, min_t, max_t, grid['full_id'], total_occ,
+         sun_down_occ_hours)
+        for grid in grids
+    ]
+    run_in_parallel(metrics_to_files, grid_args, cpu_count)
 
     # copy info.json to all results folders
     for folder_name in ['da', 'cda', 'udi_lower', 'udi', 'udi_upper']:
@@ -6,6 +6,8 @@ import json
 import os
 
 from .annual import filter_schedule_by_hours, _process_input_folder
+from .matrix import matrix_rows
+from ..parallel import run_in_parallel
 
 
 def glare_autonomy_to_file(dgp_file, occ_pattern, output_folder, glare_threshold=0.4,
@@ -15,11 +17,11 @@ def glare_autonomy_to_file(dgp_file, occ_pattern, output_folder, glare_threshold
     This function generates 1 file for glare autonomy.
 
     Args:
-        dgp_file: Path to an dgp file generated by Radiance. The dgp file should be
-            tab separated and shot NOT have a header. The results for each sensor point
-            should be available in a row and and each column should be the daylight
-            glare probability value for a sun_up_hour. The number of columns should
-            match the number of sun up hours.
+        dgp_file: Path to an dgp file generated by Radiance. The dgp file can be
+            in ASCII, float or double format and binary files must have a header.
+            The results for each sensor point should be available in a row and
+            and each column should be the daylight glare probability value for a
+            sun_up_hour. The number of columns should match the number of sun up hours.
         occ_pattern: A list of 0 and 1 values for hours of occupancy.
         output_folder: An output folder where the results will be written to. The folder
             will be created if not exist.
@@ -46,9 +48,8 @@ def glare_autonomy_to_file(dgp_file, occ_pattern, output_folder, glare_threshold
     if not os.path.isdir(folder):
         os.makedirs(folder)
 
-    with open(dgp_file) as results, open(ga, 'w') as gaf:
-        for pt_res in results:
-            values = (float(res) for res in pt_res.split())
+    with open(ga, 'w') as gaf:
+        for values in matrix_rows(dgp_file):
             gar = _glare_autonomy(values, occ_pattern, glare_threshold, total_hours)
             gaf.write(str(gar) + '\n')
 
@@ -59,10 +60,11 @@ def glare_autonomy(dgp_file, occ_pattern, glare_threshold=0.4, total_hours=None)
     """Compute glare autonomy for a given result file.
 
     Args:
-        dgp_file: Path to a dgp file generated by Radiance. The dgp file should be
-            tab separated and shot NOT have a header. The results for each sensor point
-            should be available in a row and and each column should be the DGP value for
-            a sun_up_hour. The number of columns should match the number of sun up hours.
+        dgp_file: Path to a dgp file generated by Radiance. The dgp file can be
+            in ASCII, float or double format and binary files must have a header.
+            The results for each sensor point should be available in a row and
+            and each column should be the DGP value for a sun_up_hour. The number
+            of columns should match the number of sun up hours.
         occ_pattern: A list of 0 and 1 values for hours of occupancy.
         glare_threshold: Threshold DGP level for glare autonomy. Default: 0.4.
         total_hours: An integer for the total number of occupied hours in the
@@ -77,20 +79,18 @@ def glare_autonomy(dgp_file, occ_pattern, glare_threshold=0.4, total_hours=None)
     """
     ga = []
     total_occupied_hours = sum(occ_pattern) if total_hours is None else total_hours
-    with open(dgp_file) as results:
-        for pt_res in results:
-            values = (float(res) for res in pt_res.split())
-            ga_v = _glare_autonomy(
-                values, occ_pattern, glare_threshold, total_occupied_hours
-            )
-            ga.append(ga_v)
+    for values in matrix_rows(dgp_file):
+        ga_v = _glare_autonomy(
+            values, occ_pattern, glare_threshold, total_occupied_hours
+        )
+        ga.append(ga_v)
 
     return ga
 
 
 # TODO - support a list of schedules/schedule folder to match the input grids
-def glare_autonomy_from_folder(results_folder, schedule=None, glare_threshold=0.4, 
-                               grids_filter='*'):
+def glare_autonomy_from_folder(results_folder, schedule=None, glare_threshold=0.4,
+                               grids_filter='*', cpu_count=1):
     """Compute glare autonomy for a folder.
 
     This folder is an output folder of imageless annual glare recipe. Folder should
@@ -103,29 +103,32 @@ def glare_autonomy_from_folder(results_folder, schedule=None, glare_threshold=0.
         glare_threshold: Threshold DGP level for glare autonomy. Default: 0.4.
         grids_filter: A pattern to filter the grids. By default all the grids will be
             processed.
+        cpu_count: An integer for the number of processes used to compute the
+            glare autonomy of the grids in parallel. If None, all of the CPUs of
+            the machine will be used. (Default: 1).
 
     Returns:
         Tuple[List] - There will be a list for each input sensor grid. Number of results
         in each list matches the number of lines in ill input file.
 
     """
-    ga = []
-
     grids, sun_up_hours = _process_input_folder(results_folder, grids_filter)
     occ_pattern, total_occ, sun_down_occ_hours = \
         filter_schedule_by_hours(sun_up_hours=sun_up_hours, schedule=schedule)
 
-    for grid in grids:
-        dgp_file = os.path.join(results_folder, '%s.dgp' % grid['full_id'])
-        ga_r = glare_autonomy(dgp_file, occ_pattern, glare_threshold, total_occ)
-        ga.append(ga_r)
+    grid_args = [
+        (os.path.join(results_folder, '%s.dgp' % grid['full_id']), occ_pattern,
+         glare_threshold, total_occ)
+        for grid in grids
+    ]
+    ga = run_in_parallel(glare_autonomy, grid_args, cpu_count)
 
     return ga
 
 
 def glare_autonomy_to_folder(
     results_folder, schedule=None, glare_threshold=0.4, grids_filter='*',
-    sub_folder='metrics'
+    sub_folder='metrics', cpu_count=1
         ):
     """Compute annual glare autonomy in a folder and write them in a subfolder.
 
@@ -142,6 +145,10 @@ def glare_autonomy_to_folder(
             processed.
         sub_folder: An optional relative path for subfolder to copy results files.
             Default: metrics
+        cpu_count: An integer for the number of processes used to compute the
+            glare autonomy of the grids in parallel. The output files are the same
+            as those of a serial run. If None, all of the CPUs of the machine will
+            be used. (Default: 1).
 
     Returns:
         str -- Path to results folder.
@@ -151,16 +158,18 @@ def glare_autonomy_to_folder(
     occ_pattern, total_occ, sun_down_occ_hours = \
         filter_schedule_by_hours(sun_up_hours=sun_up_hours, schedule=schedule)
 
+    # create the folder before the grids are processed in parallel
     metrics_folder = os.path.join(results_folder, sub_folder)
-    if not os.path.isdir(metrics_folder):
-        os.makedirs(metrics_folder)
-
-    for grid in grids:
-        dgp_file = os.path.join(results_folder, '%s.dgp' % grid['full_id'])
-        glare_autonomy_to_file(
-            dgp_file, occ_pattern, metrics_folder, glare_threshold,
-            grid['full_id'], total_occ
-        )
+    ga_folder = os.path.join(metrics_folder, 'ga')
+    if not os.path.isdir(ga_folder):
+        os.makedirs(ga_folder)
+
+    grid_args = [
+        (os.path.join(results_folder, '%s.dgp' % grid['full_id']), occ_pattern,
+         metrics_folder, glare_threshold, grid['full_id'], total_occ)
+        for grid in grids
+    ]
+    run_in_parallel(glare_autonomy_to_file, grid_args, cpu_count)
 
     # copy info.json to all results folders
     grid_info = os.path.join(metrics_folder, 'ga', 'grids_info.json')
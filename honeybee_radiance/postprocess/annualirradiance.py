@@ -11,10 +11,13 @@ from ladybug.datatype.energyflux import EnergyFlux
 from ladybug.datatype.energyintensity import EnergyIntensity
 from ladybug.legend import LegendParameters
 
-from .annual import remove_header
+from .matrix import matrix_rows
+from ..parallel import run_in_parallel
 
 
-def annual_irradiance_to_folder(folder, wea, timestep=1, sub_folder='metrics'):
+def annual_irradiance_to_folder(
+    folder, wea, timestep=1, sub_folder='metrics', cpu_count=1
+):
     """Compute irradiance metrics in a folder and write them in a subfolder.
 
     This command generates 3 files for each input grid.
@@ -33,6 +36,10 @@ def annual_irradiance_to_folder(folder, wea, timestep=1, sub_folder='metrics'):
             of the Wea. (Default: 1).
         sub_folder: An optional relative path for subfolder to copy results
             files. (Default: metrics).
+        cpu_count: An integer for the number of processes used to compute the
+            metrics of the grids in parallel. The output files are the same as
+            those of a serial run. If None, all of the CPUs of the machine will
+            be used. (Default: 1).
 
     Returns:
         str -- Path to results folder.
@@ -59,30 +66,8 @@ def annual_irradiance_to_folder(folder, wea, timestep=1, sub_folder='metrics'):
         shutil.copyfile(grid_info, grid_info_copy)
 
     # loop through the grids and compute metrics
-    for grid in grids:
-        input_matrix = os.path.join(folder, '{}.ill'.format(grid))
-        first_line, input_file = remove_header(input_matrix)
-        avg = os.path.join(metrics_folders[0], '{}.res'.format(grid))
-        pk = os.path.join(metrics_folders[1], '{}.res'.format(grid))
-        cml = os.path.join(metrics_folders[2], '{}.res'.format(grid))
-        with open(avg, 'w') as avg_i, open(pk, 'w') as pk_i, open(cml, 'w') as cml_r:
-            # calculate the values for the first line
-            values = [float(v) for v in first_line.split()]
-            total_val = sum(values)
-            avg_i.write('{}\n'.format(total_val / wea_len))
-            pk_i.write('{}\n'.format(max(values)))
-            cml_r.write('{}\n'.format(total_val / (timestep * 1000)))
-
-            # write rest of the lines
-            for line in input_file:
-                try:
-                    values = [float(v) for v in line.split()]
-                    total_val = sum(values)
-                    pk_i.write('{}\n'.format(max(values)))
-                    avg_i.write('{}\n'.format(total_val / wea_len))
-                    cml_r.write('{}\n'.format(total_val / (timestep * 1000)))
-                except ValueError:
-                    pass  # last line of the file
+    grid_args = [(folder, metrics_folders, grid, wea_len, timestep) for grid in grids]
+    run_in_parallel(_annual_irradiance_grid, grid_args, cpu_count)
 
     metric_info_dict = _annual_irradiance_vis_metadata()
     for metric, data in metric_info_dict.items():
@@ -93,6 +78,20 @@ def annual_irradiance_to_folder(folder, wea, timestep=1, sub_folder='metrics'):
     return metrics_folder
 
 
+def _annual_irradiance_grid(folder, metrics_folders, grid, wea_len, timestep):
+    """Compute the irradiance metrics of a single grid and write them to files."""
+    input_matrix = os.path.join(folder, '{}.ill'.format(grid))
+    avg = os.path.join(metrics_folders[0], '{}.res'.format(grid))
+    pk = os.path.join(metrics_folders[1], '{}.res'.format(grid))
+    cml = os.path.join(metrics_folders[2], '{}.res'.format(grid))
+    with open(avg, 'w') as avg_i, open(pk, 'w') as pk_i, open(cml, 'w') as cml_r:
+        for values in matrix_rows(input_matrix):
+            total_val = sum(values)
+            pk_i.write('{}\n'.format(max(values)))
+            avg_i.write('{}\n'.format(total_val / wea_len))
+            cml_r.write('{}\n'.format(total_val / (timestep * 1000)))
+
+
 def _annual_irradiance_vis_metadata():
     """Return visualization metadata for annual irradiance."""
     cumulative_radiation_lpar = LegendParameters(min=0)
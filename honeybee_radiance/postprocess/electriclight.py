@@ -2,11 +2,18 @@
 import os
 
 from .annual import generate_default_schedule, _process_input_folder
+from .matrix import matrix_rows, matrix_array_chunks
+from ..parallel import run_in_parallel
+
+try:
+    import numpy as np
+except ImportError:  # numpy is not available; use the pure Python functions
+    np = None
 
 
 def daylight_control_schedules(
     results_folder, base_schedule=None, ill_setpoint=300,
-    min_power_in=0.3, min_light_out=0.2, off_at_min=False
+    min_power_in=0.3, min_light_out=0.2, off_at_min=False, cpu_count=1
 ):
     """Generate electric lighting schedules from annual daylight results.
 
@@ -51,6 +58,8 @@ def daylight_control_schedules(
             with the off_at_min input below. (Default: 0.2).
         off_at_min: Boolean to note whether lights should switch off completely when
             they get to the minimum power input. (Default: False).
+        cpu_count: An integer for the number of processes used to compute the
+            dimming fractions of the grids in parallel. (Default: 1).
 
     Returns:
         A tuple with two values.
@@ -70,14 +79,12 @@ def daylight_control_schedules(
     sun_up_hours = [int(h) for h in sun_up_hours]
 
     # get the dimming fractions for each sensor grid from the .ill files
-    dim_fracts = []
-    for grid_info in grids:
-        ill_file = os.path.join(results_folder, '%s.ill' % grid_info['full_id'])
-        fract_list = _file_to_dimming_fraction(
-            ill_file, sun_up_hours, ill_setpoint, min_power_in,
-            min_light_out, off_at_min
-        )
-        dim_fracts.append(fract_list)
+    grid_args = [
+        (os.path.join(results_folder, '%s.ill' % grid_info['full_id']), sun_up_hours,
+         ill_setpoint, min_power_in, min_light_out, off_at_min)
+        for grid_info in grids
+    ]
+    dim_fracts = run_in_parallel(_file_to_dimming_fraction, grid_args, cpu_count)
 
     # create the schedule by combining the base schedule with the dimming fraction
     schedules, schedule_ids = [], []
@@ -90,15 +97,21 @@ def daylight_control_schedules(
 
 
 def _file_to_dimming_fraction(ill_file, su_pattern, setpt, m_pow, m_lgt, off_m):
-    """Compute hourly dimming fractions for a given result file."""
+    """Compute hourly dimming fractions for a given result file.
+
+    The result file can be an ASCII or a binary Radiance matrix.
+    """
     # get a base schedule of dimming fractions for the sun-up hours
-    su_values = [0] * len(su_pattern)
+    su_values = [0] * len(su_pattern) if np is None else np.zeros(len(su_pattern))
     sensor_count = 0
-    with open(ill_file) as results:
-        for pt_res in results:
-            sensor_count += 1
-            for i, val in enumerate(pt_res.split()):
-                su_values[i] += _dimming_from_ill(float(val), setpt, m_pow, m_lgt, off_m)
+    if np is None:
+        sensor_count += _sum_dimming_fractions(
+            su_values, matrix_rows(ill_file), setpt, m_pow, m_lgt, off_m)
+    else:
+        for values in matrix_array_chunks(ill_file):
+            sensor_count += _sum_dimming_fractions(
+                su_values, values, setpt, m_pow, m_lgt, off_m)
+        su_values = su_values.tolist()
     su_values = [val / sensor_count for val in su_values]
 
     # account for the hours where the sun is not up
@@ -117,3 +130,50 @@ def _dimming_from_ill(ill_val, ill_setpt, min_pow, min_light, off_at_min):
     else:  # partially dimmed
         fract_dim = (ill_setpt - ill_val) / (ill_setpt - min_light)
         return fract_dim + ((1 - fract_dim) * min_pow)
+
+
+def _dimming_array(values, ill_setpt, min_pow, min_light, off_at_min):
+    """Compute the dimming fractions for a NumPy array of illuminance values.
+
+    The results are identical to calling _dimming_from_ill for each value.
+    """
+    values = np.asarray(values, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        fract_dim = (ill_setpt - values) / (ill_setpt - min_light)
+        dimming = fract_dim + ((1 - fract_dim) * min_pow)
+    dimming[values <= min_light] = 1  # not dimmed at all
+    dimming[values > ill_setpt] = 0 if off_at_min else min_pow  # dimmed all the way
+    return dimming
+
+
+def _sum_dimming_fractions(su_values, rows, ill_setpt, min_pow, min_light, off_at_min):
+    """Add the dimming fractions of several sensors to the sums of each sun-up hour.
+
+    Args:
+        su_values: A list with the sum of dimming fractions for each sun-up hour.
+            This must be a NumPy array if NumPy is available and it will be
+            edited in place.
+        rows: The illuminance values of the sensors. This is a 2D NumPy array if
+            NumPy is available and an iterable of lists otherwise.
+        ill_setpt: A number for the illuminance setpoint.
+        min_pow: A number for the the lowest power the lighting system can dim to.
+        min_light: A number for the lowest lighting output the system can dim to.
+        off_at_min: Boolean for whether lights switch off at the minimum power.
+
+    Returns:
+        An integer for the number of sensors that were added.
+    """
+    sensor_count = 0
+    if np is None:
+        for values in rows:
+            sensor_count += 1
+            for i, val in enumerate(values):
+                su_values[i] += _dimming_from_ill(
+                    val, ill_setpt, min_pow, min_light, off_at_min)
+        return sensor_count
+    dimming = _dimming_array(rows, ill_setpt, min_pow, min_light, off_at_min)
+    hour_count = dimming.shape[1]
+    for sensor_dimming in dimming:  # add the sensors in order to match the rounding
+        su_values[:hour_count] += sensor_dimming
+        sensor_count += 1
+    return sensor_count
@@ -1,8 +1,30 @@
 """Functions for post-processing EN 17037 daylight outputs."""
 import json
 import os
+from bisect import bisect_right
 
 from .annual import filter_schedule_by_hours, _process_input_folder
+from .matrix import matrix_rows, matrix_array_chunks
+from ..parallel import run_in_parallel
+
+try:
+    import numpy as np
+except ImportError:  # numpy is not available; use the pure Python functions
+    np = None
+
+# daylight autonomy thresholds for each level of recommendation in EN 17037
+_RECOMMENDATIONS = {
+    'minimum_illuminance': {
+        'minimum': 100,
+        'medium': 300,
+        'high': 500
+    },
+    'target_illuminance': {
+        'minimum': 300,
+        'medium': 500,
+        'high': 750
+    }
+}
 
 
 def _daylight_autonomy(values, occ_pattern, threshold, total_hours):
@@ -28,6 +50,75 @@ def _daylight_autonomy(values, occ_pattern, threshold, total_hours):
     return round(100.0 * da / total_hours, 2)
 
 
+def _daylight_autonomy_by_thresholds(values, occ_pattern, thresholds, total_hours):
+    """Calculate annual daylight autonomy of a sensor for several thresholds at once.
+
+    The occupied values are sorted once such that the number of hours above each
+    threshold can be found with a binary search. The results are identical to
+    calling _daylight_autonomy for each threshold.
+
+    Args:
+        values: Hourly illuminance values as numbers.
+        occ_pattern: A list of 0 and 1 values for hours of occupancy.
+        thresholds: A list of threshold values for daylight autonomy.
+        total_hours: An integer for the total number of occupied hours.
+
+    Returns:
+        A list with the daylight autonomy for each threshold.
+    """
+    occ_values = sorted(v for is_occ, v in zip(occ_pattern, values) if is_occ != 0)
+    occ_count = len(occ_values)
+    return [
+        round(100.0 * (occ_count - bisect_right(occ_values, threshold)) / total_hours, 2)
+        for threshold in thresholds
+    ]
+
+
+def _daylight_autonomy_array(values, occ_pattern, thresholds, total_hours):
+    """Calculate daylight autonomy for several sensors and thresholds using NumPy.
+
+    The results are identical to calling _daylight_autonomy_by_thresholds for
+    each row of the array.
+
+    Args:
+        values: A 2D NumPy array of illuminance values where each row is a sensor
+            and each column is a sun-up hour.
+        occ_pattern: A list of 0 and 1 values for hours of occupancy.
+        thresholds: A list of threshold values for daylight autonomy.
+        total_hours: An integer for the total number of occupied hours.
+
+    Returns:
+        A list with a list of daylight autonomy values for each sensor.
+    """
+    # only keep the occupied hours (zip in _daylight_autonomy ignores extra values)
+    hour_count = min(values.shape[1], len(occ_pattern))
+    occ = np.asarray(occ_pattern[:hour_count]) != 0
+    values = values[:, :hour_count][:, occ]
+    counts = [np.count_nonzero(values > threshold, axis=1).tolist()
+              for threshold in thresholds]
+    return [[round(100.0 * count / total_hours, 2) for count in sensor_counts]
+            for sensor_counts in zip(*counts)]
+
+
+def _daylight_autonomy_by_sensor(ill_file, occ_pattern, thresholds, total_hours):
+    """Yield a list of daylight autonomy values for each sensor in an ill file.
+
+    Each sensor gets one value for each of the thresholds and the ill file is
+    only read once. If NumPy is available, the sensors will be loaded and
+    computed in chunks of rows.
+    """
+    if np is None:
+        for values in matrix_rows(ill_file):
+            yield _daylight_autonomy_by_thresholds(
+                values, occ_pattern, thresholds, total_hours)
+        return
+    for values in matrix_array_chunks(ill_file):
+        values = np.asarray(values, dtype=float)
+        for sensor_da in _daylight_autonomy_array(
+                values, occ_pattern, thresholds, total_hours):
+            yield sensor_da
+
+
 def en17037_metrics_to_files(
     ill_file, occ_pattern, output_folder, grid_name=None, total_hours=None
 ):
@@ -37,11 +128,11 @@ def en17037_metrics_to_files(
     level of recommendation in EN 17037.
 
     Args:
-        ill_file: Path to an ill file generated by Radiance. The ill file should be
-            tab separated and shot NOT have a header. The results for each sensor point
-            should be available in a row and and each column should be the illuminance
-            value for a sun_up_hour. The number of columns should match the number of
-            sun up hours.
+        ill_file: Path to an ill file generated by Radiance. The ill file can be
+            in ASCII, float or double format and binary files must have a header.
+            The results for each sensor point should be available in a row and
+            and each column should be the illuminance value for a sun_up_hour. The
+            number of columns should match the number of sun up hours.
         occ_pattern: A list of 0 and 1 values for hours of occupancy.
         output_folder: An output folder where the results will be written to. The folder
             will be created if not exist.
@@ -55,66 +146,54 @@ def en17037_metrics_to_files(
     if not os.path.isdir(output_folder):
         os.makedirs(output_folder)
 
-    recommendations = {
-        'minimum_illuminance': {
-            'minimum': 100,
-            'medium': 300,
-            'high': 500
-        },
-        'target_illuminance': {
-            'minimum': 300,
-            'medium': 500,
-            'high': 750
-        }
-    }
-
     grid_name = grid_name or os.path.split(ill_file)[-1][-4:]
-    da_folders = []
-
-    for target_type, thresholds in recommendations.items():
-        type_folder = os.path.join(output_folder, target_type)
-        if not os.path.isdir(type_folder):
-            os.makedirs(type_folder)
 
+    # create the folders and open the da file for each level of recommendation
+    levels, da_files, da_folders = [], [], []
+    for target_type, thresholds in _RECOMMENDATIONS.items():
+        space_target = 50 if target_type == 'target_illuminance' else 95
         for level, threshold in thresholds.items():
-            level_folder = os.path.join(type_folder, level)
-            if not os.path.isdir(level_folder):
-                os.makedirs(level_folder)
+            level_folder = os.path.join(output_folder, target_type, level)
+            for metric in ('da', 'sda'):
+                folder = os.path.join(level_folder, metric)
+                if not os.path.isdir(folder):
+                    os.makedirs(folder)
+            levels.append((level_folder, threshold, space_target))
+            da_folders.append(os.path.join(level_folder, 'da'))
 
+    # compute the daylight autonomy for all of the levels with one read of the file
+    thresholds = [threshold for _, threshold, _ in levels]
+    passing = [0] * len(levels)
+    sensor_count = 0
+    try:
+        for level_folder, _, _ in levels:
             da_file = os.path.join(
                 level_folder, 'da', '%s.da' % grid_name).replace('\\', '/')
-            folder = os.path.dirname(da_file)
-            if not os.path.isdir(folder):
-                os.makedirs(folder)
-            sda_file = os.path.join(
-                level_folder, 'sda', '%s.sda' % grid_name).replace('\\', '/')
-            folder = os.path.dirname(sda_file)
-            if not os.path.isdir(folder):
-                os.makedirs(folder)
-
-            da = []
-            with open(ill_file) as results, open(da_file, 'w') as daf:
-                for pt_res in results:
-                    values = (float(res) for res in pt_res.split())
-                    dar = _daylight_autonomy(values, occ_pattern, threshold, total_hours)
-                    daf.write(str(dar) + '\n')
-                    da.append(dar)
-
-            space_target = 50 if target_type == 'target_illuminance' else 95
-            pass_fail = [int(val > space_target) for val in da]
-
-            sda = sum(pass_fail) / len(pass_fail)
-            with open(sda_file, 'w') as sdaf:
-                sdaf.write(str(sda))
-
-            da_folders.append(os.path.join(level_folder, 'da'))
+            da_files.append(open(da_file, 'w'))
+        for sensor_da in _daylight_autonomy_by_sensor(
+                ill_file, occ_pattern, thresholds, total_hours):
+            sensor_count += 1
+            for i, (dar, (_, _, space_target)) in enumerate(zip(sensor_da, levels)):
+                da_files[i].write(str(dar) + '\n')
+                if dar > space_target:
+                    passing[i] += 1
+    finally:
+        for daf in da_files:
+            daf.close()
+
+    for (level_folder, _, _), level_passing in zip(levels, passing):
+        sda_file = os.path.join(
+            level_folder, 'sda', '%s.sda' % grid_name).replace('\\', '/')
+        sda = level_passing / sensor_count
+        with open(sda_file, 'w') as sdaf:
+            sdaf.write(str(sda))
 
     return da_folders
 
 
 # TODO - support a list of schedules/schedule folder to match the input grids
 def en17037_to_folder(
-    results_folder, schedule, grids_filter='*', sub_folder='metrics'
+    results_folder, schedule, grids_filter='*', sub_folder='metrics', cpu_count=1
         ):
     """Compute annual EN 17037 metrics in a folder and write them in a subfolder.
 
@@ -130,6 +209,10 @@ def en17037_to_folder(
             processed.
         sub_folder: An optional relative path for subfolder to copy results files.
             Default: metrics
+        cpu_count: An integer for the number of processes used to compute the
+            metrics of the grids in parallel. The output files are the same as
+            those of a serial run. If None, all of the CPUs of the machine will
+            be used. (Default: 1).
 
     Returns:
         str -- Path to results folder.
@@ -145,19 +228,26 @@ def en17037_to_folder(
             'schedule must consist of the daylight hours which is defined '
             'as the half of the year with the largest quantity of daylight' % total_occ)
 
+    # create all of the folders before the grids are processed in parallel
     metrics_folder = os.path.join(results_folder, sub_folder)
-    if not os.path.isdir(metrics_folder):
-        os.makedirs(metrics_folder)
-
-    for grid in grids:
-        ill_file = os.path.join(results_folder, '%s.ill' % grid['full_id'])
-        da_folders = en17037_metrics_to_files(
-            ill_file, occ_pattern, metrics_folder, grid['full_id'], total_occ
-        )
+    for target_type, thresholds in _RECOMMENDATIONS.items():
+        for level in thresholds:
+            for metric in ('da', 'sda'):
+                folder = os.path.join(metrics_folder, target_type, level, metric)
+                if not os.path.isdir(folder):
+                    os.makedirs(folder)
+
+    grid_args = [
+        (os.path.join(results_folder, '%s.ill' % grid['full_id']), occ_pattern,
+         metrics_folder, grid['full_id'], total_occ)
+        for grid in grids
+    ]
+    grid_da_folders = run_in_parallel(en17037_metrics_to_files, grid_args, cpu_count)
+    da_folders = grid_da_folders[-1] if grid_da_folders else []
 
     # copy info.json to all results folders
     for folder_name in da_folders:
-        grid_info = os.path.join(metrics_folder, folder_name, 'grids_info.json')
+        grid_info = os.path.join(folder_name, 'grids_info.json')
         with open(grid_info, 'w') as outf:
             json.dump(grids, outf, indent=2)
 
@@ -7,6 +7,7 @@ import math
 from honeybee.model import Model
 from honeybee.units import conversion_factor_to_meters
 from ..writer import _filter_by_pattern
+from .matrix import matrix_rows
 
 
 def _process_input_folder(folder, filter_pattern):
@@ -40,8 +41,7 @@ def ill_pass_fail_from_folder(
     grids = _process_input_folder(results_folder, grids_filter)
     for grid in grids:
         res_file = os.path.join(results_folder, '%s.res' % grid['full_id'])
-        with open(res_file) as inf:
-            values = [float(line) for line in inf]
+        values = [row[0] for row in matrix_rows(res_file)]
         grid_pf = []
         for val in values:
             if val > 300:
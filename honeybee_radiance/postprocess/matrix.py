@@ -0,0 +1,274 @@
+"""Functions for reading Radiance matrix files in ASCII or binary format.
+
+Radiance matrices can have an optional header that starts with ``#?RADIANCE`` and
+ends with an empty line. The header is used to get the number of rows (``NROWS``),
+columns (``NCOLS``) and components (``NCOMP``) as well as the ``FORMAT`` of the
+data that follows the header. Matrices with ``FORMAT=float`` or ``FORMAT=double``
+are read directly from their binary data without any text parsing.
+
+Matrices with more than one component (eg. RGB matrices with ``NCOMP=3``) are
+returned with a flattened layout where the components of each column follow one
+another in each row. For example, a row of an RGB matrix with two columns is
+returned as ``[r0, g0, b0, r1, g1, b1]``.
+"""
+import os
+import struct
+import sys
+from itertools import islice
+
+from ..reader import open_at_line
+
+try:
+    import numpy as np
+except ImportError:  # numpy is not available; arrays cannot be used
+    np = None
+
+# number of rows that are loaded into an array at a time
+CHUNK_SIZE = 1000
+
+_BINARY_FORMATS = {'float': ('f', 4), 'double': ('d', 8)}
+
+
+def matrix_header(input_file):
+    """Parse the header of a Radiance matrix file.
+
+    Args:
+        input_file: Path to a Radiance matrix file with or without a header.
+
+    Returns:
+        A dictionary with the following keys.
+
+        -   nrows: An integer for the number of rows or None if the number of rows
+            is not in the header.
+
+        -   ncols: An integer for the number of columns or None if the number of
+            columns is not in the header.
+
+        -   ncomp: An integer for the number of components for each value. This is
+            1 for matrices without a header.
+
+        -   format: Text for the format of the data. This will be one of the
+            following: ascii, float, double.
+
+        -   big_endian: A boolean for whether the binary data is big endian. This
+            is None if the byte order is not in the header, in which case the
+            byte order of the machine will be used.
+
+        -   offset: An integer for the number of bytes in the header.
+    """
+    header = {
+        'nrows': None, 'ncols': None, 'ncomp': 1, 'format': 'ascii',
+        'big_endian': None, 'offset': 0
+    }
+    with open(input_file, 'rb') as inf:
+        first_line = inf.readline()
+        if first_line[:10] != b'#?RADIANCE':
+            return header
+        header['ncomp'] = 3  # Radiance default when NCOMP is not specified
+        for line in iter(inf.readline, b''):
+            line = line.strip()
+            if not line:
+                break
+            try:
+                key, value = line.decode('ascii', 'ignore').split('=', 1)
+            except ValueError:
+                continue  # a line of the header that is not a variable
+            key = key.strip().upper()
+            if key == 'NROWS':
+                header['nrows'] = int(value)
+            elif key == 'NCOLS':
+                header['ncols'] = int(value)
+            elif key == 'NCOMP':
+                header['ncomp'] = int(value)
+                if header['ncomp'] < 1:
+                    raise ValueError(
+                        'Invalid NCOMP in Radiance matrix header: {}. NCOMP must '
+                        'be a positive integer.'.format(header['ncomp']))
+            elif key == 'FORMAT':
+                header['format'] = value.strip()
+            elif key == 'BIGENDIAN':
+                header['big_endian'] = value.strip() == '1'
+        header['offset'] = inf.tell()
+    return header
+
+
+def matrix_rows(input_file, start_row=None, end_row=None):
+    """Yield the values of each row in a Radiance matrix as a list of floats.
+
+    Only one row of the matrix is loaded into memory at a time. Empty rows of
+    ASCII matrices are ignored.
+
+    Binary matrices are moved directly to the start row. ASCII matrices will use
+    the line index of the file if it exists (see reader.build_line_index) to
+    move to the start row, in which case each row of the matrix is expected to
+    be written on a single line.
+
+    Args:
+        input_file: Path to a Radiance matrix file with or without a header. The
+            data can be in ASCII, float or double format. For matrices with more
+            than one component (eg. RGB), the components of each column will
+            follow one another in each row.
+        start_row: An optional integer for the index of the first row to be
+            read. (Default: 0).
+        end_row: An optional integer for the index of the last row to be
+            read. (Default: last row of the matrix).
+    """
+    start_row = start_row or 0
+    row_count = None if end_row is None else max(0, end_row - start_row + 1)
+    header = matrix_header(input_file)
+    if header['format'] == 'ascii':
+        start_line = start_row
+        if start_row and header['offset']:
+            with open(input_file, 'rb') as inf:
+                start_line += inf.read(header['offset']).count(b'\n')
+        with open_at_line(input_file, start_line) as inf:
+            if not start_line:
+                _skip_header(inf, header)
+            for line in islice(inf, row_count):
+                values = [float(v) for v in line.split()]
+                if values:
+                    yield values
+        return
+
+    code, size = _binary_format(header)
+    row_length = header['ncols'] * header['ncomp']
+    row_struct = struct.Struct(_byte_order(header) + code * row_length)
+    row_size = size * row_length
+    if header['nrows'] is not None:
+        available = max(0, header['nrows'] - start_row)
+        row_count = available if row_count is None else min(row_count, available)
+    with open(input_file, 'rb') as inf:
+        inf.seek(header['offset'] + start_row * row_size)
+        count = 0
+        while row_count is None or count < row_count:
+            data = inf.read(row_size)
+            if len(data) < row_size:
+                break
+            yield list(row_struct.unpack(data))
+            count += 1
+
+
+def matrix_to_array(input_file):
+    """Load a Radiance matrix as a 2D NumPy array.
+
+    Binary matrices are memory-mapped, which means that the values are only read
+    from the disk once they are accessed. ASCII matrices are parsed into memory.
+
+    Args:
+        input_file: Path to a Radiance matrix file with or without a header.
+
+    Returns:
+        A 2D NumPy array with a row for each row of the matrix. For matrices with
+        more than one component, the components of each column will follow one
+        another in each row such that each row has NCOLS * NCOMP values.
+    """
+    _check_numpy()
+    header = matrix_header(input_file)
+    if header['format'] == 'ascii':
+        with open(input_file) as inf:
+            _skip_header(inf, header)
+            return _check_row_length(np.loadtxt(inf, dtype=float, ndmin=2), header)
+
+    dtype = _numpy_dtype(header)
+    row_length = header['ncols'] * header['ncomp']
+    row_count = header['nrows']
+    if row_count is None:
+        data_size = os.path.getsize(input_file) - header['offset']
+        row_count = data_size // (dtype.itemsize * row_length)
+    if row_count == 0:
+        return np.zeros((0, row_length), dtype=dtype)
+    return np.memmap(
+        input_file, dtype=dtype, mode='r', offset=header['offset'],
+        shape=(row_count, row_length)
+    )
+
+
+def matrix_array_chunks(input_file, chunk_size=CHUNK_SIZE):
+    """Yield the rows of a Radiance matrix as 2D NumPy arrays of several rows.
+
+    This keeps memory usage bounded for very large matrices while still allowing
+    vectorized operations over many rows at a time. Chunks of binary matrices
+    are views into a memory-mapped file.
+
+    Args:
+        input_file: Path to a Radiance matrix file with or without a header.
+        chunk_size: An integer for the maximum number of rows in each
+            chunk. (Default: 1000).
+
+    Returns:
+        An iterator of 2D NumPy arrays. Like matrix_to_array, the components of
+        each column follow one another in each row.
+    """
+    _check_numpy()
+    header = matrix_header(input_file)
+    if header['format'] == 'ascii':
+        with open(input_file) as inf:
+            _skip_header(inf, header)
+            while True:
+                lines = list(islice(inf, chunk_size))
+                if not lines:
+                    break
+                values = np.loadtxt(lines, dtype=float, ndmin=2)
+                if values.size:
+                    yield _check_row_length(values, header)
+        return
+
+    array = matrix_to_array(input_file)
+    for st in range(0, array.shape[0], chunk_size):
+        yield array[st:st + chunk_size]
+
+
+def _skip_header(text_file, header):
+    """Move an open text file to the line after the header of a Radiance matrix."""
+    if header['offset'] == 0:
+        return
+    for line in text_file:
+        if not line.strip():
+            break
+
+
+def _check_row_length(values, header):
+    """Check that the rows of an ASCII matrix have NCOLS * NCOMP values."""
+    if header['ncols'] is not None and values.size and \
+            values.shape[1] != header['ncols'] * header['ncomp']:
+        raise ValueError(
+            'The rows of the Radiance matrix have {} values but the header has '
+            'NCOLS={} and NCOMP={}.'.format(
+                values.shape[1], header['ncols'], header['ncomp']))
+    return values
+
+
+def _binary_format(header):
+    """Get the struct code and the size of each value of a binary matrix."""
+    try:
+        code, size = _BINARY_FORMATS[header['format']]
+    except KeyError:
+        raise ValueError(
+            'Unsupported Radiance matrix format: "{}". Supported formats are '
+            'ascii, float and double.'.format(header['format']))
+    if not header['ncols']:
+        raise ValueError(
+            'The header of a binary Radiance matrix must include NCOLS.')
+    return code, size
+
+
+def _byte_order(header):
+    """Get the struct byte order character for a binary matrix."""
+    if header['big_endian'] is None:
+        return '='
+    return '>' if header['big_endian'] else '<'
+
+
+def _numpy_dtype(header):
+    """Get the NumPy data type for the values of a binary matrix."""
+    size = _binary_format(header)[1]
+    big_endian = header['big_endian']
+    if big_endian is None:
+        big_endian = sys.byteorder == 'big'
+    return np.dtype('{}f{}'.format('>' if big_endian else '<', size))
+
+
+def _check_numpy():
+    """Raise an ImportError if NumPy is not available."""
+    if np is None:
+        raise ImportError('NumPy must be installed to load matrices as arrays.')
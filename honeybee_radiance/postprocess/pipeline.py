@@ -0,0 +1,475 @@
+"""Compute several annual metrics with a single read of each result matrix.
+
+Each metric is a reducer that receives the rows of a grid's result matrix in
+chunks. The matrix of each grid is streamed only once no matter how many metrics
+are requested, which avoids re-reading and re-parsing large .ill files for each
+metric.
+
+Usage:
+
+.. code-block:: python
+
+    from honeybee_radiance.postprocess.pipeline import annual_bundle_to_folder, \\
+        AnnualDaylightReducer, DaylightControlReducer
+
+    reducers = [AnnualDaylightReducer(threshold=300), DaylightControlReducer()]
+    annual_bundle_to_folder('./results', reducers, sub_folder='metrics')
+"""
+from __future__ import division
+
+import json
+import os
+
+from ladybug.wea import Wea
+
+from .annual import filter_schedule_by_hours, generate_default_schedule, \
+    _process_input_folder
+from .matrix import CHUNK_SIZE, matrix_rows, matrix_array_chunks
+from .annualdaylight import _metrics, _metrics_array, \
+    _annual_daylight_vis_metadata, _annual_daylight_config
+from .en17037 import _daylight_autonomy_by_thresholds, _daylight_autonomy_array, \
+    _annual_daylight_en17037_config, _RECOMMENDATIONS
+from .electriclight import _sum_dimming_fractions
+from .annualirradiance import _annual_irradiance_vis_metadata, \
+    _annual_irradiance_config
+from ..parallel import run_in_parallel
+
+try:
+    import numpy as np
+except ImportError:  # numpy is not available; use the pure Python functions
+    np = None
+
+
+class MetricReducer(object):
+    """Base class for a metric that is computed from one pass over result matrices.
+
+    Args:
+        sub_folder: Text for the name of the folder into which the metric files will
+            be written. This folder is relative to the sub-folder of the pipeline.
+
+    Properties:
+        * sub_folder
+        * output_folder
+    """
+    __slots__ = ('_sub_folder', '_output_folder')
+
+    def __init__(self, sub_folder):
+        self._sub_folder = sub_folder
+        self._output_folder = None
+
+    @property
+    def sub_folder(self):
+        """Get the name of the folder into which the metric files will be written."""
+        return self._sub_folder
+
+    @property
+    def output_folder(self):
+        """Get the path to the folder of the metric once it has been prepared."""
+        return self._output_folder
+
+    def prepare(self, results_folder, output_folder, sun_up_hours):
+        """Prepare the metric before any of the grids are processed.
+
+        This method runs once in the main process and must create all of the
+        folders that are written to by the grids.
+
+        Args:
+            results_folder: The folder of the annual results.
+            output_folder: The folder into which the metric files will be written.
+            sun_up_hours: A list of sun-up hours for the columns of the matrices.
+        """
+        self._output_folder = output_folder
+        if not os.path.isdir(output_folder):
+            os.makedirs(output_folder)
+
+    def start_grid(self, grid_id):
+        """Get an object to track the state of the metric for a grid."""
+        raise NotImplementedError()
+
+    def add_rows(self, state, rows):
+        """Add the rows of a chunk of the grid's matrix to the metric.
+
+        Args:
+            state: The object returned by start_grid for the grid.
+            rows: A 2D NumPy array if NumPy is available. Otherwise, a list of lists
+                where each sub-list is a row of the matrix.
+        """
+        raise NotImplementedError()
+
+    def end_grid(self, state):
+        """Finish the metric for a grid and return any result for the finish method.
+        """
+        return None
+
+    def finish(self, grids, grid_results):
+        """Write the files that are shared by all of the grids.
+
+        Args:
+            grids: A list of grid dictionaries from the grids_info.json.
+            grid_results: A list with the output of end_grid for each grid.
+        """
+        pass
+
+    def _write_grids_info(self, grids, folder_names, indent=None):
+        """Write the grids_info.json into several folders of the metric."""
+        for folder_name in folder_names:
+            grid_info = os.path.join(self._output_folder, folder_name, 'grids_info.json')
+            with open(grid_info, 'w') as outf:
+                json.dump(grids, outf, indent=indent)
+
+    def _write_vis_metadata(self, metric_info_dict):
+        """Write the vis_metadata.json into the folder of each metric."""
+        for metric, data in metric_info_dict.items():
+            file_path = os.path.join(self._output_folder, metric, 'vis_metadata.json')
+            with open(file_path, 'w') as fp:
+                json.dump(data, fp, indent=4)
+
+    def _write_config(self, cfg):
+        """Write the config.json for visualization into the metric folder."""
+        with open(os.path.join(self._output_folder, 'config.json'), 'w') as outf:
+            json.dump(cfg, outf)
+
+    def __repr__(self):
+        return '{}: {}'.format(self.__class__.__name__, self.sub_folder)
+
+
+class AnnualDaylightReducer(MetricReducer):
+    """Daylight autonomy, continuous daylight autonomy and useful daylight illuminance.
+
+    Args:
+        schedule: An annual occupancy schedule for 8760 hours of the year as a list
+            of values. If None, the default schedule will be used. (Default: None).
+        threshold: Threshold illuminance level for daylight autonomy. (Default: 300).
+        min_t: Minimum threshold for useful daylight illuminance. (Default: 100).
+        max_t: Maximum threshold for useful daylight illuminance. (Default: 3000).
+        sub_folder: Text for the name of the folder into which the metric files will
+            be written. (Default: annual_daylight).
+    """
+    __slots__ = ('schedule', 'threshold', 'min_t', 'max_t', '_occ_pattern',
+                 '_total_occ', '_sun_down_occ_hours')
+    METRICS = (
+        ('da', 'da'), ('cda', 'cda'), ('udi', 'udi'), ('udi_lower', 'udi'),
+        ('udi_upper', 'udi')
+    )
+
+    def __init__(self, schedule=None, threshold=300, min_t=100, max_t=3000,
+                 sub_folder='annual_daylight'):
+        MetricReducer.__init__(self, sub_folder)
+        self.schedule = schedule
+        self.threshold = threshold
+        self.min_t = min_t
+        self.max_t = max_t
+
+    def prepare(self, results_folder, output_folder, sun_up_hours):
+        MetricReducer.prepare(self, results_folder, output_folder, sun_up_hours)
+        self._occ_pattern, self._total_occ, self._sun_down_occ_hours = \
+            filter_schedule_by_hours(sun_up_hours=sun_up_hours, schedule=self.schedule)
+        for folder_name, _ in self.METRICS:
+            folder = os.path.join(output_folder, folder_name)
+            if not os.path.isdir(folder):
+                os.makedirs(folder)
+
+    def start_grid(self, grid_id):
+        return [
+            open(os.path.join(self._output_folder, folder_name,
+                              '%s.%s' % (grid_id, ext)), 'w')
+            for folder_name, ext in self.METRICS
+        ]
+
+    def add_rows(self, state, rows):
+        args = (self._occ_pattern, self.threshold, self.min_t, self.max_t,
+                self._total_occ, self._sun_down_occ_hours)
+        if np is not None:
+            pt_metrics = _metrics_array(rows, *args)
+        else:
+            pt_metrics = [_metrics(row, *args) for row in rows]
+        # the order of _metrics is da, cda, udi_lower, udi, udi_upper
+        daf, cdaf, udif, udi_lowerf, udi_upperf = state
+        for dar, cdar, udi_lowerr, udir, udi_upperr in pt_metrics:
+            daf.write(str(dar) + '\n')
+            cdaf.write(str(cdar) + '\n')
+            udi_lowerf.write(str(udi_lowerr) + '\n')
+            udif.write(str(udir) + '\n')
+            udi_upperf.write(str(udi_upperr) + '\n')
+
+    def end_grid(self, state):
+        for metric_file in state:
+            metric_file.close()
+
+    def finish(self, grids, grid_results):
+        self._write_grids_info(grids, [folder_name for folder_name, _ in self.METRICS])
+        self._write_vis_metadata(_annual_daylight_vis_metadata())
+        self._write_config(_annual_daylight_config())
+
+
+class EN17037Reducer(MetricReducer):
+    """Daylight autonomy and spatial daylight autonomy for the levels of EN 17037.
+
+    Args:
+        schedule: An annual schedule for 8760 hours of the year as a list of values.
+            This should be a daylight hours schedule with 4380 occupied hours.
+        sub_folder: Text for the name of the folder into which the metric files will
+            be written. (Default: en17037).
+    """
+    __slots__ = ('schedule', '_occ_pattern', '_total_occ', '_levels')
+
+    def __init__(self, schedule, sub_folder='en17037'):
+        MetricReducer.__init__(self, sub_folder)
+        self.schedule = schedule
+
+    def prepare(self, results_folder, output_folder, sun_up_hours):
+        self._occ_pattern, self._total_occ, _ = \
+            filter_schedule_by_hours(sun_up_hours=sun_up_hours, schedule=self.schedule)
+        if self._total_occ != 4380:
+            raise ValueError(
+                'There are %s occupied hours in the schedule. According to EN 17037 '
+                'the schedule must consist of the daylight hours which is defined '
+                'as the half of the year with the largest quantity of daylight'
+                % self._total_occ)
+        MetricReducer.prepare(self, results_folder, output_folder, sun_up_hours)
+        self._levels = []
+        for target_type, thresholds in _RECOMMENDATIONS.items():
+            space_target = 50 if target_type == 'target_illuminance' else 95
+            for level, threshold in thresholds.items():
+                level_folder = os.path.join(target_type, level)
+                for metric in ('da', 'sda'):
+                    folder = os.path.join(output_folder, level_folder, metric)
+                    if not os.path.isdir(folder):
+                        os.makedirs(folder)
+                self._levels.append((level_folder, threshold, space_target))
+
+    def start_grid(self, grid_id):
+        da_files = [
+            open(os.path.join(self._output_folder, level_folder, 'da',
+                              '%s.da' % grid_id), 'w')
+            for level_folder, _, _ in self._levels
+        ]
+        return {'id': grid_id, 'files': da_files, 'passing': [0] * len(self._levels),
+                'count': 0}
+
+    def add_rows(self, state, rows):
+        thresholds = [threshold for _, threshold, _ in self._levels]
+        if np is not None:
+            sensors_da = _daylight_autonomy_array(
+                rows, self._occ_pattern, thresholds, self._total_occ)
+        else:
+            sensors_da = [
+                _daylight_autonomy_by_thresholds(
+                    row, self._occ_pattern, thresholds, self._total_occ)
+                for row in rows
+            ]
+        for sensor_da in sensors_da:
+            state['count'] += 1
+            for i, (dar, (_, _, space_target)) in \
+                    enumerate(zip(sensor_da, self._levels)):
+                state['files'][i].write(str(dar) + '\n')
+                if dar > space_target:
+                    state['passing'][i] += 1
+
+    def end_grid(self, state):
+        for da_file in state['files']:
+            da_file.close()
+        for (level_folder, _, _), passing in zip(self._levels, state['passing']):
+            sda_file = os.path.join(
+                self._output_folder, level_folder, 'sda', '%s.sda' % state['id'])
+            with open(sda_file, 'w') as sdaf:
+                sdaf.write(str(passing / state['count']))
+
+    def finish(self, grids, grid_results):
+        da_folders = [os.path.join(level_folder, 'da')
+                      for level_folder, _, _ in self._levels]
+        self._write_grids_info(grids, da_folders, indent=2)
+        self._write_config(_annual_daylight_en17037_config())
+
+
+class DaylightControlReducer(MetricReducer):
+    """Electric lighting schedules with daylight dimming controls.
+
+    A CSV file named schedules.csv will be written with one column for each grid
+    and one row for each hour of the year.
+
+    Args:
+        base_schedule: A list of 8760 fractional values for the lighting schedule
+            without any daylight controls. If None, the default schedule will be
+            used. (Default: None).
+        ill_setpoint: A number for the illuminance setpoint in lux beyond which
+            electric lights are dimmed if there is sufficient daylight. (Default: 300).
+        min_power_in: A number between 0 and 1 for the the lowest power the lighting
+            system can dim down to. (Default: 0.3).
+        min_light_out: A number between 0 and 1 the lowest lighting output the
+            lighting system can dim down to. (Default: 0.2).
+        off_at_min: Boolean to note whether lights should switch off completely when
+            they get to the minimum power input. (Default: False).
+        sub_folder: Text for the name of the folder into which the schedules will
+            be written. (Default: electric_lighting).
+    """
+    __slots__ = ('base_schedule', 'ill_setpoint', 'min_power_in', 'min_light_out',
+                 'off_at_min', '_sun_up_hours')
+
+    def __init__(self, base_schedule=None, ill_setpoint=300, min_power_in=0.3,
+                 min_light_out=0.2, off_at_min=False, sub_folder='electric_lighting'):
+        MetricReducer.__init__(self, sub_folder)
+        self.base_schedule = base_schedule
+        self.ill_setpoint = ill_setpoint
+        self.min_power_in = min_power_in
+        self.min_light_out = min_light_out
+        self.off_at_min = off_at_min
+
+    def prepare(self, results_folder, output_folder, sun_up_hours):
+        MetricReducer.prepare(self, results_folder, output_folder, sun_up_hours)
+        self._sun_up_hours = [int(h) for h in sun_up_hours]
+
+    def start_grid(self, grid_id):
+        hour_count = len(self._sun_up_hours)
+        su_values = [0] * hour_count if np is None else np.zeros(hour_count)
+        return {'values': su_values, 'count': 0}
+
+    def add_rows(self, state, rows):
+        state['count'] += _sum_dimming_fractions(
+            state['values'], rows, self.ill_setpoint, self.min_power_in,
+            self.min_light_out, self.off_at_min)
+
+    def end_grid(self, state):
+        dim_fract = [1] * 8760
+        for val, hr in zip(_row_lists(state['values']), self._sun_up_hours):
+            dim_fract[hr] = float(val / state['count'])
+        base_schedule = self.base_schedule or generate_default_schedule()
+        return [b_val * d_val for b_val, d_val in zip(base_schedule, dim_fract)]
+
+    def finish(self, grids, grid_results):
+        self._write_grids_info(grids, [''])
+        csv_file = os.path.join(self._output_folder, 'schedules.csv')
+        with open(csv_file, 'w') as outf:
+            for line in zip(*grid_results):
+                outf.write(','.join([str(v) for v in line]) + '\n')
+
+
+class AnnualIrradianceReducer(MetricReducer):
+    """Average irradiance, peak irradiance and cumulative radiation.
+
+    Args:
+        wea: The .wea file that was used in the annual irradiance simulation. This
+            will be used to determine the duration of the analysis for computing
+            cumulative radiation.
+        timestep: The timestep of the Wea file. (Default: 1).
+        sub_folder: Text for the name of the folder into which the metric files will
+            be written. (Default: annual_irradiance).
+    """
+    __slots__ = ('wea', 'timestep', '_wea_len')
+    METRICS = ('average_irradiance', 'peak_irradiance', 'cumulative_radiation')
+
+    def __init__(self, wea, timestep=1, sub_folder='annual_irradiance'):
+        MetricReducer.__init__(self, sub_folder)
+        self.wea = wea
+        self.timestep = timestep
+
+    def prepare(self, results_folder, output_folder, sun_up_hours):
+        MetricReducer.prepare(self, results_folder, output_folder, sun_up_hours)
+        self._wea_len = Wea.count_timesteps(self.wea) * self.timestep
+        t_step_f = os.path.join(results_folder, 'timestep.txt')
+        with open(t_step_f, 'w') as t_f:
+            t_f.write(str(self.timestep))
+        for folder_name in self.METRICS:
+            folder = os.path.join(output_folder, folder_name)
+            if not os.path.isdir(folder):
+                os.makedirs(folder)
+
+    def start_grid(self, grid_id):
+        return [
+            open(os.path.join(self._output_folder, folder_name, '%s.res' % grid_id), 'w')
+            for folder_name in self.METRICS
+        ]
+
+    def add_rows(self, state, rows):
+        avg_i, pk_i, cml_r = state
+        for values in _row_lists(rows):
+            total_val = sum(values)
+            pk_i.write('{}\n'.format(max(values)))
+            avg_i.write('{}\n'.format(total_val / self._wea_len))
+            cml_r.write('{}\n'.format(total_val / (self.timestep * 1000)))
+
+    def end_grid(self, state):
+        for metric_file in state:
+            metric_file.close()
+
+    def finish(self, grids, grid_results):
+        self._write_grids_info(grids, self.METRICS)
+        self._write_vis_metadata(_annual_irradiance_vis_metadata())
+        self._write_config(_annual_irradiance_config())
+
+
+def annual_bundle_to_folder(
+    results_folder, reducers, grids_filter='*', sub_folder='metrics', cpu_count=1
+):
+    """Compute several annual metrics in a folder with one read of each result file.
+
+    This folder is an output folder of an annual recipe. Folder should include
+    grids_info.json and sun-up-hours.txt - the script uses the list in
+    grids_info.json to find the .ill file for each sensor grid. Each reducer
+    writes its files into its own sub_folder inside the sub_folder of this function.
+
+    Args:
+        results_folder: Results folder.
+        reducers: A list of MetricReducer objects for the metrics to compute.
+        grids_filter: A pattern to filter the grids. By default all the grids will be
+            processed.
+        sub_folder: An optional relative path for subfolder to write the metric
+            folders. (Default: metrics).
+        cpu_count: An integer for the number of processes used to process the grids
+            in parallel. If None, all of the CPUs of the machine will be
+            used. (Default: 1).
+
+    Returns:
+        str -- Path to the folder of the metrics.
+    """
+    grids, sun_up_hours = _process_input_folder(results_folder, grids_filter)
+    metrics_folder = os.path.join(results_folder, sub_folder)
+    for reducer in reducers:
+        reducer.prepare(
+            results_folder, os.path.join(metrics_folder, reducer.sub_folder),
+            sun_up_hours)
+
+    grid_args = [
+        (os.path.join(results_folder, '%s.ill' % grid['full_id']), grid['full_id'],
+         reducers)
+        for grid in grids
+    ]
+    grid_results = run_in_parallel(_reduce_grid, grid_args, cpu_count)
+
+    # transpose the results from grid-by-reducer to reducer-by-grid
+    reducer_results = list(zip(*grid_results)) if grid_results else \
+        [[] for _ in reducers]
+    for reducer, results in zip(reducers, reducer_results):
+        reducer.finish(grids, list(results))
+
+    return metrics_folder
+
+
+def _reduce_grid(ill_file, grid_id, reducers):
+    """Stream the matrix of a grid once through all of the reducers."""
+    states = [reducer.start_grid(grid_id) for reducer in reducers]
+    for rows in _matrix_chunks(ill_file):
+        for reducer, state in zip(reducers, states):
+            reducer.add_rows(state, rows)
+    return [reducer.end_grid(state) for reducer, state in zip(reducers, states)]
+
+
+def _matrix_chunks(ill_file):
+    """Yield chunks of matrix rows as NumPy arrays or as lists of lists."""
+    if np is not None:
+        for rows in matrix_array_chunks(ill_file):
+            yield np.asarray(rows, dtype=float)
+        return
+    rows = []
+    for row in matrix_rows(ill_file):
+        rows.append(row)
+        if len(rows) == CHUNK_SIZE:
+            yield rows
+            rows = []
+    if rows:
+        yield rows
+
+
+def _row_lists(rows):
+    """Get a chunk of rows as lists of Python floats."""
+    return rows.tolist() if np is not None else rows
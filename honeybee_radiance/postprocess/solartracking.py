@@ -3,9 +3,24 @@ import os
 import json
 import shutil
 import math
+import struct
 
 from ladybug_geometry.geometry3d.pointvector import Vector3D
-from ladybug.sunpath import Sunpath
+
+from ..lightsource.sunpath import sun_positions
+
+from .matrix import matrix_header, matrix_rows, matrix_array_chunks, \
+    _skip_header, _binary_format, _byte_order, _numpy_dtype
+
+try:
+    from itertools import izip as zip  # python 2
+except ImportError:
+    pass  # python 3
+
+try:
+    import numpy as np
+except ImportError:  # numpy is not available; use the pure Python functions
+    np = None
 
 
 def post_process_solar_tracking(
@@ -15,6 +30,12 @@ def post_process_solar_tracking(
 
     This function essentially takes .ill files for each state of a dynamic tracking
     system and produces a single .ill file that models the tracking behavior.
+    The .ill files of the states are streamed one sensor row at a time such that
+    memory use does not grow with the size of the sensor grids. The .ill files
+    can be in ASCII, float or double format and binary .ill files will produce
+    a binary .ill file of the same format. The .ill files must have one
+    component per value (NCOMP=1) and the .ill files of all states must have the
+    same format and number of rows.
 
     Args:
         result_folders: A list of folders containing .ill files and each representing
@@ -40,16 +61,15 @@ def post_process_solar_tracking(
     end_angle = int(90 + (len(result_folders) * tracking_increment / 2))
     angles = list(range(st_angle, end_angle, tracking_increment))
 
-    # create a sun path ang get the sun-up hours to be used to get solar positions
-    sp = Sunpath.from_location(location, north)
+    # get the sun-up hours to be used to get solar positions
     with open(sun_up_file) as suh_file:
         sun_up_hours = [float(hour) for hour in suh_file.readlines()]
+    _, sun_vectors = sun_positions(location, north, sun_up_hours)
 
     # for each hour of the sun_up_hours, figure out which file is the one to use
     mtx_to_use, ground_vec = [], Vector3D(1, 0, 0)
-    for hoy in sun_up_hours:
-        sun = sp.calculate_sun_from_hoy(hoy)
-        vec = Vector3D(sun.sun_vector_reversed.x, 0, sun.sun_vector_reversed.z)
+    for sun_vec in sun_vectors:
+        vec = Vector3D(-sun_vec.x, 0, -sun_vec.z)
         orient = math.degrees(ground_vec.angle(vec))
         for i, ang in enumerate(angles):
             if ang > orient:
@@ -73,18 +93,146 @@ def post_process_solar_tracking(
 
     # convert the .ill files of each sensor grid into a single .ill file
     for grid_id in grid_ids:
-        grid_mtx = []
-        for i, model in enumerate(result_folders):
-            grid_file = os.path.join(model, '{}.ill'.format(grid_id))
-            with open(grid_file) as ill_file:
-                grid_mtx.append([lin.split() for lin in ill_file])
-        grid_ill = []
-        for i, hoy_mtx in enumerate(mtx_to_use):
-            hoy_vals = []
-            for pt in range(len(grid_mtx[0])):
-                hoy_vals.append(grid_mtx[hoy_mtx][pt][i])
-            grid_ill.append(hoy_vals)
+        grid_files = [os.path.join(model, '{}.ill'.format(grid_id))
+                      for model in result_folders]
         dest_file = os.path.join(destination_folder, '{}.ill'.format(grid_id))
-        with open(dest_file, 'w') as ill_file:
-            for row in zip(*grid_ill):
-                ill_file.write('  '.join(row) + '\n')
+        _track_grid(grid_files, mtx_to_use, dest_file)
+
+
+def _track_grid(grid_files, mtx_to_use, dest_file):
+    """Write a single .ill file from the .ill files of each state of a grid.
+
+    The files of all states are read together one sensor row at a time such that
+    only one row of each state is in memory at once.
+
+    Args:
+        grid_files: A list of .ill files with one file for each state.
+        mtx_to_use: A list with the index of the state to use for each hour.
+        dest_file: The path to the .ill file to be written.
+    """
+    # group the hours by the state that is used for them
+    state_hours = [[] for _ in grid_files]
+    for hour, state in enumerate(mtx_to_use):
+        state_hours[state].append(hour)
+    state_hours = [(i, hours) for i, hours in enumerate(state_hours) if hours]
+    hour_count = len(mtx_to_use)
+
+    headers = [matrix_header(grid_file) for grid_file in grid_files]
+    _check_state_headers(grid_files, headers)
+    header = headers[0]
+    if header['format'] == 'ascii':
+        in_files = [open(grid_file) for grid_file in grid_files]
+        try:
+            for in_file, state_header in zip(in_files, headers):
+                _skip_header(in_file, state_header)
+            state_lines = [
+                (line for line in in_file if line.strip()) for in_file in in_files]
+            with open(dest_file, 'w') as ill_file:
+                for lines in _zip_states(state_lines, grid_files):
+                    row = [None] * hour_count
+                    for i, hours in state_hours:
+                        values = lines[i].split()
+                        for hour in hours:
+                            row[hour] = values[hour]
+                    ill_file.write('  '.join(row) + '\n')
+        finally:
+            for in_file in in_files:
+                in_file.close()
+        return
+
+    # binary matrices are written into a binary matrix with the same format
+    row_counts = [_binary_row_count(f, h) for f, h in zip(grid_files, headers)]
+    for grid_file, row_count in zip(grid_files[1:], row_counts[1:]):
+        if row_count != row_counts[0]:
+            raise ValueError(
+                'The .ill files of all states must have the same number of rows but '
+                '"{}" has {} rows and "{}" has {} rows.'.format(
+                    grid_files[0], row_counts[0], grid_file, row_count))
+    with open(dest_file, 'wb') as ill_file:
+        ill_file.write(_binary_header(header, hour_count).encode('ascii'))
+        if np is not None:
+            dtype = _numpy_dtype(header)
+            state_chunks = [matrix_array_chunks(f) for f in grid_files]
+            for chunks in zip(*state_chunks):
+                rows = np.empty((chunks[0].shape[0], hour_count), dtype=dtype)
+                for i, hours in state_hours:
+                    rows[:, hours] = chunks[i][:, hours]
+                ill_file.write(rows.tobytes())
+        else:
+            code = _binary_format(header)[0]
+            row_struct = struct.Struct(_byte_order(header) + code * hour_count)
+            state_rows = [matrix_rows(f) for f in grid_files]
+            for rows in zip(*state_rows):
+                row = [None] * hour_count
+                for i, hours in state_hours:
+                    values = rows[i]
+                    for hour in hours:
+                        row[hour] = values[hour]
+                ill_file.write(row_struct.pack(*row))
+
+
+def _check_state_headers(grid_files, headers):
+    """Check that the .ill files of all states can be combined into a single file.
+
+    Args:
+        grid_files: A list of .ill files with one file for each state.
+        headers: A list with the result of matrix_header for each file.
+    """
+    for grid_file, header in zip(grid_files, headers):
+        if header['ncomp'] != 1:
+            raise ValueError(
+                'The .ill files of a solar tracking system must have one component '
+                'per value but "{}" has NCOMP={}.'.format(grid_file, header['ncomp']))
+    first_file, first_header = grid_files[0], headers[0]
+    for grid_file, header in zip(grid_files[1:], headers[1:]):
+        for key in ('format', 'nrows', 'ncols'):
+            if header[key] is None or first_header[key] is None:
+                continue  # the value is not in the header of one of the files
+            if header[key] != first_header[key]:
+                raise ValueError(
+                    'The .ill files of all states must have the same {} but "{}" '
+                    'has {}={} and "{}" has {}={}.'.format(
+                        key.upper(), first_file, key.upper(), first_header[key],
+                        grid_file, key.upper(), header[key]))
+
+
+def _binary_row_count(grid_file, header):
+    """Get the number of rows in a binary .ill file from the size of the file."""
+    size = _binary_format(header)[1]
+    data_size = os.path.getsize(grid_file) - header['offset']
+    return data_size // (header['ncols'] * header['ncomp'] * size)
+
+
+def _zip_states(state_rows, grid_files):
+    """Zip the rows of each state and raise an error if a state has fewer rows.
+
+    Args:
+        state_rows: A list with an iterator of the rows of each state.
+        grid_files: A list of .ill files with one file for each state.
+    """
+    missing = object()
+    state_rows = [iter(rows) for rows in state_rows]
+    while True:
+        rows = tuple(next(row_iter, missing) for row_iter in state_rows)
+        ended = [f for f, row in zip(grid_files, rows) if row is missing]
+        if not ended:
+            yield rows
+        elif len(ended) == len(rows):
+            return
+        else:
+            raise ValueError(
+                'The .ill files of all states must have the same number of rows '
+                'but the following files have fewer rows than the others: '
+                '{}'.format(', '.join('"{}"'.format(f) for f in ended)))
+
+
+def _binary_header(header, hour_count):
+    """Get the header text for a binary .ill file of the tracking system."""
+    lines = ['#?RADIANCE']
+    if header['nrows'] is not None:
+        lines.append('NROWS={}'.format(header['nrows']))
+    lines.extend(['NCOLS={}'.format(hour_count), 'NCOMP=1'])
+    if header['big_endian'] is not None:
+        lines.append('BigEndian={}'.format(int(header['big_endian'])))
+    lines.append('FORMAT={}'.format(header['format']))
+    return '\n'.join(lines) + '\n\n'
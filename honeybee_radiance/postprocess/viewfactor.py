@@ -0,0 +1,122 @@
+"""Functions for post-processing spherical view factor outputs.
+
+The input of these functions is a Radiance matrix with one row for each ray that
+was traced from the sensors and one column for each modifier of the scene. The rays
+of each sensor must follow one another in the matrix. The matrix can be in ASCII,
+float or double format.
+"""
+from __future__ import division
+
+import math
+
+from .matrix import CHUNK_SIZE, matrix_header, matrix_rows, matrix_array_chunks, \
+    _check_numpy
+
+try:
+    import numpy as np
+except ImportError:  # numpy is not available; use the pure Python functions
+    np = None
+
+
+def sensor_view_factors(mtx_file, ray_count):
+    """Yield the view factors of each sensor as a list with a value for each modifier.
+
+    The rays of each sensor are averaged in chunks of several sensors such that
+    only a limited number of rows of the matrix are loaded into memory at once.
+
+    Args:
+        mtx_file: Path to a Radiance matrix of ray contributions.
+        ray_count: An integer for the number of rays traced from each sensor.
+    """
+    if np is None:
+        for sens_facs in _sensor_view_factors_python(mtx_file, ray_count):
+            yield sens_facs
+        return
+    for view_facs in _sensor_view_factors_array(mtx_file, ray_count):
+        for sens_facs in view_facs.tolist():
+            yield sens_facs
+
+
+def view_factors_to_files(mtx_file, ray_count, csv_file, npy_file=None):
+    """Write the view factors of each sensor to a CSV file and an optional NPY file.
+
+    Args:
+        mtx_file: Path to a Radiance matrix of ray contributions.
+        ray_count: An integer for the number of rays traced from each sensor.
+        csv_file: Path to a CSV file into which the view factors will be written.
+            Each row of the file will be a sensor and each column will be a modifier.
+        npy_file: An optional path to a NumPy file into which the view factors
+            will also be written as a 2D array of doubles. This requires NumPy
+            to be installed. (Default: None).
+
+    Returns:
+        The path to the CSV file.
+    """
+    if npy_file is None:
+        with open(csv_file, 'w') as v_file:
+            for facs in sensor_view_factors(mtx_file, ray_count):
+                v_file.write(','.join(str(v) for v in facs) + '\n')
+        return csv_file
+
+    _check_numpy()
+    sensor_count = -(-_matrix_row_count(mtx_file) // ray_count)
+    npy_array = None
+    row_i = 0
+    with open(csv_file, 'w') as v_file:
+        for view_facs in _sensor_view_factors_array(mtx_file, ray_count):
+            if npy_array is None:
+                npy_array = np.lib.format.open_memmap(
+                    npy_file, mode='w+', dtype=np.float64,
+                    shape=(sensor_count, view_facs.shape[1]))
+            npy_array[row_i:row_i + len(view_facs)] = view_facs
+            row_i += len(view_facs)
+            for facs in view_facs.tolist():
+                v_file.write(','.join(str(v) for v in facs) + '\n')
+    if npy_array is None:
+        np.save(npy_file, np.zeros((0, 0)))
+    else:
+        npy_array.flush()
+        del npy_array
+    return csv_file
+
+
+def _sensor_view_factors_array(mtx_file, ray_count):
+    """Yield 2D NumPy arrays with the view factors of several sensors at a time."""
+    # each chunk includes all of the rays of the sensors in the chunk
+    chunk_size = ray_count * max(1, CHUNK_SIZE // ray_count)
+    factor = math.pi * ray_count
+    for rays in matrix_array_chunks(mtx_file, chunk_size):
+        sensor_count = len(rays) // ray_count
+        full_count = sensor_count * ray_count
+        if sensor_count:
+            rays_3d = np.asarray(rays[:full_count], dtype=np.float64).reshape(
+                sensor_count, ray_count, -1)
+            # add the rays in order to match the rounding of the sum of each column
+            view_facs = rays_3d[:, 0].copy()
+            for ray_i in range(1, ray_count):
+                view_facs += rays_3d[:, ray_i]
+            yield view_facs / factor
+        if full_count != len(rays):  # last sensor of an incomplete matrix
+            yield np.asarray(rays[full_count:], dtype=np.float64).sum(
+                axis=0, keepdims=True) / factor
+
+
+def _sensor_view_factors_python(mtx_file, ray_count):
+    """Yield the view factors of each sensor as a list without using NumPy."""
+    factor = math.pi * ray_count
+    sens_rays = []
+    for ray in matrix_rows(mtx_file):
+        sens_rays.append(ray)
+        if len(sens_rays) == ray_count:
+            yield [sum(sens_facs) / factor for sens_facs in zip(*sens_rays)]
+            sens_rays = []
+    if sens_rays:
+        yield [sum(sens_facs) / factor for sens_facs in zip(*sens_rays)]
+
+
+def _matrix_row_count(mtx_file):
+    """Get the number of rows in a Radiance matrix file."""
+    header = matrix_header(mtx_file)
+    if header['nrows'] is not None:
+        return header['nrows']
+    return sum(1 for _ in matrix_rows(mtx_file))
@@ -1,7 +1,7 @@
 # coding=utf-8
 """Base class of Radiance Properties for all planar geometry objects."""
 from ..modifier import Modifier
-from ..mutil import dict_to_modifier  # imports all modifiers classes
+from ..mutil import dict_to_modifier, modifier_assignment_changed  # all modifiers
 from ..dynamic.state import _RadianceState
 from ..lib.modifiers import black
 
@@ -57,6 +57,7 @@ class _RadianceProperties(object):
                 'Expected Radiance Modifier for shade. Got {}'.format(type(value))
             value.lock()  # lock editing in case modifier has multiple references
         self._modifier = value
+        modifier_assignment_changed()
 
     @property
     def modifier_blk(self):
@@ -80,6 +81,7 @@ class _RadianceProperties(object):
                 'Expected Radiance Modifier. Got {}'.format(type(value))
             value.lock()  # lock editing in case modifier has multiple references
         self._modifier_blk = value
+        modifier_assignment_changed()
 
     @property
     def is_opaque(self):
@@ -110,6 +112,7 @@ class _RadianceProperties(object):
         This means that the Shade's modifier will be assigned by a ModifierSet instead.
         """
         self._modifier = None
+        modifier_assignment_changed()
 
     def duplicate(self, new_host=None):
         """Get a copy of this object.
@@ -257,6 +260,7 @@ class _DynamicRadianceProperties(_RadianceProperties):
                                 'Got  {}.'.format(type(value)))
         else:
             self._states = []
+        modifier_assignment_changed()
 
     @property
     def state_count(self):
@@ -268,6 +272,7 @@ class _DynamicRadianceProperties(_RadianceProperties):
         for state in self._states:
             state._parent = None
         self._states = []
+        modifier_assignment_changed()
 
     def add_state(self, state):
         """Add a Radiance state object to this object.
@@ -278,6 +283,7 @@ class _DynamicRadianceProperties(_RadianceProperties):
         assert self._dynamic_group_identifier is not None, 'Object must have ' \
             'a dynamic_group_identifier to assign states.'
         self._states.append(self._check_state(state))
+        modifier_assignment_changed()
 
     def move(self, moving_vec):
         """Move all state geometry along a vector.
@@ -2,6 +2,7 @@
 """Aperture Radiance Properties."""
 from ._base import _DynamicRadianceProperties
 from ..modifier import Modifier
+from ..mutil import modifier_assignment_changed
 from ..dynamic.state import RadianceSubFaceState
 from ..lib.modifiers import black
 from ..lib.modifiersets import generic_modifier_set_visible
@@ -76,6 +77,7 @@ class ApertureRadianceProperties(_DynamicRadianceProperties):
                 'Expected Radiance Modifier for aperture. Got {}'.format(type(value))
             value.lock()  # lock editing in case modifier has multiple references
         self._modifier = value
+        modifier_assignment_changed()
 
     @property
     def modifier_blk(self):
@@ -94,6 +96,7 @@ class ApertureRadianceProperties(_DynamicRadianceProperties):
                 'Expected Radiance Modifier for aperture. Got {}'.format(type(value))
             value.lock()  # lock editing in case modifier has multiple references
         self._modifier_blk = value
+        modifier_assignment_changed()
 
     @classmethod
     def from_dict(cls, data, host):
@@ -2,6 +2,7 @@
 """Face Radiance Properties."""
 from ._base import _RadianceProperties
 from ..modifier import Modifier
+from ..mutil import modifier_assignment_changed
 from ..lib.modifiersets import generic_modifier_set_visible
 
 
@@ -61,6 +62,7 @@ class FaceRadianceProperties(_RadianceProperties):
                 'Expected Radiance Modifier for face. Got {}'.format(type(value))
             value.lock()  # lock editing in case modifier has multiple references
         self._modifier = value
+        modifier_assignment_changed()
 
     @classmethod
     def from_dict(cls, data, host):
@@ -1,5 +1,6 @@
 # coding=utf-8
 """Model Radiance Properties."""
+from ladybug_geometry.geometry3d.pointvector import Vector3D
 from honeybee.extensionutil import model_extension_dicts
 from honeybee.checkdup import check_duplicate_identifiers
 from honeybee.boundarycondition import Surface
@@ -10,11 +11,15 @@ from ..sensorgrid import SensorGrid
 from ..view import View
 from ..dynamic.group import DynamicShadeGroup, DynamicSubFaceGroup
 from ..modifierset import ModifierSet
-from ..mutil import dict_to_modifier  # imports all modifiers classes
+from ..mutil import dict_to_modifier, modifier_assignment_version, \
+    InstanceSet  # imports all modifiers classes
 from ..modifier.material import aBSDF, BSDF
 from ..lib.modifiers import black, generic_context
 from ..lib.modifiersets import generic_modifier_set_visible
 from ..luminaire import Luminaire
+from ..parallel import run_in_parallel
+
+from itertools import chain
 
 try:
     from itertools import izip as zip  # python 2
@@ -63,6 +68,7 @@ class ModelRadianceProperties(object):
         self.sensor_grids = sensor_grids
         self.views = views
         self.luminaires = luminaires
+        self._modifier_cache = {}  # collected modifiers with the state of the model
 
     @property
     def host(self):
@@ -118,8 +124,13 @@ class ModelRadianceProperties(object):
         blk_modifiers and the modifier_direct of any states, which can be obtained
         separately from the blk_modifiers property.
         """
-        all_mods = self.room_modifiers + self.face_modifiers + self.shade_modifiers
-        return list(set(all_mods))
+        cache_key = self._modifier_cache_key()
+        all_mods = InstanceSet(self.room_modifiers)
+        all_mods.update(self._cached_modifiers(
+            'face', self._collect_face_modifiers, cache_key))
+        all_mods.update(self._cached_modifiers(
+            'shade', self._collect_shade_modifiers, cache_key))
+        return all_mods.unique_values()
 
     @property
     def blk_modifiers(self):
@@ -129,26 +140,15 @@ class ModelRadianceProperties(object):
         It also includes modifier_direct for any dynamic states assigned to
         these objects.
         """
-        modifiers = [black]
-        for face in self.host.faces:  # check all orphaned Face modifiers
-            self._check_and_add_face_modifier_blk(face, modifiers)
-        for ap in self.host.orphaned_apertures:  # check all Aperture modifiers
-            self._check_and_add_dynamic_obj_modifier_blk(ap, modifiers)
-        for dr in self.host.orphaned_doors:  # check all Door modifiers
-            self._check_and_add_dynamic_obj_modifier_blk(dr, modifiers)
-        for shade in self.host.shades:
-            self._check_and_add_dynamic_obj_modifier_blk(shade, modifiers)
-        for sm in self.host.shade_meshes:  # check all ShadeMesh modifiers
-            self._check_and_add_obj_modifier_blk(sm, modifiers)
-        return list(set(modifiers))
+        return self._cached_modifiers('blk', self._collect_blk_modifiers)
 
     @property
     def room_modifiers(self):
         """A list of all unique modifiers assigned to Room ModifierSets."""
-        room_mods = []
+        room_mods = InstanceSet()
         for cnstr_set in self.modifier_sets:
-            room_mods.extend(cnstr_set.modified_modifiers_unique)
-        return list(set(room_mods))
+            room_mods.update(cnstr_set.modified_modifiers_unique)
+        return room_mods.unique_values()
 
     @property
     def face_modifiers(self):
@@ -158,33 +158,13 @@ class ModelRadianceProperties(object):
         objects. It does not include the modifiers of any shades assigned to these
         objects. Nor does it include any blk modifiers.
         """
-        modifiers = []
-        for face in self.host.faces:  # check all orphaned Face modifiers
-            self._check_and_add_face_modifier(face, modifiers)
-        for ap in self.host.orphaned_apertures:  # check all Aperture modifiers
-            self._check_and_add_dynamic_obj_modifier(ap, modifiers)
-        for dr in self.host.orphaned_doors:  # check all Door modifiers
-            self._check_and_add_dynamic_obj_modifier(dr, modifiers)
-        return list(set(modifiers))
+        return self._cached_modifiers('face', self._collect_face_modifiers)
 
     @property
     def shade_modifiers(self):
         """A list of all unique modifiers assigned to Shade and ShadeMeshes in the model.
         """
-        modifiers = []
-        for room in self.host.rooms:
-            self._check_and_add_room_modifier_shade(room, modifiers)
-        for face in self.host.orphaned_faces:
-            self._check_and_add_face_modifier_shade(face, modifiers)
-        for ap in self.host.orphaned_apertures:
-            self._check_and_add_obj_modifier_shade(ap, modifiers)
-        for dr in self.host.orphaned_doors:
-            self._check_and_add_obj_modifier_shade(dr, modifiers)
-        for shade in self.host.orphaned_shades:
-            self._check_and_add_orphaned_shade_modifier(shade, modifiers)
-        for shade_mesh in self.host.shade_meshes:
-            self._check_and_add_shade_mesh_modifier(shade_mesh, modifiers)
-        return list(set(modifiers))
+        return self._cached_modifiers('shade', self._collect_shade_modifiers)
 
     @property
     def bsdf_modifiers(self):
@@ -194,18 +174,17 @@ class ModelRadianceProperties(object):
         Model.blk_modifiers.
         """
         all_mods = self.modifiers + self.blk_modifiers
-        return list(set(mod for mod in all_mods if isinstance(mod, (aBSDF, BSDF))))
+        return InstanceSet(
+            mod for mod in all_mods if isinstance(mod, (aBSDF, BSDF))).unique_values()
 
     @property
     def modifier_sets(self):
         """A list of all unique Room-Assigned ModifierSets in the Model."""
-        modifier_sets = []
+        modifier_sets = InstanceSet()
         for room in self.host.rooms:
             if room.properties.radiance._modifier_set is not None:
-                if not self._instance_in_array(room.properties.radiance._modifier_set,
-                                               modifier_sets):
-                    modifier_sets.append(room.properties.radiance._modifier_set)
-        return list(set(modifier_sets))  # catch equivalent modifier sets
+                modifier_sets.add(room.properties.radiance._modifier_set)
+        return modifier_sets.unique_values()  # catch equivalent modifier sets
 
     @property
     def global_modifier_set(self):
@@ -531,6 +510,91 @@ class ModelRadianceProperties(object):
         for luminaire in self._luminaires:
             luminaire.scale(factor, origin)
 
+    def generate_room_sensor_grids(
+            self, x_dim, y_dim=None, offset=1.0, remove_out=False, wall_offset=0,
+            rooms=None, cpu_count=1):
+        """Get a list of SensorGrids generated from the floors of the Model's Rooms.
+
+        The grids are generated with the generate_sensor_grid method of each
+        Room's radiance properties and they can be generated for several Rooms
+        at once using a pool of processes.
+
+        Args:
+            x_dim: The x dimension of the grid cells as a number.
+            y_dim: The y dimension of the grid cells as a number. If None,
+                the y dimension will be assumed to be the same as the x
+                dimension. (Default: None).
+            offset: A number for how far to offset the grid from the base face.
+                (Default: 1.0).
+            remove_out: Boolean to note whether an extra check should be run to remove
+                sensor points that lie outside the Room volume. (Default: False).
+            wall_offset: A number for the distance at which sensors close to walls
+                should be removed. (Default: 0).
+            rooms: An optional list of Rooms for which sensor grids will be
+                generated. If None, all Rooms of the Model will be used. (Default: None).
+            cpu_count: An integer for the number of processes used to generate
+                the grids of the Rooms in parallel. (Default: 1).
+
+        Returns:
+            A list of honeybee_radiance SensorGrids in the same order as the Rooms.
+            Rooms without a valid grid are excluded from the list.
+        """
+        rooms = self.host.rooms if rooms is None else rooms
+        kwargs = {
+            'x_dim': x_dim, 'y_dim': y_dim, 'offset': offset,
+            'remove_out': remove_out, 'wall_offset': wall_offset
+        }
+        arguments = [(room, 'generate_sensor_grid', kwargs) for room in rooms]
+        sensor_grids = run_in_parallel(_room_sensor_grid, arguments, cpu_count)
+        return [sg for sg in sensor_grids if sg is not None]
+
+    def generate_room_sensor_grids_radial(
+            self, x_dim, y_dim=None, offset=1.0, remove_out=False, wall_offset=0,
+            dir_count=8, start_vector=Vector3D(0, -1, 0), mesh_radius=None,
+            rooms=None, cpu_count=1):
+        """Get a list of radial SensorGrids generated from the Model's Room floors.
+
+        The grids are generated with the generate_sensor_grid_radial method of
+        each Room's radiance properties and they can be generated for several
+        Rooms at once using a pool of processes.
+
+        Args:
+            x_dim: The x dimension of the grid cells as a number.
+            y_dim: The y dimension of the grid cells as a number. If None,
+                the y dimension will be assumed to be the same as the x
+                dimension. (Default: None).
+            offset: A number for how far to offset the grid from the base face.
+                (Default: 1.0).
+            remove_out: Boolean to note whether an extra check should be run to remove
+                sensor points that lie outside the Room volume. (Default: False).
+            wall_offset: A number for the distance at which sensors close to walls
+                should be removed. (Default: 0).
+            dir_count: A positive integer for the number of radial directions
+                to be generated around each position. (Default: 8).
+            start_vector: A Vector3D to set the start direction of the generated
+                directions. (Default: (0, -1, 0)).
+            mesh_radius: An optional number to override the radius of the meshes
+                generated around each sensor. (Default: None).
+            rooms: An optional list of Rooms for which sensor grids will be
+                generated. If None, all Rooms of the Model will be used. (Default: None).
+            cpu_count: An integer for the number of processes used to generate
+                the grids of the Rooms in parallel. (Default: 1).
+
+        Returns:
+            A list of honeybee_radiance SensorGrids in the same order as the Rooms.
+            Rooms without a valid grid are excluded from the list.
+        """
+        rooms = self.host.rooms if rooms is None else rooms
+        kwargs = {
+            'x_dim': x_dim, 'y_dim': y_dim, 'offset': offset,
+            'remove_out': remove_out, 'wall_offset': wall_offset,
+            'dir_count': dir_count, 'start_vector': start_vector,
+            'mesh_radius': mesh_radius
+        }
+        arguments = [(room, 'generate_sensor_grid_radial', kwargs) for room in rooms]
+        sensor_grids = run_in_parallel(_room_sensor_grid, arguments, cpu_count)
+        return [sg for sg in sensor_grids if sg is not None]
+
     def generate_exterior_face_sensor_grid(
             self, dimension, offset=0.1, face_type='Wall', punched_geometry=False):
         """Get a radiance SensorGrid generated from all exterior Faces of this Model.
@@ -1031,13 +1095,12 @@ class ModelRadianceProperties(object):
             base['radiance']['modifier_sets'].append(mod_set.to_dict(abridged=True))
 
         # add all unique Modifiers to the dictionary
-        room_mods = []
+        modifiers = InstanceSet()
         for mod_set in modifier_sets:
-            room_mods.extend(mod_set.modified_modifiers_unique)
-        all_mods = room_mods + self.face_modifiers + self.shade_modifiers
-        modifiers = list(set(all_mods))
+            modifiers.update(mod_set.modified_modifiers_unique)
+        modifiers.update(self.face_modifiers + self.shade_modifiers)
         base['radiance']['modifiers'] = []
-        for mod in modifiers:
+        for mod in modifiers.unique_values():
             base['radiance']['modifiers'].append(mod.to_dict())
 
         # add the sensor grids and views to the dictionary
@@ -1219,14 +1282,90 @@ class ModelRadianceProperties(object):
             [ms.to_dict(abridged=True) for ms in modifier_sets.values()]
         return model_dict
 
+    def _modifier_cache_key(self):
+        """Get a key for the state of the model that affects the collected modifiers.
+
+        The key changes whenever a modifier is assigned to any object (or state) or
+        when objects are added to or removed from the model.
+        """
+        host = self.host
+        objects = chain(host.faces, host.apertures, host.doors, host.shades,
+                        host.shade_meshes)
+        detached = chain(host.orphaned_shades, host.shade_meshes)
+        return (modifier_assignment_version(), tuple(map(id, objects)),
+                tuple(obj.is_detached for obj in detached))
+
+    def _cached_modifiers(self, name, collect, cache_key=None):
+        """Get a list of modifiers from the cache or collect them if the model changed.
+
+        Args:
+            name: Text for the name of the modifiers in the cache.
+            collect: A method that returns a list of the modifiers.
+            cache_key: An optional key from the _modifier_cache_key method, which
+                can be used to avoid computing the key several times.
+        """
+        if cache_key is None:
+            cache_key = self._modifier_cache_key()
+        try:
+            cached_key, modifiers = self._modifier_cache[name]
+        except KeyError:
+            cached_key = None
+        if cached_key != cache_key:
+            modifiers = collect()
+            self._modifier_cache[name] = (cache_key, modifiers)
+        return list(modifiers)
+
+    def _collect_blk_modifiers(self):
+        """Collect all unique modifier_blk in the model with one pass over objects."""
+        modifiers = InstanceSet([black])
+        for face in self.host.faces:  # check all orphaned Face modifiers
+            self._check_and_add_face_modifier_blk(face, modifiers)
+        for ap in self.host.orphaned_apertures:  # check all Aperture modifiers
+            self._check_and_add_dynamic_obj_modifier_blk(ap, modifiers)
+        for dr in self.host.orphaned_doors:  # check all Door modifiers
+            self._check_and_add_dynamic_obj_modifier_blk(dr, modifiers)
+        for shade in self.host.shades:
+            self._check_and_add_dynamic_obj_modifier_blk(shade, modifiers)
+        for sm in self.host.shade_meshes:  # check all ShadeMesh modifiers
+            self._check_and_add_obj_modifier_blk(sm, modifiers)
+        return modifiers.unique_values()
+
+    def _collect_face_modifiers(self):
+        """Collect all unique Face, Aperture and Door modifiers with one pass."""
+        modifiers = InstanceSet()
+        for face in self.host.faces:  # check all orphaned Face modifiers
+            self._check_and_add_face_modifier(face, modifiers)
+        for ap in self.host.orphaned_apertures:  # check all Aperture modifiers
+            self._check_and_add_dynamic_obj_modifier(ap, modifiers)
+        for dr in self.host.orphaned_doors:  # check all Door modifiers
+            self._check_and_add_dynamic_obj_modifier(dr, modifiers)
+        return modifiers.unique_values()
+
+    def _collect_shade_modifiers(self):
+        """Collect all unique Shade and ShadeMesh modifiers with one pass."""
+        modifiers = InstanceSet()
+        for room in self.host.rooms:
+            self._check_and_add_room_modifier_shade(room, modifiers)
+        for face in self.host.orphaned_faces:
+            self._check_and_add_face_modifier_shade(face, modifiers)
+        for ap in self.host.orphaned_apertures:
+            self._check_and_add_obj_modifier_shade(ap, modifiers)
+        for dr in self.host.orphaned_doors:
+            self._check_and_add_obj_modifier_shade(dr, modifiers)
+        for shade in self.host.orphaned_shades:
+            self._check_and_add_orphaned_shade_modifier(shade, modifiers)
+        for shade_mesh in self.host.shade_meshes:
+            self._check_and_add_shade_mesh_modifier(shade_mesh, modifiers)
+        return modifiers.unique_values()
+
     def _check_and_add_room_modifier_shade(self, room, modifiers):
-        """Check if a modifier is assigned to a Room's shades and add it to a list."""
+        """Check if a modifier is assigned to a Room's shades and add it to a set."""
         self._check_and_add_obj_modifier_shade(room, modifiers)
         for face in room.faces:  # check all Face modifiers
             self._check_and_add_face_modifier_shade(face, modifiers)
 
     def _check_and_add_face_modifier_shade(self, face, modifiers):
-        """Check if a modifier is assigned to a Face's shades and add it to a list."""
+        """Check if a modifier is assigned to a Face's shades and add it to a set."""
         self._check_and_add_obj_modifier_shade(face, modifiers)
         for ap in face.apertures:  # check all Aperture modifiers
             self._check_and_add_obj_modifier_shade(ap, modifiers)
@@ -1234,12 +1373,12 @@ class ModelRadianceProperties(object):
             self._check_and_add_obj_modifier_shade(dr, modifiers)
 
     def _check_and_add_obj_modifier_shade(self, subf, modifiers):
-        """Check if a modifier is assigned to an object's shades and add it to a list."""
+        """Check if a modifier is assigned to an object's shades and add it to a set."""
         for shade in subf.shades:
             self._check_and_add_dynamic_obj_modifier(shade, modifiers)
 
     def _check_and_add_face_modifier(self, face, modifiers):
-        """Check if a modifier is assigned to a face and add it to a list."""
+        """Check if a modifier is assigned to a face and add it to a set."""
         self._check_and_add_obj_modifier(face, modifiers)
         for ap in face.apertures:  # check all Aperture modifiers
             self._check_and_add_dynamic_obj_modifier(ap, modifiers)
@@ -1247,7 +1386,7 @@ class ModelRadianceProperties(object):
             self._check_and_add_dynamic_obj_modifier(dr, modifiers)
 
     def _check_and_add_face_modifier_blk(self, face, modifiers):
-        """Check if a modifier_blk is assigned to a face and add it to a list."""
+        """Check if a modifier_blk is assigned to a face and add it to a set."""
         self._check_and_add_obj_modifier_blk(face, modifiers)
         for ap in face.apertures:  # check all Aperture modifiers
             self._check_and_add_dynamic_obj_modifier_blk(ap, modifiers)
@@ -1255,77 +1394,66 @@ class ModelRadianceProperties(object):
             self._check_and_add_dynamic_obj_modifier_blk(dr, modifiers)
 
     def _check_and_add_obj_modifier(self, obj, modifiers):
-        """Check if a modifier is assigned to an object and add it to a list."""
+        """Check if a modifier is assigned to an object and add it to an InstanceSet."""
         mod = obj.properties.radiance._modifier
         if mod is not None:
-            if not self._instance_in_array(mod, modifiers):
-                modifiers.append(mod)
+            modifiers.add(mod)
 
     def _check_and_add_dynamic_obj_modifier(self, obj, modifiers):
-        """Check if a modifier is assigned to a dynamic object and add it to a list."""
+        """Check if a modifier is assigned to a dynamic object and add it to a set."""
         mod = obj.properties.radiance._modifier
         if mod is not None:
-            if not self._instance_in_array(mod, modifiers):
-                modifiers.append(mod)
+            modifiers.add(mod)
         for st in obj.properties.radiance._states:
             stm = (st._modifier, st._modifier_direct) + \
                 tuple(s.modifier for s in st._shades)
             for mod in stm:
                 if mod is not None:
-                    if not self._instance_in_array(mod, modifiers):
-                        modifiers.append(mod)
+                    modifiers.add(mod)
 
     def _check_and_add_obj_modifier_blk(self, obj, modifiers):
-        """Check if a modifier_blk is assigned to an object and add it to a list."""
+        """Check if a modifier_blk is assigned to an object and add it to a set."""
         mod = obj.properties.radiance._modifier_blk
         if mod is not None:
-            if not self._instance_in_array(mod, modifiers):
-                modifiers.append(mod)
+            modifiers.add(mod)
 
     def _check_and_add_dynamic_obj_modifier_blk(self, obj, modifiers):
-        """Check if a modifier_blk is assigned to a dynamic object and add it to a list.
+        """Check if a modifier_blk is assigned to a dynamic object and add it to a set.
         """
         mod = obj.properties.radiance._modifier_blk
         if mod is not None:
-            if not self._instance_in_array(mod, modifiers):
-                modifiers.append(mod)
+            modifiers.add(mod)
         for st in obj.properties.radiance._states:
             for s in st._shades:
                 mod = s.modifier
                 if mod is not None:
-                    if not self._instance_in_array(mod, modifiers):
-                        modifiers.append(mod)
+                    modifiers.add(mod)
 
     def _check_and_add_orphaned_shade_modifier(self, obj, modifiers):
-        """Check if a modifier is assigned to an object and add it to a list."""
+        """Check if a modifier is assigned to an object and add it to an InstanceSet."""
         mod = obj.properties.radiance._modifier
         if mod is not None:
-            if not self._instance_in_array(mod, modifiers):
-                modifiers.append(mod)
+            modifiers.add(mod)
         else:
             def_mod = generic_context if obj.is_detached else \
                 generic_modifier_set_visible.shade_set.exterior_modifier
-            if not self._instance_in_array(def_mod, modifiers):
-                modifiers.append(def_mod)
+            modifiers.add(def_mod)
         for st in obj.properties.radiance._states:
             stm = (st._modifier, st._modifier_direct) + \
                 tuple(s.modifier for s in st._shades)
             for mod in stm:
                 if mod is not None:
-                    if not self._instance_in_array(mod, modifiers):
-                        modifiers.append(mod)
+                    modifiers.add(mod)
 
     def _check_and_add_shade_mesh_modifier(self, obj, modifiers):
-        """Check if a modifier is assigned to an object and add it to a list."""
+        """Check if a modifier is assigned to an object and add it to an InstanceSet."""
         mod = obj.properties.radiance._modifier
         if mod is not None:
-            if not self._instance_in_array(mod, modifiers):
-                modifiers.append(mod)
+            modifiers.add(mod)
         else:
             def_mod = generic_context if obj.is_detached else \
                 generic_modifier_set_visible.shade_set.exterior_modifier
-            if not self._instance_in_array(def_mod, modifiers):
-                modifiers.append(def_mod)
+            modifiers.add(def_mod)
 
     @staticmethod
     def _instance_in_array(object_instance, object_array):
@@ -1346,3 +1474,8 @@ class ModelRadianceProperties(object):
 
     def __repr__(self):
         return 'Model Radiance Properties: [host: {}]'.format(self.host.display_name)
+
+
+def _room_sensor_grid(room, method_name, kwargs):
+    """Generate the sensor grid of a Room inside a worker of run_in_parallel."""
+    return getattr(room.properties.radiance, method_name)(**kwargs)
@@ -2,6 +2,11 @@
 """Room Radiance Properties."""
 import math
 
+try:
+    import numpy as np
+except ImportError:  # numpy is not available; use the pure Python functions
+    np = None
+
 from ladybug_geometry.geometry3d.pointvector import Vector3D
 from honeybee.facetype import Floor, Wall
 from honeybee.typing import clean_rad_string
@@ -463,20 +468,8 @@ class RoomRadianceProperties(object):
         # remove any sensors within a certain distance of the walls, if requested
         if wall_offset >= x_dim / 2 or (y_dim is not None and wall_offset >= y_dim / 2):
             wall_geos = [f.geometry for f in self.host.faces if isinstance(f.type, Wall)]
-            pattern = []
-            for pt in floor_grid.face_centroids:
-                for wg in wall_geos:
-                    close_pt = wg.plane.closest_point(pt)
-                    p_dist = pt.distance_to_point(close_pt)
-                    if p_dist <= wall_offset:
-                        close_pt_2d = wg.plane.xyz_to_xy(close_pt)
-                        g_dist = wg.polygon2d.distance_to_point(close_pt_2d)
-                        f_dist = math.sqrt(p_dist ** 2 + g_dist ** 2)
-                        if f_dist <= wall_offset:
-                            pattern.append(False)
-                            break
-                else:
-                    pattern.append(True)
+            pattern = wall_offset_pattern(
+                floor_grid.face_centroids, wall_geos, wall_offset)
             try:
                 floor_grid, vertex_pattern = floor_grid.remove_faces(pattern)
             except AssertionError:  # the grid lies completely outside of the room
@@ -488,3 +481,85 @@ class RoomRadianceProperties(object):
 
     def __repr__(self):
         return 'Room Radiance Properties: [host: {}]'.format(self.host.display_name)
+
+
+def wall_offset_pattern(points, wall_geometries, wall_offset):
+    """Get a pattern for the points that are farther than a distance from the walls.
+
+    Only the walls that are within the wall_offset of a point's plane and bounding
+    box are checked with the exact distance from the point to the wall geometry.
+    These candidate walls are found for all of the points at once using numpy
+    when it is available.
+
+    Args:
+        points: A list of Point3D for the sensor positions.
+        wall_geometries: A list of Face3D for the geometry of the walls.
+        wall_offset: A number for the distance at which points close to the
+            walls should be removed.
+
+    Returns:
+        A list of booleans with one value for each point. Points that are within
+        the wall_offset of any of the walls are False and all others are True.
+    """
+    if not points or not wall_geometries:
+        return [True] * len(points)
+
+    # the bounding boxes and planes of the walls with a margin for rounding
+    bounds = [(wg.min, wg.max) for wg in wall_geometries]
+    planes = [(wg.plane.n, wg.plane.o) for wg in wall_geometries]
+    max_coord = max(
+        max(abs(v) for v in (pt_min.x, pt_min.y, pt_min.z, pt_max.x, pt_max.y, pt_max.z))
+        for pt_min, pt_max in bounds)
+    limit = wall_offset + 1e-6 * max(1.0, max_coord)
+
+    # find the walls that might be close enough to each point
+    if np is not None:
+        pts = np.array([(pt.x, pt.y, pt.z) for pt in points], dtype=np.float64)
+        candidates = np.zeros((len(points), len(wall_geometries)), dtype=bool)
+        for i, ((pt_min, pt_max), (n, o)) in enumerate(zip(bounds, planes)):
+            p_dist = np.abs(np.dot(pts - (o.x, o.y, o.z), (n.x, n.y, n.z)))
+            to_box = np.maximum(
+                np.maximum((pt_min.x, pt_min.y, pt_min.z) - pts, 0),
+                pts - (pt_max.x, pt_max.y, pt_max.z))
+            b_dist = np.sqrt((to_box ** 2).sum(axis=1))
+            candidates[:, i] = (p_dist <= limit) & (b_dist <= limit)
+        close_walls = [None] * len(points)
+        for pt_i in np.flatnonzero(candidates.any(axis=1)).tolist():
+            close_walls[pt_i] = \
+                [wall_geometries[i] for i in np.flatnonzero(candidates[pt_i]).tolist()]
+    else:
+        close_walls = []
+        for pt in points:
+            walls = []
+            for wg, (pt_min, pt_max), (n, o) in zip(wall_geometries, bounds, planes):
+                p_dist = abs(
+                    n.x * (pt.x - o.x) + n.y * (pt.y - o.y) + n.z * (pt.z - o.z))
+                if p_dist > limit:
+                    continue
+                b_dist = math.sqrt(sum(
+                    max(v_min - v, 0, v - v_max) ** 2 for v, v_min, v_max in (
+                        (pt.x, pt_min.x, pt_max.x), (pt.y, pt_min.y, pt_max.y),
+                        (pt.z, pt_min.z, pt_max.z))))
+                if b_dist <= limit:
+                    walls.append(wg)
+            close_walls.append(walls or None)
+
+    # check the exact distance to the candidate walls
+    pattern = []
+    for pt, walls in zip(points, close_walls):
+        if walls is None:
+            pattern.append(True)
+            continue
+        for wg in walls:
+            close_pt = wg.plane.closest_point(pt)
+            p_dist = pt.distance_to_point(close_pt)
+            if p_dist <= wall_offset:
+                close_pt_2d = wg.plane.xyz_to_xy(close_pt)
+                g_dist = wg.polygon2d.distance_to_point(close_pt_2d)
+                f_dist = math.sqrt(p_dist ** 2 + g_dist ** 2)
+                if f_dist <= wall_offset:
+                    pattern.append(False)
+                    break
+        else:
+            pattern.append(True)
+    return pattern
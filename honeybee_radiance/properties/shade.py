@@ -2,6 +2,7 @@
 """Shade Radiance Properties."""
 from ._base import _DynamicRadianceProperties
 from ..modifier import Modifier
+from ..mutil import modifier_assignment_changed
 from ..dynamic.state import RadianceShadeState
 from ..lib.modifiers import generic_context
 from ..lib.modifiersets import generic_modifier_set_visible
@@ -73,6 +74,7 @@ class ShadeRadianceProperties(_DynamicRadianceProperties):
                 'Expected Radiance Modifier for shade. Got {}'.format(type(value))
             value.lock()  # lock editing in case modifier has multiple references
         self._modifier = value
+        modifier_assignment_changed()
 
     @classmethod
     def from_dict(cls, data, host):
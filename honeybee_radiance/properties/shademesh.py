@@ -2,6 +2,7 @@
 """ShadeMesh Radiance Properties."""
 from ._base import _RadianceProperties
 from ..modifier import Modifier
+from ..mutil import modifier_assignment_changed
 from ..lib.modifiers import generic_context
 from ..lib.modifiersets import generic_modifier_set_visible
 
@@ -54,6 +55,7 @@ class ShadeMeshRadianceProperties(_RadianceProperties):
                 'Expected Radiance Modifier for ShadeMesh. Got {}'.format(type(value))
             value.lock()  # lock editing in case modifier has multiple references
         self._modifier = value
+        modifier_assignment_changed()
 
     @classmethod
     def from_dict(cls, data, host):
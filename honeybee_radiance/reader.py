@@ -1,9 +1,21 @@
 """A collection of auxiliary functions for working with radiance files and objects."""
 import re
 import os
+import io
+import json
+from array import array
+from itertools import islice
+
+from .sensor import Sensor
+
+# number of bytes to be read at once when scanning sensor files
+CHUNK_SIZE = 2 ** 20
+# number of lines between two offsets in a line index
+LINE_INDEX_STEP = 1000
+# a line with a sensor has a non-space character and does not start with #
+_sensor_line_pattern = re.compile(br'^(?!#)[^\S\n]*\S', re.MULTILINE)
 
 
-# TODO: Add support for comments [#] and commands [!]
 def parse_from_string(full_string):
     """Separate a Radiance file string into multiple strings for each object.
 
@@ -14,18 +26,7 @@ def parse_from_string(full_string):
         A list of strings. Each string represents a different Radiance primitive
         (geometry or modifier). Comments [#] and commands [!] are excluded.
     """
-    raw_rad_objects = re.findall(
-        r'^\s*([^0-9].*(\s*[\d.-]+.*)*)',
-        full_string,
-        re.MULTILINE)
-
-    rad_objects = (' '.join(radiance_object[0].split())
-                   for radiance_object in raw_rad_objects)
-
-    filtered_objects = tuple(rad_object for rad_object in rad_objects
-                             if rad_object and rad_object[0] not in ['#', '!'])
-
-    return filtered_objects
+    return tuple(parse_from_lines(_string_lines(full_string)))
 
 
 def parse_from_file(file_path):
@@ -50,7 +51,32 @@ def parse_from_file(file_path):
     assert os.path.isfile(file_path), "Can't find %s." % file_path
 
     with open(file_path, "r") as rad_file:
-        return parse_from_string(rad_file.read())
+        return tuple(parse_from_lines(rad_file))
+
+
+def parse_from_lines(lines):
+    """Yield a string for each Radiance object in an iterable of lines.
+
+    This is a generator and the lines are only read as the objects are requested.
+    This makes it possible to go through the objects of very large Radiance files
+    without loading the whole file in memory.
+
+    Args:
+        lines: An iterable of text lines such as an open Radiance file.
+
+    Returns:
+        A generator of strings. Each string represents a different Radiance
+        primitive (geometry or modifier). Comments [#] and commands [!] are excluded.
+
+    Usage:
+
+    .. code-block:: python
+
+        with open('some_file.rad') as rad_file:
+            for rad_obj_str in parse_from_lines(rad_file):
+                print(rad_obj_str)
+    """
+    return (' '.join(words) for words in _primitive_words(lines))
 
 
 def string_to_dicts(string):
@@ -67,59 +93,193 @@ def string_to_dicts(string):
     Returns:
         A list of dictionaries.
     """
-    def find_object(target, index):
-        for o_count, other_obj in enumerate(objects[:-(index + 1)]):
-            if other_obj['identifier'] == target:
-                return o_count, other_obj
+    objects = [_words_to_dict(words) for words in _primitive_words(_string_lines(string))]
 
-    input_objects = parse_from_string(string)
-
-    if not input_objects:
+    if not objects:
         raise ValueError(
             '{} includes no radiance objects.'.format(string)
         )
 
-    # break down each object and convert it to a dict
-    objects = [string_to_dict(inp) for inp in input_objects]
-
-    # start from the last material and try to find dependencies if any)
-    rev_objects = list(reversed(objects))
-    remove_index = []
-    for count, obj in enumerate(rev_objects):
+    # index the position of the first object with each identifier
+    first_index = {}
+    for count, obj in enumerate(objects):
+        first_index.setdefault(obj['identifier'], count)
 
+    def find_object(target, index):
+        """Get the index of the first object before index with a target identifier."""
+        o_count = first_index.get(target)
+        if o_count is not None and o_count < index:
+            return o_count
+
+    # start from the last object and replace dependencies with their objects
+    removed = set()
+    for count in range(len(objects) - 1, -1, -1):
+        obj = objects[count]
         if obj['modifier'] != 'void':
-            # try to find it in objects and add replace it
-            try:
-                o_count, other_obj = find_object(obj['modifier'], count)
-            except TypeError:
-                # didn't find any
+            o_count = find_object(obj['modifier'], count)
+            if o_count is None:
                 raise ValueError(
                     'Failed to find "{}" modifier for "{}" in input string'.format(
                         obj['modifier'], obj['identifier']
                     )
                 )
-            else:
-                objects[-(count + 1)]['modifier'] = other_obj
-                remove_index.append(o_count)
+            obj['modifier'] = objects[o_count]
+            removed.add(o_count)
+
+        for value in obj['values'][0]:
+            if '(' in value or '"' in value:
+                continue
+            # search for dependencies
+            o_count = find_object(value, count)
+            if o_count is not None:
+                obj['dependencies'].append(objects[o_count])
+                removed.add(o_count)
+
+    if removed:
+        return [obj for index, obj in enumerate(objects) if index not in removed]
+    else:
+        return objects
 
-        if len(obj['values'][0]) != 0:
-            for value in obj['values'][0]:
-                if '(' in value or '"' in value:
+
+def _string_lines(string):
+    """Get the lines of a Radiance string to be split into words.
+
+    Strings without comments, commands, expressions or quotes are returned as a
+    single line since they can be split into words all at once.
+    """
+    if '#' in string or '!' in string or '(' in string or '"' in string:
+        return string.splitlines()
+    return (string,)
+
+
+def _split_words(line):
+    """Split a line of a Radiance file into words.
+
+    Whitespace inside parentheses and double quotes does not split the words,
+    which is needed for string arguments with expressions.
+
+    Returns:
+        A tuple with the list of words and a boolean for whether all of the
+        parentheses and quotes in the line are closed.
+    """
+    if '(' not in line and '"' not in line:
+        return line.split(), True
+    words, word, depth, quoted = [], [], 0, False
+    for char in line:
+        if char.isspace():
+            if depth or quoted:
+                if word[-1] != ' ':
+                    word.append(' ')
+            elif word:
+                words.append(''.join(word))
+                word = []
+            continue
+        word.append(char)
+        if char == '"':
+            quoted = not quoted
+        elif quoted:
+            continue
+        elif char == '(':
+            depth += 1
+        elif char == ')' and depth:
+            depth -= 1
+    if word:
+        words.append(''.join(word).rstrip())
+    return words, depth == 0 and not quoted
+
+
+def _is_continued(line):
+    """Check whether a line of a Radiance command continues in the next line."""
+    return line.rstrip().endswith('\\')
+
+
+def _primitive_words(lines):
+    """Yield the list of words for each Radiance primitive in an iterable of lines.
+
+    The number of string, integer and real arguments of each primitive is used to
+    find where the primitive ends. Comments [#] and commands [!] are skipped when
+    they are found in place of a new primitive.
+    """
+    current, remaining, counts_left = [], 0, 0
+    partial_line, command = '', False
+    for line in lines:
+        if command:  # continuation of a multi-line command
+            command = _is_continued(line)
+            continue
+        if partial_line:
+            line = partial_line + ' ' + line
+            partial_line = ''
+        elif not current and line.lstrip()[:1] in ('#', '!'):
+            command = line.lstrip()[0] == '!' and _is_continued(line)
+            continue
+        words, complete = _split_words(line)
+        if not complete:  # an expression continues in the next line
+            partial_line = line
+            continue
+        i, word_count = 0, len(words)
+        while i < word_count:
+            if not current:
+                word = words[i]
+                if word[0] == '#' or word[0] == '!':
+                    command = word[0] == '!' and _is_continued(line)
+                    break  # ignore the rest of the line
+                current.append(word)
+                remaining, counts_left = 2, -1
+                i += 1
+                continue
+            if remaining:  # identifiers or arguments
+                step = min(remaining, word_count - i)
+                current.extend(words[i:i + step])
+                i += step
+                remaining -= step
+                if remaining:
+                    continue
+                if counts_left == -1:  # the modifier, type and identifier are set
+                    if current[1] == 'alias':
+                        remaining, counts_left = 1, 0
+                    else:
+                        counts_left = 3
                     continue
-                # search for dependencies
+            else:  # number of arguments
+                word = words[i]
+                current.append(word)
+                i += 1
                 try:
-                    o_count, other_obj = find_object(value, count)
-                except TypeError:
-                    # didn't find any
-                    pass
-                else:
-                    objects[-(count + 1)]['dependencies'].append(other_obj)
-                    remove_index.append(o_count)
-
-    if remove_index:
-        return [obj for index, obj in enumerate(objects) if index not in remove_index]
-    else:
-        return objects
+                    remaining = int(word)
+                except ValueError:
+                    raise ValueError(
+                        'Expected the number of arguments for "{}" Radiance object. '
+                        'Got "{}".'.format(current[2], word))
+                counts_left -= 1
+            if remaining == 0 and counts_left == 0:
+                yield current
+                current = []
+    if partial_line:  # an expression that is never closed
+        current.extend(_split_words(partial_line)[0])
+    if current:
+        yield current
+
+
+def _words_to_dict(words):
+    """Get the words of a single Radiance object as a primitive dictionary."""
+    modifier, primitive_type, identifier = words[:3]
+    base_data = words[3:]
+
+    count_1 = int(base_data[0])
+    count_2 = int(base_data[count_1 + 1])
+    count_3 = int(base_data[count_1 + count_2 + 2])
+
+    l1 = base_data[1: count_1 + 1]
+    l2 = base_data[count_1 + 2: count_1 + count_2 + 2]
+    l3 = base_data[count_1 + count_2 + 3: count_1 + count_2 + count_3 + 3]
+
+    return {
+        'modifier': modifier,
+        'type': primitive_type,
+        'identifier': identifier,
+        'values': [l1, l2, l3],
+        'dependencies': []
+    }
 
 
 # pattern one handles whitespaces inside ( )
@@ -196,7 +356,8 @@ def sensor_count_from_file(filepath):
     """Return sensor count of a sensor grid file.
 
     This function returns the sensor count of a sensor grid file. Comments [#] and
-    empty lines will not be counted.
+    empty lines will not be counted. The file is scanned in large chunks of bytes
+    without parsing the sensor values.
 
     Args:
         filepath: Full path to Radiance pts file.
@@ -205,10 +366,144 @@ def sensor_count_from_file(filepath):
         sensor_count
     """
     sensor_count = 0
-    with open(filepath, 'r') as pts_file:
-        for l in pts_file:
-            if not l.strip() or l[0] == '#':
-                pass
-            else:
-                sensor_count += 1
-    return sensor_count
\ No newline at end of file
+    with open(filepath, 'rb') as pts_file:
+        while True:
+            chunk = pts_file.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            if not chunk.endswith(b'\n'):  # read the rest of the last line
+                chunk += pts_file.readline()
+            sensor_count += len(_sensor_line_pattern.findall(chunk))
+    return sensor_count
+
+
+def sensor_values_from_file(filepath, start_line=None, end_line=None):
+    """Load the values of the sensors in a sensor grid file into a flat array.
+
+    The lines that start with # will be considered as commented lines and won't be
+    loaded. However, these commented lines are still considered in total line
+    count for the start_line and end_line inputs.
+
+    Args:
+        filepath: Full path to Radiance pts file.
+        start_line: Start line including the comments (default: 0).
+        end_line: End line as an integer including the comments
+            (default: last line in file).
+
+    Returns:
+        An array of numbers with 6 values for each sensor in the following
+        order: x, y, z, dx, dy, dz. The number of sensors is the length of the
+        array divided by 6.
+    """
+    start_line = int(start_line) if start_line is not None else 0
+    line_count = max(0, int(end_line) - start_line + 1) \
+        if end_line is not None else None
+
+    values, tokens = array('d'), []
+    with open_at_line(filepath, start_line) as inf:
+        for l in islice(inf, line_count):
+            if not l or l[0] == '#':
+                # commented line
+                continue
+            sen_values = l.split()
+            if len(sen_values) == 6:
+                tokens.extend(sen_values)
+            else:  # use the sensor defaults for the missing values
+                sensor = Sensor.from_raw_values(*sen_values)
+                tokens.extend(sensor.pos + sensor.dir)
+            if len(tokens) >= 60000:  # convert the values in batches of 10000 sensors
+                values.extend(map(float, tokens))
+                tokens = []
+    values.extend(map(float, tokens))
+    return values
+
+
+def line_index_path(filepath):
+    """Get the path to the sidecar line index file of a file."""
+    return filepath + '.idx'
+
+
+def build_line_index(filepath, step=LINE_INDEX_STEP):
+    """Build a line index for a text file and write it next to the file.
+
+    The index is a JSON file with the byte offset of every step-th line, which
+    makes it possible to move to any line of the file after reading at most
+    step lines. The size and the modification time of the file are stored in
+    the index such that an outdated index will be ignored.
+
+    Args:
+        filepath: Full path to a text file (eg. a pts or an ill file).
+        step: An integer for the number of lines between two offsets
+            in the index. (Default: 1000).
+
+    Returns:
+        A dictionary for the index with size, mtime, step, line_count and
+        offsets keys.
+    """
+    offsets, position, line_count = [], 0, 0
+    with open(filepath, 'rb') as inf:
+        for line in inf:
+            if line_count % step == 0:
+                offsets.append(position)
+            position += len(line)
+            line_count += 1
+    index = {
+        'size': os.path.getsize(filepath),
+        'mtime': os.path.getmtime(filepath),
+        'step': step,
+        'line_count': line_count,
+        'offsets': offsets
+    }
+    with open(line_index_path(filepath), 'w') as outf:
+        json.dump(index, outf)
+    return index
+
+
+def load_line_index(filepath):
+    """Load the line index of a file if it exists and it is up to date.
+
+    Args:
+        filepath: Full path to a text file.
+
+    Returns:
+        A dictionary for the index or None if there is no index for the file or
+        if the file has changed since the index was built.
+    """
+    index_file = line_index_path(filepath)
+    if not os.path.isfile(index_file):
+        return None
+    try:
+        with open(index_file) as inf:
+            index = json.load(inf)
+    except ValueError:  # not a valid JSON file
+        return None
+    if index.get('size') != os.path.getsize(filepath) or \
+            index.get('mtime') != os.path.getmtime(filepath):
+        return None
+    return index
+
+
+def open_at_line(filepath, line=0):
+    """Open a text file for reading and move it to the start of a line.
+
+    If the file has an up to date line index, the file is moved directly to the
+    closest indexed line before the target line. Otherwise, the lines before the
+    target line are read and discarded.
+
+    Args:
+        filepath: Full path to a text file.
+        line: An integer for the index of the line to start reading from. (Default: 0).
+
+    Returns:
+        An open text file object.
+    """
+    inf = io.open(filepath, 'rb')
+    index = load_line_index(filepath) if line else None
+    if index is not None and index['offsets']:
+        block = min(line // index['step'], len(index['offsets']) - 1)
+        inf.seek(index['offsets'][block])
+        line -= block * index['step']
+    inf = io.TextIOWrapper(inf)
+    if line:
+        next(islice(inf, line, line), None)
+    return inf
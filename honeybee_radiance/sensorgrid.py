@@ -3,6 +3,7 @@ from __future__ import division
 
 from .sensor import Sensor
 from .lightpath import light_path_from_room
+from .reader import sensor_values_from_file
 
 from honeybee.facetype import AirBoundary
 import honeybee.typing as typing
@@ -14,11 +15,17 @@ from ladybug_geometry.geometry3d.mesh import Mesh3D
 import os
 import json
 import math
+from array import array
 try:
     from itertools import izip as zip
 except ImportError:  # python 3
     pass
 
+try:
+    import numpy as np
+except ImportError:  # numpy is not available (eg. IronPython)
+    np = None
+
 
 class SensorGrid(object):
     """A grid of sensors.
@@ -35,6 +42,8 @@ class SensorGrid(object):
         * sensors
         * positions
         * directions
+        * raw_values
+        * count
         * room_identifier
         * light_path
         * mesh
@@ -43,8 +52,9 @@ class SensorGrid(object):
         * full_identifier
     """
 
-    __slots__ = ('_identifier', '_display_name', '_sensors', '_room_identifier',
-                 '_light_path', '_mesh', '_base_geometry', '_group_identifier')
+    __slots__ = ('_identifier', '_display_name', '_sensors', '_values',
+                 '_room_identifier', '_light_path', '_mesh', '_base_geometry',
+                 '_group_identifier')
 
     def __init__(self, identifier, sensors):
         """Initialize a SensorGrid."""
@@ -123,6 +133,30 @@ class SensorGrid(object):
         sg = tuple(Sensor(pt, v) for pt, v in zip(positions, directions))
         return cls(identifier, sg)
 
+    @classmethod
+    def from_raw_values(cls, identifier, values):
+        """Create a sensor grid from a flat list of sensor values.
+
+        The resulting grid stores the sensors in a compact array of numbers rather
+        than as individual Sensor objects, which makes it considerably lighter and
+        faster to transform for grids with a large number of sensors. Sensor
+        objects are only created once the sensors property of the grid is accessed.
+
+        Args:
+            identifier: Text string for a unique SensorGrid ID. Must not contain spaces
+                or special characters. This will be used to identify the object across
+                a model and in the exported Radiance files.
+            values: A flat list of numbers with 6 values for each sensor in the
+                following order: x, y, z, dx, dy, dz.
+        """
+        values = array('d', values)
+        assert len(values) % 6 == 0, 'The number of sensor values must be a ' \
+            'multiple of 6. Got {}.'.format(len(values))
+        new_obj = cls(identifier, ())
+        new_obj._sensors = None
+        new_obj._values = values
+        return new_obj
+
     @classmethod
     def from_mesh3d(cls, identifier, mesh):
         """Create a sensor grid from a ladybug_geometry Mesh3D.
@@ -139,9 +173,10 @@ class SensorGrid(object):
         """
         assert isinstance(mesh, Mesh3D), 'Expected ladybug_geometry Mesh3D for ' \
             'SensorGrid.from_mesh3d. Got {}.'.format(type(mesh))
-        positions = [(pt.x, pt.y, pt.z) for pt in mesh.face_centroids]
-        directions = [(vec.x, vec.y, vec.z) for vec in mesh.face_normals]
-        s_grid = cls.from_position_and_direction(identifier, positions, directions)
+        values = array('d')
+        for pt, vec in zip(mesh.face_centroids, mesh.face_normals):
+            values.extend((pt.x, pt.y, pt.z, vec.x, vec.y, vec.z))
+        s_grid = cls.from_raw_values(identifier, values)
         s_grid.mesh = mesh
         return s_grid
 
@@ -219,8 +254,13 @@ class SensorGrid(object):
         vw_vecs = [start_vector.rotate_xy(i * inc_ang) for i in range(dir_count)]
         vw_vecs = [(round(v.x, 5), round(v.y, 5), round(v.z, 3)) for v in vw_vecs]
         # set up the sensor grid object
-        sensors = tuple(Sensor(pt, v) for pt in positions for v in vw_vecs)
-        sg = cls(identifier, sensors)
+        positions = [typing.tuple_with_length(pt) for pt in positions]
+        values = array('d')
+        for pt in positions:
+            for v in vw_vecs:
+                values.extend(pt)
+                values.extend(v)
+        sg = cls.from_raw_values(identifier, values)
         # generate the mesh if it was requested
         if mesh_radius > 0:
             sg.mesh = cls.radial_positions_mesh(
@@ -289,28 +329,8 @@ class SensorGrid(object):
             raise IOError("Can't find {}.".format(file_path))
         identifier = identifier or os.path.split(os.path.splitext(file_path)[0])[-1]
 
-        start_line = int(start_line) if start_line is not None else 0
-        try:
-            end_line = int(end_line)
-        except TypeError:
-            end_line = float('+inf')
-
-        line_count = end_line - start_line + 1
-
-        sensors = []
-        with open(file_path, 'r') as inf:
-            for _ in range(start_line):
-                next(inf)
-
-            for count, l in enumerate(inf):
-                if not count < line_count:
-                    break
-                if not l or l[0] == '#':
-                    # commented line
-                    continue
-                sensors.append(Sensor.from_raw_values(*l.split()))
-
-        return cls(identifier, sensors)
+        values = sensor_values_from_file(file_path, start_line, end_line)
+        return cls.from_raw_values(identifier, values)
 
     @classmethod
     def from_merged_grids(cls, grids):
@@ -330,9 +350,9 @@ class SensorGrid(object):
             assert isinstance(grid, SensorGrid), 'Expected  SensorGrid for ' \
                 'from_merged_grids. Got {}.'.format(type(grid))
         # merge the sensors, meshes, and base geometry together
-        sensors, meshes, base_geo = [], [], []
+        values, meshes, base_geo = array('d'), [], []
         for grid in grids:
-            sensors.extend(grid.sensors)
+            values.extend(grid._raw_values())
             if grid.mesh is not None:
                 meshes.extend(grid.mesh)
             if grid.base_geometry is not None:
@@ -340,7 +360,7 @@ class SensorGrid(object):
         mesh = Mesh3D.join_meshes(meshes) if len(meshes) == len(grids) else None
         base_geo = tuple(base_geo) if len(base_geo) != 0 else None
         # create the new grid and set all properties based on the first one
-        new_grid = cls(grids[0].identifier, sensors)
+        new_grid = cls.from_raw_values(grids[0].identifier, values)
         new_grid.mesh = mesh
         new_grid.base_geometry = base_geo
         new_grid._display_name = grids[0]._display_name
@@ -377,7 +397,19 @@ class SensorGrid(object):
 
     @property
     def sensors(self):
-        """Get or set a tuple of Sensor objects for the grid sensors."""
+        """Get or set a tuple of Sensor objects for the grid sensors.
+
+        For grids that store their sensors as a compact array of values (eg. grids
+        loaded from a file), the Sensor objects are created the first time that
+        this property is accessed and the grid will use them from then on.
+        """
+        if self._sensors is None:
+            values = self._values
+            self._sensors = tuple(
+                Sensor(values[i:i + 3], values[i + 3:i + 6])
+                for i in range(0, len(values), 6)
+            )
+            self._values = None
         return self._sensors
 
     @sensors.setter
@@ -387,20 +419,35 @@ class SensorGrid(object):
             if not isinstance(sen, Sensor):
                 raise ValueError(
                     'SensorGrid sensors must be of the Sensor type not %s' % type(sen))
+        self._values = None
 
     @property
     def positions(self):
         """Get a generator of sensor positions as x, y, z."""
-        return (ap.pos for ap in self.sensors)
+        if self._sensors is None:
+            values = self._values
+            return (tuple(values[i:i + 3]) for i in range(0, len(values), 6))
+        return (ap.pos for ap in self._sensors)
 
     @property
     def directions(self):
         """Get a generator of sensor directions as x, y , z."""
-        return (ap.dir for ap in self.sensors)
+        if self._sensors is None:
+            values = self._values
+            return (tuple(values[i:i + 3]) for i in range(3, len(values), 6))
+        return (ap.dir for ap in self._sensors)
+
+    @property
+    def raw_values(self):
+        """Get a flat array of numbers with 6 values (x, y, z, dx, dy, dz) per sensor.
+        """
+        return array('d', self._raw_values())
 
     @property
     def count(self):
         """Get the number of sensors."""
+        if self._sensors is None:
+            return len(self._values) // 6
         return len(self._sensors)
 
     @property
@@ -583,8 +630,8 @@ class SensorGrid(object):
             return {room_index: fac_1, adj_i: 1 - fac_1}
 
         # loop through the sensors and verify the room that they belong to
-        for i, sensor in enumerate(self.sensors):
-            sensor_pt = Point3D(*sensor.pos)
+        for i, pos in enumerate(self.positions):
+            sensor_pt = Point3D(*pos)
             for room in rooms:
                 if room.geometry.is_point_inside(sensor_pt):
                     # add the room index of the sensor
@@ -629,7 +676,7 @@ class SensorGrid(object):
 
     def to_radiance(self):
         """Return sensors grid as a Radiance string."""
-        return "\n".join((ap.to_radiance() for ap in self._sensors))
+        return self._to_radiance_range(0, self.count)
 
     def to_file(self, folder, file_name=None, mkdir=False, ignore_group=False):
         """Write this sensor grid to a Radiance sensors file.
@@ -688,15 +735,14 @@ class SensorGrid(object):
             ]
         # calculate sensor count in each file
         sc = int(round(self.count / count))
-        sensors = iter(self._sensors)
         for fc in range(count - 1):
             name = '%s_%04d.pts' % (base_name, fc)
-            content = '\n'.join((next(sensors).to_radiance() for _ in range(sc)))
+            content = self._to_radiance_range(fc * sc, (fc + 1) * sc)
             futil.write_to_file_by_name(folder, name, content + '\n', mkdir)
 
         # write whatever is left to the last file
         name = '%s_%04d.pts' % (base_name, count - 1)
-        content = '\n'.join((sensor.to_radiance() for sensor in sensors))
+        content = self._to_radiance_range((count - 1) * sc, self.count)
         futil.write_to_file_by_name(folder, name, content + '\n', mkdir)
 
         grids_info = []
@@ -723,7 +769,8 @@ class SensorGrid(object):
         base = {
             'type': 'SensorGrid',
             'identifier': self.identifier,
-            'sensors': [sen.to_dict() for sen in self.sensors]
+            'sensors': [{'pos': pos, 'dir': drc}
+                        for pos, drc in zip(self.positions, self.directions)]
         }
         if self._display_name is not None:
             base['display_name'] = self.display_name
@@ -807,8 +854,12 @@ class SensorGrid(object):
             moving_vec: A ladybug_geometry Vector3D with the direction and distance
                 to move the sensor.
         """
-        for sens in self._sensors:
-            sens.move(moving_vec)
+        if self._sensors is None:
+            self._transform_values(
+                lambda x, y, z: (x + moving_vec.x, y + moving_vec.y, z + moving_vec.z))
+        else:
+            for sens in self._sensors:
+                sens.move(moving_vec)
         if self._mesh is not None:
             self._mesh = self._mesh.move(moving_vec)
         if self._base_geometry is not None:
@@ -824,9 +875,18 @@ class SensorGrid(object):
             origin: A ladybug_geometry Point3D for the origin around which the
                 object will be rotated.
         """
-        for sens in self._sensors:
-            sens.rotate(axis, angle, origin)
         r_angle = math.radians(angle)
+        if self._sensors is None:
+            def rotate_pos(x, y, z):
+                x, y, z = _rotate(
+                    x - origin.x, y - origin.y, z - origin.z, axis, r_angle)
+                return x + origin.x, y + origin.y, z + origin.z
+
+            self._transform_values(
+                rotate_pos, lambda x, y, z: _rotate(x, y, z, axis, r_angle))
+        else:
+            for sens in self._sensors:
+                sens.rotate(axis, angle, origin)
         if self._mesh is not None:
             self._mesh = self._mesh.rotate(axis, r_angle, origin)
         if self._base_geometry is not None:
@@ -841,9 +901,20 @@ class SensorGrid(object):
             origin: A ladybug_geometry Point3D for the origin around which the
                 object will be rotated.
         """
-        for sens in self._sensors:
-            sens.rotate_xy(angle, origin)
         r_angle = math.radians(angle)
+        if self._sensors is None:
+            def rotate_pos(x, y, z):
+                x, y = _rotate_xy(x - origin.x, y - origin.y, r_angle)
+                return x + origin.x, y + origin.y, (z - origin.z) + origin.z
+
+            def rotate_dir(x, y, z):
+                x, y = _rotate_xy(x, y, r_angle)
+                return x, y, z
+
+            self._transform_values(rotate_pos, rotate_dir)
+        else:
+            for sens in self._sensors:
+                sens.rotate_xy(angle, origin)
         if self._mesh is not None:
             self._mesh = self._mesh.rotate_xy(r_angle, origin)
         if self._base_geometry is not None:
@@ -857,8 +928,18 @@ class SensorGrid(object):
             plane: A ladybug_geometry Plane across which the object will
                 be reflected.
         """
-        for sens in self._sensors:
-            sens.reflect(plane)
+        if self._sensors is None:
+            normal, origin = plane.n, plane.o
+
+            def reflect_pos(x, y, z):
+                x, y, z = _reflect(x - origin.x, y - origin.y, z - origin.z, normal)
+                return x + origin.x, y + origin.y, z + origin.z
+
+            self._transform_values(
+                reflect_pos, lambda x, y, z: _reflect(x, y, z, normal))
+        else:
+            for sens in self._sensors:
+                sens.reflect(plane)
         if self._mesh is not None:
             self._mesh = self._mesh.reflect(plane.n, plane.o)
         if self._base_geometry is not None:
@@ -873,8 +954,18 @@ class SensorGrid(object):
             origin: A ladybug_geometry Point3D representing the origin from which
                 to scale. If None, it will be scaled from the World origin (0, 0, 0).
         """
-        for sens in self._sensors:
-            sens.scale(factor, origin)
+        if self._sensors is None:
+            if origin is None:
+                self._transform_values(
+                    lambda x, y, z: (x * factor, y * factor, z * factor))
+            else:
+                self._transform_values(
+                    lambda x, y, z: (factor * (x - origin.x) + origin.x,
+                                     factor * (y - origin.y) + origin.y,
+                                     factor * (z - origin.z) + origin.z))
+        else:
+            for sens in self._sensors:
+                sens.scale(factor, origin)
         if self._mesh is not None:
             self._mesh = self._mesh.scale(factor, origin)
         if self._base_geometry is not None:
@@ -957,16 +1048,58 @@ class SensorGrid(object):
             v_count += (dir_count + 1)
         return Mesh3D(verts, faces)
 
+    def _raw_values(self):
+        """Get the array of sensor values without copying it when possible."""
+        if self._sensors is None:
+            return self._values
+        values = array('d')
+        for sen in self._sensors:
+            values.extend(sen.pos + sen.dir)
+        return values
+
+    def _to_radiance_range(self, start, end):
+        """Get a Radiance string for the sensors between start and end indices."""
+        if self._sensors is not None:
+            return '\n'.join(sen.to_radiance() for sen in self._sensors[start:end])
+        values = [str(v) for v in self._values[start * 6:end * 6]]
+        return '\n'.join(' '.join(values[i:i + 6]) for i in range(0, len(values), 6))
+
+    def _transform_values(self, pos_func, dir_func=None):
+        """Transform the sensor array in place using functions of x, y and z.
+
+        The functions only use arithmetic operators such that they can be applied
+        to the columns of the array at once when numpy is available.
+        """
+        values = self._values
+        if len(values) == 0:
+            return
+        if np is not None:
+            columns = np.frombuffer(values, dtype=np.float64).reshape(-1, 6).T
+            columns[:3] = pos_func(*columns[:3])
+            if dir_func is not None:
+                columns[3:] = dir_func(*columns[3:])
+            return
+        for i in range(0, len(values), 6):
+            values[i], values[i + 1], values[i + 2] = \
+                pos_func(values[i], values[i + 1], values[i + 2])
+            if dir_func is not None:
+                values[i + 3], values[i + 4], values[i + 5] = \
+                    dir_func(values[i + 3], values[i + 4], values[i + 5])
+
     def __len__(self):
         """Number of sensors in this grid."""
-        return len(self.sensors)
+        return self.count
 
     def __getitem__(self, index):
         """Get a sensor for an index."""
         return self.sensors[index]
 
     def __copy__(self):
-        new_obj = SensorGrid(self.identifier, (sen.duplicate() for sen in self.sensors))
+        if self._sensors is None:
+            new_obj = SensorGrid.from_raw_values(self.identifier, self._values)
+        else:
+            new_obj = SensorGrid(
+                self.identifier, (sen.duplicate() for sen in self._sensors))
         new_obj._display_name = self._display_name
         new_obj._room_identifier = self._room_identifier
         new_obj.group_identifier = self.group_identifier
@@ -979,7 +1112,9 @@ class SensorGrid(object):
         """A tuple based on the object properties, useful for hashing."""
         return (
             self.identifier, self._display_name, self._room_identifier,
-            self._room_identifier) + tuple(hash(sensor) for sensor in self.sensors)
+            self._room_identifier) + tuple(
+                hash((hash(pos), hash(drc)))
+                for pos, drc in zip(self.positions, self.directions))
 
     def __hash__(self):
         return hash(self.__key())
@@ -1005,4 +1140,33 @@ class SensorGrid(object):
 
     def __repr__(self):
         """Get the string representation of the sensor grid."""
-        return 'SensorGrid: {} [{} sensors]'.format(self.display_name, len(self.sensors))
+        return 'SensorGrid: {} [{} sensors]'.format(self.display_name, self.count)
+
+
+def _rotate(x, y, z, axis, angle):
+    """Rotate x, y, z coordinates around an axis using ladybug_geometry's equations.
+
+    The inputs can be either numbers or numpy arrays.
+    """
+    u, v, w = axis.x, axis.y, axis.z
+    r2 = u ** 2 + v ** 2 + w ** 2
+    r = math.sqrt(r2)
+    ct = math.cos(angle)
+    st = math.sin(angle) / r
+    dt = (u * x + v * y + w * z) * (1 - ct) / r2
+    return (u * dt + x * ct + (-w * y + v * z) * st,
+            v * dt + y * ct + (w * x - u * z) * st,
+            w * dt + z * ct + (-v * x + u * y) * st)
+
+
+def _rotate_xy(x, y, angle):
+    """Rotate x, y coordinates counterclockwise in the XY plane."""
+    cos_a = math.cos(angle)
+    sin_a = math.sin(angle)
+    return cos_a * x - sin_a * y, sin_a * x + cos_a * y
+
+
+def _reflect(x, y, z, normal):
+    """Reflect x, y, z coordinates across a plane with a normalized normal vector."""
+    d = 2 * (x * normal.x + y * normal.y + z * normal.z)
+    return x - d * normal.x, y - d * normal.y, z - d * normal.z
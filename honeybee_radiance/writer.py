@@ -12,15 +12,24 @@ import honeybee_radiance_folder.config as folder_config
 from .geometry import Polygon
 from .modifier.material import aBSDF, BSDF, Trans
 from .lib.modifiers import black
+from .mutil import InstanceSet
+from .parallel import run_in_parallel
+from .luminaire import generate_scenes
 
 import os
 import sys
 import json
 import shutil
 import re
+import hashlib
+import struct
 import itertools
 from collections import defaultdict
 
+# name of the file in the model folder that keeps the hash of each written file and
+# the Radiance strings of the static geometry of the previous export
+MANIFEST_FILE = '_manifest.json'
+
 
 def shade_mesh_to_rad(shade_mesh, blk=False):
     """Generate a RAD string representation of a ShadeMesh.
@@ -274,7 +283,7 @@ def model_to_rad(model, blk=False, minimal=False):
 
 def model_to_rad_folder(
     model, folder=None, config_file=None, minimal=False, grids=None, views=None,
-    full_match=False
+    full_match=False, cpu_count=1, incremental=False
 ):
     r"""Write a honeybee model to a rad folder.
 
@@ -305,6 +314,21 @@ def model_to_rad_folder(
             matches. Setting this to True indicates that wildcard symbols will not be
             used in the filtering of grids and views. In this case the names of grids
             and views are filtered as is. (Default: False).
+        cpu_count: An integer for the number of processes to be used to translate
+            the static geometry of the model (apertures, faces, shades and shade
+            meshes) to Radiance strings. Large categories of geometry are split
+            into several batches that are translated in parallel. The same number
+            of processes is used to run ies2rad for the unique luminaires. (Default: 1).
+        incremental: Boolean to note whether the model folder should be updated
+            incrementally. If True, a manifest is kept in the model folder with
+            a hash of each static geometry object (apertures, faces, shades and
+            shade meshes), its Radiance string and a hash of the content of each
+            written file. Only the static geometry objects with a hash that is
+            not in the manifest are translated to Radiance strings and only the
+            files with content that changed since the previous export are
+            rewritten. Files that are no longer part of the model will be
+            removed. If False, the model folder will be fully
+            overwritten. (Default: False).
     """
     # prepare the folder for simulation
     model_id = model.identifier
@@ -313,7 +337,13 @@ def model_to_rad_folder(
     if not os.path.isdir(folder):
         preparedir(folder)  # create the directory if it's not there
     model_folder = ModelFolder(folder, 'model', config_file)
-    model_folder.write(folder_type=-1, cfg=folder_config.minimal, overwrite=True)
+    manifest = None
+    if incremental:
+        manifest = _WriteManifest(
+            os.path.join(model_folder.model_folder(full=True), MANIFEST_FILE))
+    if manifest is None or not manifest.exists:
+        model_folder.write(folder_type=-1, cfg=folder_config.minimal, overwrite=True)
+    remove_content = manifest is None
 
     # determine the number of places to which mesh vertices will be rounded
     dec_count = 3  # default value when there is no tolerance
@@ -328,43 +358,48 @@ def model_to_rad_folder(
                 dec_count += 1
                 break
 
-    # gather and write static apertures to the folder
-    aps, aps_blk = model.properties.radiance.subfaces_by_blk()
-    mods, mods_blk, mod_combs, mod_names = _collect_modifiers(aps, aps_blk, True)
-    _write_static_files(
-        folder, model_folder.aperture_folder(full=True), 'aperture',
-        aps, aps_blk, mods, mods_blk, mod_combs, mod_names, 'Face3D', minimal)
-
-    # gather and write static faces
-    faces, faces_blk = model.properties.radiance.faces_by_blk()
-    f_mods, f_mods_blk, mod_combs, mod_names = _collect_modifiers(faces, faces_blk)
-    _write_static_files(
-        folder, model_folder.scene_folder(full=True), 'envelope',
-        faces, faces_blk, f_mods, f_mods_blk, mod_combs, mod_names,
-        'PunchedFace3D', minimal)
-
-    # gather and write static shades
-    shades, shades_blk = model.properties.radiance.shades_by_blk()
-    s_mods, s_mods_blk, mod_combs, mod_names = _collect_modifiers(shades, shades_blk)
-    _write_static_files(
-        folder, model_folder.scene_folder(full=True), 'shades',
-        shades, shades_blk, s_mods, s_mods_blk, mod_combs, mod_names, 'Face3D', minimal)
-
-    # gather and write static shade meshes
-    shade_meshes, shade_meshes_blk = model.properties.radiance.shade_meshes_by_blk()
-    sm_mods, sm_mods_blk, mod_combs, mod_names = \
-        _collect_modifiers(shade_meshes, shade_meshes_blk)
-    _write_static_files(
-        folder, model_folder.scene_folder(full=True), 'shade_meshes',
-        shade_meshes, shade_meshes_blk, sm_mods, sm_mods_blk,
-        mod_combs, mod_names, 'Mesh3D', minimal, dec_count)
+    # gather the static apertures, faces, shades and shade meshes
+    rad_prop = model.properties.radiance
+    static_categories = (
+        (model_folder.aperture_folder(full=True), 'aperture',
+         rad_prop.subfaces_by_blk(), 'Face3D', True),
+        (model_folder.scene_folder(full=True), 'envelope',
+         rad_prop.faces_by_blk(), 'PunchedFace3D', False),
+        (model_folder.scene_folder(full=True), 'shades',
+         rad_prop.shades_by_blk(), 'Face3D', False),
+        (model_folder.scene_folder(full=True), 'shade_meshes',
+         rad_prop.shade_meshes_by_blk(), 'Mesh3D', False)
+    )
+    static_data, static_mods = [], []
+    for _, _, (geo, geo_blk), geo_type, aperture in static_categories:
+        mods, mods_blk, mod_combs, mod_names = \
+            _collect_modifiers(geo, geo_blk, aperture)
+        static_data.append(
+            _static_geometry_data(geo, geo_blk, mod_combs, mod_names, geo_type))
+        static_mods.append((mods, mods_blk))
+
+    # translate the static geometry to strings and write them to the folder
+    geo_types = [cat[3] for cat in static_categories]
+    if manifest is None:
+        static_strs = _static_geometry_strings_by_category(
+            static_data, geo_types, minimal, dec_count, cpu_count)
+    else:
+        static_strs = _cached_static_geometry_strings(
+            manifest, static_data, geo_types, minimal, dec_count, cpu_count)
+    for category, face_strs, (mods, mods_blk) in \
+            zip(static_categories, static_strs, static_mods):
+        sub_folder, file_id, (geo, geo_blk), geo_type, _ = category
+        if len(geo) != 0 or len(geo_blk) != 0:
+            _write_static_files(
+                folder, sub_folder, file_id, face_strs, mods, mods_blk,
+                geo_type, minimal, manifest)
 
     # write dynamic sub-face groups (apertures and doors)
     ext_dict = {}
     out_subfolder = model_folder.aperture_group_folder(full=True)
     dyn_subface = model.properties.radiance.dynamic_subface_groups
     if len(dyn_subface) != 0:
-        preparedir(out_subfolder)
+        preparedir(out_subfolder, remove_content)
         for group in dyn_subface:
             if group.is_indoor:
                 # TODO: Implement dynamic interior apertures once the radiance folder
@@ -373,12 +408,12 @@ def model_to_rad_folder(
                                           ' supported by Model.to.rad_folder.')
             else:
                 st_d = _write_dynamic_subface_files(
-                    folder, out_subfolder, group, minimal)
-                _write_mtx_files(folder, out_subfolder, group, st_d, minimal)
+                    folder, out_subfolder, group, minimal, manifest)
+                _write_mtx_files(folder, out_subfolder, group, st_d, minimal, manifest)
 
                 ext_dict[group.identifier] = st_d
 
-        _write_dynamic_json(folder, out_subfolder, ext_dict)
+        _write_dynamic_json(folder, out_subfolder, ext_dict, manifest)
 
     # write dynamic shade groups
     out_dict = {}
@@ -387,60 +422,67 @@ def model_to_rad_folder(
     in_subfolder = model_folder.dynamic_scene_folder(full=True, indoor=True)
     dyn_shade = model.properties.radiance.dynamic_shade_groups
     if len(dyn_shade) != 0:
-        preparedir(out_subfolder)
+        preparedir(out_subfolder, remove_content)
         indoor_created = False
         for group in dyn_shade:
             if group.is_indoor:
                 if not indoor_created:
-                    preparedir(in_subfolder)
+                    preparedir(in_subfolder, remove_content)
                     indoor_created = True
-                st_d = _write_dynamic_shade_files(folder, in_subfolder, group, minimal)
+                st_d = _write_dynamic_shade_files(
+                    folder, in_subfolder, group, minimal, manifest)
                 in_dict[group.identifier] = st_d
             else:
-                st_d = _write_dynamic_shade_files(folder, out_subfolder, group, minimal)
+                st_d = _write_dynamic_shade_files(
+                    folder, out_subfolder, group, minimal, manifest)
                 out_dict[group.identifier] = st_d
-        _write_dynamic_json(folder, out_subfolder, out_dict)
+        _write_dynamic_json(folder, out_subfolder, out_dict, manifest)
         if indoor_created:
-            _write_dynamic_json(folder, in_subfolder, in_dict)
+            _write_dynamic_json(folder, in_subfolder, in_dict, manifest)
 
     # copy all bsdfs into the bsdf folder
     bsdf_folder = model_folder.bsdf_folder(full=True)
     bsdf_mods = model.properties.radiance.bsdf_modifiers
     if len(bsdf_mods) != 0:
-        preparedir(bsdf_folder)
+        preparedir(bsdf_folder, remove_content)
         bsdfs_info = []
         for bdf_mod in bsdf_mods:
             bsdf_name = os.path.split(bdf_mod.bsdf_file)[-1]
             new_bsdf_path = os.path.join(bsdf_folder, bsdf_name)
-            shutil.copy(bdf_mod.bsdf_file, new_bsdf_path)
+            if manifest is None or manifest.changed(
+                    new_bsdf_path, _file_signature(bdf_mod.bsdf_file)):
+                shutil.copy(bdf_mod.bsdf_file, new_bsdf_path)
             bsdfs_info.append(
                 {
                     'name': bdf_mod.display_name,
                     'identifier': bdf_mod.identifier,
                     'path': os.path.join(model_folder.bsdf_folder(full=False), bsdf_name)
                 })
-        bsdf_info_file = os.path.join(bsdf_folder, '_info.json')
-        with open(bsdf_info_file, 'w') as fp:
-            json.dump(bsdfs_info, fp, indent=2)
+        _write_if_changed(
+            manifest, bsdf_folder, '_info.json', json.dumps(bsdfs_info, indent=2))
 
     # write the assigned sensor grids and views into the correct folder
     grid_dir = model_folder.grid_folder(full=True)
-    _write_sensor_grids(grid_dir, model, grids, full_match)
+    _write_sensor_grids(grid_dir, model, grids, full_match, manifest)
     view_dir = model_folder.view_folder(full=True)
-    _write_views(view_dir, model, views, full_match)
+    _write_views(view_dir, model, views, full_match, manifest)
 
     model_folder.combined_receivers(auto_mtx_path=False)
 
     # write the assigned luminaires into the correct folder
     if model.properties.radiance.luminaires:
         ies_folder = model_folder.ies_folder(full=False)
-        for luminaire in model.properties.radiance.luminaires:
-            luminaire.generate_scene(libdir=folder, prefdir=ies_folder, units=model.units)
+        generate_scenes(model.properties.radiance.luminaires, libdir=folder,
+                        prefdir=ies_folder, units=model.units, cpu_count=cpu_count)
+
+    # remove the files of the previous export that are no longer in the model
+    if manifest is not None:
+        manifest.finish()
 
     return folder
 
 
-def _write_sensor_grids(folder, model, grids_filter, full_match=False):
+def _write_sensor_grids(folder, model, grids_filter, full_match=False, manifest=None):
     """Write out the sensor grid files.
 
     Args:
@@ -452,6 +494,8 @@ def _write_sensor_grids(folder, model, grids_filter, full_match=False):
             wildcard symbols in names. Use relative path from inside grids folder.
         full_match: A boolean to filter grids by their identifiers as full matches.
             (Default: False).
+        manifest: An optional _WriteManifest to only write the files that
+            changed since the previous export. (Default: None).
 
     Returns:
         A tuple for path to _info.json and _model_grids_info.json. The first file
@@ -470,22 +514,30 @@ def _write_sensor_grids(folder, model, grids_filter, full_match=False):
         sensor_grids, grids_filter, full_match=full_match)
     if len(filtered_grids) != 0:
         grids_info = []
-        preparedir(folder)
+        preparedir(folder, manifest is None)
         # group_by_identifier
         grouped_grids = _group_by_identifier(filtered_grids)
         for grid in grouped_grids:
-            grid.to_file(folder)
+            if manifest is None:
+                grid.to_file(folder)
+            else:
+                grid_folder = os.path.join(folder, grid.group_identifier) \
+                    if grid.group_identifier else folder
+                _write_if_changed(
+                    manifest, grid_folder, '{}.pts'.format(grid.identifier),
+                    grid.to_radiance() + '\n', mkdir=True)
             grids_info.append(grid.info_dict(model))
 
         # write information file for all the grids.
         grids_info_file = os.path.join(folder, '_info.json')
-        if (sys.version_info < (3, 0)):  # we need to manually encode it as UTF-8
-            with open(grids_info_file, 'wb') as fp:
-                info_str = json.dumps(grids_info, indent=2, ensure_ascii=False)
-                fp.write(info_str.encode('utf-8'))
-        else:
-            with open(grids_info_file, 'w', encoding='utf-8') as fp:
-                json.dump(grids_info, fp, indent=2, ensure_ascii=False)
+        info_str = json.dumps(grids_info, indent=2, ensure_ascii=False)
+        if manifest is None or manifest.changed(grids_info_file, info_str):
+            if (sys.version_info < (3, 0)):  # we need to manually encode it as UTF-8
+                with open(grids_info_file, 'wb') as fp:
+                    fp.write(info_str.encode('utf-8'))
+            else:
+                with open(grids_info_file, 'w', encoding='utf-8') as fp:
+                    fp.write(info_str)
 
         # write input grids info
         model_grids_info = []
@@ -506,15 +558,16 @@ def _write_sensor_grids(folder, model, grids_filter, full_match=False):
             model_grids_info.append(grid_info)
 
         model_grids_info_file = os.path.join(folder, '_model_grids_info.json')
-        with open(model_grids_info_file, 'w') as fp:
-            json.dump(model_grids_info, fp, indent=2)
+        _write_if_changed(
+            manifest, folder, '_model_grids_info.json',
+            json.dumps(model_grids_info, indent=2))
 
         return grids_info_file, model_grids_info_file
     elif len(sensor_grids) != 0:
         raise ValueError('All sensor grids were filtered out of the model folder!')
 
 
-def _write_views(folder, model, views_filter, full_match=False):
+def _write_views(folder, model, views_filter, full_match=False, manifest=None):
     """Write out the view files.
 
     Args:
@@ -526,6 +579,8 @@ def _write_views(folder, model, views_filter, full_match=False):
             Use relative path from inside views folder.
         full_match: A boolean to filter views by their identifiers as full matches.
             (Default: False).
+        manifest: An optional _WriteManifest to only write the files that
+            changed since the previous export. (Default: None).
 
     Returns:
         The path to _info.json, which includes the information for the views that
@@ -534,14 +589,16 @@ def _write_views(folder, model, views_filter, full_match=False):
     model_views = model.properties.radiance.views
     filtered_views = _filter_by_pattern(model_views, views_filter, full_match=full_match)
     if len(filtered_views) != 0:
-        preparedir(folder)
+        preparedir(folder, manifest is None)
         # group_by_identifier
         views_info = []
         for view in filtered_views:
-            view.to_file(folder)
-            info_file = os.path.join(folder, '{}.json'.format(view.identifier))
-            with open(info_file, 'w') as fp:
-                json.dump(view.info_dict(model), fp, indent=4)
+            _write_if_changed(
+                manifest, folder, '{}.vf'.format(view.identifier),
+                'rvu ' + view.to_radiance())
+            _write_if_changed(
+                manifest, folder, '{}.json'.format(view.identifier),
+                json.dumps(view.info_dict(model), indent=4))
 
             view_info = {
                 'name': view.identifier,
@@ -552,16 +609,15 @@ def _write_views(folder, model, views_filter, full_match=False):
             views_info.append(view_info)
 
         # write information file for all the views.
-        views_info_file = os.path.join(folder, '_info.json')
-        with open(views_info_file, 'w') as fp:
-            json.dump(views_info, fp, indent=2)
+        views_info_file = _write_if_changed(
+            manifest, folder, '_info.json', json.dumps(views_info, indent=2))
 
         return views_info_file
     elif len(model_views) != 0:
         raise ValueError('All views were filtered out of the model folder!')
 
 
-def _write_dynamic_shade_files(folder, sub_folder, group, minimal=False):
+def _write_dynamic_shade_files(folder, sub_folder, group, minimal=False, manifest=None):
     """Write out the files that need to go into any dynamic model folder.
 
     Args:
@@ -569,6 +625,8 @@ def _write_dynamic_shade_files(folder, sub_folder, group, minimal=False):
         sub_folder: The sub-folder for the three files (relative to the model folder).
         group: A DynamicShadeGroup object to be written into files.
         minimal: Boolean noting whether radiance strings should be written minimally.
+        manifest: An optional _WriteManifest to only write the files that
+            changed since the previous export. (Default: None).
 
     Returns:
         A list of dictionaries to be written into the states.json file.
@@ -581,12 +639,15 @@ def _write_dynamic_shade_files(folder, sub_folder, group, minimal=False):
     for state_i, file_names in enumerate(states_list):
         default_str = group.to_radiance(state_i, direct=False, minimal=minimal)
         direct_str = group.to_radiance(state_i, direct=True, minimal=minimal)
-        write_to_file_by_name(dest, file_names['default'].replace('./', ''), default_str)
-        write_to_file_by_name(dest, file_names['direct'].replace('./', ''), direct_str)
+        _write_if_changed(
+            manifest, dest, file_names['default'].replace('./', ''), default_str)
+        _write_if_changed(
+            manifest, dest, file_names['direct'].replace('./', ''), direct_str)
     return states_list
 
 
-def _write_dynamic_subface_files(folder, sub_folder, group, minimal=False):
+def _write_dynamic_subface_files(
+        folder, sub_folder, group, minimal=False, manifest=None):
     """Write out the files that need to go into any dynamic model folder.
 
     Args:
@@ -594,6 +655,8 @@ def _write_dynamic_subface_files(folder, sub_folder, group, minimal=False):
         sub_folder: The sub-folder for the three files (relative to the model folder).
         group: A DynamicSubFaceGroup object to be written into files.
         minimal: Boolean noting whether radiance strings should be written minimally.
+        manifest: An optional _WriteManifest to only write the files that
+            changed since the previous export. (Default: None).
 
     Returns:
         A list of dictionaries to be written into the states.json file.
@@ -606,16 +669,19 @@ def _write_dynamic_subface_files(folder, sub_folder, group, minimal=False):
     for state_i, file_names in enumerate(states_list):
         default_str = group.to_radiance(state_i, direct=False, minimal=minimal)
         direct_str = group.to_radiance(state_i, direct=True, minimal=minimal)
-        write_to_file_by_name(dest, file_names['default'].replace('./', ''), default_str)
-        write_to_file_by_name(dest, file_names['direct'].replace('./', ''), direct_str)
+        _write_if_changed(
+            manifest, dest, file_names['default'].replace('./', ''), default_str)
+        _write_if_changed(
+            manifest, dest, file_names['direct'].replace('./', ''), direct_str)
 
     # write out the black representation of the aperture
     black_str = group.blk_to_radiance(minimal)
-    write_to_file_by_name(dest, file_names['black'].replace('./', ''), black_str)
+    _write_if_changed(manifest, dest, file_names['black'].replace('./', ''), black_str)
     return states_list
 
 
-def _write_mtx_files(folder, sub_folder, group, states_json_list, minimal=False):
+def _write_mtx_files(
+        folder, sub_folder, group, states_json_list, minimal=False, manifest=None):
     """Write out the mtx files needed for 3-phase simulation into a model folder.
 
     Args:
@@ -624,6 +690,8 @@ def _write_mtx_files(folder, sub_folder, group, states_json_list, minimal=False)
         group: A DynamicSubFaceGroup object to be written into files.
         states_json_list: A list to be written into the states.json file.
         minimal: Boolean noting whether radiance strings should be written minimally.
+        manifest: An optional _WriteManifest to only write the files that
+            changed since the previous export. (Default: None).
 
     Returns:
         A list of dictionaries to be written into the states.json file.
@@ -657,34 +725,38 @@ def _write_mtx_files(folder, sub_folder, group, states_json_list, minimal=False)
                     './{}..dmtx..{}.rad'.format(group.identifier, str(state_i))
                 vmtx_str = group.vmtx_to_radiance(state_i, minimal)
                 dmtx_str = group.dmtx_to_radiance(state_i, minimal)
-                write_to_file_by_name(
-                    dest, states_json_list[state_i]['vmtx'].replace('./', ''), vmtx_str)
-                write_to_file_by_name(
-                    dest, states_json_list[state_i]['dmtx'].replace('./', ''), dmtx_str)
+                _write_if_changed(
+                    manifest, dest, states_json_list[state_i]['vmtx'].replace('./', ''),
+                    vmtx_str)
+                _write_if_changed(
+                    manifest, dest, states_json_list[state_i]['dmtx'].replace('./', ''),
+                    dmtx_str)
 
     # write the single mtx file if everything is default
     if one_mtx and tmxt_valid:
         mtx_str = group.vmtx_to_radiance(state_i, minimal)
-        write_to_file_by_name(dest, mtx_file, mtx_str)
+        _write_if_changed(manifest, dest, mtx_file, mtx_str)
 
 
-def _write_dynamic_json(folder, sub_folder, json_dict):
+def _write_dynamic_json(folder, sub_folder, json_dict, manifest=None):
     """Write out the files that need to go into any dynamic model folder.
 
     Args:
         folder: The model folder location on this machine.
         sub_folder: The sub-folder for the three files (relative to the model folder).
         json_dict: A dictionary to be written into the states.json file.
+        manifest: An optional _WriteManifest to only write the files that
+            changed since the previous export. (Default: None).
     """
     if json_dict != {}:
-        dest_file = os.path.join(folder, sub_folder, 'states.json')
-        with open(dest_file, 'w') as fp:
-            json.dump(json_dict, fp, indent=4)
+        _write_if_changed(
+            manifest, os.path.join(folder, sub_folder), 'states.json',
+            json.dumps(json_dict, indent=4))
 
 
 def _write_static_files(
-        folder, sub_folder, file_id, geometry, geometry_blk, modifiers, modifiers_blk,
-        mod_combs, mod_names, geo_type='Face3D', minimal=False, decimal_count=3):
+        folder, sub_folder, file_id, face_strs, modifiers, modifiers_blk,
+        geo_type='Face3D', minimal=False, manifest=None):
     """Write out the three files that need to go into any static radiance model folder.
 
     This includes a .rad, .mat, and .blk file for the folder.
@@ -695,104 +767,357 @@ def _write_static_files(
         folder: The model folder location on this machine.
         sub_folder: The sub-folder for the three files (relative to the model folder).
         file_id: An identifier to be used for the names of each of the files.
-        geometry: A list of geometry objects all with default blk modifiers.
-        geometry_blk: A list of geometry objects with overridden blk modifiers.
+        face_strs: A list of Radiance strings for the geometry, which can be
+            obtained from the _static_geometry_strings method.
         modifiers: A list of modifiers to write.
         modifiers_blk: A list of modifier_blk to write.
+        geo_type: Text for the type of static geometry being written (either Face3D,
+            PunchedFace3D, or Mesh3D).
+        minimal: Boolean noting whether radiance strings should be written minimally.
+        manifest: An optional _WriteManifest to only write the files that
+            changed since the previous export. (Default: None).
+    """
+    # write the strings for the modifiers
+    mod_strs = []
+    mod_blk_strs = []
+    for mod in modifiers:
+        if isinstance(mod, (aBSDF, BSDF)):
+            _process_bsdf_modifier(mod, mod_strs, minimal)
+        elif isinstance(mod, Trans):
+            r_values = (mod.r_reflectance, mod.g_reflectance, mod.b_reflectance)
+            if mod.identifier != 'air_boundary' and not \
+                    all(v == 1 for v in r_values):
+                mod_strs.append(mod.to_radiance(minimal))
+        else:
+            mod_strs.append(mod.to_radiance(minimal))
+    for mod in modifiers_blk:
+        if isinstance(mod, (aBSDF, BSDF)):
+            _process_bsdf_modifier(mod, mod_blk_strs, minimal)
+        elif isinstance(mod, Trans):
+            r_values = (mod.r_reflectance, mod.g_reflectance, mod.b_reflectance)
+            if mod.identifier != 'air_boundary' and not \
+                    all(v == 1 for v in r_values):
+                mod_blk_strs.append(mod.to_radiance(minimal))
+        else:
+            mod_blk_strs.append(mod.to_radiance(minimal))
+
+    # write the three files for the model sub-folder
+    dest = os.path.join(folder, sub_folder)
+    if geo_type == 'Mesh3D':  # write minimum specification to reduce file size
+        geo_str = '\n'.join(face_strs)
+    else:
+        geo_str = '\n\n'.join(face_strs)
+    _write_if_changed(manifest, dest, '{}.rad'.format(file_id), geo_str)
+    _write_if_changed(manifest, dest, '{}.mat'.format(file_id), '\n\n'.join(mod_strs))
+    _write_if_changed(
+        manifest, dest, '{}.blk'.format(file_id), '\n\n'.join(mod_blk_strs))
+
+
+def _static_geometry_data(geometry, geometry_blk, mod_combs, mod_names, geo_type):
+    """Get the data needed to write static geometry to Radiance strings.
+
+    The resulting data only includes plain geometry and modifiers such that it can
+    be sent to other processes to be translated in parallel.
+
+    Args:
+        geometry: A list of geometry objects all with default blk modifiers.
+        geometry_blk: A list of geometry objects with overridden blk modifiers.
         mod_combs: Dictionary of modifiers from _unique_modifier_blk_combinations method.
         mod_names: Modifier names from the _unique_modifier_blk_combinations method.
         geo_type: Text for the type of static geometry being written (either Face3D,
             PunchedFace3D, or Mesh3D).
-        minimal: Boolean noting whether radiance strings should be written minimally.
-        decimal_count: Integer for the number of decimal places to round mesh vertices
+
+    Returns:
+        A list of tuples with three items for each geometry object. The first is
+        the identifier, the second is the vertices (or a tuple with the vertices
+        and the faces of Mesh3D) and the last one is the modifier.
     """
     def is_air_boundary(face):
         return isinstance(face, Face) and isinstance(face.type, AirBoundary)
 
-    if len(geometry) != 0 or len(geometry_blk) != 0:
-        # write the strings for the geometry
-        face_strs = []
-        if geo_type == 'Face3D':
-            for face in geometry:
-                modifier = face.properties.radiance.modifier
-                rad_poly = Polygon(face.identifier, face.vertices, modifier)
-                face_strs.append(rad_poly.to_radiance(minimal, False, False))
-            for face, mod_name in zip(geometry_blk, mod_names):
-                modifier = mod_combs[mod_name][0]
-                rad_poly = Polygon(face.identifier, face.vertices, modifier)
-                face_strs.append(rad_poly.to_radiance(minimal, False, False))
-        elif geo_type == 'Mesh3D':
-            tol_f_str = '{:.' + str(decimal_count) + 'f}'
-            for shade_mesh in geometry:
-                str_vertices = tuple(tuple(tol_f_str.format(v) for v in pt.to_array())
-                                     for pt in shade_mesh.vertices)
-                modifier = shade_mesh.properties.radiance.modifier
-                base_geo = modifier.identifier + ' polygon {} 0 0 {} {}'
-                shd_id = shade_mesh.identifier
-                for fi, f_geo in enumerate(shade_mesh.faces):
-                    coords = tuple(v for pt in f_geo for v in str_vertices[pt])
-                    poly_id = '{}_{}'.format(shd_id, fi)
-                    geo_str = base_geo.format(poly_id, len(coords), ' '.join(coords))
-                    face_strs.append(geo_str)
-            for shade_mesh, mod_name in zip(geometry_blk, mod_names):
-                str_vertices = tuple(tuple(tol_f_str.format(v) for v in pt.to_array())
-                                     for pt in shade_mesh.vertices)
-                modifier = mod_combs[mod_name][0]
-                base_geo = modifier.identifier + ' polygon {} 0 0 {} {}'
-                shd_id = shade_mesh.identifier
-                for fi, f_geo in enumerate(shade_mesh.faces):
-                    coords = tuple(v for pt in f_geo for v in str_vertices[pt])
-                    poly_id = '{}_{}'.format(shd_id, fi)
-                    geo_str = base_geo.format(poly_id, len(coords), ' '.join(coords))
-                    face_strs.append(geo_str)
-        else:  # assume that it is punched Face3D
-            for face in geometry:
-                if not is_air_boundary(face):
-                    modifier = face.properties.radiance.modifier
-                    geo = face.punched_vertices if hasattr(face, 'punched_vertices') \
-                        else face.vertices
-                    rad_poly = Polygon(face.identifier, geo, modifier)
-                    face_strs.append(rad_poly.to_radiance(minimal, False, False))
-            for face, mod_name in zip(geometry_blk, mod_names):
-                if not is_air_boundary(face):
-                    modifier = mod_combs[mod_name][0]
-                    geo = face.punched_vertices if hasattr(face, 'punched_vertices') \
-                        else face.vertices
-                    rad_poly = Polygon(face.identifier, geo, modifier)
-                    face_strs.append(rad_poly.to_radiance(minimal, False, False))
-
-        # write the strings for the modifiers
-        mod_strs = []
-        mod_blk_strs = []
-        for mod in modifiers:
-            if isinstance(mod, (aBSDF, BSDF)):
-                _process_bsdf_modifier(mod, mod_strs, minimal)
-            elif isinstance(mod, Trans):
-                r_values = (mod.r_reflectance, mod.g_reflectance, mod.b_reflectance)
-                if mod.identifier != 'air_boundary' and not \
-                        all(v == 1 for v in r_values):
-                    mod_strs.append(mod.to_radiance(minimal))
-            else:
-                mod_strs.append(mod.to_radiance(minimal))
-        for mod in modifiers_blk:
-            if isinstance(mod, (aBSDF, BSDF)):
-                _process_bsdf_modifier(mod, mod_blk_strs, minimal)
-            elif isinstance(mod, Trans):
-                r_values = (mod.r_reflectance, mod.g_reflectance, mod.b_reflectance)
-                if mod.identifier != 'air_boundary' and not \
-                        all(v == 1 for v in r_values):
-                    mod_blk_strs.append(mod.to_radiance(minimal))
-            else:
-                mod_blk_strs.append(mod.to_radiance(minimal))
+    geo_objs = [(geo, geo.properties.radiance.modifier) for geo in geometry]
+    geo_objs.extend(
+        (geo, mod_combs[mod_name][0]) for geo, mod_name in zip(geometry_blk, mod_names))
+    geo_data = []
+    if geo_type == 'Mesh3D':
+        for shade_mesh, modifier in geo_objs:
+            geo = (shade_mesh.vertices, shade_mesh.faces)
+            geo_data.append((shade_mesh.identifier, geo, modifier))
+    elif geo_type == 'Face3D':
+        for face, modifier in geo_objs:
+            geo_data.append((face.identifier, face.vertices, modifier))
+    else:  # assume that it is punched Face3D
+        for face, modifier in geo_objs:
+            if not is_air_boundary(face):
+                geo = face.punched_vertices if hasattr(face, 'punched_vertices') \
+                    else face.vertices
+                geo_data.append((face.identifier, geo, modifier))
+    return geo_data
+
+
+def _static_geometry_strings(geo_data, geo_type='Face3D', minimal=False,
+                             decimal_count=3):
+    """Translate the data from _static_geometry_data to a list of Radiance strings.
+
+    Args:
+        geo_data: A list of tuples from the _static_geometry_data method.
+        geo_type: Text for the type of static geometry being written (either Face3D,
+            PunchedFace3D, or Mesh3D).
+        minimal: Boolean noting whether radiance strings should be written minimally.
+        decimal_count: Integer for the number of decimal places to round mesh vertices
+
+    Returns:
+        A list with the Radiance string of each item in geo_data. The string of a
+        Mesh3D has a polygon for each of its faces on a separate line.
+    """
+    face_strs = []
+    if geo_type == 'Mesh3D':
+        tol_f_str = '{:.' + str(decimal_count) + 'f}'
+        for shd_id, (vertices, faces), modifier in geo_data:
+            str_vertices = tuple(tuple(tol_f_str.format(v) for v in pt.to_array())
+                                 for pt in vertices)
+            base_geo = modifier.identifier + ' polygon {} 0 0 {} {}'
+            poly_strs = []
+            for fi, f_geo in enumerate(faces):
+                coords = tuple(v for pt in f_geo for v in str_vertices[pt])
+                poly_id = '{}_{}'.format(shd_id, fi)
+                geo_str = base_geo.format(poly_id, len(coords), ' '.join(coords))
+                poly_strs.append(geo_str)
+            face_strs.append('\n'.join(poly_strs))
+    else:
+        for identifier, vertices, modifier in geo_data:
+            rad_poly = Polygon(identifier, vertices, modifier)
+            face_strs.append(rad_poly.to_radiance(minimal, False, False))
+    return face_strs
+
+
+def _static_geometry_strings_by_category(
+        geo_data_list, geo_types, minimal=False, decimal_count=3, cpu_count=1):
+    """Translate several categories of static geometry to Radiance strings.
+
+    When cpu_count is greater than 1, the geometry of all the categories is split
+    into batches that are translated in parallel.
+
+    Args:
+        geo_data_list: A list with the result of _static_geometry_data for each
+            category of geometry.
+        geo_types: A list of text for the type of geometry in each category.
+        minimal: Boolean noting whether radiance strings should be written minimally.
+        decimal_count: Integer for the number of decimal places to round mesh vertices
+        cpu_count: An integer for the number of processes to be used. (Default: 1).
+
+    Returns:
+        A list with a list of Radiance strings for each category of geometry.
+    """
+    if cpu_count is not None and cpu_count <= 1:
+        return [_static_geometry_strings(geo_data, geo_type, minimal, decimal_count)
+                for geo_data, geo_type in zip(geo_data_list, geo_types)]
+
+    # split the geometry into batches such that each process gets several of them
+    total = sum(len(geo_data) for geo_data in geo_data_list)
+    batch_size = max(1, -(-total // ((cpu_count or 1) * 4)))
+    arguments, categories = [], []
+    for cat_i, (geo_data, geo_type) in enumerate(zip(geo_data_list, geo_types)):
+        for st in range(0, len(geo_data), batch_size):
+            arguments.append(
+                (geo_data[st:st + batch_size], geo_type, minimal, decimal_count))
+            categories.append(cat_i)
+    results = run_in_parallel(_static_geometry_strings, arguments, cpu_count)
+
+    # put the batches back together in the original order
+    face_strs = [[] for _ in geo_data_list]
+    for cat_i, batch_strs in zip(categories, results):
+        face_strs[cat_i].extend(batch_strs)
+    return face_strs
+
+
+def _cached_static_geometry_strings(
+        manifest, geo_data_list, geo_types, minimal=False, decimal_count=3,
+        cpu_count=1):
+    """Translate static geometry to Radiance strings reusing the previous export.
+
+    Only the objects with a hash that is not in the manifest are translated and the
+    strings of all the objects are recorded in the manifest for the next export.
+
+    Args:
+        manifest: A _WriteManifest with the strings of the previous export.
+        geo_data_list: A list with the result of _static_geometry_data for each
+            category of geometry.
+        geo_types: A list of text for the type of geometry in each category.
+        minimal: Boolean noting whether radiance strings should be written minimally.
+        decimal_count: Integer for the number of decimal places to round mesh vertices
+        cpu_count: An integer for the number of processes to be used. (Default: 1).
+
+    Returns:
+        A list with a list of Radiance strings for each category of geometry.
+    """
+    keys_list = [
+        _static_geometry_keys(geo_data, geo_type, minimal, decimal_count)
+        for geo_data, geo_type in zip(geo_data_list, geo_types)]
+    missing_data = [
+        [item for item, key in zip(geo_data, keys)
+         if manifest.cached_string(key) is None]
+        for geo_data, keys in zip(geo_data_list, keys_list)]
+    missing_strs = _static_geometry_strings_by_category(
+        missing_data, geo_types, minimal, decimal_count, cpu_count)
+
+    face_strs = []
+    for keys, new_strs in zip(keys_list, missing_strs):
+        new_strs = iter(new_strs)
+        cat_strs = []
+        for key in keys:
+            geo_str = manifest.cached_string(key)
+            if geo_str is None:
+                geo_str = next(new_strs)
+            manifest.record_string(key, geo_str)
+            cat_strs.append(geo_str)
+        face_strs.append(cat_strs)
+    return face_strs
+
+
+def _static_geometry_keys(geo_data, geo_type='Face3D', minimal=False,
+                          decimal_count=3):
+    """Get a hash for each item of _static_geometry_data before it is translated.
+
+    The hash changes whenever the Radiance string of the item changes and it is
+    much faster to calculate than the string.
+
+    Args:
+        geo_data: A list of tuples from the _static_geometry_data method.
+        geo_type: Text for the type of static geometry (either Face3D,
+            PunchedFace3D, or Mesh3D).
+        minimal: Boolean noting whether radiance strings should be written minimally.
+        decimal_count: Integer for the number of decimal places to round mesh vertices
 
-        # write the three files for the model sub-folder
-        dest = os.path.join(folder, sub_folder)
-        if geo_type == 'Mesh3D':  # write minimum specification to reduce file size
-            write_to_file_by_name(dest, '{}.rad'.format(file_id), '\n'.join(face_strs))
+    Returns:
+        A list of text for the hash of each item in geo_data.
+    """
+    settings = '{}|{}|{}|'.format(geo_type, minimal, decimal_count)
+    keys = []
+    for identifier, geo, modifier in geo_data:
+        if geo_type == 'Mesh3D':
+            vertices, faces = geo
+            indices = [i for f_geo in faces for i in (len(f_geo),) + tuple(f_geo)]
+            face_bytes = struct.pack('<{}i'.format(len(indices)), *indices)
         else:
-            write_to_file_by_name(dest, '{}.rad'.format(file_id), '\n\n'.join(face_strs))
-        write_to_file_by_name(dest, '{}.mat'.format(file_id), '\n\n'.join(mod_strs))
-        write_to_file_by_name(dest, '{}.blk'.format(file_id), '\n\n'.join(mod_blk_strs))
+            vertices, face_bytes = geo, b''
+        coords = [v for pt in vertices for v in (pt.x, pt.y, pt.z)]
+        content = '{}{}|{}|'.format(settings, identifier, modifier.identifier)
+        content = content.encode('utf-8') + face_bytes + \
+            struct.pack('<{}d'.format(len(coords)), *coords)
+        keys.append(hashlib.md5(content).hexdigest())
+    return keys
+
+
+class _WriteManifest(object):
+    """A record of the content of each file written into a model folder.
+
+    The manifest is used to incrementally update a model folder where only the
+    files with content that changed since the previous export are rewritten. It
+    also keeps the Radiance string of each static geometry object such that the
+    unchanged objects are not translated again.
+
+    Args:
+        manifest_file: Path to the JSON file of the manifest.
+
+    Properties:
+        * manifest_file
+        * exists
+    """
+    __slots__ = ('manifest_file', 'exists', '_root', '_previous', '_current',
+                 '_previous_strings', '_current_strings')
+
+    def __init__(self, manifest_file):
+        self.manifest_file = manifest_file
+        self._root = os.path.dirname(manifest_file)
+        self._previous, self._previous_strings = {}, {}
+        self._current, self._current_strings = {}, {}
+        self.exists = os.path.isfile(manifest_file)
+        if self.exists:
+            with open(manifest_file) as inf:
+                data = json.load(inf)
+            self._previous = data.get('files', {})
+            self._previous_strings = data.get('strings', {})
+
+    def changed(self, file_path, content):
+        """Record the content of a file and check whether it must be written.
+
+        Args:
+            file_path: Full path to the file.
+            content: Text for the content of the file.
+
+        Returns:
+            True if the file does not exist or its content is different from the
+            content of the previous export. False if the file is up to date.
+        """
+        if not isinstance(content, bytes):
+            content = content.encode('utf-8')
+        key = os.path.relpath(file_path, self._root).replace('\\', '/')
+        content_hash = hashlib.md5(content).hexdigest()
+        self._current[key] = content_hash
+        return self._previous.get(key) != content_hash or \
+            not os.path.isfile(file_path)
+
+    def cached_string(self, key):
+        """Get the Radiance string of an object from the previous export.
+
+        Args:
+            key: Text for the hash of the object from _static_geometry_keys.
+
+        Returns:
+            The Radiance string of the object or None if it was not in the
+            previous export.
+        """
+        return self._previous_strings.get(key)
+
+    def record_string(self, key, rad_string):
+        """Record the Radiance string of an object to be reused by the next export.
+
+        Args:
+            key: Text for the hash of the object from _static_geometry_keys.
+            rad_string: Text for the Radiance string of the object.
+        """
+        self._current_strings[key] = rad_string
+
+    def finish(self):
+        """Remove the files that were not part of this export and write the manifest.
+        """
+        for key in self._previous:
+            if key not in self._current:
+                file_path = os.path.join(self._root, key)
+                if os.path.isfile(file_path):
+                    os.remove(file_path)
+        with open(self.manifest_file, 'w') as outf:
+            json.dump({'files': self._current, 'strings': self._current_strings},
+                      outf, indent=2, sort_keys=True)
+        self._previous, self._current = self._current, {}
+        self._previous_strings, self._current_strings = self._current_strings, {}
+        self.exists = True
+
+
+def _write_if_changed(manifest, folder, file_name, content, mkdir=False):
+    """Write content to a file unless the manifest notes it is already up to date.
+
+    Args:
+        manifest: A _WriteManifest or None to always write the file.
+        folder: Target folder.
+        file_name: The name of the file.
+        content: Text for the content of the file.
+        mkdir: Set to True to create the directory if doesn't exist (Default: False).
+
+    Returns:
+        Full path to the file.
+    """
+    file_path = os.path.join(folder, file_name)
+    if manifest is None or manifest.changed(file_path, content):
+        write_to_file_by_name(folder, file_name, content, mkdir)
+    return file_path
+
+
+def _file_signature(file_path):
+    """Get text that changes whenever a file on this machine is edited."""
+    stat = os.stat(file_path)
+    return '{}|{}|{}'.format(os.path.abspath(file_path), stat.st_size, stat.st_mtime)
 
 
 def _unique_modifiers(geometry_objects):
@@ -805,12 +1130,8 @@ def _unique_modifiers(geometry_objects):
     Returns:
         A list of all unique modifiers across the input geometry_objects
     """
-    modifiers = []
-    for obj in geometry_objects:
-        mod = obj.properties.radiance.modifier
-        if not _instance_in_array(mod, modifiers):
-            modifiers.append(mod)
-    return list(set(modifiers))
+    return InstanceSet(
+        obj.properties.radiance.modifier for obj in geometry_objects).unique_values()
 
 
 def _unique_modifier_blk_combinations(geometry_objects):
@@ -881,20 +1202,6 @@ def _process_bsdf_modifier(modifier, mod_strs, minimal):
     mod_strs.append(mod_dup.to_radiance(minimal))
 
 
-def _instance_in_array(object_instance, object_array):
-    """Check if a specific object instance is already in an array.
-
-    This can be much faster than  `if object_instance in object_array`
-    when you expect to be testing a lot of the same instance of an object for
-    inclusion in an array since the builtin method uses an == operator to
-    test inclusion.
-    """
-    for val in object_array:
-        if val is object_instance:
-            return True
-    return False
-
-
 def _filter_by_pattern(input_objects, filter, full_match=False):
     """Filter model grids and views based on user input."""
     if not filter or filter == '*':
@@ -0,0 +1,56 @@
+import os
+
+from ladybug.futil import nukedir
+
+import honeybee_radiance.postprocess.annualdaylight as annualdaylight
+from honeybee_radiance.postprocess.annualdaylight import metrics, metrics_to_folder
+
+
+def test_metrics_matches_python_fallback(monkeypatch):
+    ill_file = './tests/assets/irrad_result/TestRoom_1.ill'
+    with open(ill_file) as inf:
+        hour_count = len(inf.readline().split())
+    occ_pattern = [1 if i % 3 else 0 for i in range(hour_count)]
+    args = (ill_file, occ_pattern, 0.3, 0.1, 0.8, None, 12)
+
+    results = metrics(*args)
+    monkeypatch.setattr(annualdaylight, 'np', None)
+    python_results = metrics(*args)
+
+    assert results == python_results
+    assert len(results[0]) == 4
+    assert 0 < results[0][0] < 100
+
+
+def test_metrics_to_folder():
+    input_folder = './tests/assets/irrad_result'
+    sub_folder = 'daylight_metrics'
+    result_dir = os.path.join(input_folder, sub_folder)
+
+    metrics_to_folder(input_folder, threshold=0.3, min_t=0.1, max_t=0.8,
+                      sub_folder=sub_folder)
+    for metric, ext in (('da', 'da'), ('cda', 'cda'), ('udi', 'udi'),
+                        ('udi_lower', 'udi'), ('udi_upper', 'udi')):
+        metric_file = os.path.join(result_dir, metric, 'TestRoom_1.%s' % ext)
+        assert os.path.isfile(metric_file)
+        assert os.path.isfile(os.path.join(result_dir, metric, 'vis_metadata.json'))
+        with open(metric_file) as inf:
+            assert len(inf.readlines()) == 4
+    nukedir(result_dir, rmdir=True)
+
+
+def test_metrics_to_folder_parallel():
+    input_folder = './tests/assets/irrad_result'
+    metrics_to_folder(input_folder, threshold=0.3, min_t=0.1, max_t=0.8,
+                      sub_folder='serial_metrics')
+    metrics_to_folder(input_folder, threshold=0.3, min_t=0.1, max_t=0.8,
+                      sub_folder='parallel_metrics', cpu_count=2)
+    for grid in ('TestRoom_1', 'TestRoom_2'):
+        for metric, ext in (('da', 'da'), ('cda', 'cda'), ('udi_lower', 'udi')):
+            rel_path = os.path.join(metric, '%s.%s' % (grid, ext))
+            with open(os.path.join(input_folder, 'serial_metrics', rel_path)) as inf:
+                serial = inf.read()
+            with open(os.path.join(input_folder, 'parallel_metrics', rel_path)) as inf:
+                assert inf.read() == serial
+    nukedir(os.path.join(input_folder, 'serial_metrics'), rmdir=True)
+    nukedir(os.path.join(input_folder, 'parallel_metrics'), rmdir=True)
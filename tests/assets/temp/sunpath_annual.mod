@@ -0,0 +1,4434 @@
+sol_000480
+sol_000540
+sol_000600
+sol_000660
+sol_000720
+sol_000780
+sol_000840
+sol_000900
+sol_000960
+sol_001920
+sol_001980
+sol_002040
+sol_002100
+sol_002160
+sol_002220
+sol_002280
+sol_002340
+sol_002400
+sol_003360
+sol_003420
+sol_003480
+sol_003540
+sol_003600
+sol_003660
+sol_003720
+sol_003780
+sol_003840
+sol_004800
+sol_004860
+sol_004920
+sol_004980
+sol_005040
+sol_005100
+sol_005160
+sol_005220
+sol_005280
+sol_006240
+sol_006300
+sol_006360
+sol_006420
+sol_006480
+sol_006540
+sol_006600
+sol_006660
+sol_006720
+sol_007680
+sol_007740
+sol_007800
+sol_007860
+sol_007920
+sol_007980
+sol_008040
+sol_008100
+sol_008160
+sol_009120
+sol_009180
+sol_009240
+sol_009300
+sol_009360
+sol_009420
+sol_009480
+sol_009540
+sol_009600
+sol_010560
+sol_010620
+sol_010680
+sol_010740
+sol_010800
+sol_010860
+sol_010920
+sol_010980
+sol_011040
+sol_012000
+sol_012060
+sol_012120
+sol_012180
+sol_012240
+sol_012300
+sol_012360
+sol_012420
+sol_012480
+sol_013440
+sol_013500
+sol_013560
+sol_013620
+sol_013680
+sol_013740
+sol_013800
+sol_013860
+sol_013920
+sol_014880
+sol_014940
+sol_015000
+sol_015060
+sol_015120
+sol_015180
+sol_015240
+sol_015300
+sol_015360
+sol_016320
+sol_016380
+sol_016440
+sol_016500
+sol_016560
+sol_016620
+sol_016680
+sol_016740
+sol_016800
+sol_017760
+sol_017820
+sol_017880
+sol_017940
+sol_018000
+sol_018060
+sol_018120
+sol_018180
+sol_018240
+sol_019200
+sol_019260
+sol_019320
+sol_019380
+sol_019440
+sol_019500
+sol_019560
+sol_019620
+sol_019680
+sol_020640
+sol_020700
+sol_020760
+sol_020820
+sol_020880
+sol_020940
+sol_021000
+sol_021060
+sol_021120
+sol_022080
+sol_022140
+sol_022200
+sol_022260
+sol_022320
+sol_022380
+sol_022440
+sol_022500
+sol_022560
+sol_023520
+sol_023580
+sol_023640
+sol_023700
+sol_023760
+sol_023820
+sol_023880
+sol_023940
+sol_024000
+sol_024060
+sol_024960
+sol_025020
+sol_025080
+sol_025140
+sol_025200
+sol_025260
+sol_025320
+sol_025380
+sol_025440
+sol_025500
+sol_026400
+sol_026460
+sol_026520
+sol_026580
+sol_026640
+sol_026700
+sol_026760
+sol_026820
+sol_026880
+sol_026940
+sol_027840
+sol_027900
+sol_027960
+sol_028020
+sol_028080
+sol_028140
+sol_028200
+sol_028260
+sol_028320
+sol_028380
+sol_029280
+sol_029340
+sol_029400
+sol_029460
+sol_029520
+sol_029580
+sol_029640
+sol_029700
+sol_029760
+sol_029820
+sol_030720
+sol_030780
+sol_030840
+sol_030900
+sol_030960
+sol_031020
+sol_031080
+sol_031140
+sol_031200
+sol_031260
+sol_032160
+sol_032220
+sol_032280
+sol_032340
+sol_032400
+sol_032460
+sol_032520
+sol_032580
+sol_032640
+sol_032700
+sol_033600
+sol_033660
+sol_033720
+sol_033780
+sol_033840
+sol_033900
+sol_033960
+sol_034020
+sol_034080
+sol_034140
+sol_035040
+sol_035100
+sol_035160
+sol_035220
+sol_035280
+sol_035340
+sol_035400
+sol_035460
+sol_035520
+sol_035580
+sol_036480
+sol_036540
+sol_036600
+sol_036660
+sol_036720
+sol_036780
+sol_036840
+sol_036900
+sol_036960
+sol_037020
+sol_037920
+sol_037980
+sol_038040
+sol_038100
+sol_038160
+sol_038220
+sol_038280
+sol_038340
+sol_038400
+sol_038460
+sol_039360
+sol_039420
+sol_039480
+sol_039540
+sol_039600
+sol_039660
+sol_039720
+sol_039780
+sol_039840
+sol_039900
+sol_040800
+sol_040860
+sol_040920
+sol_040980
+sol_041040
+sol_041100
+sol_041160
+sol_041220
+sol_041280
+sol_041340
+sol_042240
+sol_042300
+sol_042360
+sol_042420
+sol_042480
+sol_042540
+sol_042600
+sol_042660
+sol_042720
+sol_042780
+sol_043680
+sol_043740
+sol_043800
+sol_043860
+sol_043920
+sol_043980
+sol_044040
+sol_044100
+sol_044160
+sol_044220
+sol_045120
+sol_045180
+sol_045240
+sol_045300
+sol_045360
+sol_045420
+sol_045480
+sol_045540
+sol_045600
+sol_045660
+sol_046560
+sol_046620
+sol_046680
+sol_046740
+sol_046800
+sol_046860
+sol_046920
+sol_046980
+sol_047040
+sol_047100
+sol_048000
+sol_048060
+sol_048120
+sol_048180
+sol_048240
+sol_048300
+sol_048360
+sol_048420
+sol_048480
+sol_048540
+sol_049440
+sol_049500
+sol_049560
+sol_049620
+sol_049680
+sol_049740
+sol_049800
+sol_049860
+sol_049920
+sol_049980
+sol_050880
+sol_050940
+sol_051000
+sol_051060
+sol_051120
+sol_051180
+sol_051240
+sol_051300
+sol_051360
+sol_051420
+sol_052320
+sol_052380
+sol_052440
+sol_052500
+sol_052560
+sol_052620
+sol_052680
+sol_052740
+sol_052800
+sol_052860
+sol_053760
+sol_053820
+sol_053880
+sol_053940
+sol_054000
+sol_054060
+sol_054120
+sol_054180
+sol_054240
+sol_054300
+sol_055200
+sol_055260
+sol_055320
+sol_055380
+sol_055440
+sol_055500
+sol_055560
+sol_055620
+sol_055680
+sol_055740
+sol_056640
+sol_056700
+sol_056760
+sol_056820
+sol_056880
+sol_056940
+sol_057000
+sol_057060
+sol_057120
+sol_057180
+sol_058020
+sol_058080
+sol_058140
+sol_058200
+sol_058260
+sol_058320
+sol_058380
+sol_058440
+sol_058500
+sol_058560
+sol_058620
+sol_059460
+sol_059520
+sol_059580
+sol_059640
+sol_059700
+sol_059760
+sol_059820
+sol_059880
+sol_059940
+sol_060000
+sol_060060
+sol_060900
+sol_060960
+sol_061020
+sol_061080
+sol_061140
+sol_061200
+sol_061260
+sol_061320
+sol_061380
+sol_061440
+sol_061500
+sol_062340
+sol_062400
+sol_062460
+sol_062520
+sol_062580
+sol_062640
+sol_062700
+sol_062760
+sol_062820
+sol_062880
+sol_062940
+sol_063780
+sol_063840
+sol_063900
+sol_063960
+sol_064020
+sol_064080
+sol_064140
+sol_064200
+sol_064260
+sol_064320
+sol_064380
+sol_065220
+sol_065280
+sol_065340
+sol_065400
+sol_065460
+sol_065520
+sol_065580
+sol_065640
+sol_065700
+sol_065760
+sol_065820
+sol_066660
+sol_066720
+sol_066780
+sol_066840
+sol_066900
+sol_066960
+sol_067020
+sol_067080
+sol_067140
+sol_067200
+sol_067260
+sol_068100
+sol_068160
+sol_068220
+sol_068280
+sol_068340
+sol_068400
+sol_068460
+sol_068520
+sol_068580
+sol_068640
+sol_068700
+sol_069540
+sol_069600
+sol_069660
+sol_069720
+sol_069780
+sol_069840
+sol_069900
+sol_069960
+sol_070020
+sol_070080
+sol_070140
+sol_070980
+sol_071040
+sol_071100
+sol_071160
+sol_071220
+sol_071280
+sol_071340
+sol_071400
+sol_071460
+sol_071520
+sol_071580
+sol_072420
+sol_072480
+sol_072540
+sol_072600
+sol_072660
+sol_072720
+sol_072780
+sol_072840
+sol_072900
+sol_072960
+sol_073020
+sol_073860
+sol_073920
+sol_073980
+sol_074040
+sol_074100
+sol_074160
+sol_074220
+sol_074280
+sol_074340
+sol_074400
+sol_074460
+sol_075300
+sol_075360
+sol_075420
+sol_075480
+sol_075540
+sol_075600
+sol_075660
+sol_075720
+sol_075780
+sol_075840
+sol_075900
+sol_076740
+sol_076800
+sol_076860
+sol_076920
+sol_076980
+sol_077040
+sol_077100
+sol_077160
+sol_077220
+sol_077280
+sol_077340
+sol_078180
+sol_078240
+sol_078300
+sol_078360
+sol_078420
+sol_078480
+sol_078540
+sol_078600
+sol_078660
+sol_078720
+sol_078780
+sol_079620
+sol_079680
+sol_079740
+sol_079800
+sol_079860
+sol_079920
+sol_079980
+sol_080040
+sol_080100
+sol_080160
+sol_080220
+sol_081060
+sol_081120
+sol_081180
+sol_081240
+sol_081300
+sol_081360
+sol_081420
+sol_081480
+sol_081540
+sol_081600
+sol_081660
+sol_082500
+sol_082560
+sol_082620
+sol_082680
+sol_082740
+sol_082800
+sol_082860
+sol_082920
+sol_082980
+sol_083040
+sol_083100
+sol_083940
+sol_084000
+sol_084060
+sol_084120
+sol_084180
+sol_084240
+sol_084300
+sol_084360
+sol_084420
+sol_084480
+sol_084540
+sol_085380
+sol_085440
+sol_085500
+sol_085560
+sol_085620
+sol_085680
+sol_085740
+sol_085800
+sol_085860
+sol_085920
+sol_085980
+sol_086820
+sol_086880
+sol_086940
+sol_087000
+sol_087060
+sol_087120
+sol_087180
+sol_087240
+sol_087300
+sol_087360
+sol_087420
+sol_088260
+sol_088320
+sol_088380
+sol_088440
+sol_088500
+sol_088560
+sol_088620
+sol_088680
+sol_088740
+sol_088800
+sol_088860
+sol_089700
+sol_089760
+sol_089820
+sol_089880
+sol_089940
+sol_090000
+sol_090060
+sol_090120
+sol_090180
+sol_090240
+sol_090300
+sol_091140
+sol_091200
+sol_091260
+sol_091320
+sol_091380
+sol_091440
+sol_091500
+sol_091560
+sol_091620
+sol_091680
+sol_091740
+sol_092580
+sol_092640
+sol_092700
+sol_092760
+sol_092820
+sol_092880
+sol_092940
+sol_093000
+sol_093060
+sol_093120
+sol_093180
+sol_094020
+sol_094080
+sol_094140
+sol_094200
+sol_094260
+sol_094320
+sol_094380
+sol_094440
+sol_094500
+sol_094560
+sol_094620
+sol_095460
+sol_095520
+sol_095580
+sol_095640
+sol_095700
+sol_095760
+sol_095820
+sol_095880
+sol_095940
+sol_096000
+sol_096060
+sol_096900
+sol_096960
+sol_097020
+sol_097080
+sol_097140
+sol_097200
+sol_097260
+sol_097320
+sol_097380
+sol_097440
+sol_097500
+sol_098340
+sol_098400
+sol_098460
+sol_098520
+sol_098580
+sol_098640
+sol_098700
+sol_098760
+sol_098820
+sol_098880
+sol_098940
+sol_099000
+sol_099780
+sol_099840
+sol_099900
+sol_099960
+sol_100020
+sol_100080
+sol_100140
+sol_100200
+sol_100260
+sol_100320
+sol_100380
+sol_100440
+sol_101220
+sol_101280
+sol_101340
+sol_101400
+sol_101460
+sol_101520
+sol_101580
+sol_101640
+sol_101700
+sol_101760
+sol_101820
+sol_101880
+sol_102660
+sol_102720
+sol_102780
+sol_102840
+sol_102900
+sol_102960
+sol_103020
+sol_103080
+sol_103140
+sol_103200
+sol_103260
+sol_103320
+sol_104100
+sol_104160
+sol_104220
+sol_104280
+sol_104340
+sol_104400
+sol_104460
+sol_104520
+sol_104580
+sol_104640
+sol_104700
+sol_104760
+sol_105540
+sol_105600
+sol_105660
+sol_105720
+sol_105780
+sol_105840
+sol_105900
+sol_105960
+sol_106020
+sol_106080
+sol_106140
+sol_106200
+sol_106980
+sol_107040
+sol_107100
+sol_107160
+sol_107220
+sol_107280
+sol_107340
+sol_107400
+sol_107460
+sol_107520
+sol_107580
+sol_107640
+sol_108420
+sol_108480
+sol_108540
+sol_108600
+sol_108660
+sol_108720
+sol_108780
+sol_108840
+sol_108900
+sol_108960
+sol_109020
+sol_109080
+sol_109860
+sol_109920
+sol_109980
+sol_110040
+sol_110100
+sol_110160
+sol_110220
+sol_110280
+sol_110340
+sol_110400
+sol_110460
+sol_110520
+sol_111300
+sol_111360
+sol_111420
+sol_111480
+sol_111540
+sol_111600
+sol_111660
+sol_111720
+sol_111780
+sol_111840
+sol_111900
+sol_111960
+sol_112740
+sol_112800
+sol_112860
+sol_112920
+sol_112980
+sol_113040
+sol_113100
+sol_113160
+sol_113220
+sol_113280
+sol_113340
+sol_113400
+sol_114180
+sol_114240
+sol_114300
+sol_114360
+sol_114420
+sol_114480
+sol_114540
+sol_114600
+sol_114660
+sol_114720
+sol_114780
+sol_114840
+sol_115620
+sol_115680
+sol_115740
+sol_115800
+sol_115860
+sol_115920
+sol_115980
+sol_116040
+sol_116100
+sol_116160
+sol_116220
+sol_116280
+sol_117000
+sol_117060
+sol_117120
+sol_117180
+sol_117240
+sol_117300
+sol_117360
+sol_117420
+sol_117480
+sol_117540
+sol_117600
+sol_117660
+sol_117720
+sol_118440
+sol_118500
+sol_118560
+sol_118620
+sol_118680
+sol_118740
+sol_118800
+sol_118860
+sol_118920
+sol_118980
+sol_119040
+sol_119100
+sol_119160
+sol_119880
+sol_119940
+sol_120000
+sol_120060
+sol_120120
+sol_120180
+sol_120240
+sol_120300
+sol_120360
+sol_120420
+sol_120480
+sol_120540
+sol_120600
+sol_121320
+sol_121380
+sol_121440
+sol_121500
+sol_121560
+sol_121620
+sol_121680
+sol_121740
+sol_121800
+sol_121860
+sol_121920
+sol_121980
+sol_122040
+sol_122760
+sol_122820
+sol_122880
+sol_122940
+sol_123000
+sol_123060
+sol_123120
+sol_123180
+sol_123240
+sol_123300
+sol_123360
+sol_123420
+sol_123480
+sol_124200
+sol_124260
+sol_124320
+sol_124380
+sol_124440
+sol_124500
+sol_124560
+sol_124620
+sol_124680
+sol_124740
+sol_124800
+sol_124860
+sol_124920
+sol_125640
+sol_125700
+sol_125760
+sol_125820
+sol_125880
+sol_125940
+sol_126000
+sol_126060
+sol_126120
+sol_126180
+sol_126240
+sol_126300
+sol_126360
+sol_127080
+sol_127140
+sol_127200
+sol_127260
+sol_127320
+sol_127380
+sol_127440
+sol_127500
+sol_127560
+sol_127620
+sol_127680
+sol_127740
+sol_127800
+sol_128520
+sol_128580
+sol_128640
+sol_128700
+sol_128760
+sol_128820
+sol_128880
+sol_128940
+sol_129000
+sol_129060
+sol_129120
+sol_129180
+sol_129240
+sol_129960
+sol_130020
+sol_130080
+sol_130140
+sol_130200
+sol_130260
+sol_130320
+sol_130380
+sol_130440
+sol_130500
+sol_130560
+sol_130620
+sol_130680
+sol_131400
+sol_131460
+sol_131520
+sol_131580
+sol_131640
+sol_131700
+sol_131760
+sol_131820
+sol_131880
+sol_131940
+sol_132000
+sol_132060
+sol_132120
+sol_132840
+sol_132900
+sol_132960
+sol_133020
+sol_133080
+sol_133140
+sol_133200
+sol_133260
+sol_133320
+sol_133380
+sol_133440
+sol_133500
+sol_133560
+sol_134280
+sol_134340
+sol_134400
+sol_134460
+sol_134520
+sol_134580
+sol_134640
+sol_134700
+sol_134760
+sol_134820
+sol_134880
+sol_134940
+sol_135000
+sol_135720
+sol_135780
+sol_135840
+sol_135900
+sol_135960
+sol_136020
+sol_136080
+sol_136140
+sol_136200
+sol_136260
+sol_136320
+sol_136380
+sol_136440
+sol_137160
+sol_137220
+sol_137280
+sol_137340
+sol_137400
+sol_137460
+sol_137520
+sol_137580
+sol_137640
+sol_137700
+sol_137760
+sol_137820
+sol_137880
+sol_138600
+sol_138660
+sol_138720
+sol_138780
+sol_138840
+sol_138900
+sol_138960
+sol_139020
+sol_139080
+sol_139140
+sol_139200
+sol_139260
+sol_139320
+sol_140040
+sol_140100
+sol_140160
+sol_140220
+sol_140280
+sol_140340
+sol_140400
+sol_140460
+sol_140520
+sol_140580
+sol_140640
+sol_140700
+sol_140760
+sol_141480
+sol_141540
+sol_141600
+sol_141660
+sol_141720
+sol_141780
+sol_141840
+sol_141900
+sol_141960
+sol_142020
+sol_142080
+sol_142140
+sol_142200
+sol_142920
+sol_142980
+sol_143040
+sol_143100
+sol_143160
+sol_143220
+sol_143280
+sol_143340
+sol_143400
+sol_143460
+sol_143520
+sol_143580
+sol_143640
+sol_144360
+sol_144420
+sol_144480
+sol_144540
+sol_144600
+sol_144660
+sol_144720
+sol_144780
+sol_144840
+sol_144900
+sol_144960
+sol_145020
+sol_145080
+sol_145800
+sol_145860
+sol_145920
+sol_145980
+sol_146040
+sol_146100
+sol_146160
+sol_146220
+sol_146280
+sol_146340
+sol_146400
+sol_146460
+sol_146520
+sol_147240
+sol_147300
+sol_147360
+sol_147420
+sol_147480
+sol_147540
+sol_147600
+sol_147660
+sol_147720
+sol_147780
+sol_147840
+sol_147900
+sol_147960
+sol_148680
+sol_148740
+sol_148800
+sol_148860
+sol_148920
+sol_148980
+sol_149040
+sol_149100
+sol_149160
+sol_149220
+sol_149280
+sol_149340
+sol_149400
+sol_150120
+sol_150180
+sol_150240
+sol_150300
+sol_150360
+sol_150420
+sol_150480
+sol_150540
+sol_150600
+sol_150660
+sol_150720
+sol_150780
+sol_150840
+sol_151560
+sol_151620
+sol_151680
+sol_151740
+sol_151800
+sol_151860
+sol_151920
+sol_151980
+sol_152040
+sol_152100
+sol_152160
+sol_152220
+sol_152280
+sol_153000
+sol_153060
+sol_153120
+sol_153180
+sol_153240
+sol_153300
+sol_153360
+sol_153420
+sol_153480
+sol_153540
+sol_153600
+sol_153660
+sol_153720
+sol_154440
+sol_154500
+sol_154560
+sol_154620
+sol_154680
+sol_154740
+sol_154800
+sol_154860
+sol_154920
+sol_154980
+sol_155040
+sol_155100
+sol_155160
+sol_155880
+sol_155940
+sol_156000
+sol_156060
+sol_156120
+sol_156180
+sol_156240
+sol_156300
+sol_156360
+sol_156420
+sol_156480
+sol_156540
+sol_156600
+sol_157320
+sol_157380
+sol_157440
+sol_157500
+sol_157560
+sol_157620
+sol_157680
+sol_157740
+sol_157800
+sol_157860
+sol_157920
+sol_157980
+sol_158040
+sol_158760
+sol_158820
+sol_158880
+sol_158940
+sol_159000
+sol_159060
+sol_159120
+sol_159180
+sol_159240
+sol_159300
+sol_159360
+sol_159420
+sol_159480
+sol_160200
+sol_160260
+sol_160320
+sol_160380
+sol_160440
+sol_160500
+sol_160560
+sol_160620
+sol_160680
+sol_160740
+sol_160800
+sol_160860
+sol_160920
+sol_161640
+sol_161700
+sol_161760
+sol_161820
+sol_161880
+sol_161940
+sol_162000
+sol_162060
+sol_162120
+sol_162180
+sol_162240
+sol_162300
+sol_162360
+sol_163080
+sol_163140
+sol_163200
+sol_163260
+sol_163320
+sol_163380
+sol_163440
+sol_163500
+sol_163560
+sol_163620
+sol_163680
+sol_163740
+sol_163800
+sol_164520
+sol_164580
+sol_164640
+sol_164700
+sol_164760
+sol_164820
+sol_164880
+sol_164940
+sol_165000
+sol_165060
+sol_165120
+sol_165180
+sol_165240
+sol_165960
+sol_166020
+sol_166080
+sol_166140
+sol_166200
+sol_166260
+sol_166320
+sol_166380
+sol_166440
+sol_166500
+sol_166560
+sol_166620
+sol_166680
+sol_167400
+sol_167460
+sol_167520
+sol_167580
+sol_167640
+sol_167700
+sol_167760
+sol_167820
+sol_167880
+sol_167940
+sol_168000
+sol_168060
+sol_168120
+sol_168840
+sol_168900
+sol_168960
+sol_169020
+sol_169080
+sol_169140
+sol_169200
+sol_169260
+sol_169320
+sol_169380
+sol_169440
+sol_169500
+sol_169560
+sol_170280
+sol_170340
+sol_170400
+sol_170460
+sol_170520
+sol_170580
+sol_170640
+sol_170700
+sol_170760
+sol_170820
+sol_170880
+sol_170940
+sol_171000
+sol_171720
+sol_171780
+sol_171840
+sol_171900
+sol_171960
+sol_172020
+sol_172080
+sol_172140
+sol_172200
+sol_172260
+sol_172320
+sol_172380
+sol_172440
+sol_173160
+sol_173220
+sol_173280
+sol_173340
+sol_173400
+sol_173460
+sol_173520
+sol_173580
+sol_173640
+sol_173700
+sol_173760
+sol_173820
+sol_173880
+sol_174540
+sol_174600
+sol_174660
+sol_174720
+sol_174780
+sol_174840
+sol_174900
+sol_174960
+sol_175020
+sol_175080
+sol_175140
+sol_175200
+sol_175260
+sol_175320
+sol_175980
+sol_176040
+sol_176100
+sol_176160
+sol_176220
+sol_176280
+sol_176340
+sol_176400
+sol_176460
+sol_176520
+sol_176580
+sol_176640
+sol_176700
+sol_176760
+sol_177420
+sol_177480
+sol_177540
+sol_177600
+sol_177660
+sol_177720
+sol_177780
+sol_177840
+sol_177900
+sol_177960
+sol_178020
+sol_178080
+sol_178140
+sol_178200
+sol_178860
+sol_178920
+sol_178980
+sol_179040
+sol_179100
+sol_179160
+sol_179220
+sol_179280
+sol_179340
+sol_179400
+sol_179460
+sol_179520
+sol_179580
+sol_179640
+sol_180300
+sol_180360
+sol_180420
+sol_180480
+sol_180540
+sol_180600
+sol_180660
+sol_180720
+sol_180780
+sol_180840
+sol_180900
+sol_180960
+sol_181020
+sol_181080
+sol_181740
+sol_181800
+sol_181860
+sol_181920
+sol_181980
+sol_182040
+sol_182100
+sol_182160
+sol_182220
+sol_182280
+sol_182340
+sol_182400
+sol_182460
+sol_182520
+sol_183180
+sol_183240
+sol_183300
+sol_183360
+sol_183420
+sol_183480
+sol_183540
+sol_183600
+sol_183660
+sol_183720
+sol_183780
+sol_183840
+sol_183900
+sol_183960
+sol_184620
+sol_184680
+sol_184740
+sol_184800
+sol_184860
+sol_184920
+sol_184980
+sol_185040
+sol_185100
+sol_185160
+sol_185220
+sol_185280
+sol_185340
+sol_185400
+sol_185460
+sol_186060
+sol_186120
+sol_186180
+sol_186240
+sol_186300
+sol_186360
+sol_186420
+sol_186480
+sol_186540
+sol_186600
+sol_186660
+sol_186720
+sol_186780
+sol_186840
+sol_186900
+sol_187500
+sol_187560
+sol_187620
+sol_187680
+sol_187740
+sol_187800
+sol_187860
+sol_187920
+sol_187980
+sol_188040
+sol_188100
+sol_188160
+sol_188220
+sol_188280
+sol_188340
+sol_188940
+sol_189000
+sol_189060
+sol_189120
+sol_189180
+sol_189240
+sol_189300
+sol_189360
+sol_189420
+sol_189480
+sol_189540
+sol_189600
+sol_189660
+sol_189720
+sol_189780
+sol_190380
+sol_190440
+sol_190500
+sol_190560
+sol_190620
+sol_190680
+sol_190740
+sol_190800
+sol_190860
+sol_190920
+sol_190980
+sol_191040
+sol_191100
+sol_191160
+sol_191220
+sol_191820
+sol_191880
+sol_191940
+sol_192000
+sol_192060
+sol_192120
+sol_192180
+sol_192240
+sol_192300
+sol_192360
+sol_192420
+sol_192480
+sol_192540
+sol_192600
+sol_192660
+sol_193260
+sol_193320
+sol_193380
+sol_193440
+sol_193500
+sol_193560
+sol_193620
+sol_193680
+sol_193740
+sol_193800
+sol_193860
+sol_193920
+sol_193980
+sol_194040
+sol_194100
+sol_194700
+sol_194760
+sol_194820
+sol_194880
+sol_194940
+sol_195000
+sol_195060
+sol_195120
+sol_195180
+sol_195240
+sol_195300
+sol_195360
+sol_195420
+sol_195480
+sol_195540
+sol_196140
+sol_196200
+sol_196260
+sol_196320
+sol_196380
+sol_196440
+sol_196500
+sol_196560
+sol_196620
+sol_196680
+sol_196740
+sol_196800
+sol_196860
+sol_196920
+sol_196980
+sol_197580
+sol_197640
+sol_197700
+sol_197760
+sol_197820
+sol_197880
+sol_197940
+sol_198000
+sol_198060
+sol_198120
+sol_198180
+sol_198240
+sol_198300
+sol_198360
+sol_198420
+sol_199020
+sol_199080
+sol_199140
+sol_199200
+sol_199260
+sol_199320
+sol_199380
+sol_199440
+sol_199500
+sol_199560
+sol_199620
+sol_199680
+sol_199740
+sol_199800
+sol_199860
+sol_200460
+sol_200520
+sol_200580
+sol_200640
+sol_200700
+sol_200760
+sol_200820
+sol_200880
+sol_200940
+sol_201000
+sol_201060
+sol_201120
+sol_201180
+sol_201240
+sol_201300
+sol_201900
+sol_201960
+sol_202020
+sol_202080
+sol_202140
+sol_202200
+sol_202260
+sol_202320
+sol_202380
+sol_202440
+sol_202500
+sol_202560
+sol_202620
+sol_202680
+sol_202740
+sol_203340
+sol_203400
+sol_203460
+sol_203520
+sol_203580
+sol_203640
+sol_203700
+sol_203760
+sol_203820
+sol_203880
+sol_203940
+sol_204000
+sol_204060
+sol_204120
+sol_204180
+sol_204780
+sol_204840
+sol_204900
+sol_204960
+sol_205020
+sol_205080
+sol_205140
+sol_205200
+sol_205260
+sol_205320
+sol_205380
+sol_205440
+sol_205500
+sol_205560
+sol_205620
+sol_206220
+sol_206280
+sol_206340
+sol_206400
+sol_206460
+sol_206520
+sol_206580
+sol_206640
+sol_206700
+sol_206760
+sol_206820
+sol_206880
+sol_206940
+sol_207000
+sol_207060
+sol_207660
+sol_207720
+sol_207780
+sol_207840
+sol_207900
+sol_207960
+sol_208020
+sol_208080
+sol_208140
+sol_208200
+sol_208260
+sol_208320
+sol_208380
+sol_208440
+sol_208500
+sol_209100
+sol_209160
+sol_209220
+sol_209280
+sol_209340
+sol_209400
+sol_209460
+sol_209520
+sol_209580
+sol_209640
+sol_209700
+sol_209760
+sol_209820
+sol_209880
+sol_209940
+sol_210540
+sol_210600
+sol_210660
+sol_210720
+sol_210780
+sol_210840
+sol_210900
+sol_210960
+sol_211020
+sol_211080
+sol_211140
+sol_211200
+sol_211260
+sol_211320
+sol_211380
+sol_211980
+sol_212040
+sol_212100
+sol_212160
+sol_212220
+sol_212280
+sol_212340
+sol_212400
+sol_212460
+sol_212520
+sol_212580
+sol_212640
+sol_212700
+sol_212760
+sol_212820
+sol_213420
+sol_213480
+sol_213540
+sol_213600
+sol_213660
+sol_213720
+sol_213780
+sol_213840
+sol_213900
+sol_213960
+sol_214020
+sol_214080
+sol_214140
+sol_214200
+sol_214260
+sol_214860
+sol_214920
+sol_214980
+sol_215040
+sol_215100
+sol_215160
+sol_215220
+sol_215280
+sol_215340
+sol_215400
+sol_215460
+sol_215520
+sol_215580
+sol_215640
+sol_215700
+sol_216300
+sol_216360
+sol_216420
+sol_216480
+sol_216540
+sol_216600
+sol_216660
+sol_216720
+sol_216780
+sol_216840
+sol_216900
+sol_216960
+sol_217020
+sol_217080
+sol_217140
+sol_217740
+sol_217800
+sol_217860
+sol_217920
+sol_217980
+sol_218040
+sol_218100
+sol_218160
+sol_218220
+sol_218280
+sol_218340
+sol_218400
+sol_218460
+sol_218520
+sol_218580
+sol_219180
+sol_219240
+sol_219300
+sol_219360
+sol_219420
+sol_219480
+sol_219540
+sol_219600
+sol_219660
+sol_219720
+sol_219780
+sol_219840
+sol_219900
+sol_219960
+sol_220020
+sol_220620
+sol_220680
+sol_220740
+sol_220800
+sol_220860
+sol_220920
+sol_220980
+sol_221040
+sol_221100
+sol_221160
+sol_221220
+sol_221280
+sol_221340
+sol_221400
+sol_221460
+sol_222060
+sol_222120
+sol_222180
+sol_222240
+sol_222300
+sol_222360
+sol_222420
+sol_222480
+sol_222540
+sol_222600
+sol_222660
+sol_222720
+sol_222780
+sol_222840
+sol_222900
+sol_223500
+sol_223560
+sol_223620
+sol_223680
+sol_223740
+sol_223800
+sol_223860
+sol_223920
+sol_223980
+sol_224040
+sol_224100
+sol_224160
+sol_224220
+sol_224280
+sol_224340
+sol_224940
+sol_225000
+sol_225060
+sol_225120
+sol_225180
+sol_225240
+sol_225300
+sol_225360
+sol_225420
+sol_225480
+sol_225540
+sol_225600
+sol_225660
+sol_225720
+sol_225780
+sol_226380
+sol_226440
+sol_226500
+sol_226560
+sol_226620
+sol_226680
+sol_226740
+sol_226800
+sol_226860
+sol_226920
+sol_226980
+sol_227040
+sol_227100
+sol_227160
+sol_227220
+sol_227820
+sol_227880
+sol_227940
+sol_228000
+sol_228060
+sol_228120
+sol_228180
+sol_228240
+sol_228300
+sol_228360
+sol_228420
+sol_228480
+sol_228540
+sol_228600
+sol_228660
+sol_229260
+sol_229320
+sol_229380
+sol_229440
+sol_229500
+sol_229560
+sol_229620
+sol_229680
+sol_229740
+sol_229800
+sol_229860
+sol_229920
+sol_229980
+sol_230040
+sol_230100
+sol_230700
+sol_230760
+sol_230820
+sol_230880
+sol_230940
+sol_231000
+sol_231060
+sol_231120
+sol_231180
+sol_231240
+sol_231300
+sol_231360
+sol_231420
+sol_231480
+sol_231540
+sol_232140
+sol_232200
+sol_232260
+sol_232320
+sol_232380
+sol_232440
+sol_232500
+sol_232560
+sol_232620
+sol_232680
+sol_232740
+sol_232800
+sol_232860
+sol_232920
+sol_232980
+sol_233580
+sol_233640
+sol_233700
+sol_233760
+sol_233820
+sol_233880
+sol_233940
+sol_234000
+sol_234060
+sol_234120
+sol_234180
+sol_234240
+sol_234300
+sol_234360
+sol_234420
+sol_235020
+sol_235080
+sol_235140
+sol_235200
+sol_235260
+sol_235320
+sol_235380
+sol_235440
+sol_235500
+sol_235560
+sol_235620
+sol_235680
+sol_235740
+sol_235800
+sol_235860
+sol_236460
+sol_236520
+sol_236580
+sol_236640
+sol_236700
+sol_236760
+sol_236820
+sol_236880
+sol_236940
+sol_237000
+sol_237060
+sol_237120
+sol_237180
+sol_237240
+sol_237300
+sol_237900
+sol_237960
+sol_238020
+sol_238080
+sol_238140
+sol_238200
+sol_238260
+sol_238320
+sol_238380
+sol_238440
+sol_238500
+sol_238560
+sol_238620
+sol_238680
+sol_238740
+sol_239340
+sol_239400
+sol_239460
+sol_239520
+sol_239580
+sol_239640
+sol_239700
+sol_239760
+sol_239820
+sol_239880
+sol_239940
+sol_240000
+sol_240060
+sol_240120
+sol_240180
+sol_240780
+sol_240840
+sol_240900
+sol_240960
+sol_241020
+sol_241080
+sol_241140
+sol_241200
+sol_241260
+sol_241320
+sol_241380
+sol_241440
+sol_241500
+sol_241560
+sol_241620
+sol_242220
+sol_242280
+sol_242340
+sol_242400
+sol_242460
+sol_242520
+sol_242580
+sol_242640
+sol_242700
+sol_242760
+sol_242820
+sol_242880
+sol_242940
+sol_243000
+sol_243060
+sol_243660
+sol_243720
+sol_243780
+sol_243840
+sol_243900
+sol_243960
+sol_244020
+sol_244080
+sol_244140
+sol_244200
+sol_244260
+sol_244320
+sol_244380
+sol_244440
+sol_244500
+sol_245100
+sol_245160
+sol_245220
+sol_245280
+sol_245340
+sol_245400
+sol_245460
+sol_245520
+sol_245580
+sol_245640
+sol_245700
+sol_245760
+sol_245820
+sol_245880
+sol_245940
+sol_246540
+sol_246600
+sol_246660
+sol_246720
+sol_246780
+sol_246840
+sol_246900
+sol_246960
+sol_247020
+sol_247080
+sol_247140
+sol_247200
+sol_247260
+sol_247320
+sol_247380
+sol_247980
+sol_248040
+sol_248100
+sol_248160
+sol_248220
+sol_248280
+sol_248340
+sol_248400
+sol_248460
+sol_248520
+sol_248580
+sol_248640
+sol_248700
+sol_248760
+sol_248820
+sol_249420
+sol_249480
+sol_249540
+sol_249600
+sol_249660
+sol_249720
+sol_249780
+sol_249840
+sol_249900
+sol_249960
+sol_250020
+sol_250080
+sol_250140
+sol_250200
+sol_250260
+sol_250860
+sol_250920
+sol_250980
+sol_251040
+sol_251100
+sol_251160
+sol_251220
+sol_251280
+sol_251340
+sol_251400
+sol_251460
+sol_251520
+sol_251580
+sol_251640
+sol_251700
+sol_252300
+sol_252360
+sol_252420
+sol_252480
+sol_252540
+sol_252600
+sol_252660
+sol_252720
+sol_252780
+sol_252840
+sol_252900
+sol_252960
+sol_253020
+sol_253080
+sol_253140
+sol_253740
+sol_253800
+sol_253860
+sol_253920
+sol_253980
+sol_254040
+sol_254100
+sol_254160
+sol_254220
+sol_254280
+sol_254340
+sol_254400
+sol_254460
+sol_254520
+sol_254580
+sol_255180
+sol_255240
+sol_255300
+sol_255360
+sol_255420
+sol_255480
+sol_255540
+sol_255600
+sol_255660
+sol_255720
+sol_255780
+sol_255840
+sol_255900
+sol_255960
+sol_256020
+sol_256620
+sol_256680
+sol_256740
+sol_256800
+sol_256860
+sol_256920
+sol_256980
+sol_257040
+sol_257100
+sol_257160
+sol_257220
+sol_257280
+sol_257340
+sol_257400
+sol_257460
+sol_258060
+sol_258120
+sol_258180
+sol_258240
+sol_258300
+sol_258360
+sol_258420
+sol_258480
+sol_258540
+sol_258600
+sol_258660
+sol_258720
+sol_258780
+sol_258840
+sol_258900
+sol_259500
+sol_259560
+sol_259620
+sol_259680
+sol_259740
+sol_259800
+sol_259860
+sol_259920
+sol_259980
+sol_260040
+sol_260100
+sol_260160
+sol_260220
+sol_260280
+sol_260340
+sol_260940
+sol_261000
+sol_261060
+sol_261120
+sol_261180
+sol_261240
+sol_261300
+sol_261360
+sol_261420
+sol_261480
+sol_261540
+sol_261600
+sol_261660
+sol_261720
+sol_261780
+sol_262380
+sol_262440
+sol_262500
+sol_262560
+sol_262620
+sol_262680
+sol_262740
+sol_262800
+sol_262860
+sol_262920
+sol_262980
+sol_263040
+sol_263100
+sol_263160
+sol_263220
+sol_263820
+sol_263880
+sol_263940
+sol_264000
+sol_264060
+sol_264120
+sol_264180
+sol_264240
+sol_264300
+sol_264360
+sol_264420
+sol_264480
+sol_264540
+sol_264600
+sol_264660
+sol_265260
+sol_265320
+sol_265380
+sol_265440
+sol_265500
+sol_265560
+sol_265620
+sol_265680
+sol_265740
+sol_265800
+sol_265860
+sol_265920
+sol_265980
+sol_266040
+sol_266100
+sol_266700
+sol_266760
+sol_266820
+sol_266880
+sol_266940
+sol_267000
+sol_267060
+sol_267120
+sol_267180
+sol_267240
+sol_267300
+sol_267360
+sol_267420
+sol_267480
+sol_267540
+sol_268140
+sol_268200
+sol_268260
+sol_268320
+sol_268380
+sol_268440
+sol_268500
+sol_268560
+sol_268620
+sol_268680
+sol_268740
+sol_268800
+sol_268860
+sol_268920
+sol_268980
+sol_269580
+sol_269640
+sol_269700
+sol_269760
+sol_269820
+sol_269880
+sol_269940
+sol_270000
+sol_270060
+sol_270120
+sol_270180
+sol_270240
+sol_270300
+sol_270360
+sol_270420
+sol_271020
+sol_271080
+sol_271140
+sol_271200
+sol_271260
+sol_271320
+sol_271380
+sol_271440
+sol_271500
+sol_271560
+sol_271620
+sol_271680
+sol_271740
+sol_271800
+sol_271860
+sol_272460
+sol_272520
+sol_272580
+sol_272640
+sol_272700
+sol_272760
+sol_272820
+sol_272880
+sol_272940
+sol_273000
+sol_273060
+sol_273120
+sol_273180
+sol_273240
+sol_273300
+sol_273900
+sol_273960
+sol_274020
+sol_274080
+sol_274140
+sol_274200
+sol_274260
+sol_274320
+sol_274380
+sol_274440
+sol_274500
+sol_274560
+sol_274620
+sol_274680
+sol_274740
+sol_275340
+sol_275400
+sol_275460
+sol_275520
+sol_275580
+sol_275640
+sol_275700
+sol_275760
+sol_275820
+sol_275880
+sol_275940
+sol_276000
+sol_276060
+sol_276120
+sol_276180
+sol_276780
+sol_276840
+sol_276900
+sol_276960
+sol_277020
+sol_277080
+sol_277140
+sol_277200
+sol_277260
+sol_277320
+sol_277380
+sol_277440
+sol_277500
+sol_277560
+sol_277620
+sol_278220
+sol_278280
+sol_278340
+sol_278400
+sol_278460
+sol_278520
+sol_278580
+sol_278640
+sol_278700
+sol_278760
+sol_278820
+sol_278880
+sol_278940
+sol_279000
+sol_279060
+sol_279660
+sol_279720
+sol_279780
+sol_279840
+sol_279900
+sol_279960
+sol_280020
+sol_280080
+sol_280140
+sol_280200
+sol_280260
+sol_280320
+sol_280380
+sol_280440
+sol_280500
+sol_281100
+sol_281160
+sol_281220
+sol_281280
+sol_281340
+sol_281400
+sol_281460
+sol_281520
+sol_281580
+sol_281640
+sol_281700
+sol_281760
+sol_281820
+sol_281880
+sol_281940
+sol_282540
+sol_282600
+sol_282660
+sol_282720
+sol_282780
+sol_282840
+sol_282900
+sol_282960
+sol_283020
+sol_283080
+sol_283140
+sol_283200
+sol_283260
+sol_283320
+sol_283380
+sol_283980
+sol_284040
+sol_284100
+sol_284160
+sol_284220
+sol_284280
+sol_284340
+sol_284400
+sol_284460
+sol_284520
+sol_284580
+sol_284640
+sol_284700
+sol_284760
+sol_284820
+sol_285420
+sol_285480
+sol_285540
+sol_285600
+sol_285660
+sol_285720
+sol_285780
+sol_285840
+sol_285900
+sol_285960
+sol_286020
+sol_286080
+sol_286140
+sol_286200
+sol_286260
+sol_286860
+sol_286920
+sol_286980
+sol_287040
+sol_287100
+sol_287160
+sol_287220
+sol_287280
+sol_287340
+sol_287400
+sol_287460
+sol_287520
+sol_287580
+sol_287640
+sol_287700
+sol_288300
+sol_288360
+sol_288420
+sol_288480
+sol_288540
+sol_288600
+sol_288660
+sol_288720
+sol_288780
+sol_288840
+sol_288900
+sol_288960
+sol_289020
+sol_289080
+sol_289140
+sol_289740
+sol_289800
+sol_289860
+sol_289920
+sol_289980
+sol_290040
+sol_290100
+sol_290160
+sol_290220
+sol_290280
+sol_290340
+sol_290400
+sol_290460
+sol_290520
+sol_290580
+sol_291180
+sol_291240
+sol_291300
+sol_291360
+sol_291420
+sol_291480
+sol_291540
+sol_291600
+sol_291660
+sol_291720
+sol_291780
+sol_291840
+sol_291900
+sol_291960
+sol_292020
+sol_292620
+sol_292680
+sol_292740
+sol_292800
+sol_292860
+sol_292920
+sol_292980
+sol_293040
+sol_293100
+sol_293160
+sol_293220
+sol_293280
+sol_293340
+sol_293400
+sol_293460
+sol_294060
+sol_294120
+sol_294180
+sol_294240
+sol_294300
+sol_294360
+sol_294420
+sol_294480
+sol_294540
+sol_294600
+sol_294660
+sol_294720
+sol_294780
+sol_294840
+sol_294900
+sol_295500
+sol_295560
+sol_295620
+sol_295680
+sol_295740
+sol_295800
+sol_295860
+sol_295920
+sol_295980
+sol_296040
+sol_296100
+sol_296160
+sol_296220
+sol_296280
+sol_296340
+sol_296940
+sol_297000
+sol_297060
+sol_297120
+sol_297180
+sol_297240
+sol_297300
+sol_297360
+sol_297420
+sol_297480
+sol_297540
+sol_297600
+sol_297660
+sol_297720
+sol_297780
+sol_298380
+sol_298440
+sol_298500
+sol_298560
+sol_298620
+sol_298680
+sol_298740
+sol_298800
+sol_298860
+sol_298920
+sol_298980
+sol_299040
+sol_299100
+sol_299160
+sol_299220
+sol_299820
+sol_299880
+sol_299940
+sol_300000
+sol_300060
+sol_300120
+sol_300180
+sol_300240
+sol_300300
+sol_300360
+sol_300420
+sol_300480
+sol_300540
+sol_300600
+sol_300660
+sol_301260
+sol_301320
+sol_301380
+sol_301440
+sol_301500
+sol_301560
+sol_301620
+sol_301680
+sol_301740
+sol_301800
+sol_301860
+sol_301920
+sol_301980
+sol_302040
+sol_302100
+sol_302700
+sol_302760
+sol_302820
+sol_302880
+sol_302940
+sol_303000
+sol_303060
+sol_303120
+sol_303180
+sol_303240
+sol_303300
+sol_303360
+sol_303420
+sol_303480
+sol_303540
+sol_304140
+sol_304200
+sol_304260
+sol_304320
+sol_304380
+sol_304440
+sol_304500
+sol_304560
+sol_304620
+sol_304680
+sol_304740
+sol_304800
+sol_304860
+sol_304920
+sol_304980
+sol_305640
+sol_305700
+sol_305760
+sol_305820
+sol_305880
+sol_305940
+sol_306000
+sol_306060
+sol_306120
+sol_306180
+sol_306240
+sol_306300
+sol_306360
+sol_306420
+sol_307080
+sol_307140
+sol_307200
+sol_307260
+sol_307320
+sol_307380
+sol_307440
+sol_307500
+sol_307560
+sol_307620
+sol_307680
+sol_307740
+sol_307800
+sol_307860
+sol_308520
+sol_308580
+sol_308640
+sol_308700
+sol_308760
+sol_308820
+sol_308880
+sol_308940
+sol_309000
+sol_309060
+sol_309120
+sol_309180
+sol_309240
+sol_309300
+sol_309960
+sol_310020
+sol_310080
+sol_310140
+sol_310200
+sol_310260
+sol_310320
+sol_310380
+sol_310440
+sol_310500
+sol_310560
+sol_310620
+sol_310680
+sol_310740
+sol_311400
+sol_311460
+sol_311520
+sol_311580
+sol_311640
+sol_311700
+sol_311760
+sol_311820
+sol_311880
+sol_311940
+sol_312000
+sol_312060
+sol_312120
+sol_312180
+sol_312840
+sol_312900
+sol_312960
+sol_313020
+sol_313080
+sol_313140
+sol_313200
+sol_313260
+sol_313320
+sol_313380
+sol_313440
+sol_313500
+sol_313560
+sol_313620
+sol_314280
+sol_314340
+sol_314400
+sol_314460
+sol_314520
+sol_314580
+sol_314640
+sol_314700
+sol_314760
+sol_314820
+sol_314880
+sol_314940
+sol_315000
+sol_315060
+sol_315720
+sol_315780
+sol_315840
+sol_315900
+sol_315960
+sol_316020
+sol_316080
+sol_316140
+sol_316200
+sol_316260
+sol_316320
+sol_316380
+sol_316440
+sol_316500
+sol_317160
+sol_317220
+sol_317280
+sol_317340
+sol_317400
+sol_317460
+sol_317520
+sol_317580
+sol_317640
+sol_317700
+sol_317760
+sol_317820
+sol_317880
+sol_317940
+sol_318600
+sol_318660
+sol_318720
+sol_318780
+sol_318840
+sol_318900
+sol_318960
+sol_319020
+sol_319080
+sol_319140
+sol_319200
+sol_319260
+sol_319320
+sol_319380
+sol_320040
+sol_320100
+sol_320160
+sol_320220
+sol_320280
+sol_320340
+sol_320400
+sol_320460
+sol_320520
+sol_320580
+sol_320640
+sol_320700
+sol_320760
+sol_321480
+sol_321540
+sol_321600
+sol_321660
+sol_321720
+sol_321780
+sol_321840
+sol_321900
+sol_321960
+sol_322020
+sol_322080
+sol_322140
+sol_322200
+sol_322920
+sol_322980
+sol_323040
+sol_323100
+sol_323160
+sol_323220
+sol_323280
+sol_323340
+sol_323400
+sol_323460
+sol_323520
+sol_323580
+sol_323640
+sol_324360
+sol_324420
+sol_324480
+sol_324540
+sol_324600
+sol_324660
+sol_324720
+sol_324780
+sol_324840
+sol_324900
+sol_324960
+sol_325020
+sol_325080
+sol_325800
+sol_325860
+sol_325920
+sol_325980
+sol_326040
+sol_326100
+sol_326160
+sol_326220
+sol_326280
+sol_326340
+sol_326400
+sol_326460
+sol_326520
+sol_327240
+sol_327300
+sol_327360
+sol_327420
+sol_327480
+sol_327540
+sol_327600
+sol_327660
+sol_327720
+sol_327780
+sol_327840
+sol_327900
+sol_327960
+sol_328680
+sol_328740
+sol_328800
+sol_328860
+sol_328920
+sol_328980
+sol_329040
+sol_329100
+sol_329160
+sol_329220
+sol_329280
+sol_329340
+sol_329400
+sol_330120
+sol_330180
+sol_330240
+sol_330300
+sol_330360
+sol_330420
+sol_330480
+sol_330540
+sol_330600
+sol_330660
+sol_330720
+sol_330780
+sol_330840
+sol_331560
+sol_331620
+sol_331680
+sol_331740
+sol_331800
+sol_331860
+sol_331920
+sol_331980
+sol_332040
+sol_332100
+sol_332160
+sol_332220
+sol_332280
+sol_333000
+sol_333060
+sol_333120
+sol_333180
+sol_333240
+sol_333300
+sol_333360
+sol_333420
+sol_333480
+sol_333540
+sol_333600
+sol_333660
+sol_333720
+sol_334440
+sol_334500
+sol_334560
+sol_334620
+sol_334680
+sol_334740
+sol_334800
+sol_334860
+sol_334920
+sol_334980
+sol_335040
+sol_335100
+sol_335160
+sol_335880
+sol_335940
+sol_336000
+sol_336060
+sol_336120
+sol_336180
+sol_336240
+sol_336300
+sol_336360
+sol_336420
+sol_336480
+sol_336540
+sol_336600
+sol_337320
+sol_337380
+sol_337440
+sol_337500
+sol_337560
+sol_337620
+sol_337680
+sol_337740
+sol_337800
+sol_337860
+sol_337920
+sol_337980
+sol_338040
+sol_338760
+sol_338820
+sol_338880
+sol_338940
+sol_339000
+sol_339060
+sol_339120
+sol_339180
+sol_339240
+sol_339300
+sol_339360
+sol_339420
+sol_339480
+sol_340200
+sol_340260
+sol_340320
+sol_340380
+sol_340440
+sol_340500
+sol_340560
+sol_340620
+sol_340680
+sol_340740
+sol_340800
+sol_340860
+sol_340920
+sol_341640
+sol_341700
+sol_341760
+sol_341820
+sol_341880
+sol_341940
+sol_342000
+sol_342060
+sol_342120
+sol_342180
+sol_342240
+sol_342300
+sol_342360
+sol_343080
+sol_343140
+sol_343200
+sol_343260
+sol_343320
+sol_343380
+sol_343440
+sol_343500
+sol_343560
+sol_343620
+sol_343680
+sol_343740
+sol_343800
+sol_344520
+sol_344580
+sol_344640
+sol_344700
+sol_344760
+sol_344820
+sol_344880
+sol_344940
+sol_345000
+sol_345060
+sol_345120
+sol_345180
+sol_345240
+sol_345960
+sol_346020
+sol_346080
+sol_346140
+sol_346200
+sol_346260
+sol_346320
+sol_346380
+sol_346440
+sol_346500
+sol_346560
+sol_346620
+sol_346680
+sol_347400
+sol_347460
+sol_347520
+sol_347580
+sol_347640
+sol_347700
+sol_347760
+sol_347820
+sol_347880
+sol_347940
+sol_348000
+sol_348060
+sol_348120
+sol_348840
+sol_348900
+sol_348960
+sol_349020
+sol_349080
+sol_349140
+sol_349200
+sol_349260
+sol_349320
+sol_349380
+sol_349440
+sol_349500
+sol_349560
+sol_350280
+sol_350340
+sol_350400
+sol_350460
+sol_350520
+sol_350580
+sol_350640
+sol_350700
+sol_350760
+sol_350820
+sol_350880
+sol_350940
+sol_351000
+sol_351720
+sol_351780
+sol_351840
+sol_351900
+sol_351960
+sol_352020
+sol_352080
+sol_352140
+sol_352200
+sol_352260
+sol_352320
+sol_352380
+sol_352440
+sol_353160
+sol_353220
+sol_353280
+sol_353340
+sol_353400
+sol_353460
+sol_353520
+sol_353580
+sol_353640
+sol_353700
+sol_353760
+sol_353820
+sol_353880
+sol_354600
+sol_354660
+sol_354720
+sol_354780
+sol_354840
+sol_354900
+sol_354960
+sol_355020
+sol_355080
+sol_355140
+sol_355200
+sol_355260
+sol_355320
+sol_356040
+sol_356100
+sol_356160
+sol_356220
+sol_356280
+sol_356340
+sol_356400
+sol_356460
+sol_356520
+sol_356580
+sol_356640
+sol_356700
+sol_356760
+sol_357480
+sol_357540
+sol_357600
+sol_357660
+sol_357720
+sol_357780
+sol_357840
+sol_357900
+sol_357960
+sol_358020
+sol_358080
+sol_358140
+sol_358200
+sol_358920
+sol_358980
+sol_359040
+sol_359100
+sol_359160
+sol_359220
+sol_359280
+sol_359340
+sol_359400
+sol_359460
+sol_359520
+sol_359580
+sol_359640
+sol_360360
+sol_360420
+sol_360480
+sol_360540
+sol_360600
+sol_360660
+sol_360720
+sol_360780
+sol_360840
+sol_360900
+sol_360960
+sol_361020
+sol_361080
+sol_361800
+sol_361860
+sol_361920
+sol_361980
+sol_362040
+sol_362100
+sol_362160
+sol_362220
+sol_362280
+sol_362340
+sol_362400
+sol_362460
+sol_362520
+sol_363240
+sol_363300
+sol_363360
+sol_363420
+sol_363480
+sol_363540
+sol_363600
+sol_363660
+sol_363720
+sol_363780
+sol_363840
+sol_363900
+sol_363960
+sol_364680
+sol_364740
+sol_364800
+sol_364860
+sol_364920
+sol_364980
+sol_365040
+sol_365100
+sol_365160
+sol_365220
+sol_365280
+sol_365340
+sol_365400
+sol_366120
+sol_366180
+sol_366240
+sol_366300
+sol_366360
+sol_366420
+sol_366480
+sol_366540
+sol_366600
+sol_366660
+sol_366720
+sol_366780
+sol_366840
+sol_367560
+sol_367620
+sol_367680
+sol_367740
+sol_367800
+sol_367860
+sol_367920
+sol_367980
+sol_368040
+sol_368100
+sol_368160
+sol_368220
+sol_368280
+sol_369000
+sol_369060
+sol_369120
+sol_369180
+sol_369240
+sol_369300
+sol_369360
+sol_369420
+sol_369480
+sol_369540
+sol_369600
+sol_369660
+sol_369720
+sol_370440
+sol_370500
+sol_370560
+sol_370620
+sol_370680
+sol_370740
+sol_370800
+sol_370860
+sol_370920
+sol_370980
+sol_371040
+sol_371100
+sol_371160
+sol_371880
+sol_371940
+sol_372000
+sol_372060
+sol_372120
+sol_372180
+sol_372240
+sol_372300
+sol_372360
+sol_372420
+sol_372480
+sol_372540
+sol_372600
+sol_373320
+sol_373380
+sol_373440
+sol_373500
+sol_373560
+sol_373620
+sol_373680
+sol_373740
+sol_373800
+sol_373860
+sol_373920
+sol_373980
+sol_374040
+sol_374760
+sol_374820
+sol_374880
+sol_374940
+sol_375000
+sol_375060
+sol_375120
+sol_375180
+sol_375240
+sol_375300
+sol_375360
+sol_375420
+sol_375480
+sol_376200
+sol_376260
+sol_376320
+sol_376380
+sol_376440
+sol_376500
+sol_376560
+sol_376620
+sol_376680
+sol_376740
+sol_376800
+sol_376860
+sol_377640
+sol_377700
+sol_377760
+sol_377820
+sol_377880
+sol_377940
+sol_378000
+sol_378060
+sol_378120
+sol_378180
+sol_378240
+sol_378300
+sol_379080
+sol_379140
+sol_379200
+sol_379260
+sol_379320
+sol_379380
+sol_379440
+sol_379500
+sol_379560
+sol_379620
+sol_379680
+sol_379740
+sol_380520
+sol_380580
+sol_380640
+sol_380700
+sol_380760
+sol_380820
+sol_380880
+sol_380940
+sol_381000
+sol_381060
+sol_381120
+sol_381180
+sol_381960
+sol_382020
+sol_382080
+sol_382140
+sol_382200
+sol_382260
+sol_382320
+sol_382380
+sol_382440
+sol_382500
+sol_382560
+sol_382620
+sol_383400
+sol_383460
+sol_383520
+sol_383580
+sol_383640
+sol_383700
+sol_383760
+sol_383820
+sol_383880
+sol_383940
+sol_384000
+sol_384060
+sol_384840
+sol_384900
+sol_384960
+sol_385020
+sol_385080
+sol_385140
+sol_385200
+sol_385260
+sol_385320
+sol_385380
+sol_385440
+sol_385500
+sol_386280
+sol_386340
+sol_386400
+sol_386460
+sol_386520
+sol_386580
+sol_386640
+sol_386700
+sol_386760
+sol_386820
+sol_386880
+sol_386940
+sol_387720
+sol_387780
+sol_387840
+sol_387900
+sol_387960
+sol_388020
+sol_388080
+sol_388140
+sol_388200
+sol_388260
+sol_388320
+sol_388380
+sol_389160
+sol_389220
+sol_389280
+sol_389340
+sol_389400
+sol_389460
+sol_389520
+sol_389580
+sol_389640
+sol_389700
+sol_389760
+sol_389820
+sol_390600
+sol_390660
+sol_390720
+sol_390780
+sol_390840
+sol_390900
+sol_390960
+sol_391020
+sol_391080
+sol_391140
+sol_391200
+sol_391260
+sol_392040
+sol_392100
+sol_392160
+sol_392220
+sol_392280
+sol_392340
+sol_392400
+sol_392460
+sol_392520
+sol_392580
+sol_392640
+sol_392700
+sol_393480
+sol_393540
+sol_393600
+sol_393660
+sol_393720
+sol_393780
+sol_393840
+sol_393900
+sol_393960
+sol_394020
+sol_394080
+sol_394140
+sol_394920
+sol_394980
+sol_395040
+sol_395100
+sol_395160
+sol_395220
+sol_395280
+sol_395340
+sol_395400
+sol_395460
+sol_395520
+sol_395580
+sol_396360
+sol_396420
+sol_396480
+sol_396540
+sol_396600
+sol_396660
+sol_396720
+sol_396780
+sol_396840
+sol_396900
+sol_396960
+sol_397020
+sol_397860
+sol_397920
+sol_397980
+sol_398040
+sol_398100
+sol_398160
+sol_398220
+sol_398280
+sol_398340
+sol_398400
+sol_398460
+sol_399300
+sol_399360
+sol_399420
+sol_399480
+sol_399540
+sol_399600
+sol_399660
+sol_399720
+sol_399780
+sol_399840
+sol_399900
+sol_400740
+sol_400800
+sol_400860
+sol_400920
+sol_400980
+sol_401040
+sol_401100
+sol_401160
+sol_401220
+sol_401280
+sol_401340
+sol_402180
+sol_402240
+sol_402300
+sol_402360
+sol_402420
+sol_402480
+sol_402540
+sol_402600
+sol_402660
+sol_402720
+sol_402780
+sol_403620
+sol_403680
+sol_403740
+sol_403800
+sol_403860
+sol_403920
+sol_403980
+sol_404040
+sol_404100
+sol_404160
+sol_404220
+sol_405060
+sol_405120
+sol_405180
+sol_405240
+sol_405300
+sol_405360
+sol_405420
+sol_405480
+sol_405540
+sol_405600
+sol_405660
+sol_406500
+sol_406560
+sol_406620
+sol_406680
+sol_406740
+sol_406800
+sol_406860
+sol_406920
+sol_406980
+sol_407040
+sol_407100
+sol_407940
+sol_408000
+sol_408060
+sol_408120
+sol_408180
+sol_408240
+sol_408300
+sol_408360
+sol_408420
+sol_408480
+sol_408540
+sol_409380
+sol_409440
+sol_409500
+sol_409560
+sol_409620
+sol_409680
+sol_409740
+sol_409800
+sol_409860
+sol_409920
+sol_409980
+sol_410820
+sol_410880
+sol_410940
+sol_411000
+sol_411060
+sol_411120
+sol_411180
+sol_411240
+sol_411300
+sol_411360
+sol_411420
+sol_412260
+sol_412320
+sol_412380
+sol_412440
+sol_412500
+sol_412560
+sol_412620
+sol_412680
+sol_412740
+sol_412800
+sol_412860
+sol_413700
+sol_413760
+sol_413820
+sol_413880
+sol_413940
+sol_414000
+sol_414060
+sol_414120
+sol_414180
+sol_414240
+sol_414300
+sol_415140
+sol_415200
+sol_415260
+sol_415320
+sol_415380
+sol_415440
+sol_415500
+sol_415560
+sol_415620
+sol_415680
+sol_415740
+sol_416580
+sol_416640
+sol_416700
+sol_416760
+sol_416820
+sol_416880
+sol_416940
+sol_417000
+sol_417060
+sol_417120
+sol_417180
+sol_418020
+sol_418080
+sol_418140
+sol_418200
+sol_418260
+sol_418320
+sol_418380
+sol_418440
+sol_418500
+sol_418560
+sol_418620
+sol_419460
+sol_419520
+sol_419580
+sol_419640
+sol_419700
+sol_419760
+sol_419820
+sol_419880
+sol_419940
+sol_420000
+sol_420060
+sol_420900
+sol_420960
+sol_421020
+sol_421080
+sol_421140
+sol_421200
+sol_421260
+sol_421320
+sol_421380
+sol_421440
+sol_421500
+sol_422340
+sol_422400
+sol_422460
+sol_422520
+sol_422580
+sol_422640
+sol_422700
+sol_422760
+sol_422820
+sol_422880
+sol_422940
+sol_423780
+sol_423840
+sol_423900
+sol_423960
+sol_424020
+sol_424080
+sol_424140
+sol_424200
+sol_424260
+sol_424320
+sol_424380
+sol_425220
+sol_425280
+sol_425340
+sol_425400
+sol_425460
+sol_425520
+sol_425580
+sol_425640
+sol_425700
+sol_425760
+sol_425820
+sol_426660
+sol_426720
+sol_426780
+sol_426840
+sol_426900
+sol_426960
+sol_427020
+sol_427080
+sol_427140
+sol_427200
+sol_427260
+sol_428100
+sol_428160
+sol_428220
+sol_428280
+sol_428340
+sol_428400
+sol_428460
+sol_428520
+sol_428580
+sol_428640
+sol_428700
+sol_429540
+sol_429600
+sol_429660
+sol_429720
+sol_429780
+sol_429840
+sol_429900
+sol_429960
+sol_430020
+sol_430080
+sol_430140
+sol_430980
+sol_431040
+sol_431100
+sol_431160
+sol_431220
+sol_431280
+sol_431340
+sol_431400
+sol_431460
+sol_431520
+sol_431580
+sol_432420
+sol_432480
+sol_432540
+sol_432600
+sol_432660
+sol_432720
+sol_432780
+sol_432840
+sol_432900
+sol_432960
+sol_433020
+sol_433860
+sol_433920
+sol_433980
+sol_434040
+sol_434100
+sol_434160
+sol_434220
+sol_434280
+sol_434340
+sol_434400
+sol_435300
+sol_435360
+sol_435420
+sol_435480
+sol_435540
+sol_435600
+sol_435660
+sol_435720
+sol_435780
+sol_435840
+sol_436740
+sol_436800
+sol_436860
+sol_436920
+sol_436980
+sol_437040
+sol_437100
+sol_437160
+sol_437220
+sol_437280
+sol_438180
+sol_438240
+sol_438300
+sol_438360
+sol_438420
+sol_438480
+sol_438540
+sol_438600
+sol_438660
+sol_438720
+sol_439620
+sol_439680
+sol_439740
+sol_439800
+sol_439860
+sol_439920
+sol_439980
+sol_440040
+sol_440100
+sol_440160
+sol_441060
+sol_441120
+sol_441180
+sol_441240
+sol_441300
+sol_441360
+sol_441420
+sol_441480
+sol_441540
+sol_441600
+sol_442500
+sol_442560
+sol_442620
+sol_442680
+sol_442740
+sol_442800
+sol_442860
+sol_442920
+sol_442980
+sol_443040
+sol_443940
+sol_444000
+sol_444060
+sol_444120
+sol_444180
+sol_444240
+sol_444300
+sol_444360
+sol_444420
+sol_444480
+sol_445380
+sol_445440
+sol_445500
+sol_445560
+sol_445620
+sol_445680
+sol_445740
+sol_445800
+sol_445860
+sol_445920
+sol_446820
+sol_446880
+sol_446940
+sol_447000
+sol_447060
+sol_447120
+sol_447180
+sol_447240
+sol_447300
+sol_447360
+sol_448260
+sol_448320
+sol_448380
+sol_448440
+sol_448500
+sol_448560
+sol_448620
+sol_448680
+sol_448740
+sol_448800
+sol_449700
+sol_449760
+sol_449820
+sol_449880
+sol_449940
+sol_450000
+sol_450060
+sol_450120
+sol_450180
+sol_450240
+sol_451140
+sol_451200
+sol_451260
+sol_451320
+sol_451380
+sol_451440
+sol_451500
+sol_451560
+sol_451620
+sol_451680
+sol_452580
+sol_452640
+sol_452700
+sol_452760
+sol_452820
+sol_452880
+sol_452940
+sol_453000
+sol_453060
+sol_453120
+sol_454020
+sol_454080
+sol_454140
+sol_454200
+sol_454260
+sol_454320
+sol_454380
+sol_454440
+sol_454500
+sol_454560
+sol_455460
+sol_455520
+sol_455580
+sol_455640
+sol_455700
+sol_455760
+sol_455820
+sol_455880
+sol_455940
+sol_456000
+sol_456900
+sol_456960
+sol_457020
+sol_457080
+sol_457140
+sol_457200
+sol_457260
+sol_457320
+sol_457380
+sol_457440
+sol_458340
+sol_458400
+sol_458460
+sol_458520
+sol_458580
+sol_458640
+sol_458700
+sol_458760
+sol_458820
+sol_458880
+sol_459780
+sol_459840
+sol_459900
+sol_459960
+sol_460020
+sol_460080
+sol_460140
+sol_460200
+sol_460260
+sol_460320
+sol_461220
+sol_461280
+sol_461340
+sol_461400
+sol_461460
+sol_461520
+sol_461580
+sol_461640
+sol_461700
+sol_461760
+sol_462660
+sol_462720
+sol_462780
+sol_462840
+sol_462900
+sol_462960
+sol_463020
+sol_463080
+sol_463140
+sol_463200
+sol_464100
+sol_464160
+sol_464220
+sol_464280
+sol_464340
+sol_464400
+sol_464460
+sol_464520
+sol_464580
+sol_464640
+sol_465540
+sol_465600
+sol_465660
+sol_465720
+sol_465780
+sol_465840
+sol_465900
+sol_465960
+sol_466020
+sol_466080
+sol_466980
+sol_467040
+sol_467100
+sol_467160
+sol_467220
+sol_467280
+sol_467340
+sol_467400
+sol_467460
+sol_467520
+sol_468420
+sol_468480
+sol_468540
+sol_468600
+sol_468660
+sol_468720
+sol_468780
+sol_468840
+sol_468900
+sol_468960
+sol_469860
+sol_469920
+sol_469980
+sol_470040
+sol_470100
+sol_470160
+sol_470220
+sol_470280
+sol_470340
+sol_470400
+sol_471300
+sol_471360
+sol_471420
+sol_471480
+sol_471540
+sol_471600
+sol_471660
+sol_471720
+sol_471780
+sol_471840
+sol_472740
+sol_472800
+sol_472860
+sol_472920
+sol_472980
+sol_473040
+sol_473100
+sol_473160
+sol_473220
+sol_473280
+sol_474180
+sol_474240
+sol_474300
+sol_474360
+sol_474420
+sol_474480
+sol_474540
+sol_474600
+sol_474660
+sol_474720
+sol_475620
+sol_475680
+sol_475740
+sol_475800
+sol_475860
+sol_475920
+sol_475980
+sol_476040
+sol_476100
+sol_476160
+sol_477120
+sol_477180
+sol_477240
+sol_477300
+sol_477360
+sol_477420
+sol_477480
+sol_477540
+sol_477600
+sol_478560
+sol_478620
+sol_478680
+sol_478740
+sol_478800
+sol_478860
+sol_478920
+sol_478980
+sol_479040
+sol_480000
+sol_480060
+sol_480120
+sol_480180
+sol_480240
+sol_480300
+sol_480360
+sol_480420
+sol_480480
+sol_481440
+sol_481500
+sol_481560
+sol_481620
+sol_481680
+sol_481740
+sol_481800
+sol_481860
+sol_481920
+sol_482880
+sol_482940
+sol_483000
+sol_483060
+sol_483120
+sol_483180
+sol_483240
+sol_483300
+sol_483360
+sol_484320
+sol_484380
+sol_484440
+sol_484500
+sol_484560
+sol_484620
+sol_484680
+sol_484740
+sol_484800
+sol_485760
+sol_485820
+sol_485880
+sol_485940
+sol_486000
+sol_486060
+sol_486120
+sol_486180
+sol_486240
+sol_487200
+sol_487260
+sol_487320
+sol_487380
+sol_487440
+sol_487500
+sol_487560
+sol_487620
+sol_487680
+sol_488640
+sol_488700
+sol_488760
+sol_488820
+sol_488880
+sol_488940
+sol_489000
+sol_489060
+sol_489120
+sol_490080
+sol_490140
+sol_490200
+sol_490260
+sol_490320
+sol_490380
+sol_490440
+sol_490500
+sol_490560
+sol_491520
+sol_491580
+sol_491640
+sol_491700
+sol_491760
+sol_491820
+sol_491880
+sol_491940
+sol_492000
+sol_492960
+sol_493020
+sol_493080
+sol_493140
+sol_493200
+sol_493260
+sol_493320
+sol_493380
+sol_493440
+sol_494400
+sol_494460
+sol_494520
+sol_494580
+sol_494640
+sol_494700
+sol_494760
+sol_494820
+sol_494880
+sol_495840
+sol_495900
+sol_495960
+sol_496020
+sol_496080
+sol_496140
+sol_496200
+sol_496260
+sol_496320
+sol_497280
+sol_497340
+sol_497400
+sol_497460
+sol_497520
+sol_497580
+sol_497640
+sol_497700
+sol_497760
+sol_498720
+sol_498780
+sol_498840
+sol_498900
+sol_498960
+sol_499020
+sol_499080
+sol_499140
+sol_499200
+sol_500160
+sol_500220
+sol_500280
+sol_500340
+sol_500400
+sol_500460
+sol_500520
+sol_500580
+sol_500640
+sol_501600
+sol_501660
+sol_501720
+sol_501780
+sol_501840
+sol_501900
+sol_501960
+sol_502020
+sol_502080
+sol_503040
+sol_503100
+sol_503160
+sol_503220
+sol_503280
+sol_503340
+sol_503400
+sol_503460
+sol_503520
+sol_504480
+sol_504540
+sol_504600
+sol_504660
+sol_504720
+sol_504780
+sol_504840
+sol_504900
+sol_504960
+sol_505920
+sol_505980
+sol_506040
+sol_506100
+sol_506160
+sol_506220
+sol_506280
+sol_506340
+sol_506400
+sol_507360
+sol_507420
+sol_507480
+sol_507540
+sol_507600
+sol_507660
+sol_507720
+sol_507780
+sol_507840
+sol_508800
+sol_508860
+sol_508920
+sol_508980
+sol_509040
+sol_509100
+sol_509160
+sol_509220
+sol_509280
+sol_510240
+sol_510300
+sol_510360
+sol_510420
+sol_510480
+sol_510540
+sol_510600
+sol_510660
+sol_510720
+sol_511680
+sol_511740
+sol_511800
+sol_511860
+sol_511920
+sol_511980
+sol_512040
+sol_512100
+sol_512160
+sol_513120
+sol_513180
+sol_513240
+sol_513300
+sol_513360
+sol_513420
+sol_513480
+sol_513540
+sol_513600
+sol_514560
+sol_514620
+sol_514680
+sol_514740
+sol_514800
+sol_514860
+sol_514920
+sol_514980
+sol_515040
+sol_516000
+sol_516060
+sol_516120
+sol_516180
+sol_516240
+sol_516300
+sol_516360
+sol_516420
+sol_516480
+sol_517440
+sol_517500
+sol_517560
+sol_517620
+sol_517680
+sol_517740
+sol_517800
+sol_517860
+sol_517920
+sol_518880
+sol_518940
+sol_519000
+sol_519060
+sol_519120
+sol_519180
+sol_519240
+sol_519300
+sol_519360
+sol_520320
+sol_520380
+sol_520440
+sol_520500
+sol_520560
+sol_520620
+sol_520680
+sol_520740
+sol_520800
+sol_521760
+sol_521820
+sol_521880
+sol_521940
+sol_522000
+sol_522060
+sol_522120
+sol_522180
+sol_522240
+sol_523200
+sol_523260
+sol_523320
+sol_523380
+sol_523440
+sol_523500
+sol_523560
+sol_523620
+sol_523680
+sol_524640
+sol_524700
+sol_524760
+sol_524820
+sol_524880
+sol_524940
+sol_525000
+sol_525060
+sol_525120
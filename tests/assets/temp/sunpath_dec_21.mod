@@ -0,0 +1,9 @@
+sol_510240
+sol_510300
+sol_510360
+sol_510420
+sol_510480
+sol_510540
+sol_510600
+sol_510660
+sol_510720
@@ -0,0 +1,37 @@
+sol_510210
+sol_510225
+sol_510240
+sol_510255
+sol_510270
+sol_510285
+sol_510300
+sol_510315
+sol_510330
+sol_510345
+sol_510360
+sol_510375
+sol_510390
+sol_510405
+sol_510420
+sol_510435
+sol_510450
+sol_510465
+sol_510480
+sol_510495
+sol_510510
+sol_510525
+sol_510540
+sol_510555
+sol_510570
+sol_510585
+sol_510600
+sol_510615
+sol_510630
+sol_510645
+sol_510660
+sol_510675
+sol_510690
+sol_510705
+sol_510720
+sol_510735
+sol_510750
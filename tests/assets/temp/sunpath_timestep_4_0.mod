@@ -0,0 +1,8864 @@
+sol_000450
+sol_000465
+sol_000480
+sol_000495
+sol_000510
+sol_000525
+sol_000540
+sol_000555
+sol_000570
+sol_000585
+sol_000600
+sol_000615
+sol_000630
+sol_000645
+sol_000660
+sol_000675
+sol_000690
+sol_000705
+sol_000720
+sol_000735
+sol_000750
+sol_000765
+sol_000780
+sol_000795
+sol_000810
+sol_000825
+sol_000840
+sol_000855
+sol_000870
+sol_000885
+sol_000900
+sol_000915
+sol_000930
+sol_000945
+sol_000960
+sol_000975
+sol_000990
+sol_001890
+sol_001905
+sol_001920
+sol_001935
+sol_001950
+sol_001965
+sol_001980
+sol_001995
+sol_002010
+sol_002025
+sol_002040
+sol_002055
+sol_002070
+sol_002085
+sol_002100
+sol_002115
+sol_002130
+sol_002145
+sol_002160
+sol_002175
+sol_002190
+sol_002205
+sol_002220
+sol_002235
+sol_002250
+sol_002265
+sol_002280
+sol_002295
+sol_002310
+sol_002325
+sol_002340
+sol_002355
+sol_002370
+sol_002385
+sol_002400
+sol_002415
+sol_002430
+sol_002445
+sol_003330
+sol_003345
+sol_003360
+sol_003375
+sol_003390
+sol_003405
+sol_003420
+sol_003435
+sol_003450
+sol_003465
+sol_003480
+sol_003495
+sol_003510
+sol_003525
+sol_003540
+sol_003555
+sol_003570
+sol_003585
+sol_003600
+sol_003615
+sol_003630
+sol_003645
+sol_003660
+sol_003675
+sol_003690
+sol_003705
+sol_003720
+sol_003735
+sol_003750
+sol_003765
+sol_003780
+sol_003795
+sol_003810
+sol_003825
+sol_003840
+sol_003855
+sol_003870
+sol_003885
+sol_004770
+sol_004785
+sol_004800
+sol_004815
+sol_004830
+sol_004845
+sol_004860
+sol_004875
+sol_004890
+sol_004905
+sol_004920
+sol_004935
+sol_004950
+sol_004965
+sol_004980
+sol_004995
+sol_005010
+sol_005025
+sol_005040
+sol_005055
+sol_005070
+sol_005085
+sol_005100
+sol_005115
+sol_005130
+sol_005145
+sol_005160
+sol_005175
+sol_005190
+sol_005205
+sol_005220
+sol_005235
+sol_005250
+sol_005265
+sol_005280
+sol_005295
+sol_005310
+sol_005325
+sol_006210
+sol_006225
+sol_006240
+sol_006255
+sol_006270
+sol_006285
+sol_006300
+sol_006315
+sol_006330
+sol_006345
+sol_006360
+sol_006375
+sol_006390
+sol_006405
+sol_006420
+sol_006435
+sol_006450
+sol_006465
+sol_006480
+sol_006495
+sol_006510
+sol_006525
+sol_006540
+sol_006555
+sol_006570
+sol_006585
+sol_006600
+sol_006615
+sol_006630
+sol_006645
+sol_006660
+sol_006675
+sol_006690
+sol_006705
+sol_006720
+sol_006735
+sol_006750
+sol_006765
+sol_007650
+sol_007665
+sol_007680
+sol_007695
+sol_007710
+sol_007725
+sol_007740
+sol_007755
+sol_007770
+sol_007785
+sol_007800
+sol_007815
+sol_007830
+sol_007845
+sol_007860
+sol_007875
+sol_007890
+sol_007905
+sol_007920
+sol_007935
+sol_007950
+sol_007965
+sol_007980
+sol_007995
+sol_008010
+sol_008025
+sol_008040
+sol_008055
+sol_008070
+sol_008085
+sol_008100
+sol_008115
+sol_008130
+sol_008145
+sol_008160
+sol_008175
+sol_008190
+sol_008205
+sol_009090
+sol_009105
+sol_009120
+sol_009135
+sol_009150
+sol_009165
+sol_009180
+sol_009195
+sol_009210
+sol_009225
+sol_009240
+sol_009255
+sol_009270
+sol_009285
+sol_009300
+sol_009315
+sol_009330
+sol_009345
+sol_009360
+sol_009375
+sol_009390
+sol_009405
+sol_009420
+sol_009435
+sol_009450
+sol_009465
+sol_009480
+sol_009495
+sol_009510
+sol_009525
+sol_009540
+sol_009555
+sol_009570
+sol_009585
+sol_009600
+sol_009615
+sol_009630
+sol_009645
+sol_010530
+sol_010545
+sol_010560
+sol_010575
+sol_010590
+sol_010605
+sol_010620
+sol_010635
+sol_010650
+sol_010665
+sol_010680
+sol_010695
+sol_010710
+sol_010725
+sol_010740
+sol_010755
+sol_010770
+sol_010785
+sol_010800
+sol_010815
+sol_010830
+sol_010845
+sol_010860
+sol_010875
+sol_010890
+sol_010905
+sol_010920
+sol_010935
+sol_010950
+sol_010965
+sol_010980
+sol_010995
+sol_011010
+sol_011025
+sol_011040
+sol_011055
+sol_011070
+sol_011085
+sol_011970
+sol_011985
+sol_012000
+sol_012015
+sol_012030
+sol_012045
+sol_012060
+sol_012075
+sol_012090
+sol_012105
+sol_012120
+sol_012135
+sol_012150
+sol_012165
+sol_012180
+sol_012195
+sol_012210
+sol_012225
+sol_012240
+sol_012255
+sol_012270
+sol_012285
+sol_012300
+sol_012315
+sol_012330
+sol_012345
+sol_012360
+sol_012375
+sol_012390
+sol_012405
+sol_012420
+sol_012435
+sol_012450
+sol_012465
+sol_012480
+sol_012495
+sol_012510
+sol_012525
+sol_013410
+sol_013425
+sol_013440
+sol_013455
+sol_013470
+sol_013485
+sol_013500
+sol_013515
+sol_013530
+sol_013545
+sol_013560
+sol_013575
+sol_013590
+sol_013605
+sol_013620
+sol_013635
+sol_013650
+sol_013665
+sol_013680
+sol_013695
+sol_013710
+sol_013725
+sol_013740
+sol_013755
+sol_013770
+sol_013785
+sol_013800
+sol_013815
+sol_013830
+sol_013845
+sol_013860
+sol_013875
+sol_013890
+sol_013905
+sol_013920
+sol_013935
+sol_013950
+sol_013965
+sol_014850
+sol_014865
+sol_014880
+sol_014895
+sol_014910
+sol_014925
+sol_014940
+sol_014955
+sol_014970
+sol_014985
+sol_015000
+sol_015015
+sol_015030
+sol_015045
+sol_015060
+sol_015075
+sol_015090
+sol_015105
+sol_015120
+sol_015135
+sol_015150
+sol_015165
+sol_015180
+sol_015195
+sol_015210
+sol_015225
+sol_015240
+sol_015255
+sol_015270
+sol_015285
+sol_015300
+sol_015315
+sol_015330
+sol_015345
+sol_015360
+sol_015375
+sol_015390
+sol_015405
+sol_016290
+sol_016305
+sol_016320
+sol_016335
+sol_016350
+sol_016365
+sol_016380
+sol_016395
+sol_016410
+sol_016425
+sol_016440
+sol_016455
+sol_016470
+sol_016485
+sol_016500
+sol_016515
+sol_016530
+sol_016545
+sol_016560
+sol_016575
+sol_016590
+sol_016605
+sol_016620
+sol_016635
+sol_016650
+sol_016665
+sol_016680
+sol_016695
+sol_016710
+sol_016725
+sol_016740
+sol_016755
+sol_016770
+sol_016785
+sol_016800
+sol_016815
+sol_016830
+sol_016845
+sol_017730
+sol_017745
+sol_017760
+sol_017775
+sol_017790
+sol_017805
+sol_017820
+sol_017835
+sol_017850
+sol_017865
+sol_017880
+sol_017895
+sol_017910
+sol_017925
+sol_017940
+sol_017955
+sol_017970
+sol_017985
+sol_018000
+sol_018015
+sol_018030
+sol_018045
+sol_018060
+sol_018075
+sol_018090
+sol_018105
+sol_018120
+sol_018135
+sol_018150
+sol_018165
+sol_018180
+sol_018195
+sol_018210
+sol_018225
+sol_018240
+sol_018255
+sol_018270
+sol_018285
+sol_019170
+sol_019185
+sol_019200
+sol_019215
+sol_019230
+sol_019245
+sol_019260
+sol_019275
+sol_019290
+sol_019305
+sol_019320
+sol_019335
+sol_019350
+sol_019365
+sol_019380
+sol_019395
+sol_019410
+sol_019425
+sol_019440
+sol_019455
+sol_019470
+sol_019485
+sol_019500
+sol_019515
+sol_019530
+sol_019545
+sol_019560
+sol_019575
+sol_019590
+sol_019605
+sol_019620
+sol_019635
+sol_019650
+sol_019665
+sol_019680
+sol_019695
+sol_019710
+sol_019725
+sol_020610
+sol_020625
+sol_020640
+sol_020655
+sol_020670
+sol_020685
+sol_020700
+sol_020715
+sol_020730
+sol_020745
+sol_020760
+sol_020775
+sol_020790
+sol_020805
+sol_020820
+sol_020835
+sol_020850
+sol_020865
+sol_020880
+sol_020895
+sol_020910
+sol_020925
+sol_020940
+sol_020955
+sol_020970
+sol_020985
+sol_021000
+sol_021015
+sol_021030
+sol_021045
+sol_021060
+sol_021075
+sol_021090
+sol_021105
+sol_021120
+sol_021135
+sol_021150
+sol_021165
+sol_022050
+sol_022065
+sol_022080
+sol_022095
+sol_022110
+sol_022125
+sol_022140
+sol_022155
+sol_022170
+sol_022185
+sol_022200
+sol_022215
+sol_022230
+sol_022245
+sol_022260
+sol_022275
+sol_022290
+sol_022305
+sol_022320
+sol_022335
+sol_022350
+sol_022365
+sol_022380
+sol_022395
+sol_022410
+sol_022425
+sol_022440
+sol_022455
+sol_022470
+sol_022485
+sol_022500
+sol_022515
+sol_022530
+sol_022545
+sol_022560
+sol_022575
+sol_022590
+sol_022605
+sol_023490
+sol_023505
+sol_023520
+sol_023535
+sol_023550
+sol_023565
+sol_023580
+sol_023595
+sol_023610
+sol_023625
+sol_023640
+sol_023655
+sol_023670
+sol_023685
+sol_023700
+sol_023715
+sol_023730
+sol_023745
+sol_023760
+sol_023775
+sol_023790
+sol_023805
+sol_023820
+sol_023835
+sol_023850
+sol_023865
+sol_023880
+sol_023895
+sol_023910
+sol_023925
+sol_023940
+sol_023955
+sol_023970
+sol_023985
+sol_024000
+sol_024015
+sol_024030
+sol_024045
+sol_024060
+sol_024930
+sol_024945
+sol_024960
+sol_024975
+sol_024990
+sol_025005
+sol_025020
+sol_025035
+sol_025050
+sol_025065
+sol_025080
+sol_025095
+sol_025110
+sol_025125
+sol_025140
+sol_025155
+sol_025170
+sol_025185
+sol_025200
+sol_025215
+sol_025230
+sol_025245
+sol_025260
+sol_025275
+sol_025290
+sol_025305
+sol_025320
+sol_025335
+sol_025350
+sol_025365
+sol_025380
+sol_025395
+sol_025410
+sol_025425
+sol_025440
+sol_025455
+sol_025470
+sol_025485
+sol_025500
+sol_026370
+sol_026385
+sol_026400
+sol_026415
+sol_026430
+sol_026445
+sol_026460
+sol_026475
+sol_026490
+sol_026505
+sol_026520
+sol_026535
+sol_026550
+sol_026565
+sol_026580
+sol_026595
+sol_026610
+sol_026625
+sol_026640
+sol_026655
+sol_026670
+sol_026685
+sol_026700
+sol_026715
+sol_026730
+sol_026745
+sol_026760
+sol_026775
+sol_026790
+sol_026805
+sol_026820
+sol_026835
+sol_026850
+sol_026865
+sol_026880
+sol_026895
+sol_026910
+sol_026925
+sol_026940
+sol_027810
+sol_027825
+sol_027840
+sol_027855
+sol_027870
+sol_027885
+sol_027900
+sol_027915
+sol_027930
+sol_027945
+sol_027960
+sol_027975
+sol_027990
+sol_028005
+sol_028020
+sol_028035
+sol_028050
+sol_028065
+sol_028080
+sol_028095
+sol_028110
+sol_028125
+sol_028140
+sol_028155
+sol_028170
+sol_028185
+sol_028200
+sol_028215
+sol_028230
+sol_028245
+sol_028260
+sol_028275
+sol_028290
+sol_028305
+sol_028320
+sol_028335
+sol_028350
+sol_028365
+sol_028380
+sol_029250
+sol_029265
+sol_029280
+sol_029295
+sol_029310
+sol_029325
+sol_029340
+sol_029355
+sol_029370
+sol_029385
+sol_029400
+sol_029415
+sol_029430
+sol_029445
+sol_029460
+sol_029475
+sol_029490
+sol_029505
+sol_029520
+sol_029535
+sol_029550
+sol_029565
+sol_029580
+sol_029595
+sol_029610
+sol_029625
+sol_029640
+sol_029655
+sol_029670
+sol_029685
+sol_029700
+sol_029715
+sol_029730
+sol_029745
+sol_029760
+sol_029775
+sol_029790
+sol_029805
+sol_029820
+sol_030690
+sol_030705
+sol_030720
+sol_030735
+sol_030750
+sol_030765
+sol_030780
+sol_030795
+sol_030810
+sol_030825
+sol_030840
+sol_030855
+sol_030870
+sol_030885
+sol_030900
+sol_030915
+sol_030930
+sol_030945
+sol_030960
+sol_030975
+sol_030990
+sol_031005
+sol_031020
+sol_031035
+sol_031050
+sol_031065
+sol_031080
+sol_031095
+sol_031110
+sol_031125
+sol_031140
+sol_031155
+sol_031170
+sol_031185
+sol_031200
+sol_031215
+sol_031230
+sol_031245
+sol_031260
+sol_032130
+sol_032145
+sol_032160
+sol_032175
+sol_032190
+sol_032205
+sol_032220
+sol_032235
+sol_032250
+sol_032265
+sol_032280
+sol_032295
+sol_032310
+sol_032325
+sol_032340
+sol_032355
+sol_032370
+sol_032385
+sol_032400
+sol_032415
+sol_032430
+sol_032445
+sol_032460
+sol_032475
+sol_032490
+sol_032505
+sol_032520
+sol_032535
+sol_032550
+sol_032565
+sol_032580
+sol_032595
+sol_032610
+sol_032625
+sol_032640
+sol_032655
+sol_032670
+sol_032685
+sol_032700
+sol_033570
+sol_033585
+sol_033600
+sol_033615
+sol_033630
+sol_033645
+sol_033660
+sol_033675
+sol_033690
+sol_033705
+sol_033720
+sol_033735
+sol_033750
+sol_033765
+sol_033780
+sol_033795
+sol_033810
+sol_033825
+sol_033840
+sol_033855
+sol_033870
+sol_033885
+sol_033900
+sol_033915
+sol_033930
+sol_033945
+sol_033960
+sol_033975
+sol_033990
+sol_034005
+sol_034020
+sol_034035
+sol_034050
+sol_034065
+sol_034080
+sol_034095
+sol_034110
+sol_034125
+sol_034140
+sol_034995
+sol_035010
+sol_035025
+sol_035040
+sol_035055
+sol_035070
+sol_035085
+sol_035100
+sol_035115
+sol_035130
+sol_035145
+sol_035160
+sol_035175
+sol_035190
+sol_035205
+sol_035220
+sol_035235
+sol_035250
+sol_035265
+sol_035280
+sol_035295
+sol_035310
+sol_035325
+sol_035340
+sol_035355
+sol_035370
+sol_035385
+sol_035400
+sol_035415
+sol_035430
+sol_035445
+sol_035460
+sol_035475
+sol_035490
+sol_035505
+sol_035520
+sol_035535
+sol_035550
+sol_035565
+sol_035580
+sol_036435
+sol_036450
+sol_036465
+sol_036480
+sol_036495
+sol_036510
+sol_036525
+sol_036540
+sol_036555
+sol_036570
+sol_036585
+sol_036600
+sol_036615
+sol_036630
+sol_036645
+sol_036660
+sol_036675
+sol_036690
+sol_036705
+sol_036720
+sol_036735
+sol_036750
+sol_036765
+sol_036780
+sol_036795
+sol_036810
+sol_036825
+sol_036840
+sol_036855
+sol_036870
+sol_036885
+sol_036900
+sol_036915
+sol_036930
+sol_036945
+sol_036960
+sol_036975
+sol_036990
+sol_037005
+sol_037020
+sol_037875
+sol_037890
+sol_037905
+sol_037920
+sol_037935
+sol_037950
+sol_037965
+sol_037980
+sol_037995
+sol_038010
+sol_038025
+sol_038040
+sol_038055
+sol_038070
+sol_038085
+sol_038100
+sol_038115
+sol_038130
+sol_038145
+sol_038160
+sol_038175
+sol_038190
+sol_038205
+sol_038220
+sol_038235
+sol_038250
+sol_038265
+sol_038280
+sol_038295
+sol_038310
+sol_038325
+sol_038340
+sol_038355
+sol_038370
+sol_038385
+sol_038400
+sol_038415
+sol_038430
+sol_038445
+sol_038460
+sol_039315
+sol_039330
+sol_039345
+sol_039360
+sol_039375
+sol_039390
+sol_039405
+sol_039420
+sol_039435
+sol_039450
+sol_039465
+sol_039480
+sol_039495
+sol_039510
+sol_039525
+sol_039540
+sol_039555
+sol_039570
+sol_039585
+sol_039600
+sol_039615
+sol_039630
+sol_039645
+sol_039660
+sol_039675
+sol_039690
+sol_039705
+sol_039720
+sol_039735
+sol_039750
+sol_039765
+sol_039780
+sol_039795
+sol_039810
+sol_039825
+sol_039840
+sol_039855
+sol_039870
+sol_039885
+sol_039900
+sol_040755
+sol_040770
+sol_040785
+sol_040800
+sol_040815
+sol_040830
+sol_040845
+sol_040860
+sol_040875
+sol_040890
+sol_040905
+sol_040920
+sol_040935
+sol_040950
+sol_040965
+sol_040980
+sol_040995
+sol_041010
+sol_041025
+sol_041040
+sol_041055
+sol_041070
+sol_041085
+sol_041100
+sol_041115
+sol_041130
+sol_041145
+sol_041160
+sol_041175
+sol_041190
+sol_041205
+sol_041220
+sol_041235
+sol_041250
+sol_041265
+sol_041280
+sol_041295
+sol_041310
+sol_041325
+sol_041340
+sol_042195
+sol_042210
+sol_042225
+sol_042240
+sol_042255
+sol_042270
+sol_042285
+sol_042300
+sol_042315
+sol_042330
+sol_042345
+sol_042360
+sol_042375
+sol_042390
+sol_042405
+sol_042420
+sol_042435
+sol_042450
+sol_042465
+sol_042480
+sol_042495
+sol_042510
+sol_042525
+sol_042540
+sol_042555
+sol_042570
+sol_042585
+sol_042600
+sol_042615
+sol_042630
+sol_042645
+sol_042660
+sol_042675
+sol_042690
+sol_042705
+sol_042720
+sol_042735
+sol_042750
+sol_042765
+sol_042780
+sol_042795
+sol_043635
+sol_043650
+sol_043665
+sol_043680
+sol_043695
+sol_043710
+sol_043725
+sol_043740
+sol_043755
+sol_043770
+sol_043785
+sol_043800
+sol_043815
+sol_043830
+sol_043845
+sol_043860
+sol_043875
+sol_043890
+sol_043905
+sol_043920
+sol_043935
+sol_043950
+sol_043965
+sol_043980
+sol_043995
+sol_044010
+sol_044025
+sol_044040
+sol_044055
+sol_044070
+sol_044085
+sol_044100
+sol_044115
+sol_044130
+sol_044145
+sol_044160
+sol_044175
+sol_044190
+sol_044205
+sol_044220
+sol_044235
+sol_045075
+sol_045090
+sol_045105
+sol_045120
+sol_045135
+sol_045150
+sol_045165
+sol_045180
+sol_045195
+sol_045210
+sol_045225
+sol_045240
+sol_045255
+sol_045270
+sol_045285
+sol_045300
+sol_045315
+sol_045330
+sol_045345
+sol_045360
+sol_045375
+sol_045390
+sol_045405
+sol_045420
+sol_045435
+sol_045450
+sol_045465
+sol_045480
+sol_045495
+sol_045510
+sol_045525
+sol_045540
+sol_045555
+sol_045570
+sol_045585
+sol_045600
+sol_045615
+sol_045630
+sol_045645
+sol_045660
+sol_045675
+sol_046515
+sol_046530
+sol_046545
+sol_046560
+sol_046575
+sol_046590
+sol_046605
+sol_046620
+sol_046635
+sol_046650
+sol_046665
+sol_046680
+sol_046695
+sol_046710
+sol_046725
+sol_046740
+sol_046755
+sol_046770
+sol_046785
+sol_046800
+sol_046815
+sol_046830
+sol_046845
+sol_046860
+sol_046875
+sol_046890
+sol_046905
+sol_046920
+sol_046935
+sol_046950
+sol_046965
+sol_046980
+sol_046995
+sol_047010
+sol_047025
+sol_047040
+sol_047055
+sol_047070
+sol_047085
+sol_047100
+sol_047115
+sol_047955
+sol_047970
+sol_047985
+sol_048000
+sol_048015
+sol_048030
+sol_048045
+sol_048060
+sol_048075
+sol_048090
+sol_048105
+sol_048120
+sol_048135
+sol_048150
+sol_048165
+sol_048180
+sol_048195
+sol_048210
+sol_048225
+sol_048240
+sol_048255
+sol_048270
+sol_048285
+sol_048300
+sol_048315
+sol_048330
+sol_048345
+sol_048360
+sol_048375
+sol_048390
+sol_048405
+sol_048420
+sol_048435
+sol_048450
+sol_048465
+sol_048480
+sol_048495
+sol_048510
+sol_048525
+sol_048540
+sol_048555
+sol_049395
+sol_049410
+sol_049425
+sol_049440
+sol_049455
+sol_049470
+sol_049485
+sol_049500
+sol_049515
+sol_049530
+sol_049545
+sol_049560
+sol_049575
+sol_049590
+sol_049605
+sol_049620
+sol_049635
+sol_049650
+sol_049665
+sol_049680
+sol_049695
+sol_049710
+sol_049725
+sol_049740
+sol_049755
+sol_049770
+sol_049785
+sol_049800
+sol_049815
+sol_049830
+sol_049845
+sol_049860
+sol_049875
+sol_049890
+sol_049905
+sol_049920
+sol_049935
+sol_049950
+sol_049965
+sol_049980
+sol_049995
+sol_050835
+sol_050850
+sol_050865
+sol_050880
+sol_050895
+sol_050910
+sol_050925
+sol_050940
+sol_050955
+sol_050970
+sol_050985
+sol_051000
+sol_051015
+sol_051030
+sol_051045
+sol_051060
+sol_051075
+sol_051090
+sol_051105
+sol_051120
+sol_051135
+sol_051150
+sol_051165
+sol_051180
+sol_051195
+sol_051210
+sol_051225
+sol_051240
+sol_051255
+sol_051270
+sol_051285
+sol_051300
+sol_051315
+sol_051330
+sol_051345
+sol_051360
+sol_051375
+sol_051390
+sol_051405
+sol_051420
+sol_051435
+sol_052275
+sol_052290
+sol_052305
+sol_052320
+sol_052335
+sol_052350
+sol_052365
+sol_052380
+sol_052395
+sol_052410
+sol_052425
+sol_052440
+sol_052455
+sol_052470
+sol_052485
+sol_052500
+sol_052515
+sol_052530
+sol_052545
+sol_052560
+sol_052575
+sol_052590
+sol_052605
+sol_052620
+sol_052635
+sol_052650
+sol_052665
+sol_052680
+sol_052695
+sol_052710
+sol_052725
+sol_052740
+sol_052755
+sol_052770
+sol_052785
+sol_052800
+sol_052815
+sol_052830
+sol_052845
+sol_052860
+sol_052875
+sol_053715
+sol_053730
+sol_053745
+sol_053760
+sol_053775
+sol_053790
+sol_053805
+sol_053820
+sol_053835
+sol_053850
+sol_053865
+sol_053880
+sol_053895
+sol_053910
+sol_053925
+sol_053940
+sol_053955
+sol_053970
+sol_053985
+sol_054000
+sol_054015
+sol_054030
+sol_054045
+sol_054060
+sol_054075
+sol_054090
+sol_054105
+sol_054120
+sol_054135
+sol_054150
+sol_054165
+sol_054180
+sol_054195
+sol_054210
+sol_054225
+sol_054240
+sol_054255
+sol_054270
+sol_054285
+sol_054300
+sol_054315
+sol_055155
+sol_055170
+sol_055185
+sol_055200
+sol_055215
+sol_055230
+sol_055245
+sol_055260
+sol_055275
+sol_055290
+sol_055305
+sol_055320
+sol_055335
+sol_055350
+sol_055365
+sol_055380
+sol_055395
+sol_055410
+sol_055425
+sol_055440
+sol_055455
+sol_055470
+sol_055485
+sol_055500
+sol_055515
+sol_055530
+sol_055545
+sol_055560
+sol_055575
+sol_055590
+sol_055605
+sol_055620
+sol_055635
+sol_055650
+sol_055665
+sol_055680
+sol_055695
+sol_055710
+sol_055725
+sol_055740
+sol_055755
+sol_056595
+sol_056610
+sol_056625
+sol_056640
+sol_056655
+sol_056670
+sol_056685
+sol_056700
+sol_056715
+sol_056730
+sol_056745
+sol_056760
+sol_056775
+sol_056790
+sol_056805
+sol_056820
+sol_056835
+sol_056850
+sol_056865
+sol_056880
+sol_056895
+sol_056910
+sol_056925
+sol_056940
+sol_056955
+sol_056970
+sol_056985
+sol_057000
+sol_057015
+sol_057030
+sol_057045
+sol_057060
+sol_057075
+sol_057090
+sol_057105
+sol_057120
+sol_057135
+sol_057150
+sol_057165
+sol_057180
+sol_057195
+sol_058020
+sol_058035
+sol_058050
+sol_058065
+sol_058080
+sol_058095
+sol_058110
+sol_058125
+sol_058140
+sol_058155
+sol_058170
+sol_058185
+sol_058200
+sol_058215
+sol_058230
+sol_058245
+sol_058260
+sol_058275
+sol_058290
+sol_058305
+sol_058320
+sol_058335
+sol_058350
+sol_058365
+sol_058380
+sol_058395
+sol_058410
+sol_058425
+sol_058440
+sol_058455
+sol_058470
+sol_058485
+sol_058500
+sol_058515
+sol_058530
+sol_058545
+sol_058560
+sol_058575
+sol_058590
+sol_058605
+sol_058620
+sol_058635
+sol_059460
+sol_059475
+sol_059490
+sol_059505
+sol_059520
+sol_059535
+sol_059550
+sol_059565
+sol_059580
+sol_059595
+sol_059610
+sol_059625
+sol_059640
+sol_059655
+sol_059670
+sol_059685
+sol_059700
+sol_059715
+sol_059730
+sol_059745
+sol_059760
+sol_059775
+sol_059790
+sol_059805
+sol_059820
+sol_059835
+sol_059850
+sol_059865
+sol_059880
+sol_059895
+sol_059910
+sol_059925
+sol_059940
+sol_059955
+sol_059970
+sol_059985
+sol_060000
+sol_060015
+sol_060030
+sol_060045
+sol_060060
+sol_060075
+sol_060090
+sol_060900
+sol_060915
+sol_060930
+sol_060945
+sol_060960
+sol_060975
+sol_060990
+sol_061005
+sol_061020
+sol_061035
+sol_061050
+sol_061065
+sol_061080
+sol_061095
+sol_061110
+sol_061125
+sol_061140
+sol_061155
+sol_061170
+sol_061185
+sol_061200
+sol_061215
+sol_061230
+sol_061245
+sol_061260
+sol_061275
+sol_061290
+sol_061305
+sol_061320
+sol_061335
+sol_061350
+sol_061365
+sol_061380
+sol_061395
+sol_061410
+sol_061425
+sol_061440
+sol_061455
+sol_061470
+sol_061485
+sol_061500
+sol_061515
+sol_061530
+sol_062340
+sol_062355
+sol_062370
+sol_062385
+sol_062400
+sol_062415
+sol_062430
+sol_062445
+sol_062460
+sol_062475
+sol_062490
+sol_062505
+sol_062520
+sol_062535
+sol_062550
+sol_062565
+sol_062580
+sol_062595
+sol_062610
+sol_062625
+sol_062640
+sol_062655
+sol_062670
+sol_062685
+sol_062700
+sol_062715
+sol_062730
+sol_062745
+sol_062760
+sol_062775
+sol_062790
+sol_062805
+sol_062820
+sol_062835
+sol_062850
+sol_062865
+sol_062880
+sol_062895
+sol_062910
+sol_062925
+sol_062940
+sol_062955
+sol_062970
+sol_063780
+sol_063795
+sol_063810
+sol_063825
+sol_063840
+sol_063855
+sol_063870
+sol_063885
+sol_063900
+sol_063915
+sol_063930
+sol_063945
+sol_063960
+sol_063975
+sol_063990
+sol_064005
+sol_064020
+sol_064035
+sol_064050
+sol_064065
+sol_064080
+sol_064095
+sol_064110
+sol_064125
+sol_064140
+sol_064155
+sol_064170
+sol_064185
+sol_064200
+sol_064215
+sol_064230
+sol_064245
+sol_064260
+sol_064275
+sol_064290
+sol_064305
+sol_064320
+sol_064335
+sol_064350
+sol_064365
+sol_064380
+sol_064395
+sol_064410
+sol_065220
+sol_065235
+sol_065250
+sol_065265
+sol_065280
+sol_065295
+sol_065310
+sol_065325
+sol_065340
+sol_065355
+sol_065370
+sol_065385
+sol_065400
+sol_065415
+sol_065430
+sol_065445
+sol_065460
+sol_065475
+sol_065490
+sol_065505
+sol_065520
+sol_065535
+sol_065550
+sol_065565
+sol_065580
+sol_065595
+sol_065610
+sol_065625
+sol_065640
+sol_065655
+sol_065670
+sol_065685
+sol_065700
+sol_065715
+sol_065730
+sol_065745
+sol_065760
+sol_065775
+sol_065790
+sol_065805
+sol_065820
+sol_065835
+sol_065850
+sol_066660
+sol_066675
+sol_066690
+sol_066705
+sol_066720
+sol_066735
+sol_066750
+sol_066765
+sol_066780
+sol_066795
+sol_066810
+sol_066825
+sol_066840
+sol_066855
+sol_066870
+sol_066885
+sol_066900
+sol_066915
+sol_066930
+sol_066945
+sol_066960
+sol_066975
+sol_066990
+sol_067005
+sol_067020
+sol_067035
+sol_067050
+sol_067065
+sol_067080
+sol_067095
+sol_067110
+sol_067125
+sol_067140
+sol_067155
+sol_067170
+sol_067185
+sol_067200
+sol_067215
+sol_067230
+sol_067245
+sol_067260
+sol_067275
+sol_067290
+sol_068100
+sol_068115
+sol_068130
+sol_068145
+sol_068160
+sol_068175
+sol_068190
+sol_068205
+sol_068220
+sol_068235
+sol_068250
+sol_068265
+sol_068280
+sol_068295
+sol_068310
+sol_068325
+sol_068340
+sol_068355
+sol_068370
+sol_068385
+sol_068400
+sol_068415
+sol_068430
+sol_068445
+sol_068460
+sol_068475
+sol_068490
+sol_068505
+sol_068520
+sol_068535
+sol_068550
+sol_068565
+sol_068580
+sol_068595
+sol_068610
+sol_068625
+sol_068640
+sol_068655
+sol_068670
+sol_068685
+sol_068700
+sol_068715
+sol_068730
+sol_069540
+sol_069555
+sol_069570
+sol_069585
+sol_069600
+sol_069615
+sol_069630
+sol_069645
+sol_069660
+sol_069675
+sol_069690
+sol_069705
+sol_069720
+sol_069735
+sol_069750
+sol_069765
+sol_069780
+sol_069795
+sol_069810
+sol_069825
+sol_069840
+sol_069855
+sol_069870
+sol_069885
+sol_069900
+sol_069915
+sol_069930
+sol_069945
+sol_069960
+sol_069975
+sol_069990
+sol_070005
+sol_070020
+sol_070035
+sol_070050
+sol_070065
+sol_070080
+sol_070095
+sol_070110
+sol_070125
+sol_070140
+sol_070155
+sol_070170
+sol_070980
+sol_070995
+sol_071010
+sol_071025
+sol_071040
+sol_071055
+sol_071070
+sol_071085
+sol_071100
+sol_071115
+sol_071130
+sol_071145
+sol_071160
+sol_071175
+sol_071190
+sol_071205
+sol_071220
+sol_071235
+sol_071250
+sol_071265
+sol_071280
+sol_071295
+sol_071310
+sol_071325
+sol_071340
+sol_071355
+sol_071370
+sol_071385
+sol_071400
+sol_071415
+sol_071430
+sol_071445
+sol_071460
+sol_071475
+sol_071490
+sol_071505
+sol_071520
+sol_071535
+sol_071550
+sol_071565
+sol_071580
+sol_071595
+sol_071610
+sol_072420
+sol_072435
+sol_072450
+sol_072465
+sol_072480
+sol_072495
+sol_072510
+sol_072525
+sol_072540
+sol_072555
+sol_072570
+sol_072585
+sol_072600
+sol_072615
+sol_072630
+sol_072645
+sol_072660
+sol_072675
+sol_072690
+sol_072705
+sol_072720
+sol_072735
+sol_072750
+sol_072765
+sol_072780
+sol_072795
+sol_072810
+sol_072825
+sol_072840
+sol_072855
+sol_072870
+sol_072885
+sol_072900
+sol_072915
+sol_072930
+sol_072945
+sol_072960
+sol_072975
+sol_072990
+sol_073005
+sol_073020
+sol_073035
+sol_073050
+sol_073845
+sol_073860
+sol_073875
+sol_073890
+sol_073905
+sol_073920
+sol_073935
+sol_073950
+sol_073965
+sol_073980
+sol_073995
+sol_074010
+sol_074025
+sol_074040
+sol_074055
+sol_074070
+sol_074085
+sol_074100
+sol_074115
+sol_074130
+sol_074145
+sol_074160
+sol_074175
+sol_074190
+sol_074205
+sol_074220
+sol_074235
+sol_074250
+sol_074265
+sol_074280
+sol_074295
+sol_074310
+sol_074325
+sol_074340
+sol_074355
+sol_074370
+sol_074385
+sol_074400
+sol_074415
+sol_074430
+sol_074445
+sol_074460
+sol_074475
+sol_074490
+sol_075285
+sol_075300
+sol_075315
+sol_075330
+sol_075345
+sol_075360
+sol_075375
+sol_075390
+sol_075405
+sol_075420
+sol_075435
+sol_075450
+sol_075465
+sol_075480
+sol_075495
+sol_075510
+sol_075525
+sol_075540
+sol_075555
+sol_075570
+sol_075585
+sol_075600
+sol_075615
+sol_075630
+sol_075645
+sol_075660
+sol_075675
+sol_075690
+sol_075705
+sol_075720
+sol_075735
+sol_075750
+sol_075765
+sol_075780
+sol_075795
+sol_075810
+sol_075825
+sol_075840
+sol_075855
+sol_075870
+sol_075885
+sol_075900
+sol_075915
+sol_075930
+sol_076725
+sol_076740
+sol_076755
+sol_076770
+sol_076785
+sol_076800
+sol_076815
+sol_076830
+sol_076845
+sol_076860
+sol_076875
+sol_076890
+sol_076905
+sol_076920
+sol_076935
+sol_076950
+sol_076965
+sol_076980
+sol_076995
+sol_077010
+sol_077025
+sol_077040
+sol_077055
+sol_077070
+sol_077085
+sol_077100
+sol_077115
+sol_077130
+sol_077145
+sol_077160
+sol_077175
+sol_077190
+sol_077205
+sol_077220
+sol_077235
+sol_077250
+sol_077265
+sol_077280
+sol_077295
+sol_077310
+sol_077325
+sol_077340
+sol_077355
+sol_077370
+sol_078165
+sol_078180
+sol_078195
+sol_078210
+sol_078225
+sol_078240
+sol_078255
+sol_078270
+sol_078285
+sol_078300
+sol_078315
+sol_078330
+sol_078345
+sol_078360
+sol_078375
+sol_078390
+sol_078405
+sol_078420
+sol_078435
+sol_078450
+sol_078465
+sol_078480
+sol_078495
+sol_078510
+sol_078525
+sol_078540
+sol_078555
+sol_078570
+sol_078585
+sol_078600
+sol_078615
+sol_078630
+sol_078645
+sol_078660
+sol_078675
+sol_078690
+sol_078705
+sol_078720
+sol_078735
+sol_078750
+sol_078765
+sol_078780
+sol_078795
+sol_078810
+sol_079605
+sol_079620
+sol_079635
+sol_079650
+sol_079665
+sol_079680
+sol_079695
+sol_079710
+sol_079725
+sol_079740
+sol_079755
+sol_079770
+sol_079785
+sol_079800
+sol_079815
+sol_079830
+sol_079845
+sol_079860
+sol_079875
+sol_079890
+sol_079905
+sol_079920
+sol_079935
+sol_079950
+sol_079965
+sol_079980
+sol_079995
+sol_080010
+sol_080025
+sol_080040
+sol_080055
+sol_080070
+sol_080085
+sol_080100
+sol_080115
+sol_080130
+sol_080145
+sol_080160
+sol_080175
+sol_080190
+sol_080205
+sol_080220
+sol_080235
+sol_080250
+sol_080265
+sol_081045
+sol_081060
+sol_081075
+sol_081090
+sol_081105
+sol_081120
+sol_081135
+sol_081150
+sol_081165
+sol_081180
+sol_081195
+sol_081210
+sol_081225
+sol_081240
+sol_081255
+sol_081270
+sol_081285
+sol_081300
+sol_081315
+sol_081330
+sol_081345
+sol_081360
+sol_081375
+sol_081390
+sol_081405
+sol_081420
+sol_081435
+sol_081450
+sol_081465
+sol_081480
+sol_081495
+sol_081510
+sol_081525
+sol_081540
+sol_081555
+sol_081570
+sol_081585
+sol_081600
+sol_081615
+sol_081630
+sol_081645
+sol_081660
+sol_081675
+sol_081690
+sol_081705
+sol_082485
+sol_082500
+sol_082515
+sol_082530
+sol_082545
+sol_082560
+sol_082575
+sol_082590
+sol_082605
+sol_082620
+sol_082635
+sol_082650
+sol_082665
+sol_082680
+sol_082695
+sol_082710
+sol_082725
+sol_082740
+sol_082755
+sol_082770
+sol_082785
+sol_082800
+sol_082815
+sol_082830
+sol_082845
+sol_082860
+sol_082875
+sol_082890
+sol_082905
+sol_082920
+sol_082935
+sol_082950
+sol_082965
+sol_082980
+sol_082995
+sol_083010
+sol_083025
+sol_083040
+sol_083055
+sol_083070
+sol_083085
+sol_083100
+sol_083115
+sol_083130
+sol_083145
+sol_083925
+sol_083940
+sol_083955
+sol_083970
+sol_083985
+sol_084000
+sol_084015
+sol_084030
+sol_084045
+sol_084060
+sol_084075
+sol_084090
+sol_084105
+sol_084120
+sol_084135
+sol_084150
+sol_084165
+sol_084180
+sol_084195
+sol_084210
+sol_084225
+sol_084240
+sol_084255
+sol_084270
+sol_084285
+sol_084300
+sol_084315
+sol_084330
+sol_084345
+sol_084360
+sol_084375
+sol_084390
+sol_084405
+sol_084420
+sol_084435
+sol_084450
+sol_084465
+sol_084480
+sol_084495
+sol_084510
+sol_084525
+sol_084540
+sol_084555
+sol_084570
+sol_084585
+sol_085365
+sol_085380
+sol_085395
+sol_085410
+sol_085425
+sol_085440
+sol_085455
+sol_085470
+sol_085485
+sol_085500
+sol_085515
+sol_085530
+sol_085545
+sol_085560
+sol_085575
+sol_085590
+sol_085605
+sol_085620
+sol_085635
+sol_085650
+sol_085665
+sol_085680
+sol_085695
+sol_085710
+sol_085725
+sol_085740
+sol_085755
+sol_085770
+sol_085785
+sol_085800
+sol_085815
+sol_085830
+sol_085845
+sol_085860
+sol_085875
+sol_085890
+sol_085905
+sol_085920
+sol_085935
+sol_085950
+sol_085965
+sol_085980
+sol_085995
+sol_086010
+sol_086025
+sol_086805
+sol_086820
+sol_086835
+sol_086850
+sol_086865
+sol_086880
+sol_086895
+sol_086910
+sol_086925
+sol_086940
+sol_086955
+sol_086970
+sol_086985
+sol_087000
+sol_087015
+sol_087030
+sol_087045
+sol_087060
+sol_087075
+sol_087090
+sol_087105
+sol_087120
+sol_087135
+sol_087150
+sol_087165
+sol_087180
+sol_087195
+sol_087210
+sol_087225
+sol_087240
+sol_087255
+sol_087270
+sol_087285
+sol_087300
+sol_087315
+sol_087330
+sol_087345
+sol_087360
+sol_087375
+sol_087390
+sol_087405
+sol_087420
+sol_087435
+sol_087450
+sol_087465
+sol_088245
+sol_088260
+sol_088275
+sol_088290
+sol_088305
+sol_088320
+sol_088335
+sol_088350
+sol_088365
+sol_088380
+sol_088395
+sol_088410
+sol_088425
+sol_088440
+sol_088455
+sol_088470
+sol_088485
+sol_088500
+sol_088515
+sol_088530
+sol_088545
+sol_088560
+sol_088575
+sol_088590
+sol_088605
+sol_088620
+sol_088635
+sol_088650
+sol_088665
+sol_088680
+sol_088695
+sol_088710
+sol_088725
+sol_088740
+sol_088755
+sol_088770
+sol_088785
+sol_088800
+sol_088815
+sol_088830
+sol_088845
+sol_088860
+sol_088875
+sol_088890
+sol_088905
+sol_089670
+sol_089685
+sol_089700
+sol_089715
+sol_089730
+sol_089745
+sol_089760
+sol_089775
+sol_089790
+sol_089805
+sol_089820
+sol_089835
+sol_089850
+sol_089865
+sol_089880
+sol_089895
+sol_089910
+sol_089925
+sol_089940
+sol_089955
+sol_089970
+sol_089985
+sol_090000
+sol_090015
+sol_090030
+sol_090045
+sol_090060
+sol_090075
+sol_090090
+sol_090105
+sol_090120
+sol_090135
+sol_090150
+sol_090165
+sol_090180
+sol_090195
+sol_090210
+sol_090225
+sol_090240
+sol_090255
+sol_090270
+sol_090285
+sol_090300
+sol_090315
+sol_090330
+sol_090345
+sol_091110
+sol_091125
+sol_091140
+sol_091155
+sol_091170
+sol_091185
+sol_091200
+sol_091215
+sol_091230
+sol_091245
+sol_091260
+sol_091275
+sol_091290
+sol_091305
+sol_091320
+sol_091335
+sol_091350
+sol_091365
+sol_091380
+sol_091395
+sol_091410
+sol_091425
+sol_091440
+sol_091455
+sol_091470
+sol_091485
+sol_091500
+sol_091515
+sol_091530
+sol_091545
+sol_091560
+sol_091575
+sol_091590
+sol_091605
+sol_091620
+sol_091635
+sol_091650
+sol_091665
+sol_091680
+sol_091695
+sol_091710
+sol_091725
+sol_091740
+sol_091755
+sol_091770
+sol_091785
+sol_092550
+sol_092565
+sol_092580
+sol_092595
+sol_092610
+sol_092625
+sol_092640
+sol_092655
+sol_092670
+sol_092685
+sol_092700
+sol_092715
+sol_092730
+sol_092745
+sol_092760
+sol_092775
+sol_092790
+sol_092805
+sol_092820
+sol_092835
+sol_092850
+sol_092865
+sol_092880
+sol_092895
+sol_092910
+sol_092925
+sol_092940
+sol_092955
+sol_092970
+sol_092985
+sol_093000
+sol_093015
+sol_093030
+sol_093045
+sol_093060
+sol_093075
+sol_093090
+sol_093105
+sol_093120
+sol_093135
+sol_093150
+sol_093165
+sol_093180
+sol_093195
+sol_093210
+sol_093225
+sol_093990
+sol_094005
+sol_094020
+sol_094035
+sol_094050
+sol_094065
+sol_094080
+sol_094095
+sol_094110
+sol_094125
+sol_094140
+sol_094155
+sol_094170
+sol_094185
+sol_094200
+sol_094215
+sol_094230
+sol_094245
+sol_094260
+sol_094275
+sol_094290
+sol_094305
+sol_094320
+sol_094335
+sol_094350
+sol_094365
+sol_094380
+sol_094395
+sol_094410
+sol_094425
+sol_094440
+sol_094455
+sol_094470
+sol_094485
+sol_094500
+sol_094515
+sol_094530
+sol_094545
+sol_094560
+sol_094575
+sol_094590
+sol_094605
+sol_094620
+sol_094635
+sol_094650
+sol_094665
+sol_095430
+sol_095445
+sol_095460
+sol_095475
+sol_095490
+sol_095505
+sol_095520
+sol_095535
+sol_095550
+sol_095565
+sol_095580
+sol_095595
+sol_095610
+sol_095625
+sol_095640
+sol_095655
+sol_095670
+sol_095685
+sol_095700
+sol_095715
+sol_095730
+sol_095745
+sol_095760
+sol_095775
+sol_095790
+sol_095805
+sol_095820
+sol_095835
+sol_095850
+sol_095865
+sol_095880
+sol_095895
+sol_095910
+sol_095925
+sol_095940
+sol_095955
+sol_095970
+sol_095985
+sol_096000
+sol_096015
+sol_096030
+sol_096045
+sol_096060
+sol_096075
+sol_096090
+sol_096105
+sol_096870
+sol_096885
+sol_096900
+sol_096915
+sol_096930
+sol_096945
+sol_096960
+sol_096975
+sol_096990
+sol_097005
+sol_097020
+sol_097035
+sol_097050
+sol_097065
+sol_097080
+sol_097095
+sol_097110
+sol_097125
+sol_097140
+sol_097155
+sol_097170
+sol_097185
+sol_097200
+sol_097215
+sol_097230
+sol_097245
+sol_097260
+sol_097275
+sol_097290
+sol_097305
+sol_097320
+sol_097335
+sol_097350
+sol_097365
+sol_097380
+sol_097395
+sol_097410
+sol_097425
+sol_097440
+sol_097455
+sol_097470
+sol_097485
+sol_097500
+sol_097515
+sol_097530
+sol_097545
+sol_098310
+sol_098325
+sol_098340
+sol_098355
+sol_098370
+sol_098385
+sol_098400
+sol_098415
+sol_098430
+sol_098445
+sol_098460
+sol_098475
+sol_098490
+sol_098505
+sol_098520
+sol_098535
+sol_098550
+sol_098565
+sol_098580
+sol_098595
+sol_098610
+sol_098625
+sol_098640
+sol_098655
+sol_098670
+sol_098685
+sol_098700
+sol_098715
+sol_098730
+sol_098745
+sol_098760
+sol_098775
+sol_098790
+sol_098805
+sol_098820
+sol_098835
+sol_098850
+sol_098865
+sol_098880
+sol_098895
+sol_098910
+sol_098925
+sol_098940
+sol_098955
+sol_098970
+sol_098985
+sol_099000
+sol_099750
+sol_099765
+sol_099780
+sol_099795
+sol_099810
+sol_099825
+sol_099840
+sol_099855
+sol_099870
+sol_099885
+sol_099900
+sol_099915
+sol_099930
+sol_099945
+sol_099960
+sol_099975
+sol_099990
+sol_100005
+sol_100020
+sol_100035
+sol_100050
+sol_100065
+sol_100080
+sol_100095
+sol_100110
+sol_100125
+sol_100140
+sol_100155
+sol_100170
+sol_100185
+sol_100200
+sol_100215
+sol_100230
+sol_100245
+sol_100260
+sol_100275
+sol_100290
+sol_100305
+sol_100320
+sol_100335
+sol_100350
+sol_100365
+sol_100380
+sol_100395
+sol_100410
+sol_100425
+sol_100440
+sol_101190
+sol_101205
+sol_101220
+sol_101235
+sol_101250
+sol_101265
+sol_101280
+sol_101295
+sol_101310
+sol_101325
+sol_101340
+sol_101355
+sol_101370
+sol_101385
+sol_101400
+sol_101415
+sol_101430
+sol_101445
+sol_101460
+sol_101475
+sol_101490
+sol_101505
+sol_101520
+sol_101535
+sol_101550
+sol_101565
+sol_101580
+sol_101595
+sol_101610
+sol_101625
+sol_101640
+sol_101655
+sol_101670
+sol_101685
+sol_101700
+sol_101715
+sol_101730
+sol_101745
+sol_101760
+sol_101775
+sol_101790
+sol_101805
+sol_101820
+sol_101835
+sol_101850
+sol_101865
+sol_101880
+sol_102615
+sol_102630
+sol_102645
+sol_102660
+sol_102675
+sol_102690
+sol_102705
+sol_102720
+sol_102735
+sol_102750
+sol_102765
+sol_102780
+sol_102795
+sol_102810
+sol_102825
+sol_102840
+sol_102855
+sol_102870
+sol_102885
+sol_102900
+sol_102915
+sol_102930
+sol_102945
+sol_102960
+sol_102975
+sol_102990
+sol_103005
+sol_103020
+sol_103035
+sol_103050
+sol_103065
+sol_103080
+sol_103095
+sol_103110
+sol_103125
+sol_103140
+sol_103155
+sol_103170
+sol_103185
+sol_103200
+sol_103215
+sol_103230
+sol_103245
+sol_103260
+sol_103275
+sol_103290
+sol_103305
+sol_103320
+sol_104055
+sol_104070
+sol_104085
+sol_104100
+sol_104115
+sol_104130
+sol_104145
+sol_104160
+sol_104175
+sol_104190
+sol_104205
+sol_104220
+sol_104235
+sol_104250
+sol_104265
+sol_104280
+sol_104295
+sol_104310
+sol_104325
+sol_104340
+sol_104355
+sol_104370
+sol_104385
+sol_104400
+sol_104415
+sol_104430
+sol_104445
+sol_104460
+sol_104475
+sol_104490
+sol_104505
+sol_104520
+sol_104535
+sol_104550
+sol_104565
+sol_104580
+sol_104595
+sol_104610
+sol_104625
+sol_104640
+sol_104655
+sol_104670
+sol_104685
+sol_104700
+sol_104715
+sol_104730
+sol_104745
+sol_104760
+sol_105495
+sol_105510
+sol_105525
+sol_105540
+sol_105555
+sol_105570
+sol_105585
+sol_105600
+sol_105615
+sol_105630
+sol_105645
+sol_105660
+sol_105675
+sol_105690
+sol_105705
+sol_105720
+sol_105735
+sol_105750
+sol_105765
+sol_105780
+sol_105795
+sol_105810
+sol_105825
+sol_105840
+sol_105855
+sol_105870
+sol_105885
+sol_105900
+sol_105915
+sol_105930
+sol_105945
+sol_105960
+sol_105975
+sol_105990
+sol_106005
+sol_106020
+sol_106035
+sol_106050
+sol_106065
+sol_106080
+sol_106095
+sol_106110
+sol_106125
+sol_106140
+sol_106155
+sol_106170
+sol_106185
+sol_106200
+sol_106935
+sol_106950
+sol_106965
+sol_106980
+sol_106995
+sol_107010
+sol_107025
+sol_107040
+sol_107055
+sol_107070
+sol_107085
+sol_107100
+sol_107115
+sol_107130
+sol_107145
+sol_107160
+sol_107175
+sol_107190
+sol_107205
+sol_107220
+sol_107235
+sol_107250
+sol_107265
+sol_107280
+sol_107295
+sol_107310
+sol_107325
+sol_107340
+sol_107355
+sol_107370
+sol_107385
+sol_107400
+sol_107415
+sol_107430
+sol_107445
+sol_107460
+sol_107475
+sol_107490
+sol_107505
+sol_107520
+sol_107535
+sol_107550
+sol_107565
+sol_107580
+sol_107595
+sol_107610
+sol_107625
+sol_107640
+sol_108375
+sol_108390
+sol_108405
+sol_108420
+sol_108435
+sol_108450
+sol_108465
+sol_108480
+sol_108495
+sol_108510
+sol_108525
+sol_108540
+sol_108555
+sol_108570
+sol_108585
+sol_108600
+sol_108615
+sol_108630
+sol_108645
+sol_108660
+sol_108675
+sol_108690
+sol_108705
+sol_108720
+sol_108735
+sol_108750
+sol_108765
+sol_108780
+sol_108795
+sol_108810
+sol_108825
+sol_108840
+sol_108855
+sol_108870
+sol_108885
+sol_108900
+sol_108915
+sol_108930
+sol_108945
+sol_108960
+sol_108975
+sol_108990
+sol_109005
+sol_109020
+sol_109035
+sol_109050
+sol_109065
+sol_109080
+sol_109815
+sol_109830
+sol_109845
+sol_109860
+sol_109875
+sol_109890
+sol_109905
+sol_109920
+sol_109935
+sol_109950
+sol_109965
+sol_109980
+sol_109995
+sol_110010
+sol_110025
+sol_110040
+sol_110055
+sol_110070
+sol_110085
+sol_110100
+sol_110115
+sol_110130
+sol_110145
+sol_110160
+sol_110175
+sol_110190
+sol_110205
+sol_110220
+sol_110235
+sol_110250
+sol_110265
+sol_110280
+sol_110295
+sol_110310
+sol_110325
+sol_110340
+sol_110355
+sol_110370
+sol_110385
+sol_110400
+sol_110415
+sol_110430
+sol_110445
+sol_110460
+sol_110475
+sol_110490
+sol_110505
+sol_110520
+sol_111255
+sol_111270
+sol_111285
+sol_111300
+sol_111315
+sol_111330
+sol_111345
+sol_111360
+sol_111375
+sol_111390
+sol_111405
+sol_111420
+sol_111435
+sol_111450
+sol_111465
+sol_111480
+sol_111495
+sol_111510
+sol_111525
+sol_111540
+sol_111555
+sol_111570
+sol_111585
+sol_111600
+sol_111615
+sol_111630
+sol_111645
+sol_111660
+sol_111675
+sol_111690
+sol_111705
+sol_111720
+sol_111735
+sol_111750
+sol_111765
+sol_111780
+sol_111795
+sol_111810
+sol_111825
+sol_111840
+sol_111855
+sol_111870
+sol_111885
+sol_111900
+sol_111915
+sol_111930
+sol_111945
+sol_111960
+sol_112695
+sol_112710
+sol_112725
+sol_112740
+sol_112755
+sol_112770
+sol_112785
+sol_112800
+sol_112815
+sol_112830
+sol_112845
+sol_112860
+sol_112875
+sol_112890
+sol_112905
+sol_112920
+sol_112935
+sol_112950
+sol_112965
+sol_112980
+sol_112995
+sol_113010
+sol_113025
+sol_113040
+sol_113055
+sol_113070
+sol_113085
+sol_113100
+sol_113115
+sol_113130
+sol_113145
+sol_113160
+sol_113175
+sol_113190
+sol_113205
+sol_113220
+sol_113235
+sol_113250
+sol_113265
+sol_113280
+sol_113295
+sol_113310
+sol_113325
+sol_113340
+sol_113355
+sol_113370
+sol_113385
+sol_113400
+sol_114135
+sol_114150
+sol_114165
+sol_114180
+sol_114195
+sol_114210
+sol_114225
+sol_114240
+sol_114255
+sol_114270
+sol_114285
+sol_114300
+sol_114315
+sol_114330
+sol_114345
+sol_114360
+sol_114375
+sol_114390
+sol_114405
+sol_114420
+sol_114435
+sol_114450
+sol_114465
+sol_114480
+sol_114495
+sol_114510
+sol_114525
+sol_114540
+sol_114555
+sol_114570
+sol_114585
+sol_114600
+sol_114615
+sol_114630
+sol_114645
+sol_114660
+sol_114675
+sol_114690
+sol_114705
+sol_114720
+sol_114735
+sol_114750
+sol_114765
+sol_114780
+sol_114795
+sol_114810
+sol_114825
+sol_114840
+sol_115575
+sol_115590
+sol_115605
+sol_115620
+sol_115635
+sol_115650
+sol_115665
+sol_115680
+sol_115695
+sol_115710
+sol_115725
+sol_115740
+sol_115755
+sol_115770
+sol_115785
+sol_115800
+sol_115815
+sol_115830
+sol_115845
+sol_115860
+sol_115875
+sol_115890
+sol_115905
+sol_115920
+sol_115935
+sol_115950
+sol_115965
+sol_115980
+sol_115995
+sol_116010
+sol_116025
+sol_116040
+sol_116055
+sol_116070
+sol_116085
+sol_116100
+sol_116115
+sol_116130
+sol_116145
+sol_116160
+sol_116175
+sol_116190
+sol_116205
+sol_116220
+sol_116235
+sol_116250
+sol_116265
+sol_116280
+sol_117000
+sol_117015
+sol_117030
+sol_117045
+sol_117060
+sol_117075
+sol_117090
+sol_117105
+sol_117120
+sol_117135
+sol_117150
+sol_117165
+sol_117180
+sol_117195
+sol_117210
+sol_117225
+sol_117240
+sol_117255
+sol_117270
+sol_117285
+sol_117300
+sol_117315
+sol_117330
+sol_117345
+sol_117360
+sol_117375
+sol_117390
+sol_117405
+sol_117420
+sol_117435
+sol_117450
+sol_117465
+sol_117480
+sol_117495
+sol_117510
+sol_117525
+sol_117540
+sol_117555
+sol_117570
+sol_117585
+sol_117600
+sol_117615
+sol_117630
+sol_117645
+sol_117660
+sol_117675
+sol_117690
+sol_117705
+sol_117720
+sol_118440
+sol_118455
+sol_118470
+sol_118485
+sol_118500
+sol_118515
+sol_118530
+sol_118545
+sol_118560
+sol_118575
+sol_118590
+sol_118605
+sol_118620
+sol_118635
+sol_118650
+sol_118665
+sol_118680
+sol_118695
+sol_118710
+sol_118725
+sol_118740
+sol_118755
+sol_118770
+sol_118785
+sol_118800
+sol_118815
+sol_118830
+sol_118845
+sol_118860
+sol_118875
+sol_118890
+sol_118905
+sol_118920
+sol_118935
+sol_118950
+sol_118965
+sol_118980
+sol_118995
+sol_119010
+sol_119025
+sol_119040
+sol_119055
+sol_119070
+sol_119085
+sol_119100
+sol_119115
+sol_119130
+sol_119145
+sol_119160
+sol_119880
+sol_119895
+sol_119910
+sol_119925
+sol_119940
+sol_119955
+sol_119970
+sol_119985
+sol_120000
+sol_120015
+sol_120030
+sol_120045
+sol_120060
+sol_120075
+sol_120090
+sol_120105
+sol_120120
+sol_120135
+sol_120150
+sol_120165
+sol_120180
+sol_120195
+sol_120210
+sol_120225
+sol_120240
+sol_120255
+sol_120270
+sol_120285
+sol_120300
+sol_120315
+sol_120330
+sol_120345
+sol_120360
+sol_120375
+sol_120390
+sol_120405
+sol_120420
+sol_120435
+sol_120450
+sol_120465
+sol_120480
+sol_120495
+sol_120510
+sol_120525
+sol_120540
+sol_120555
+sol_120570
+sol_120585
+sol_120600
+sol_120615
+sol_121320
+sol_121335
+sol_121350
+sol_121365
+sol_121380
+sol_121395
+sol_121410
+sol_121425
+sol_121440
+sol_121455
+sol_121470
+sol_121485
+sol_121500
+sol_121515
+sol_121530
+sol_121545
+sol_121560
+sol_121575
+sol_121590
+sol_121605
+sol_121620
+sol_121635
+sol_121650
+sol_121665
+sol_121680
+sol_121695
+sol_121710
+sol_121725
+sol_121740
+sol_121755
+sol_121770
+sol_121785
+sol_121800
+sol_121815
+sol_121830
+sol_121845
+sol_121860
+sol_121875
+sol_121890
+sol_121905
+sol_121920
+sol_121935
+sol_121950
+sol_121965
+sol_121980
+sol_121995
+sol_122010
+sol_122025
+sol_122040
+sol_122055
+sol_122760
+sol_122775
+sol_122790
+sol_122805
+sol_122820
+sol_122835
+sol_122850
+sol_122865
+sol_122880
+sol_122895
+sol_122910
+sol_122925
+sol_122940
+sol_122955
+sol_122970
+sol_122985
+sol_123000
+sol_123015
+sol_123030
+sol_123045
+sol_123060
+sol_123075
+sol_123090
+sol_123105
+sol_123120
+sol_123135
+sol_123150
+sol_123165
+sol_123180
+sol_123195
+sol_123210
+sol_123225
+sol_123240
+sol_123255
+sol_123270
+sol_123285
+sol_123300
+sol_123315
+sol_123330
+sol_123345
+sol_123360
+sol_123375
+sol_123390
+sol_123405
+sol_123420
+sol_123435
+sol_123450
+sol_123465
+sol_123480
+sol_123495
+sol_124200
+sol_124215
+sol_124230
+sol_124245
+sol_124260
+sol_124275
+sol_124290
+sol_124305
+sol_124320
+sol_124335
+sol_124350
+sol_124365
+sol_124380
+sol_124395
+sol_124410
+sol_124425
+sol_124440
+sol_124455
+sol_124470
+sol_124485
+sol_124500
+sol_124515
+sol_124530
+sol_124545
+sol_124560
+sol_124575
+sol_124590
+sol_124605
+sol_124620
+sol_124635
+sol_124650
+sol_124665
+sol_124680
+sol_124695
+sol_124710
+sol_124725
+sol_124740
+sol_124755
+sol_124770
+sol_124785
+sol_124800
+sol_124815
+sol_124830
+sol_124845
+sol_124860
+sol_124875
+sol_124890
+sol_124905
+sol_124920
+sol_124935
+sol_125640
+sol_125655
+sol_125670
+sol_125685
+sol_125700
+sol_125715
+sol_125730
+sol_125745
+sol_125760
+sol_125775
+sol_125790
+sol_125805
+sol_125820
+sol_125835
+sol_125850
+sol_125865
+sol_125880
+sol_125895
+sol_125910
+sol_125925
+sol_125940
+sol_125955
+sol_125970
+sol_125985
+sol_126000
+sol_126015
+sol_126030
+sol_126045
+sol_126060
+sol_126075
+sol_126090
+sol_126105
+sol_126120
+sol_126135
+sol_126150
+sol_126165
+sol_126180
+sol_126195
+sol_126210
+sol_126225
+sol_126240
+sol_126255
+sol_126270
+sol_126285
+sol_126300
+sol_126315
+sol_126330
+sol_126345
+sol_126360
+sol_126375
+sol_127080
+sol_127095
+sol_127110
+sol_127125
+sol_127140
+sol_127155
+sol_127170
+sol_127185
+sol_127200
+sol_127215
+sol_127230
+sol_127245
+sol_127260
+sol_127275
+sol_127290
+sol_127305
+sol_127320
+sol_127335
+sol_127350
+sol_127365
+sol_127380
+sol_127395
+sol_127410
+sol_127425
+sol_127440
+sol_127455
+sol_127470
+sol_127485
+sol_127500
+sol_127515
+sol_127530
+sol_127545
+sol_127560
+sol_127575
+sol_127590
+sol_127605
+sol_127620
+sol_127635
+sol_127650
+sol_127665
+sol_127680
+sol_127695
+sol_127710
+sol_127725
+sol_127740
+sol_127755
+sol_127770
+sol_127785
+sol_127800
+sol_127815
+sol_128520
+sol_128535
+sol_128550
+sol_128565
+sol_128580
+sol_128595
+sol_128610
+sol_128625
+sol_128640
+sol_128655
+sol_128670
+sol_128685
+sol_128700
+sol_128715
+sol_128730
+sol_128745
+sol_128760
+sol_128775
+sol_128790
+sol_128805
+sol_128820
+sol_128835
+sol_128850
+sol_128865
+sol_128880
+sol_128895
+sol_128910
+sol_128925
+sol_128940
+sol_128955
+sol_128970
+sol_128985
+sol_129000
+sol_129015
+sol_129030
+sol_129045
+sol_129060
+sol_129075
+sol_129090
+sol_129105
+sol_129120
+sol_129135
+sol_129150
+sol_129165
+sol_129180
+sol_129195
+sol_129210
+sol_129225
+sol_129240
+sol_129255
+sol_129945
+sol_129960
+sol_129975
+sol_129990
+sol_130005
+sol_130020
+sol_130035
+sol_130050
+sol_130065
+sol_130080
+sol_130095
+sol_130110
+sol_130125
+sol_130140
+sol_130155
+sol_130170
+sol_130185
+sol_130200
+sol_130215
+sol_130230
+sol_130245
+sol_130260
+sol_130275
+sol_130290
+sol_130305
+sol_130320
+sol_130335
+sol_130350
+sol_130365
+sol_130380
+sol_130395
+sol_130410
+sol_130425
+sol_130440
+sol_130455
+sol_130470
+sol_130485
+sol_130500
+sol_130515
+sol_130530
+sol_130545
+sol_130560
+sol_130575
+sol_130590
+sol_130605
+sol_130620
+sol_130635
+sol_130650
+sol_130665
+sol_130680
+sol_130695
+sol_131385
+sol_131400
+sol_131415
+sol_131430
+sol_131445
+sol_131460
+sol_131475
+sol_131490
+sol_131505
+sol_131520
+sol_131535
+sol_131550
+sol_131565
+sol_131580
+sol_131595
+sol_131610
+sol_131625
+sol_131640
+sol_131655
+sol_131670
+sol_131685
+sol_131700
+sol_131715
+sol_131730
+sol_131745
+sol_131760
+sol_131775
+sol_131790
+sol_131805
+sol_131820
+sol_131835
+sol_131850
+sol_131865
+sol_131880
+sol_131895
+sol_131910
+sol_131925
+sol_131940
+sol_131955
+sol_131970
+sol_131985
+sol_132000
+sol_132015
+sol_132030
+sol_132045
+sol_132060
+sol_132075
+sol_132090
+sol_132105
+sol_132120
+sol_132135
+sol_132825
+sol_132840
+sol_132855
+sol_132870
+sol_132885
+sol_132900
+sol_132915
+sol_132930
+sol_132945
+sol_132960
+sol_132975
+sol_132990
+sol_133005
+sol_133020
+sol_133035
+sol_133050
+sol_133065
+sol_133080
+sol_133095
+sol_133110
+sol_133125
+sol_133140
+sol_133155
+sol_133170
+sol_133185
+sol_133200
+sol_133215
+sol_133230
+sol_133245
+sol_133260
+sol_133275
+sol_133290
+sol_133305
+sol_133320
+sol_133335
+sol_133350
+sol_133365
+sol_133380
+sol_133395
+sol_133410
+sol_133425
+sol_133440
+sol_133455
+sol_133470
+sol_133485
+sol_133500
+sol_133515
+sol_133530
+sol_133545
+sol_133560
+sol_133575
+sol_134265
+sol_134280
+sol_134295
+sol_134310
+sol_134325
+sol_134340
+sol_134355
+sol_134370
+sol_134385
+sol_134400
+sol_134415
+sol_134430
+sol_134445
+sol_134460
+sol_134475
+sol_134490
+sol_134505
+sol_134520
+sol_134535
+sol_134550
+sol_134565
+sol_134580
+sol_134595
+sol_134610
+sol_134625
+sol_134640
+sol_134655
+sol_134670
+sol_134685
+sol_134700
+sol_134715
+sol_134730
+sol_134745
+sol_134760
+sol_134775
+sol_134790
+sol_134805
+sol_134820
+sol_134835
+sol_134850
+sol_134865
+sol_134880
+sol_134895
+sol_134910
+sol_134925
+sol_134940
+sol_134955
+sol_134970
+sol_134985
+sol_135000
+sol_135015
+sol_135705
+sol_135720
+sol_135735
+sol_135750
+sol_135765
+sol_135780
+sol_135795
+sol_135810
+sol_135825
+sol_135840
+sol_135855
+sol_135870
+sol_135885
+sol_135900
+sol_135915
+sol_135930
+sol_135945
+sol_135960
+sol_135975
+sol_135990
+sol_136005
+sol_136020
+sol_136035
+sol_136050
+sol_136065
+sol_136080
+sol_136095
+sol_136110
+sol_136125
+sol_136140
+sol_136155
+sol_136170
+sol_136185
+sol_136200
+sol_136215
+sol_136230
+sol_136245
+sol_136260
+sol_136275
+sol_136290
+sol_136305
+sol_136320
+sol_136335
+sol_136350
+sol_136365
+sol_136380
+sol_136395
+sol_136410
+sol_136425
+sol_136440
+sol_136455
+sol_137145
+sol_137160
+sol_137175
+sol_137190
+sol_137205
+sol_137220
+sol_137235
+sol_137250
+sol_137265
+sol_137280
+sol_137295
+sol_137310
+sol_137325
+sol_137340
+sol_137355
+sol_137370
+sol_137385
+sol_137400
+sol_137415
+sol_137430
+sol_137445
+sol_137460
+sol_137475
+sol_137490
+sol_137505
+sol_137520
+sol_137535
+sol_137550
+sol_137565
+sol_137580
+sol_137595
+sol_137610
+sol_137625
+sol_137640
+sol_137655
+sol_137670
+sol_137685
+sol_137700
+sol_137715
+sol_137730
+sol_137745
+sol_137760
+sol_137775
+sol_137790
+sol_137805
+sol_137820
+sol_137835
+sol_137850
+sol_137865
+sol_137880
+sol_137895
+sol_138585
+sol_138600
+sol_138615
+sol_138630
+sol_138645
+sol_138660
+sol_138675
+sol_138690
+sol_138705
+sol_138720
+sol_138735
+sol_138750
+sol_138765
+sol_138780
+sol_138795
+sol_138810
+sol_138825
+sol_138840
+sol_138855
+sol_138870
+sol_138885
+sol_138900
+sol_138915
+sol_138930
+sol_138945
+sol_138960
+sol_138975
+sol_138990
+sol_139005
+sol_139020
+sol_139035
+sol_139050
+sol_139065
+sol_139080
+sol_139095
+sol_139110
+sol_139125
+sol_139140
+sol_139155
+sol_139170
+sol_139185
+sol_139200
+sol_139215
+sol_139230
+sol_139245
+sol_139260
+sol_139275
+sol_139290
+sol_139305
+sol_139320
+sol_139335
+sol_140025
+sol_140040
+sol_140055
+sol_140070
+sol_140085
+sol_140100
+sol_140115
+sol_140130
+sol_140145
+sol_140160
+sol_140175
+sol_140190
+sol_140205
+sol_140220
+sol_140235
+sol_140250
+sol_140265
+sol_140280
+sol_140295
+sol_140310
+sol_140325
+sol_140340
+sol_140355
+sol_140370
+sol_140385
+sol_140400
+sol_140415
+sol_140430
+sol_140445
+sol_140460
+sol_140475
+sol_140490
+sol_140505
+sol_140520
+sol_140535
+sol_140550
+sol_140565
+sol_140580
+sol_140595
+sol_140610
+sol_140625
+sol_140640
+sol_140655
+sol_140670
+sol_140685
+sol_140700
+sol_140715
+sol_140730
+sol_140745
+sol_140760
+sol_140775
+sol_141465
+sol_141480
+sol_141495
+sol_141510
+sol_141525
+sol_141540
+sol_141555
+sol_141570
+sol_141585
+sol_141600
+sol_141615
+sol_141630
+sol_141645
+sol_141660
+sol_141675
+sol_141690
+sol_141705
+sol_141720
+sol_141735
+sol_141750
+sol_141765
+sol_141780
+sol_141795
+sol_141810
+sol_141825
+sol_141840
+sol_141855
+sol_141870
+sol_141885
+sol_141900
+sol_141915
+sol_141930
+sol_141945
+sol_141960
+sol_141975
+sol_141990
+sol_142005
+sol_142020
+sol_142035
+sol_142050
+sol_142065
+sol_142080
+sol_142095
+sol_142110
+sol_142125
+sol_142140
+sol_142155
+sol_142170
+sol_142185
+sol_142200
+sol_142215
+sol_142230
+sol_142905
+sol_142920
+sol_142935
+sol_142950
+sol_142965
+sol_142980
+sol_142995
+sol_143010
+sol_143025
+sol_143040
+sol_143055
+sol_143070
+sol_143085
+sol_143100
+sol_143115
+sol_143130
+sol_143145
+sol_143160
+sol_143175
+sol_143190
+sol_143205
+sol_143220
+sol_143235
+sol_143250
+sol_143265
+sol_143280
+sol_143295
+sol_143310
+sol_143325
+sol_143340
+sol_143355
+sol_143370
+sol_143385
+sol_143400
+sol_143415
+sol_143430
+sol_143445
+sol_143460
+sol_143475
+sol_143490
+sol_143505
+sol_143520
+sol_143535
+sol_143550
+sol_143565
+sol_143580
+sol_143595
+sol_143610
+sol_143625
+sol_143640
+sol_143655
+sol_143670
+sol_144330
+sol_144345
+sol_144360
+sol_144375
+sol_144390
+sol_144405
+sol_144420
+sol_144435
+sol_144450
+sol_144465
+sol_144480
+sol_144495
+sol_144510
+sol_144525
+sol_144540
+sol_144555
+sol_144570
+sol_144585
+sol_144600
+sol_144615
+sol_144630
+sol_144645
+sol_144660
+sol_144675
+sol_144690
+sol_144705
+sol_144720
+sol_144735
+sol_144750
+sol_144765
+sol_144780
+sol_144795
+sol_144810
+sol_144825
+sol_144840
+sol_144855
+sol_144870
+sol_144885
+sol_144900
+sol_144915
+sol_144930
+sol_144945
+sol_144960
+sol_144975
+sol_144990
+sol_145005
+sol_145020
+sol_145035
+sol_145050
+sol_145065
+sol_145080
+sol_145095
+sol_145110
+sol_145770
+sol_145785
+sol_145800
+sol_145815
+sol_145830
+sol_145845
+sol_145860
+sol_145875
+sol_145890
+sol_145905
+sol_145920
+sol_145935
+sol_145950
+sol_145965
+sol_145980
+sol_145995
+sol_146010
+sol_146025
+sol_146040
+sol_146055
+sol_146070
+sol_146085
+sol_146100
+sol_146115
+sol_146130
+sol_146145
+sol_146160
+sol_146175
+sol_146190
+sol_146205
+sol_146220
+sol_146235
+sol_146250
+sol_146265
+sol_146280
+sol_146295
+sol_146310
+sol_146325
+sol_146340
+sol_146355
+sol_146370
+sol_146385
+sol_146400
+sol_146415
+sol_146430
+sol_146445
+sol_146460
+sol_146475
+sol_146490
+sol_146505
+sol_146520
+sol_146535
+sol_146550
+sol_147210
+sol_147225
+sol_147240
+sol_147255
+sol_147270
+sol_147285
+sol_147300
+sol_147315
+sol_147330
+sol_147345
+sol_147360
+sol_147375
+sol_147390
+sol_147405
+sol_147420
+sol_147435
+sol_147450
+sol_147465
+sol_147480
+sol_147495
+sol_147510
+sol_147525
+sol_147540
+sol_147555
+sol_147570
+sol_147585
+sol_147600
+sol_147615
+sol_147630
+sol_147645
+sol_147660
+sol_147675
+sol_147690
+sol_147705
+sol_147720
+sol_147735
+sol_147750
+sol_147765
+sol_147780
+sol_147795
+sol_147810
+sol_147825
+sol_147840
+sol_147855
+sol_147870
+sol_147885
+sol_147900
+sol_147915
+sol_147930
+sol_147945
+sol_147960
+sol_147975
+sol_147990
+sol_148650
+sol_148665
+sol_148680
+sol_148695
+sol_148710
+sol_148725
+sol_148740
+sol_148755
+sol_148770
+sol_148785
+sol_148800
+sol_148815
+sol_148830
+sol_148845
+sol_148860
+sol_148875
+sol_148890
+sol_148905
+sol_148920
+sol_148935
+sol_148950
+sol_148965
+sol_148980
+sol_148995
+sol_149010
+sol_149025
+sol_149040
+sol_149055
+sol_149070
+sol_149085
+sol_149100
+sol_149115
+sol_149130
+sol_149145
+sol_149160
+sol_149175
+sol_149190
+sol_149205
+sol_149220
+sol_149235
+sol_149250
+sol_149265
+sol_149280
+sol_149295
+sol_149310
+sol_149325
+sol_149340
+sol_149355
+sol_149370
+sol_149385
+sol_149400
+sol_149415
+sol_149430
+sol_150090
+sol_150105
+sol_150120
+sol_150135
+sol_150150
+sol_150165
+sol_150180
+sol_150195
+sol_150210
+sol_150225
+sol_150240
+sol_150255
+sol_150270
+sol_150285
+sol_150300
+sol_150315
+sol_150330
+sol_150345
+sol_150360
+sol_150375
+sol_150390
+sol_150405
+sol_150420
+sol_150435
+sol_150450
+sol_150465
+sol_150480
+sol_150495
+sol_150510
+sol_150525
+sol_150540
+sol_150555
+sol_150570
+sol_150585
+sol_150600
+sol_150615
+sol_150630
+sol_150645
+sol_150660
+sol_150675
+sol_150690
+sol_150705
+sol_150720
+sol_150735
+sol_150750
+sol_150765
+sol_150780
+sol_150795
+sol_150810
+sol_150825
+sol_150840
+sol_150855
+sol_150870
+sol_151530
+sol_151545
+sol_151560
+sol_151575
+sol_151590
+sol_151605
+sol_151620
+sol_151635
+sol_151650
+sol_151665
+sol_151680
+sol_151695
+sol_151710
+sol_151725
+sol_151740
+sol_151755
+sol_151770
+sol_151785
+sol_151800
+sol_151815
+sol_151830
+sol_151845
+sol_151860
+sol_151875
+sol_151890
+sol_151905
+sol_151920
+sol_151935
+sol_151950
+sol_151965
+sol_151980
+sol_151995
+sol_152010
+sol_152025
+sol_152040
+sol_152055
+sol_152070
+sol_152085
+sol_152100
+sol_152115
+sol_152130
+sol_152145
+sol_152160
+sol_152175
+sol_152190
+sol_152205
+sol_152220
+sol_152235
+sol_152250
+sol_152265
+sol_152280
+sol_152295
+sol_152310
+sol_152970
+sol_152985
+sol_153000
+sol_153015
+sol_153030
+sol_153045
+sol_153060
+sol_153075
+sol_153090
+sol_153105
+sol_153120
+sol_153135
+sol_153150
+sol_153165
+sol_153180
+sol_153195
+sol_153210
+sol_153225
+sol_153240
+sol_153255
+sol_153270
+sol_153285
+sol_153300
+sol_153315
+sol_153330
+sol_153345
+sol_153360
+sol_153375
+sol_153390
+sol_153405
+sol_153420
+sol_153435
+sol_153450
+sol_153465
+sol_153480
+sol_153495
+sol_153510
+sol_153525
+sol_153540
+sol_153555
+sol_153570
+sol_153585
+sol_153600
+sol_153615
+sol_153630
+sol_153645
+sol_153660
+sol_153675
+sol_153690
+sol_153705
+sol_153720
+sol_153735
+sol_153750
+sol_154410
+sol_154425
+sol_154440
+sol_154455
+sol_154470
+sol_154485
+sol_154500
+sol_154515
+sol_154530
+sol_154545
+sol_154560
+sol_154575
+sol_154590
+sol_154605
+sol_154620
+sol_154635
+sol_154650
+sol_154665
+sol_154680
+sol_154695
+sol_154710
+sol_154725
+sol_154740
+sol_154755
+sol_154770
+sol_154785
+sol_154800
+sol_154815
+sol_154830
+sol_154845
+sol_154860
+sol_154875
+sol_154890
+sol_154905
+sol_154920
+sol_154935
+sol_154950
+sol_154965
+sol_154980
+sol_154995
+sol_155010
+sol_155025
+sol_155040
+sol_155055
+sol_155070
+sol_155085
+sol_155100
+sol_155115
+sol_155130
+sol_155145
+sol_155160
+sol_155175
+sol_155190
+sol_155850
+sol_155865
+sol_155880
+sol_155895
+sol_155910
+sol_155925
+sol_155940
+sol_155955
+sol_155970
+sol_155985
+sol_156000
+sol_156015
+sol_156030
+sol_156045
+sol_156060
+sol_156075
+sol_156090
+sol_156105
+sol_156120
+sol_156135
+sol_156150
+sol_156165
+sol_156180
+sol_156195
+sol_156210
+sol_156225
+sol_156240
+sol_156255
+sol_156270
+sol_156285
+sol_156300
+sol_156315
+sol_156330
+sol_156345
+sol_156360
+sol_156375
+sol_156390
+sol_156405
+sol_156420
+sol_156435
+sol_156450
+sol_156465
+sol_156480
+sol_156495
+sol_156510
+sol_156525
+sol_156540
+sol_156555
+sol_156570
+sol_156585
+sol_156600
+sol_156615
+sol_156630
+sol_157290
+sol_157305
+sol_157320
+sol_157335
+sol_157350
+sol_157365
+sol_157380
+sol_157395
+sol_157410
+sol_157425
+sol_157440
+sol_157455
+sol_157470
+sol_157485
+sol_157500
+sol_157515
+sol_157530
+sol_157545
+sol_157560
+sol_157575
+sol_157590
+sol_157605
+sol_157620
+sol_157635
+sol_157650
+sol_157665
+sol_157680
+sol_157695
+sol_157710
+sol_157725
+sol_157740
+sol_157755
+sol_157770
+sol_157785
+sol_157800
+sol_157815
+sol_157830
+sol_157845
+sol_157860
+sol_157875
+sol_157890
+sol_157905
+sol_157920
+sol_157935
+sol_157950
+sol_157965
+sol_157980
+sol_157995
+sol_158010
+sol_158025
+sol_158040
+sol_158055
+sol_158070
+sol_158715
+sol_158730
+sol_158745
+sol_158760
+sol_158775
+sol_158790
+sol_158805
+sol_158820
+sol_158835
+sol_158850
+sol_158865
+sol_158880
+sol_158895
+sol_158910
+sol_158925
+sol_158940
+sol_158955
+sol_158970
+sol_158985
+sol_159000
+sol_159015
+sol_159030
+sol_159045
+sol_159060
+sol_159075
+sol_159090
+sol_159105
+sol_159120
+sol_159135
+sol_159150
+sol_159165
+sol_159180
+sol_159195
+sol_159210
+sol_159225
+sol_159240
+sol_159255
+sol_159270
+sol_159285
+sol_159300
+sol_159315
+sol_159330
+sol_159345
+sol_159360
+sol_159375
+sol_159390
+sol_159405
+sol_159420
+sol_159435
+sol_159450
+sol_159465
+sol_159480
+sol_159495
+sol_159510
+sol_160155
+sol_160170
+sol_160185
+sol_160200
+sol_160215
+sol_160230
+sol_160245
+sol_160260
+sol_160275
+sol_160290
+sol_160305
+sol_160320
+sol_160335
+sol_160350
+sol_160365
+sol_160380
+sol_160395
+sol_160410
+sol_160425
+sol_160440
+sol_160455
+sol_160470
+sol_160485
+sol_160500
+sol_160515
+sol_160530
+sol_160545
+sol_160560
+sol_160575
+sol_160590
+sol_160605
+sol_160620
+sol_160635
+sol_160650
+sol_160665
+sol_160680
+sol_160695
+sol_160710
+sol_160725
+sol_160740
+sol_160755
+sol_160770
+sol_160785
+sol_160800
+sol_160815
+sol_160830
+sol_160845
+sol_160860
+sol_160875
+sol_160890
+sol_160905
+sol_160920
+sol_160935
+sol_160950
+sol_161595
+sol_161610
+sol_161625
+sol_161640
+sol_161655
+sol_161670
+sol_161685
+sol_161700
+sol_161715
+sol_161730
+sol_161745
+sol_161760
+sol_161775
+sol_161790
+sol_161805
+sol_161820
+sol_161835
+sol_161850
+sol_161865
+sol_161880
+sol_161895
+sol_161910
+sol_161925
+sol_161940
+sol_161955
+sol_161970
+sol_161985
+sol_162000
+sol_162015
+sol_162030
+sol_162045
+sol_162060
+sol_162075
+sol_162090
+sol_162105
+sol_162120
+sol_162135
+sol_162150
+sol_162165
+sol_162180
+sol_162195
+sol_162210
+sol_162225
+sol_162240
+sol_162255
+sol_162270
+sol_162285
+sol_162300
+sol_162315
+sol_162330
+sol_162345
+sol_162360
+sol_162375
+sol_162390
+sol_163035
+sol_163050
+sol_163065
+sol_163080
+sol_163095
+sol_163110
+sol_163125
+sol_163140
+sol_163155
+sol_163170
+sol_163185
+sol_163200
+sol_163215
+sol_163230
+sol_163245
+sol_163260
+sol_163275
+sol_163290
+sol_163305
+sol_163320
+sol_163335
+sol_163350
+sol_163365
+sol_163380
+sol_163395
+sol_163410
+sol_163425
+sol_163440
+sol_163455
+sol_163470
+sol_163485
+sol_163500
+sol_163515
+sol_163530
+sol_163545
+sol_163560
+sol_163575
+sol_163590
+sol_163605
+sol_163620
+sol_163635
+sol_163650
+sol_163665
+sol_163680
+sol_163695
+sol_163710
+sol_163725
+sol_163740
+sol_163755
+sol_163770
+sol_163785
+sol_163800
+sol_163815
+sol_163830
+sol_163845
+sol_164475
+sol_164490
+sol_164505
+sol_164520
+sol_164535
+sol_164550
+sol_164565
+sol_164580
+sol_164595
+sol_164610
+sol_164625
+sol_164640
+sol_164655
+sol_164670
+sol_164685
+sol_164700
+sol_164715
+sol_164730
+sol_164745
+sol_164760
+sol_164775
+sol_164790
+sol_164805
+sol_164820
+sol_164835
+sol_164850
+sol_164865
+sol_164880
+sol_164895
+sol_164910
+sol_164925
+sol_164940
+sol_164955
+sol_164970
+sol_164985
+sol_165000
+sol_165015
+sol_165030
+sol_165045
+sol_165060
+sol_165075
+sol_165090
+sol_165105
+sol_165120
+sol_165135
+sol_165150
+sol_165165
+sol_165180
+sol_165195
+sol_165210
+sol_165225
+sol_165240
+sol_165255
+sol_165270
+sol_165285
+sol_165915
+sol_165930
+sol_165945
+sol_165960
+sol_165975
+sol_165990
+sol_166005
+sol_166020
+sol_166035
+sol_166050
+sol_166065
+sol_166080
+sol_166095
+sol_166110
+sol_166125
+sol_166140
+sol_166155
+sol_166170
+sol_166185
+sol_166200
+sol_166215
+sol_166230
+sol_166245
+sol_166260
+sol_166275
+sol_166290
+sol_166305
+sol_166320
+sol_166335
+sol_166350
+sol_166365
+sol_166380
+sol_166395
+sol_166410
+sol_166425
+sol_166440
+sol_166455
+sol_166470
+sol_166485
+sol_166500
+sol_166515
+sol_166530
+sol_166545
+sol_166560
+sol_166575
+sol_166590
+sol_166605
+sol_166620
+sol_166635
+sol_166650
+sol_166665
+sol_166680
+sol_166695
+sol_166710
+sol_166725
+sol_167355
+sol_167370
+sol_167385
+sol_167400
+sol_167415
+sol_167430
+sol_167445
+sol_167460
+sol_167475
+sol_167490
+sol_167505
+sol_167520
+sol_167535
+sol_167550
+sol_167565
+sol_167580
+sol_167595
+sol_167610
+sol_167625
+sol_167640
+sol_167655
+sol_167670
+sol_167685
+sol_167700
+sol_167715
+sol_167730
+sol_167745
+sol_167760
+sol_167775
+sol_167790
+sol_167805
+sol_167820
+sol_167835
+sol_167850
+sol_167865
+sol_167880
+sol_167895
+sol_167910
+sol_167925
+sol_167940
+sol_167955
+sol_167970
+sol_167985
+sol_168000
+sol_168015
+sol_168030
+sol_168045
+sol_168060
+sol_168075
+sol_168090
+sol_168105
+sol_168120
+sol_168135
+sol_168150
+sol_168165
+sol_168795
+sol_168810
+sol_168825
+sol_168840
+sol_168855
+sol_168870
+sol_168885
+sol_168900
+sol_168915
+sol_168930
+sol_168945
+sol_168960
+sol_168975
+sol_168990
+sol_169005
+sol_169020
+sol_169035
+sol_169050
+sol_169065
+sol_169080
+sol_169095
+sol_169110
+sol_169125
+sol_169140
+sol_169155
+sol_169170
+sol_169185
+sol_169200
+sol_169215
+sol_169230
+sol_169245
+sol_169260
+sol_169275
+sol_169290
+sol_169305
+sol_169320
+sol_169335
+sol_169350
+sol_169365
+sol_169380
+sol_169395
+sol_169410
+sol_169425
+sol_169440
+sol_169455
+sol_169470
+sol_169485
+sol_169500
+sol_169515
+sol_169530
+sol_169545
+sol_169560
+sol_169575
+sol_169590
+sol_169605
+sol_170235
+sol_170250
+sol_170265
+sol_170280
+sol_170295
+sol_170310
+sol_170325
+sol_170340
+sol_170355
+sol_170370
+sol_170385
+sol_170400
+sol_170415
+sol_170430
+sol_170445
+sol_170460
+sol_170475
+sol_170490
+sol_170505
+sol_170520
+sol_170535
+sol_170550
+sol_170565
+sol_170580
+sol_170595
+sol_170610
+sol_170625
+sol_170640
+sol_170655
+sol_170670
+sol_170685
+sol_170700
+sol_170715
+sol_170730
+sol_170745
+sol_170760
+sol_170775
+sol_170790
+sol_170805
+sol_170820
+sol_170835
+sol_170850
+sol_170865
+sol_170880
+sol_170895
+sol_170910
+sol_170925
+sol_170940
+sol_170955
+sol_170970
+sol_170985
+sol_171000
+sol_171015
+sol_171030
+sol_171045
+sol_171675
+sol_171690
+sol_171705
+sol_171720
+sol_171735
+sol_171750
+sol_171765
+sol_171780
+sol_171795
+sol_171810
+sol_171825
+sol_171840
+sol_171855
+sol_171870
+sol_171885
+sol_171900
+sol_171915
+sol_171930
+sol_171945
+sol_171960
+sol_171975
+sol_171990
+sol_172005
+sol_172020
+sol_172035
+sol_172050
+sol_172065
+sol_172080
+sol_172095
+sol_172110
+sol_172125
+sol_172140
+sol_172155
+sol_172170
+sol_172185
+sol_172200
+sol_172215
+sol_172230
+sol_172245
+sol_172260
+sol_172275
+sol_172290
+sol_172305
+sol_172320
+sol_172335
+sol_172350
+sol_172365
+sol_172380
+sol_172395
+sol_172410
+sol_172425
+sol_172440
+sol_172455
+sol_172470
+sol_172485
+sol_173115
+sol_173130
+sol_173145
+sol_173160
+sol_173175
+sol_173190
+sol_173205
+sol_173220
+sol_173235
+sol_173250
+sol_173265
+sol_173280
+sol_173295
+sol_173310
+sol_173325
+sol_173340
+sol_173355
+sol_173370
+sol_173385
+sol_173400
+sol_173415
+sol_173430
+sol_173445
+sol_173460
+sol_173475
+sol_173490
+sol_173505
+sol_173520
+sol_173535
+sol_173550
+sol_173565
+sol_173580
+sol_173595
+sol_173610
+sol_173625
+sol_173640
+sol_173655
+sol_173670
+sol_173685
+sol_173700
+sol_173715
+sol_173730
+sol_173745
+sol_173760
+sol_173775
+sol_173790
+sol_173805
+sol_173820
+sol_173835
+sol_173850
+sol_173865
+sol_173880
+sol_173895
+sol_173910
+sol_173925
+sol_174540
+sol_174555
+sol_174570
+sol_174585
+sol_174600
+sol_174615
+sol_174630
+sol_174645
+sol_174660
+sol_174675
+sol_174690
+sol_174705
+sol_174720
+sol_174735
+sol_174750
+sol_174765
+sol_174780
+sol_174795
+sol_174810
+sol_174825
+sol_174840
+sol_174855
+sol_174870
+sol_174885
+sol_174900
+sol_174915
+sol_174930
+sol_174945
+sol_174960
+sol_174975
+sol_174990
+sol_175005
+sol_175020
+sol_175035
+sol_175050
+sol_175065
+sol_175080
+sol_175095
+sol_175110
+sol_175125
+sol_175140
+sol_175155
+sol_175170
+sol_175185
+sol_175200
+sol_175215
+sol_175230
+sol_175245
+sol_175260
+sol_175275
+sol_175290
+sol_175305
+sol_175320
+sol_175335
+sol_175350
+sol_175365
+sol_175980
+sol_175995
+sol_176010
+sol_176025
+sol_176040
+sol_176055
+sol_176070
+sol_176085
+sol_176100
+sol_176115
+sol_176130
+sol_176145
+sol_176160
+sol_176175
+sol_176190
+sol_176205
+sol_176220
+sol_176235
+sol_176250
+sol_176265
+sol_176280
+sol_176295
+sol_176310
+sol_176325
+sol_176340
+sol_176355
+sol_176370
+sol_176385
+sol_176400
+sol_176415
+sol_176430
+sol_176445
+sol_176460
+sol_176475
+sol_176490
+sol_176505
+sol_176520
+sol_176535
+sol_176550
+sol_176565
+sol_176580
+sol_176595
+sol_176610
+sol_176625
+sol_176640
+sol_176655
+sol_176670
+sol_176685
+sol_176700
+sol_176715
+sol_176730
+sol_176745
+sol_176760
+sol_176775
+sol_176790
+sol_176805
+sol_177420
+sol_177435
+sol_177450
+sol_177465
+sol_177480
+sol_177495
+sol_177510
+sol_177525
+sol_177540
+sol_177555
+sol_177570
+sol_177585
+sol_177600
+sol_177615
+sol_177630
+sol_177645
+sol_177660
+sol_177675
+sol_177690
+sol_177705
+sol_177720
+sol_177735
+sol_177750
+sol_177765
+sol_177780
+sol_177795
+sol_177810
+sol_177825
+sol_177840
+sol_177855
+sol_177870
+sol_177885
+sol_177900
+sol_177915
+sol_177930
+sol_177945
+sol_177960
+sol_177975
+sol_177990
+sol_178005
+sol_178020
+sol_178035
+sol_178050
+sol_178065
+sol_178080
+sol_178095
+sol_178110
+sol_178125
+sol_178140
+sol_178155
+sol_178170
+sol_178185
+sol_178200
+sol_178215
+sol_178230
+sol_178245
+sol_178860
+sol_178875
+sol_178890
+sol_178905
+sol_178920
+sol_178935
+sol_178950
+sol_178965
+sol_178980
+sol_178995
+sol_179010
+sol_179025
+sol_179040
+sol_179055
+sol_179070
+sol_179085
+sol_179100
+sol_179115
+sol_179130
+sol_179145
+sol_179160
+sol_179175
+sol_179190
+sol_179205
+sol_179220
+sol_179235
+sol_179250
+sol_179265
+sol_179280
+sol_179295
+sol_179310
+sol_179325
+sol_179340
+sol_179355
+sol_179370
+sol_179385
+sol_179400
+sol_179415
+sol_179430
+sol_179445
+sol_179460
+sol_179475
+sol_179490
+sol_179505
+sol_179520
+sol_179535
+sol_179550
+sol_179565
+sol_179580
+sol_179595
+sol_179610
+sol_179625
+sol_179640
+sol_179655
+sol_179670
+sol_179685
+sol_180300
+sol_180315
+sol_180330
+sol_180345
+sol_180360
+sol_180375
+sol_180390
+sol_180405
+sol_180420
+sol_180435
+sol_180450
+sol_180465
+sol_180480
+sol_180495
+sol_180510
+sol_180525
+sol_180540
+sol_180555
+sol_180570
+sol_180585
+sol_180600
+sol_180615
+sol_180630
+sol_180645
+sol_180660
+sol_180675
+sol_180690
+sol_180705
+sol_180720
+sol_180735
+sol_180750
+sol_180765
+sol_180780
+sol_180795
+sol_180810
+sol_180825
+sol_180840
+sol_180855
+sol_180870
+sol_180885
+sol_180900
+sol_180915
+sol_180930
+sol_180945
+sol_180960
+sol_180975
+sol_180990
+sol_181005
+sol_181020
+sol_181035
+sol_181050
+sol_181065
+sol_181080
+sol_181095
+sol_181110
+sol_181125
+sol_181740
+sol_181755
+sol_181770
+sol_181785
+sol_181800
+sol_181815
+sol_181830
+sol_181845
+sol_181860
+sol_181875
+sol_181890
+sol_181905
+sol_181920
+sol_181935
+sol_181950
+sol_181965
+sol_181980
+sol_181995
+sol_182010
+sol_182025
+sol_182040
+sol_182055
+sol_182070
+sol_182085
+sol_182100
+sol_182115
+sol_182130
+sol_182145
+sol_182160
+sol_182175
+sol_182190
+sol_182205
+sol_182220
+sol_182235
+sol_182250
+sol_182265
+sol_182280
+sol_182295
+sol_182310
+sol_182325
+sol_182340
+sol_182355
+sol_182370
+sol_182385
+sol_182400
+sol_182415
+sol_182430
+sol_182445
+sol_182460
+sol_182475
+sol_182490
+sol_182505
+sol_182520
+sol_182535
+sol_182550
+sol_182565
+sol_183180
+sol_183195
+sol_183210
+sol_183225
+sol_183240
+sol_183255
+sol_183270
+sol_183285
+sol_183300
+sol_183315
+sol_183330
+sol_183345
+sol_183360
+sol_183375
+sol_183390
+sol_183405
+sol_183420
+sol_183435
+sol_183450
+sol_183465
+sol_183480
+sol_183495
+sol_183510
+sol_183525
+sol_183540
+sol_183555
+sol_183570
+sol_183585
+sol_183600
+sol_183615
+sol_183630
+sol_183645
+sol_183660
+sol_183675
+sol_183690
+sol_183705
+sol_183720
+sol_183735
+sol_183750
+sol_183765
+sol_183780
+sol_183795
+sol_183810
+sol_183825
+sol_183840
+sol_183855
+sol_183870
+sol_183885
+sol_183900
+sol_183915
+sol_183930
+sol_183945
+sol_183960
+sol_183975
+sol_183990
+sol_184005
+sol_184620
+sol_184635
+sol_184650
+sol_184665
+sol_184680
+sol_184695
+sol_184710
+sol_184725
+sol_184740
+sol_184755
+sol_184770
+sol_184785
+sol_184800
+sol_184815
+sol_184830
+sol_184845
+sol_184860
+sol_184875
+sol_184890
+sol_184905
+sol_184920
+sol_184935
+sol_184950
+sol_184965
+sol_184980
+sol_184995
+sol_185010
+sol_185025
+sol_185040
+sol_185055
+sol_185070
+sol_185085
+sol_185100
+sol_185115
+sol_185130
+sol_185145
+sol_185160
+sol_185175
+sol_185190
+sol_185205
+sol_185220
+sol_185235
+sol_185250
+sol_185265
+sol_185280
+sol_185295
+sol_185310
+sol_185325
+sol_185340
+sol_185355
+sol_185370
+sol_185385
+sol_185400
+sol_185415
+sol_185430
+sol_185445
+sol_185460
+sol_186060
+sol_186075
+sol_186090
+sol_186105
+sol_186120
+sol_186135
+sol_186150
+sol_186165
+sol_186180
+sol_186195
+sol_186210
+sol_186225
+sol_186240
+sol_186255
+sol_186270
+sol_186285
+sol_186300
+sol_186315
+sol_186330
+sol_186345
+sol_186360
+sol_186375
+sol_186390
+sol_186405
+sol_186420
+sol_186435
+sol_186450
+sol_186465
+sol_186480
+sol_186495
+sol_186510
+sol_186525
+sol_186540
+sol_186555
+sol_186570
+sol_186585
+sol_186600
+sol_186615
+sol_186630
+sol_186645
+sol_186660
+sol_186675
+sol_186690
+sol_186705
+sol_186720
+sol_186735
+sol_186750
+sol_186765
+sol_186780
+sol_186795
+sol_186810
+sol_186825
+sol_186840
+sol_186855
+sol_186870
+sol_186885
+sol_186900
+sol_187500
+sol_187515
+sol_187530
+sol_187545
+sol_187560
+sol_187575
+sol_187590
+sol_187605
+sol_187620
+sol_187635
+sol_187650
+sol_187665
+sol_187680
+sol_187695
+sol_187710
+sol_187725
+sol_187740
+sol_187755
+sol_187770
+sol_187785
+sol_187800
+sol_187815
+sol_187830
+sol_187845
+sol_187860
+sol_187875
+sol_187890
+sol_187905
+sol_187920
+sol_187935
+sol_187950
+sol_187965
+sol_187980
+sol_187995
+sol_188010
+sol_188025
+sol_188040
+sol_188055
+sol_188070
+sol_188085
+sol_188100
+sol_188115
+sol_188130
+sol_188145
+sol_188160
+sol_188175
+sol_188190
+sol_188205
+sol_188220
+sol_188235
+sol_188250
+sol_188265
+sol_188280
+sol_188295
+sol_188310
+sol_188325
+sol_188340
+sol_188940
+sol_188955
+sol_188970
+sol_188985
+sol_189000
+sol_189015
+sol_189030
+sol_189045
+sol_189060
+sol_189075
+sol_189090
+sol_189105
+sol_189120
+sol_189135
+sol_189150
+sol_189165
+sol_189180
+sol_189195
+sol_189210
+sol_189225
+sol_189240
+sol_189255
+sol_189270
+sol_189285
+sol_189300
+sol_189315
+sol_189330
+sol_189345
+sol_189360
+sol_189375
+sol_189390
+sol_189405
+sol_189420
+sol_189435
+sol_189450
+sol_189465
+sol_189480
+sol_189495
+sol_189510
+sol_189525
+sol_189540
+sol_189555
+sol_189570
+sol_189585
+sol_189600
+sol_189615
+sol_189630
+sol_189645
+sol_189660
+sol_189675
+sol_189690
+sol_189705
+sol_189720
+sol_189735
+sol_189750
+sol_189765
+sol_189780
+sol_190380
+sol_190395
+sol_190410
+sol_190425
+sol_190440
+sol_190455
+sol_190470
+sol_190485
+sol_190500
+sol_190515
+sol_190530
+sol_190545
+sol_190560
+sol_190575
+sol_190590
+sol_190605
+sol_190620
+sol_190635
+sol_190650
+sol_190665
+sol_190680
+sol_190695
+sol_190710
+sol_190725
+sol_190740
+sol_190755
+sol_190770
+sol_190785
+sol_190800
+sol_190815
+sol_190830
+sol_190845
+sol_190860
+sol_190875
+sol_190890
+sol_190905
+sol_190920
+sol_190935
+sol_190950
+sol_190965
+sol_190980
+sol_190995
+sol_191010
+sol_191025
+sol_191040
+sol_191055
+sol_191070
+sol_191085
+sol_191100
+sol_191115
+sol_191130
+sol_191145
+sol_191160
+sol_191175
+sol_191190
+sol_191205
+sol_191220
+sol_191820
+sol_191835
+sol_191850
+sol_191865
+sol_191880
+sol_191895
+sol_191910
+sol_191925
+sol_191940
+sol_191955
+sol_191970
+sol_191985
+sol_192000
+sol_192015
+sol_192030
+sol_192045
+sol_192060
+sol_192075
+sol_192090
+sol_192105
+sol_192120
+sol_192135
+sol_192150
+sol_192165
+sol_192180
+sol_192195
+sol_192210
+sol_192225
+sol_192240
+sol_192255
+sol_192270
+sol_192285
+sol_192300
+sol_192315
+sol_192330
+sol_192345
+sol_192360
+sol_192375
+sol_192390
+sol_192405
+sol_192420
+sol_192435
+sol_192450
+sol_192465
+sol_192480
+sol_192495
+sol_192510
+sol_192525
+sol_192540
+sol_192555
+sol_192570
+sol_192585
+sol_192600
+sol_192615
+sol_192630
+sol_192645
+sol_192660
+sol_193260
+sol_193275
+sol_193290
+sol_193305
+sol_193320
+sol_193335
+sol_193350
+sol_193365
+sol_193380
+sol_193395
+sol_193410
+sol_193425
+sol_193440
+sol_193455
+sol_193470
+sol_193485
+sol_193500
+sol_193515
+sol_193530
+sol_193545
+sol_193560
+sol_193575
+sol_193590
+sol_193605
+sol_193620
+sol_193635
+sol_193650
+sol_193665
+sol_193680
+sol_193695
+sol_193710
+sol_193725
+sol_193740
+sol_193755
+sol_193770
+sol_193785
+sol_193800
+sol_193815
+sol_193830
+sol_193845
+sol_193860
+sol_193875
+sol_193890
+sol_193905
+sol_193920
+sol_193935
+sol_193950
+sol_193965
+sol_193980
+sol_193995
+sol_194010
+sol_194025
+sol_194040
+sol_194055
+sol_194070
+sol_194085
+sol_194100
+sol_194700
+sol_194715
+sol_194730
+sol_194745
+sol_194760
+sol_194775
+sol_194790
+sol_194805
+sol_194820
+sol_194835
+sol_194850
+sol_194865
+sol_194880
+sol_194895
+sol_194910
+sol_194925
+sol_194940
+sol_194955
+sol_194970
+sol_194985
+sol_195000
+sol_195015
+sol_195030
+sol_195045
+sol_195060
+sol_195075
+sol_195090
+sol_195105
+sol_195120
+sol_195135
+sol_195150
+sol_195165
+sol_195180
+sol_195195
+sol_195210
+sol_195225
+sol_195240
+sol_195255
+sol_195270
+sol_195285
+sol_195300
+sol_195315
+sol_195330
+sol_195345
+sol_195360
+sol_195375
+sol_195390
+sol_195405
+sol_195420
+sol_195435
+sol_195450
+sol_195465
+sol_195480
+sol_195495
+sol_195510
+sol_195525
+sol_195540
+sol_196125
+sol_196140
+sol_196155
+sol_196170
+sol_196185
+sol_196200
+sol_196215
+sol_196230
+sol_196245
+sol_196260
+sol_196275
+sol_196290
+sol_196305
+sol_196320
+sol_196335
+sol_196350
+sol_196365
+sol_196380
+sol_196395
+sol_196410
+sol_196425
+sol_196440
+sol_196455
+sol_196470
+sol_196485
+sol_196500
+sol_196515
+sol_196530
+sol_196545
+sol_196560
+sol_196575
+sol_196590
+sol_196605
+sol_196620
+sol_196635
+sol_196650
+sol_196665
+sol_196680
+sol_196695
+sol_196710
+sol_196725
+sol_196740
+sol_196755
+sol_196770
+sol_196785
+sol_196800
+sol_196815
+sol_196830
+sol_196845
+sol_196860
+sol_196875
+sol_196890
+sol_196905
+sol_196920
+sol_196935
+sol_196950
+sol_196965
+sol_196980
+sol_197565
+sol_197580
+sol_197595
+sol_197610
+sol_197625
+sol_197640
+sol_197655
+sol_197670
+sol_197685
+sol_197700
+sol_197715
+sol_197730
+sol_197745
+sol_197760
+sol_197775
+sol_197790
+sol_197805
+sol_197820
+sol_197835
+sol_197850
+sol_197865
+sol_197880
+sol_197895
+sol_197910
+sol_197925
+sol_197940
+sol_197955
+sol_197970
+sol_197985
+sol_198000
+sol_198015
+sol_198030
+sol_198045
+sol_198060
+sol_198075
+sol_198090
+sol_198105
+sol_198120
+sol_198135
+sol_198150
+sol_198165
+sol_198180
+sol_198195
+sol_198210
+sol_198225
+sol_198240
+sol_198255
+sol_198270
+sol_198285
+sol_198300
+sol_198315
+sol_198330
+sol_198345
+sol_198360
+sol_198375
+sol_198390
+sol_198405
+sol_198420
+sol_199005
+sol_199020
+sol_199035
+sol_199050
+sol_199065
+sol_199080
+sol_199095
+sol_199110
+sol_199125
+sol_199140
+sol_199155
+sol_199170
+sol_199185
+sol_199200
+sol_199215
+sol_199230
+sol_199245
+sol_199260
+sol_199275
+sol_199290
+sol_199305
+sol_199320
+sol_199335
+sol_199350
+sol_199365
+sol_199380
+sol_199395
+sol_199410
+sol_199425
+sol_199440
+sol_199455
+sol_199470
+sol_199485
+sol_199500
+sol_199515
+sol_199530
+sol_199545
+sol_199560
+sol_199575
+sol_199590
+sol_199605
+sol_199620
+sol_199635
+sol_199650
+sol_199665
+sol_199680
+sol_199695
+sol_199710
+sol_199725
+sol_199740
+sol_199755
+sol_199770
+sol_199785
+sol_199800
+sol_199815
+sol_199830
+sol_199845
+sol_199860
+sol_200445
+sol_200460
+sol_200475
+sol_200490
+sol_200505
+sol_200520
+sol_200535
+sol_200550
+sol_200565
+sol_200580
+sol_200595
+sol_200610
+sol_200625
+sol_200640
+sol_200655
+sol_200670
+sol_200685
+sol_200700
+sol_200715
+sol_200730
+sol_200745
+sol_200760
+sol_200775
+sol_200790
+sol_200805
+sol_200820
+sol_200835
+sol_200850
+sol_200865
+sol_200880
+sol_200895
+sol_200910
+sol_200925
+sol_200940
+sol_200955
+sol_200970
+sol_200985
+sol_201000
+sol_201015
+sol_201030
+sol_201045
+sol_201060
+sol_201075
+sol_201090
+sol_201105
+sol_201120
+sol_201135
+sol_201150
+sol_201165
+sol_201180
+sol_201195
+sol_201210
+sol_201225
+sol_201240
+sol_201255
+sol_201270
+sol_201285
+sol_201300
+sol_201885
+sol_201900
+sol_201915
+sol_201930
+sol_201945
+sol_201960
+sol_201975
+sol_201990
+sol_202005
+sol_202020
+sol_202035
+sol_202050
+sol_202065
+sol_202080
+sol_202095
+sol_202110
+sol_202125
+sol_202140
+sol_202155
+sol_202170
+sol_202185
+sol_202200
+sol_202215
+sol_202230
+sol_202245
+sol_202260
+sol_202275
+sol_202290
+sol_202305
+sol_202320
+sol_202335
+sol_202350
+sol_202365
+sol_202380
+sol_202395
+sol_202410
+sol_202425
+sol_202440
+sol_202455
+sol_202470
+sol_202485
+sol_202500
+sol_202515
+sol_202530
+sol_202545
+sol_202560
+sol_202575
+sol_202590
+sol_202605
+sol_202620
+sol_202635
+sol_202650
+sol_202665
+sol_202680
+sol_202695
+sol_202710
+sol_202725
+sol_202740
+sol_203325
+sol_203340
+sol_203355
+sol_203370
+sol_203385
+sol_203400
+sol_203415
+sol_203430
+sol_203445
+sol_203460
+sol_203475
+sol_203490
+sol_203505
+sol_203520
+sol_203535
+sol_203550
+sol_203565
+sol_203580
+sol_203595
+sol_203610
+sol_203625
+sol_203640
+sol_203655
+sol_203670
+sol_203685
+sol_203700
+sol_203715
+sol_203730
+sol_203745
+sol_203760
+sol_203775
+sol_203790
+sol_203805
+sol_203820
+sol_203835
+sol_203850
+sol_203865
+sol_203880
+sol_203895
+sol_203910
+sol_203925
+sol_203940
+sol_203955
+sol_203970
+sol_203985
+sol_204000
+sol_204015
+sol_204030
+sol_204045
+sol_204060
+sol_204075
+sol_204090
+sol_204105
+sol_204120
+sol_204135
+sol_204150
+sol_204165
+sol_204180
+sol_204765
+sol_204780
+sol_204795
+sol_204810
+sol_204825
+sol_204840
+sol_204855
+sol_204870
+sol_204885
+sol_204900
+sol_204915
+sol_204930
+sol_204945
+sol_204960
+sol_204975
+sol_204990
+sol_205005
+sol_205020
+sol_205035
+sol_205050
+sol_205065
+sol_205080
+sol_205095
+sol_205110
+sol_205125
+sol_205140
+sol_205155
+sol_205170
+sol_205185
+sol_205200
+sol_205215
+sol_205230
+sol_205245
+sol_205260
+sol_205275
+sol_205290
+sol_205305
+sol_205320
+sol_205335
+sol_205350
+sol_205365
+sol_205380
+sol_205395
+sol_205410
+sol_205425
+sol_205440
+sol_205455
+sol_205470
+sol_205485
+sol_205500
+sol_205515
+sol_205530
+sol_205545
+sol_205560
+sol_205575
+sol_205590
+sol_205605
+sol_205620
+sol_206205
+sol_206220
+sol_206235
+sol_206250
+sol_206265
+sol_206280
+sol_206295
+sol_206310
+sol_206325
+sol_206340
+sol_206355
+sol_206370
+sol_206385
+sol_206400
+sol_206415
+sol_206430
+sol_206445
+sol_206460
+sol_206475
+sol_206490
+sol_206505
+sol_206520
+sol_206535
+sol_206550
+sol_206565
+sol_206580
+sol_206595
+sol_206610
+sol_206625
+sol_206640
+sol_206655
+sol_206670
+sol_206685
+sol_206700
+sol_206715
+sol_206730
+sol_206745
+sol_206760
+sol_206775
+sol_206790
+sol_206805
+sol_206820
+sol_206835
+sol_206850
+sol_206865
+sol_206880
+sol_206895
+sol_206910
+sol_206925
+sol_206940
+sol_206955
+sol_206970
+sol_206985
+sol_207000
+sol_207015
+sol_207030
+sol_207045
+sol_207060
+sol_207645
+sol_207660
+sol_207675
+sol_207690
+sol_207705
+sol_207720
+sol_207735
+sol_207750
+sol_207765
+sol_207780
+sol_207795
+sol_207810
+sol_207825
+sol_207840
+sol_207855
+sol_207870
+sol_207885
+sol_207900
+sol_207915
+sol_207930
+sol_207945
+sol_207960
+sol_207975
+sol_207990
+sol_208005
+sol_208020
+sol_208035
+sol_208050
+sol_208065
+sol_208080
+sol_208095
+sol_208110
+sol_208125
+sol_208140
+sol_208155
+sol_208170
+sol_208185
+sol_208200
+sol_208215
+sol_208230
+sol_208245
+sol_208260
+sol_208275
+sol_208290
+sol_208305
+sol_208320
+sol_208335
+sol_208350
+sol_208365
+sol_208380
+sol_208395
+sol_208410
+sol_208425
+sol_208440
+sol_208455
+sol_208470
+sol_208485
+sol_208500
+sol_209085
+sol_209100
+sol_209115
+sol_209130
+sol_209145
+sol_209160
+sol_209175
+sol_209190
+sol_209205
+sol_209220
+sol_209235
+sol_209250
+sol_209265
+sol_209280
+sol_209295
+sol_209310
+sol_209325
+sol_209340
+sol_209355
+sol_209370
+sol_209385
+sol_209400
+sol_209415
+sol_209430
+sol_209445
+sol_209460
+sol_209475
+sol_209490
+sol_209505
+sol_209520
+sol_209535
+sol_209550
+sol_209565
+sol_209580
+sol_209595
+sol_209610
+sol_209625
+sol_209640
+sol_209655
+sol_209670
+sol_209685
+sol_209700
+sol_209715
+sol_209730
+sol_209745
+sol_209760
+sol_209775
+sol_209790
+sol_209805
+sol_209820
+sol_209835
+sol_209850
+sol_209865
+sol_209880
+sol_209895
+sol_209910
+sol_209925
+sol_209940
+sol_209955
+sol_210525
+sol_210540
+sol_210555
+sol_210570
+sol_210585
+sol_210600
+sol_210615
+sol_210630
+sol_210645
+sol_210660
+sol_210675
+sol_210690
+sol_210705
+sol_210720
+sol_210735
+sol_210750
+sol_210765
+sol_210780
+sol_210795
+sol_210810
+sol_210825
+sol_210840
+sol_210855
+sol_210870
+sol_210885
+sol_210900
+sol_210915
+sol_210930
+sol_210945
+sol_210960
+sol_210975
+sol_210990
+sol_211005
+sol_211020
+sol_211035
+sol_211050
+sol_211065
+sol_211080
+sol_211095
+sol_211110
+sol_211125
+sol_211140
+sol_211155
+sol_211170
+sol_211185
+sol_211200
+sol_211215
+sol_211230
+sol_211245
+sol_211260
+sol_211275
+sol_211290
+sol_211305
+sol_211320
+sol_211335
+sol_211350
+sol_211365
+sol_211380
+sol_211395
+sol_211965
+sol_211980
+sol_211995
+sol_212010
+sol_212025
+sol_212040
+sol_212055
+sol_212070
+sol_212085
+sol_212100
+sol_212115
+sol_212130
+sol_212145
+sol_212160
+sol_212175
+sol_212190
+sol_212205
+sol_212220
+sol_212235
+sol_212250
+sol_212265
+sol_212280
+sol_212295
+sol_212310
+sol_212325
+sol_212340
+sol_212355
+sol_212370
+sol_212385
+sol_212400
+sol_212415
+sol_212430
+sol_212445
+sol_212460
+sol_212475
+sol_212490
+sol_212505
+sol_212520
+sol_212535
+sol_212550
+sol_212565
+sol_212580
+sol_212595
+sol_212610
+sol_212625
+sol_212640
+sol_212655
+sol_212670
+sol_212685
+sol_212700
+sol_212715
+sol_212730
+sol_212745
+sol_212760
+sol_212775
+sol_212790
+sol_212805
+sol_212820
+sol_212835
+sol_213405
+sol_213420
+sol_213435
+sol_213450
+sol_213465
+sol_213480
+sol_213495
+sol_213510
+sol_213525
+sol_213540
+sol_213555
+sol_213570
+sol_213585
+sol_213600
+sol_213615
+sol_213630
+sol_213645
+sol_213660
+sol_213675
+sol_213690
+sol_213705
+sol_213720
+sol_213735
+sol_213750
+sol_213765
+sol_213780
+sol_213795
+sol_213810
+sol_213825
+sol_213840
+sol_213855
+sol_213870
+sol_213885
+sol_213900
+sol_213915
+sol_213930
+sol_213945
+sol_213960
+sol_213975
+sol_213990
+sol_214005
+sol_214020
+sol_214035
+sol_214050
+sol_214065
+sol_214080
+sol_214095
+sol_214110
+sol_214125
+sol_214140
+sol_214155
+sol_214170
+sol_214185
+sol_214200
+sol_214215
+sol_214230
+sol_214245
+sol_214260
+sol_214275
+sol_214845
+sol_214860
+sol_214875
+sol_214890
+sol_214905
+sol_214920
+sol_214935
+sol_214950
+sol_214965
+sol_214980
+sol_214995
+sol_215010
+sol_215025
+sol_215040
+sol_215055
+sol_215070
+sol_215085
+sol_215100
+sol_215115
+sol_215130
+sol_215145
+sol_215160
+sol_215175
+sol_215190
+sol_215205
+sol_215220
+sol_215235
+sol_215250
+sol_215265
+sol_215280
+sol_215295
+sol_215310
+sol_215325
+sol_215340
+sol_215355
+sol_215370
+sol_215385
+sol_215400
+sol_215415
+sol_215430
+sol_215445
+sol_215460
+sol_215475
+sol_215490
+sol_215505
+sol_215520
+sol_215535
+sol_215550
+sol_215565
+sol_215580
+sol_215595
+sol_215610
+sol_215625
+sol_215640
+sol_215655
+sol_215670
+sol_215685
+sol_215700
+sol_215715
+sol_216285
+sol_216300
+sol_216315
+sol_216330
+sol_216345
+sol_216360
+sol_216375
+sol_216390
+sol_216405
+sol_216420
+sol_216435
+sol_216450
+sol_216465
+sol_216480
+sol_216495
+sol_216510
+sol_216525
+sol_216540
+sol_216555
+sol_216570
+sol_216585
+sol_216600
+sol_216615
+sol_216630
+sol_216645
+sol_216660
+sol_216675
+sol_216690
+sol_216705
+sol_216720
+sol_216735
+sol_216750
+sol_216765
+sol_216780
+sol_216795
+sol_216810
+sol_216825
+sol_216840
+sol_216855
+sol_216870
+sol_216885
+sol_216900
+sol_216915
+sol_216930
+sol_216945
+sol_216960
+sol_216975
+sol_216990
+sol_217005
+sol_217020
+sol_217035
+sol_217050
+sol_217065
+sol_217080
+sol_217095
+sol_217110
+sol_217125
+sol_217140
+sol_217155
+sol_217725
+sol_217740
+sol_217755
+sol_217770
+sol_217785
+sol_217800
+sol_217815
+sol_217830
+sol_217845
+sol_217860
+sol_217875
+sol_217890
+sol_217905
+sol_217920
+sol_217935
+sol_217950
+sol_217965
+sol_217980
+sol_217995
+sol_218010
+sol_218025
+sol_218040
+sol_218055
+sol_218070
+sol_218085
+sol_218100
+sol_218115
+sol_218130
+sol_218145
+sol_218160
+sol_218175
+sol_218190
+sol_218205
+sol_218220
+sol_218235
+sol_218250
+sol_218265
+sol_218280
+sol_218295
+sol_218310
+sol_218325
+sol_218340
+sol_218355
+sol_218370
+sol_218385
+sol_218400
+sol_218415
+sol_218430
+sol_218445
+sol_218460
+sol_218475
+sol_218490
+sol_218505
+sol_218520
+sol_218535
+sol_218550
+sol_218565
+sol_218580
+sol_218595
+sol_219165
+sol_219180
+sol_219195
+sol_219210
+sol_219225
+sol_219240
+sol_219255
+sol_219270
+sol_219285
+sol_219300
+sol_219315
+sol_219330
+sol_219345
+sol_219360
+sol_219375
+sol_219390
+sol_219405
+sol_219420
+sol_219435
+sol_219450
+sol_219465
+sol_219480
+sol_219495
+sol_219510
+sol_219525
+sol_219540
+sol_219555
+sol_219570
+sol_219585
+sol_219600
+sol_219615
+sol_219630
+sol_219645
+sol_219660
+sol_219675
+sol_219690
+sol_219705
+sol_219720
+sol_219735
+sol_219750
+sol_219765
+sol_219780
+sol_219795
+sol_219810
+sol_219825
+sol_219840
+sol_219855
+sol_219870
+sol_219885
+sol_219900
+sol_219915
+sol_219930
+sol_219945
+sol_219960
+sol_219975
+sol_219990
+sol_220005
+sol_220020
+sol_220035
+sol_220605
+sol_220620
+sol_220635
+sol_220650
+sol_220665
+sol_220680
+sol_220695
+sol_220710
+sol_220725
+sol_220740
+sol_220755
+sol_220770
+sol_220785
+sol_220800
+sol_220815
+sol_220830
+sol_220845
+sol_220860
+sol_220875
+sol_220890
+sol_220905
+sol_220920
+sol_220935
+sol_220950
+sol_220965
+sol_220980
+sol_220995
+sol_221010
+sol_221025
+sol_221040
+sol_221055
+sol_221070
+sol_221085
+sol_221100
+sol_221115
+sol_221130
+sol_221145
+sol_221160
+sol_221175
+sol_221190
+sol_221205
+sol_221220
+sol_221235
+sol_221250
+sol_221265
+sol_221280
+sol_221295
+sol_221310
+sol_221325
+sol_221340
+sol_221355
+sol_221370
+sol_221385
+sol_221400
+sol_221415
+sol_221430
+sol_221445
+sol_221460
+sol_221475
+sol_222045
+sol_222060
+sol_222075
+sol_222090
+sol_222105
+sol_222120
+sol_222135
+sol_222150
+sol_222165
+sol_222180
+sol_222195
+sol_222210
+sol_222225
+sol_222240
+sol_222255
+sol_222270
+sol_222285
+sol_222300
+sol_222315
+sol_222330
+sol_222345
+sol_222360
+sol_222375
+sol_222390
+sol_222405
+sol_222420
+sol_222435
+sol_222450
+sol_222465
+sol_222480
+sol_222495
+sol_222510
+sol_222525
+sol_222540
+sol_222555
+sol_222570
+sol_222585
+sol_222600
+sol_222615
+sol_222630
+sol_222645
+sol_222660
+sol_222675
+sol_222690
+sol_222705
+sol_222720
+sol_222735
+sol_222750
+sol_222765
+sol_222780
+sol_222795
+sol_222810
+sol_222825
+sol_222840
+sol_222855
+sol_222870
+sol_222885
+sol_222900
+sol_222915
+sol_223485
+sol_223500
+sol_223515
+sol_223530
+sol_223545
+sol_223560
+sol_223575
+sol_223590
+sol_223605
+sol_223620
+sol_223635
+sol_223650
+sol_223665
+sol_223680
+sol_223695
+sol_223710
+sol_223725
+sol_223740
+sol_223755
+sol_223770
+sol_223785
+sol_223800
+sol_223815
+sol_223830
+sol_223845
+sol_223860
+sol_223875
+sol_223890
+sol_223905
+sol_223920
+sol_223935
+sol_223950
+sol_223965
+sol_223980
+sol_223995
+sol_224010
+sol_224025
+sol_224040
+sol_224055
+sol_224070
+sol_224085
+sol_224100
+sol_224115
+sol_224130
+sol_224145
+sol_224160
+sol_224175
+sol_224190
+sol_224205
+sol_224220
+sol_224235
+sol_224250
+sol_224265
+sol_224280
+sol_224295
+sol_224310
+sol_224325
+sol_224340
+sol_224355
+sol_224925
+sol_224940
+sol_224955
+sol_224970
+sol_224985
+sol_225000
+sol_225015
+sol_225030
+sol_225045
+sol_225060
+sol_225075
+sol_225090
+sol_225105
+sol_225120
+sol_225135
+sol_225150
+sol_225165
+sol_225180
+sol_225195
+sol_225210
+sol_225225
+sol_225240
+sol_225255
+sol_225270
+sol_225285
+sol_225300
+sol_225315
+sol_225330
+sol_225345
+sol_225360
+sol_225375
+sol_225390
+sol_225405
+sol_225420
+sol_225435
+sol_225450
+sol_225465
+sol_225480
+sol_225495
+sol_225510
+sol_225525
+sol_225540
+sol_225555
+sol_225570
+sol_225585
+sol_225600
+sol_225615
+sol_225630
+sol_225645
+sol_225660
+sol_225675
+sol_225690
+sol_225705
+sol_225720
+sol_225735
+sol_225750
+sol_225765
+sol_225780
+sol_225795
+sol_226365
+sol_226380
+sol_226395
+sol_226410
+sol_226425
+sol_226440
+sol_226455
+sol_226470
+sol_226485
+sol_226500
+sol_226515
+sol_226530
+sol_226545
+sol_226560
+sol_226575
+sol_226590
+sol_226605
+sol_226620
+sol_226635
+sol_226650
+sol_226665
+sol_226680
+sol_226695
+sol_226710
+sol_226725
+sol_226740
+sol_226755
+sol_226770
+sol_226785
+sol_226800
+sol_226815
+sol_226830
+sol_226845
+sol_226860
+sol_226875
+sol_226890
+sol_226905
+sol_226920
+sol_226935
+sol_226950
+sol_226965
+sol_226980
+sol_226995
+sol_227010
+sol_227025
+sol_227040
+sol_227055
+sol_227070
+sol_227085
+sol_227100
+sol_227115
+sol_227130
+sol_227145
+sol_227160
+sol_227175
+sol_227190
+sol_227205
+sol_227220
+sol_227235
+sol_227805
+sol_227820
+sol_227835
+sol_227850
+sol_227865
+sol_227880
+sol_227895
+sol_227910
+sol_227925
+sol_227940
+sol_227955
+sol_227970
+sol_227985
+sol_228000
+sol_228015
+sol_228030
+sol_228045
+sol_228060
+sol_228075
+sol_228090
+sol_228105
+sol_228120
+sol_228135
+sol_228150
+sol_228165
+sol_228180
+sol_228195
+sol_228210
+sol_228225
+sol_228240
+sol_228255
+sol_228270
+sol_228285
+sol_228300
+sol_228315
+sol_228330
+sol_228345
+sol_228360
+sol_228375
+sol_228390
+sol_228405
+sol_228420
+sol_228435
+sol_228450
+sol_228465
+sol_228480
+sol_228495
+sol_228510
+sol_228525
+sol_228540
+sol_228555
+sol_228570
+sol_228585
+sol_228600
+sol_228615
+sol_228630
+sol_228645
+sol_228660
+sol_228675
+sol_229245
+sol_229260
+sol_229275
+sol_229290
+sol_229305
+sol_229320
+sol_229335
+sol_229350
+sol_229365
+sol_229380
+sol_229395
+sol_229410
+sol_229425
+sol_229440
+sol_229455
+sol_229470
+sol_229485
+sol_229500
+sol_229515
+sol_229530
+sol_229545
+sol_229560
+sol_229575
+sol_229590
+sol_229605
+sol_229620
+sol_229635
+sol_229650
+sol_229665
+sol_229680
+sol_229695
+sol_229710
+sol_229725
+sol_229740
+sol_229755
+sol_229770
+sol_229785
+sol_229800
+sol_229815
+sol_229830
+sol_229845
+sol_229860
+sol_229875
+sol_229890
+sol_229905
+sol_229920
+sol_229935
+sol_229950
+sol_229965
+sol_229980
+sol_229995
+sol_230010
+sol_230025
+sol_230040
+sol_230055
+sol_230070
+sol_230085
+sol_230100
+sol_230115
+sol_230685
+sol_230700
+sol_230715
+sol_230730
+sol_230745
+sol_230760
+sol_230775
+sol_230790
+sol_230805
+sol_230820
+sol_230835
+sol_230850
+sol_230865
+sol_230880
+sol_230895
+sol_230910
+sol_230925
+sol_230940
+sol_230955
+sol_230970
+sol_230985
+sol_231000
+sol_231015
+sol_231030
+sol_231045
+sol_231060
+sol_231075
+sol_231090
+sol_231105
+sol_231120
+sol_231135
+sol_231150
+sol_231165
+sol_231180
+sol_231195
+sol_231210
+sol_231225
+sol_231240
+sol_231255
+sol_231270
+sol_231285
+sol_231300
+sol_231315
+sol_231330
+sol_231345
+sol_231360
+sol_231375
+sol_231390
+sol_231405
+sol_231420
+sol_231435
+sol_231450
+sol_231465
+sol_231480
+sol_231495
+sol_231510
+sol_231525
+sol_231540
+sol_231555
+sol_232125
+sol_232140
+sol_232155
+sol_232170
+sol_232185
+sol_232200
+sol_232215
+sol_232230
+sol_232245
+sol_232260
+sol_232275
+sol_232290
+sol_232305
+sol_232320
+sol_232335
+sol_232350
+sol_232365
+sol_232380
+sol_232395
+sol_232410
+sol_232425
+sol_232440
+sol_232455
+sol_232470
+sol_232485
+sol_232500
+sol_232515
+sol_232530
+sol_232545
+sol_232560
+sol_232575
+sol_232590
+sol_232605
+sol_232620
+sol_232635
+sol_232650
+sol_232665
+sol_232680
+sol_232695
+sol_232710
+sol_232725
+sol_232740
+sol_232755
+sol_232770
+sol_232785
+sol_232800
+sol_232815
+sol_232830
+sol_232845
+sol_232860
+sol_232875
+sol_232890
+sol_232905
+sol_232920
+sol_232935
+sol_232950
+sol_232965
+sol_232980
+sol_232995
+sol_233565
+sol_233580
+sol_233595
+sol_233610
+sol_233625
+sol_233640
+sol_233655
+sol_233670
+sol_233685
+sol_233700
+sol_233715
+sol_233730
+sol_233745
+sol_233760
+sol_233775
+sol_233790
+sol_233805
+sol_233820
+sol_233835
+sol_233850
+sol_233865
+sol_233880
+sol_233895
+sol_233910
+sol_233925
+sol_233940
+sol_233955
+sol_233970
+sol_233985
+sol_234000
+sol_234015
+sol_234030
+sol_234045
+sol_234060
+sol_234075
+sol_234090
+sol_234105
+sol_234120
+sol_234135
+sol_234150
+sol_234165
+sol_234180
+sol_234195
+sol_234210
+sol_234225
+sol_234240
+sol_234255
+sol_234270
+sol_234285
+sol_234300
+sol_234315
+sol_234330
+sol_234345
+sol_234360
+sol_234375
+sol_234390
+sol_234405
+sol_234420
+sol_234435
+sol_235005
+sol_235020
+sol_235035
+sol_235050
+sol_235065
+sol_235080
+sol_235095
+sol_235110
+sol_235125
+sol_235140
+sol_235155
+sol_235170
+sol_235185
+sol_235200
+sol_235215
+sol_235230
+sol_235245
+sol_235260
+sol_235275
+sol_235290
+sol_235305
+sol_235320
+sol_235335
+sol_235350
+sol_235365
+sol_235380
+sol_235395
+sol_235410
+sol_235425
+sol_235440
+sol_235455
+sol_235470
+sol_235485
+sol_235500
+sol_235515
+sol_235530
+sol_235545
+sol_235560
+sol_235575
+sol_235590
+sol_235605
+sol_235620
+sol_235635
+sol_235650
+sol_235665
+sol_235680
+sol_235695
+sol_235710
+sol_235725
+sol_235740
+sol_235755
+sol_235770
+sol_235785
+sol_235800
+sol_235815
+sol_235830
+sol_235845
+sol_235860
+sol_235875
+sol_236445
+sol_236460
+sol_236475
+sol_236490
+sol_236505
+sol_236520
+sol_236535
+sol_236550
+sol_236565
+sol_236580
+sol_236595
+sol_236610
+sol_236625
+sol_236640
+sol_236655
+sol_236670
+sol_236685
+sol_236700
+sol_236715
+sol_236730
+sol_236745
+sol_236760
+sol_236775
+sol_236790
+sol_236805
+sol_236820
+sol_236835
+sol_236850
+sol_236865
+sol_236880
+sol_236895
+sol_236910
+sol_236925
+sol_236940
+sol_236955
+sol_236970
+sol_236985
+sol_237000
+sol_237015
+sol_237030
+sol_237045
+sol_237060
+sol_237075
+sol_237090
+sol_237105
+sol_237120
+sol_237135
+sol_237150
+sol_237165
+sol_237180
+sol_237195
+sol_237210
+sol_237225
+sol_237240
+sol_237255
+sol_237270
+sol_237285
+sol_237300
+sol_237315
+sol_237885
+sol_237900
+sol_237915
+sol_237930
+sol_237945
+sol_237960
+sol_237975
+sol_237990
+sol_238005
+sol_238020
+sol_238035
+sol_238050
+sol_238065
+sol_238080
+sol_238095
+sol_238110
+sol_238125
+sol_238140
+sol_238155
+sol_238170
+sol_238185
+sol_238200
+sol_238215
+sol_238230
+sol_238245
+sol_238260
+sol_238275
+sol_238290
+sol_238305
+sol_238320
+sol_238335
+sol_238350
+sol_238365
+sol_238380
+sol_238395
+sol_238410
+sol_238425
+sol_238440
+sol_238455
+sol_238470
+sol_238485
+sol_238500
+sol_238515
+sol_238530
+sol_238545
+sol_238560
+sol_238575
+sol_238590
+sol_238605
+sol_238620
+sol_238635
+sol_238650
+sol_238665
+sol_238680
+sol_238695
+sol_238710
+sol_238725
+sol_238740
+sol_238755
+sol_239325
+sol_239340
+sol_239355
+sol_239370
+sol_239385
+sol_239400
+sol_239415
+sol_239430
+sol_239445
+sol_239460
+sol_239475
+sol_239490
+sol_239505
+sol_239520
+sol_239535
+sol_239550
+sol_239565
+sol_239580
+sol_239595
+sol_239610
+sol_239625
+sol_239640
+sol_239655
+sol_239670
+sol_239685
+sol_239700
+sol_239715
+sol_239730
+sol_239745
+sol_239760
+sol_239775
+sol_239790
+sol_239805
+sol_239820
+sol_239835
+sol_239850
+sol_239865
+sol_239880
+sol_239895
+sol_239910
+sol_239925
+sol_239940
+sol_239955
+sol_239970
+sol_239985
+sol_240000
+sol_240015
+sol_240030
+sol_240045
+sol_240060
+sol_240075
+sol_240090
+sol_240105
+sol_240120
+sol_240135
+sol_240150
+sol_240165
+sol_240180
+sol_240195
+sol_240765
+sol_240780
+sol_240795
+sol_240810
+sol_240825
+sol_240840
+sol_240855
+sol_240870
+sol_240885
+sol_240900
+sol_240915
+sol_240930
+sol_240945
+sol_240960
+sol_240975
+sol_240990
+sol_241005
+sol_241020
+sol_241035
+sol_241050
+sol_241065
+sol_241080
+sol_241095
+sol_241110
+sol_241125
+sol_241140
+sol_241155
+sol_241170
+sol_241185
+sol_241200
+sol_241215
+sol_241230
+sol_241245
+sol_241260
+sol_241275
+sol_241290
+sol_241305
+sol_241320
+sol_241335
+sol_241350
+sol_241365
+sol_241380
+sol_241395
+sol_241410
+sol_241425
+sol_241440
+sol_241455
+sol_241470
+sol_241485
+sol_241500
+sol_241515
+sol_241530
+sol_241545
+sol_241560
+sol_241575
+sol_241590
+sol_241605
+sol_241620
+sol_241635
+sol_242205
+sol_242220
+sol_242235
+sol_242250
+sol_242265
+sol_242280
+sol_242295
+sol_242310
+sol_242325
+sol_242340
+sol_242355
+sol_242370
+sol_242385
+sol_242400
+sol_242415
+sol_242430
+sol_242445
+sol_242460
+sol_242475
+sol_242490
+sol_242505
+sol_242520
+sol_242535
+sol_242550
+sol_242565
+sol_242580
+sol_242595
+sol_242610
+sol_242625
+sol_242640
+sol_242655
+sol_242670
+sol_242685
+sol_242700
+sol_242715
+sol_242730
+sol_242745
+sol_242760
+sol_242775
+sol_242790
+sol_242805
+sol_242820
+sol_242835
+sol_242850
+sol_242865
+sol_242880
+sol_242895
+sol_242910
+sol_242925
+sol_242940
+sol_242955
+sol_242970
+sol_242985
+sol_243000
+sol_243015
+sol_243030
+sol_243045
+sol_243060
+sol_243075
+sol_243645
+sol_243660
+sol_243675
+sol_243690
+sol_243705
+sol_243720
+sol_243735
+sol_243750
+sol_243765
+sol_243780
+sol_243795
+sol_243810
+sol_243825
+sol_243840
+sol_243855
+sol_243870
+sol_243885
+sol_243900
+sol_243915
+sol_243930
+sol_243945
+sol_243960
+sol_243975
+sol_243990
+sol_244005
+sol_244020
+sol_244035
+sol_244050
+sol_244065
+sol_244080
+sol_244095
+sol_244110
+sol_244125
+sol_244140
+sol_244155
+sol_244170
+sol_244185
+sol_244200
+sol_244215
+sol_244230
+sol_244245
+sol_244260
+sol_244275
+sol_244290
+sol_244305
+sol_244320
+sol_244335
+sol_244350
+sol_244365
+sol_244380
+sol_244395
+sol_244410
+sol_244425
+sol_244440
+sol_244455
+sol_244470
+sol_244485
+sol_244500
+sol_244515
+sol_245085
+sol_245100
+sol_245115
+sol_245130
+sol_245145
+sol_245160
+sol_245175
+sol_245190
+sol_245205
+sol_245220
+sol_245235
+sol_245250
+sol_245265
+sol_245280
+sol_245295
+sol_245310
+sol_245325
+sol_245340
+sol_245355
+sol_245370
+sol_245385
+sol_245400
+sol_245415
+sol_245430
+sol_245445
+sol_245460
+sol_245475
+sol_245490
+sol_245505
+sol_245520
+sol_245535
+sol_245550
+sol_245565
+sol_245580
+sol_245595
+sol_245610
+sol_245625
+sol_245640
+sol_245655
+sol_245670
+sol_245685
+sol_245700
+sol_245715
+sol_245730
+sol_245745
+sol_245760
+sol_245775
+sol_245790
+sol_245805
+sol_245820
+sol_245835
+sol_245850
+sol_245865
+sol_245880
+sol_245895
+sol_245910
+sol_245925
+sol_245940
+sol_245955
+sol_246525
+sol_246540
+sol_246555
+sol_246570
+sol_246585
+sol_246600
+sol_246615
+sol_246630
+sol_246645
+sol_246660
+sol_246675
+sol_246690
+sol_246705
+sol_246720
+sol_246735
+sol_246750
+sol_246765
+sol_246780
+sol_246795
+sol_246810
+sol_246825
+sol_246840
+sol_246855
+sol_246870
+sol_246885
+sol_246900
+sol_246915
+sol_246930
+sol_246945
+sol_246960
+sol_246975
+sol_246990
+sol_247005
+sol_247020
+sol_247035
+sol_247050
+sol_247065
+sol_247080
+sol_247095
+sol_247110
+sol_247125
+sol_247140
+sol_247155
+sol_247170
+sol_247185
+sol_247200
+sol_247215
+sol_247230
+sol_247245
+sol_247260
+sol_247275
+sol_247290
+sol_247305
+sol_247320
+sol_247335
+sol_247350
+sol_247365
+sol_247380
+sol_247395
+sol_247965
+sol_247980
+sol_247995
+sol_248010
+sol_248025
+sol_248040
+sol_248055
+sol_248070
+sol_248085
+sol_248100
+sol_248115
+sol_248130
+sol_248145
+sol_248160
+sol_248175
+sol_248190
+sol_248205
+sol_248220
+sol_248235
+sol_248250
+sol_248265
+sol_248280
+sol_248295
+sol_248310
+sol_248325
+sol_248340
+sol_248355
+sol_248370
+sol_248385
+sol_248400
+sol_248415
+sol_248430
+sol_248445
+sol_248460
+sol_248475
+sol_248490
+sol_248505
+sol_248520
+sol_248535
+sol_248550
+sol_248565
+sol_248580
+sol_248595
+sol_248610
+sol_248625
+sol_248640
+sol_248655
+sol_248670
+sol_248685
+sol_248700
+sol_248715
+sol_248730
+sol_248745
+sol_248760
+sol_248775
+sol_248790
+sol_248805
+sol_248820
+sol_248835
+sol_249405
+sol_249420
+sol_249435
+sol_249450
+sol_249465
+sol_249480
+sol_249495
+sol_249510
+sol_249525
+sol_249540
+sol_249555
+sol_249570
+sol_249585
+sol_249600
+sol_249615
+sol_249630
+sol_249645
+sol_249660
+sol_249675
+sol_249690
+sol_249705
+sol_249720
+sol_249735
+sol_249750
+sol_249765
+sol_249780
+sol_249795
+sol_249810
+sol_249825
+sol_249840
+sol_249855
+sol_249870
+sol_249885
+sol_249900
+sol_249915
+sol_249930
+sol_249945
+sol_249960
+sol_249975
+sol_249990
+sol_250005
+sol_250020
+sol_250035
+sol_250050
+sol_250065
+sol_250080
+sol_250095
+sol_250110
+sol_250125
+sol_250140
+sol_250155
+sol_250170
+sol_250185
+sol_250200
+sol_250215
+sol_250230
+sol_250245
+sol_250260
+sol_250275
+sol_250845
+sol_250860
+sol_250875
+sol_250890
+sol_250905
+sol_250920
+sol_250935
+sol_250950
+sol_250965
+sol_250980
+sol_250995
+sol_251010
+sol_251025
+sol_251040
+sol_251055
+sol_251070
+sol_251085
+sol_251100
+sol_251115
+sol_251130
+sol_251145
+sol_251160
+sol_251175
+sol_251190
+sol_251205
+sol_251220
+sol_251235
+sol_251250
+sol_251265
+sol_251280
+sol_251295
+sol_251310
+sol_251325
+sol_251340
+sol_251355
+sol_251370
+sol_251385
+sol_251400
+sol_251415
+sol_251430
+sol_251445
+sol_251460
+sol_251475
+sol_251490
+sol_251505
+sol_251520
+sol_251535
+sol_251550
+sol_251565
+sol_251580
+sol_251595
+sol_251610
+sol_251625
+sol_251640
+sol_251655
+sol_251670
+sol_251685
+sol_251700
+sol_251715
+sol_252285
+sol_252300
+sol_252315
+sol_252330
+sol_252345
+sol_252360
+sol_252375
+sol_252390
+sol_252405
+sol_252420
+sol_252435
+sol_252450
+sol_252465
+sol_252480
+sol_252495
+sol_252510
+sol_252525
+sol_252540
+sol_252555
+sol_252570
+sol_252585
+sol_252600
+sol_252615
+sol_252630
+sol_252645
+sol_252660
+sol_252675
+sol_252690
+sol_252705
+sol_252720
+sol_252735
+sol_252750
+sol_252765
+sol_252780
+sol_252795
+sol_252810
+sol_252825
+sol_252840
+sol_252855
+sol_252870
+sol_252885
+sol_252900
+sol_252915
+sol_252930
+sol_252945
+sol_252960
+sol_252975
+sol_252990
+sol_253005
+sol_253020
+sol_253035
+sol_253050
+sol_253065
+sol_253080
+sol_253095
+sol_253110
+sol_253125
+sol_253140
+sol_253155
+sol_253725
+sol_253740
+sol_253755
+sol_253770
+sol_253785
+sol_253800
+sol_253815
+sol_253830
+sol_253845
+sol_253860
+sol_253875
+sol_253890
+sol_253905
+sol_253920
+sol_253935
+sol_253950
+sol_253965
+sol_253980
+sol_253995
+sol_254010
+sol_254025
+sol_254040
+sol_254055
+sol_254070
+sol_254085
+sol_254100
+sol_254115
+sol_254130
+sol_254145
+sol_254160
+sol_254175
+sol_254190
+sol_254205
+sol_254220
+sol_254235
+sol_254250
+sol_254265
+sol_254280
+sol_254295
+sol_254310
+sol_254325
+sol_254340
+sol_254355
+sol_254370
+sol_254385
+sol_254400
+sol_254415
+sol_254430
+sol_254445
+sol_254460
+sol_254475
+sol_254490
+sol_254505
+sol_254520
+sol_254535
+sol_254550
+sol_254565
+sol_254580
+sol_254595
+sol_254610
+sol_255165
+sol_255180
+sol_255195
+sol_255210
+sol_255225
+sol_255240
+sol_255255
+sol_255270
+sol_255285
+sol_255300
+sol_255315
+sol_255330
+sol_255345
+sol_255360
+sol_255375
+sol_255390
+sol_255405
+sol_255420
+sol_255435
+sol_255450
+sol_255465
+sol_255480
+sol_255495
+sol_255510
+sol_255525
+sol_255540
+sol_255555
+sol_255570
+sol_255585
+sol_255600
+sol_255615
+sol_255630
+sol_255645
+sol_255660
+sol_255675
+sol_255690
+sol_255705
+sol_255720
+sol_255735
+sol_255750
+sol_255765
+sol_255780
+sol_255795
+sol_255810
+sol_255825
+sol_255840
+sol_255855
+sol_255870
+sol_255885
+sol_255900
+sol_255915
+sol_255930
+sol_255945
+sol_255960
+sol_255975
+sol_255990
+sol_256005
+sol_256020
+sol_256035
+sol_256050
+sol_256605
+sol_256620
+sol_256635
+sol_256650
+sol_256665
+sol_256680
+sol_256695
+sol_256710
+sol_256725
+sol_256740
+sol_256755
+sol_256770
+sol_256785
+sol_256800
+sol_256815
+sol_256830
+sol_256845
+sol_256860
+sol_256875
+sol_256890
+sol_256905
+sol_256920
+sol_256935
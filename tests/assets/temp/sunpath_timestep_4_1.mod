@@ -0,0 +1,8865 @@
+sol_256950
+sol_256965
+sol_256980
+sol_256995
+sol_257010
+sol_257025
+sol_257040
+sol_257055
+sol_257070
+sol_257085
+sol_257100
+sol_257115
+sol_257130
+sol_257145
+sol_257160
+sol_257175
+sol_257190
+sol_257205
+sol_257220
+sol_257235
+sol_257250
+sol_257265
+sol_257280
+sol_257295
+sol_257310
+sol_257325
+sol_257340
+sol_257355
+sol_257370
+sol_257385
+sol_257400
+sol_257415
+sol_257430
+sol_257445
+sol_257460
+sol_257475
+sol_257490
+sol_258045
+sol_258060
+sol_258075
+sol_258090
+sol_258105
+sol_258120
+sol_258135
+sol_258150
+sol_258165
+sol_258180
+sol_258195
+sol_258210
+sol_258225
+sol_258240
+sol_258255
+sol_258270
+sol_258285
+sol_258300
+sol_258315
+sol_258330
+sol_258345
+sol_258360
+sol_258375
+sol_258390
+sol_258405
+sol_258420
+sol_258435
+sol_258450
+sol_258465
+sol_258480
+sol_258495
+sol_258510
+sol_258525
+sol_258540
+sol_258555
+sol_258570
+sol_258585
+sol_258600
+sol_258615
+sol_258630
+sol_258645
+sol_258660
+sol_258675
+sol_258690
+sol_258705
+sol_258720
+sol_258735
+sol_258750
+sol_258765
+sol_258780
+sol_258795
+sol_258810
+sol_258825
+sol_258840
+sol_258855
+sol_258870
+sol_258885
+sol_258900
+sol_258915
+sol_259485
+sol_259500
+sol_259515
+sol_259530
+sol_259545
+sol_259560
+sol_259575
+sol_259590
+sol_259605
+sol_259620
+sol_259635
+sol_259650
+sol_259665
+sol_259680
+sol_259695
+sol_259710
+sol_259725
+sol_259740
+sol_259755
+sol_259770
+sol_259785
+sol_259800
+sol_259815
+sol_259830
+sol_259845
+sol_259860
+sol_259875
+sol_259890
+sol_259905
+sol_259920
+sol_259935
+sol_259950
+sol_259965
+sol_259980
+sol_259995
+sol_260010
+sol_260025
+sol_260040
+sol_260055
+sol_260070
+sol_260085
+sol_260100
+sol_260115
+sol_260130
+sol_260145
+sol_260160
+sol_260175
+sol_260190
+sol_260205
+sol_260220
+sol_260235
+sol_260250
+sol_260265
+sol_260280
+sol_260295
+sol_260310
+sol_260325
+sol_260340
+sol_260355
+sol_260925
+sol_260940
+sol_260955
+sol_260970
+sol_260985
+sol_261000
+sol_261015
+sol_261030
+sol_261045
+sol_261060
+sol_261075
+sol_261090
+sol_261105
+sol_261120
+sol_261135
+sol_261150
+sol_261165
+sol_261180
+sol_261195
+sol_261210
+sol_261225
+sol_261240
+sol_261255
+sol_261270
+sol_261285
+sol_261300
+sol_261315
+sol_261330
+sol_261345
+sol_261360
+sol_261375
+sol_261390
+sol_261405
+sol_261420
+sol_261435
+sol_261450
+sol_261465
+sol_261480
+sol_261495
+sol_261510
+sol_261525
+sol_261540
+sol_261555
+sol_261570
+sol_261585
+sol_261600
+sol_261615
+sol_261630
+sol_261645
+sol_261660
+sol_261675
+sol_261690
+sol_261705
+sol_261720
+sol_261735
+sol_261750
+sol_261765
+sol_261780
+sol_261795
+sol_262365
+sol_262380
+sol_262395
+sol_262410
+sol_262425
+sol_262440
+sol_262455
+sol_262470
+sol_262485
+sol_262500
+sol_262515
+sol_262530
+sol_262545
+sol_262560
+sol_262575
+sol_262590
+sol_262605
+sol_262620
+sol_262635
+sol_262650
+sol_262665
+sol_262680
+sol_262695
+sol_262710
+sol_262725
+sol_262740
+sol_262755
+sol_262770
+sol_262785
+sol_262800
+sol_262815
+sol_262830
+sol_262845
+sol_262860
+sol_262875
+sol_262890
+sol_262905
+sol_262920
+sol_262935
+sol_262950
+sol_262965
+sol_262980
+sol_262995
+sol_263010
+sol_263025
+sol_263040
+sol_263055
+sol_263070
+sol_263085
+sol_263100
+sol_263115
+sol_263130
+sol_263145
+sol_263160
+sol_263175
+sol_263190
+sol_263205
+sol_263220
+sol_263235
+sol_263805
+sol_263820
+sol_263835
+sol_263850
+sol_263865
+sol_263880
+sol_263895
+sol_263910
+sol_263925
+sol_263940
+sol_263955
+sol_263970
+sol_263985
+sol_264000
+sol_264015
+sol_264030
+sol_264045
+sol_264060
+sol_264075
+sol_264090
+sol_264105
+sol_264120
+sol_264135
+sol_264150
+sol_264165
+sol_264180
+sol_264195
+sol_264210
+sol_264225
+sol_264240
+sol_264255
+sol_264270
+sol_264285
+sol_264300
+sol_264315
+sol_264330
+sol_264345
+sol_264360
+sol_264375
+sol_264390
+sol_264405
+sol_264420
+sol_264435
+sol_264450
+sol_264465
+sol_264480
+sol_264495
+sol_264510
+sol_264525
+sol_264540
+sol_264555
+sol_264570
+sol_264585
+sol_264600
+sol_264615
+sol_264630
+sol_264645
+sol_264660
+sol_264675
+sol_265245
+sol_265260
+sol_265275
+sol_265290
+sol_265305
+sol_265320
+sol_265335
+sol_265350
+sol_265365
+sol_265380
+sol_265395
+sol_265410
+sol_265425
+sol_265440
+sol_265455
+sol_265470
+sol_265485
+sol_265500
+sol_265515
+sol_265530
+sol_265545
+sol_265560
+sol_265575
+sol_265590
+sol_265605
+sol_265620
+sol_265635
+sol_265650
+sol_265665
+sol_265680
+sol_265695
+sol_265710
+sol_265725
+sol_265740
+sol_265755
+sol_265770
+sol_265785
+sol_265800
+sol_265815
+sol_265830
+sol_265845
+sol_265860
+sol_265875
+sol_265890
+sol_265905
+sol_265920
+sol_265935
+sol_265950
+sol_265965
+sol_265980
+sol_265995
+sol_266010
+sol_266025
+sol_266040
+sol_266055
+sol_266070
+sol_266085
+sol_266100
+sol_266115
+sol_266685
+sol_266700
+sol_266715
+sol_266730
+sol_266745
+sol_266760
+sol_266775
+sol_266790
+sol_266805
+sol_266820
+sol_266835
+sol_266850
+sol_266865
+sol_266880
+sol_266895
+sol_266910
+sol_266925
+sol_266940
+sol_266955
+sol_266970
+sol_266985
+sol_267000
+sol_267015
+sol_267030
+sol_267045
+sol_267060
+sol_267075
+sol_267090
+sol_267105
+sol_267120
+sol_267135
+sol_267150
+sol_267165
+sol_267180
+sol_267195
+sol_267210
+sol_267225
+sol_267240
+sol_267255
+sol_267270
+sol_267285
+sol_267300
+sol_267315
+sol_267330
+sol_267345
+sol_267360
+sol_267375
+sol_267390
+sol_267405
+sol_267420
+sol_267435
+sol_267450
+sol_267465
+sol_267480
+sol_267495
+sol_267510
+sol_267525
+sol_267540
+sol_267555
+sol_268125
+sol_268140
+sol_268155
+sol_268170
+sol_268185
+sol_268200
+sol_268215
+sol_268230
+sol_268245
+sol_268260
+sol_268275
+sol_268290
+sol_268305
+sol_268320
+sol_268335
+sol_268350
+sol_268365
+sol_268380
+sol_268395
+sol_268410
+sol_268425
+sol_268440
+sol_268455
+sol_268470
+sol_268485
+sol_268500
+sol_268515
+sol_268530
+sol_268545
+sol_268560
+sol_268575
+sol_268590
+sol_268605
+sol_268620
+sol_268635
+sol_268650
+sol_268665
+sol_268680
+sol_268695
+sol_268710
+sol_268725
+sol_268740
+sol_268755
+sol_268770
+sol_268785
+sol_268800
+sol_268815
+sol_268830
+sol_268845
+sol_268860
+sol_268875
+sol_268890
+sol_268905
+sol_268920
+sol_268935
+sol_268950
+sol_268965
+sol_268980
+sol_268995
+sol_269565
+sol_269580
+sol_269595
+sol_269610
+sol_269625
+sol_269640
+sol_269655
+sol_269670
+sol_269685
+sol_269700
+sol_269715
+sol_269730
+sol_269745
+sol_269760
+sol_269775
+sol_269790
+sol_269805
+sol_269820
+sol_269835
+sol_269850
+sol_269865
+sol_269880
+sol_269895
+sol_269910
+sol_269925
+sol_269940
+sol_269955
+sol_269970
+sol_269985
+sol_270000
+sol_270015
+sol_270030
+sol_270045
+sol_270060
+sol_270075
+sol_270090
+sol_270105
+sol_270120
+sol_270135
+sol_270150
+sol_270165
+sol_270180
+sol_270195
+sol_270210
+sol_270225
+sol_270240
+sol_270255
+sol_270270
+sol_270285
+sol_270300
+sol_270315
+sol_270330
+sol_270345
+sol_270360
+sol_270375
+sol_270390
+sol_270405
+sol_270420
+sol_270435
+sol_271005
+sol_271020
+sol_271035
+sol_271050
+sol_271065
+sol_271080
+sol_271095
+sol_271110
+sol_271125
+sol_271140
+sol_271155
+sol_271170
+sol_271185
+sol_271200
+sol_271215
+sol_271230
+sol_271245
+sol_271260
+sol_271275
+sol_271290
+sol_271305
+sol_271320
+sol_271335
+sol_271350
+sol_271365
+sol_271380
+sol_271395
+sol_271410
+sol_271425
+sol_271440
+sol_271455
+sol_271470
+sol_271485
+sol_271500
+sol_271515
+sol_271530
+sol_271545
+sol_271560
+sol_271575
+sol_271590
+sol_271605
+sol_271620
+sol_271635
+sol_271650
+sol_271665
+sol_271680
+sol_271695
+sol_271710
+sol_271725
+sol_271740
+sol_271755
+sol_271770
+sol_271785
+sol_271800
+sol_271815
+sol_271830
+sol_271845
+sol_271860
+sol_271875
+sol_272445
+sol_272460
+sol_272475
+sol_272490
+sol_272505
+sol_272520
+sol_272535
+sol_272550
+sol_272565
+sol_272580
+sol_272595
+sol_272610
+sol_272625
+sol_272640
+sol_272655
+sol_272670
+sol_272685
+sol_272700
+sol_272715
+sol_272730
+sol_272745
+sol_272760
+sol_272775
+sol_272790
+sol_272805
+sol_272820
+sol_272835
+sol_272850
+sol_272865
+sol_272880
+sol_272895
+sol_272910
+sol_272925
+sol_272940
+sol_272955
+sol_272970
+sol_272985
+sol_273000
+sol_273015
+sol_273030
+sol_273045
+sol_273060
+sol_273075
+sol_273090
+sol_273105
+sol_273120
+sol_273135
+sol_273150
+sol_273165
+sol_273180
+sol_273195
+sol_273210
+sol_273225
+sol_273240
+sol_273255
+sol_273270
+sol_273285
+sol_273300
+sol_273315
+sol_273885
+sol_273900
+sol_273915
+sol_273930
+sol_273945
+sol_273960
+sol_273975
+sol_273990
+sol_274005
+sol_274020
+sol_274035
+sol_274050
+sol_274065
+sol_274080
+sol_274095
+sol_274110
+sol_274125
+sol_274140
+sol_274155
+sol_274170
+sol_274185
+sol_274200
+sol_274215
+sol_274230
+sol_274245
+sol_274260
+sol_274275
+sol_274290
+sol_274305
+sol_274320
+sol_274335
+sol_274350
+sol_274365
+sol_274380
+sol_274395
+sol_274410
+sol_274425
+sol_274440
+sol_274455
+sol_274470
+sol_274485
+sol_274500
+sol_274515
+sol_274530
+sol_274545
+sol_274560
+sol_274575
+sol_274590
+sol_274605
+sol_274620
+sol_274635
+sol_274650
+sol_274665
+sol_274680
+sol_274695
+sol_274710
+sol_274725
+sol_274740
+sol_274755
+sol_275325
+sol_275340
+sol_275355
+sol_275370
+sol_275385
+sol_275400
+sol_275415
+sol_275430
+sol_275445
+sol_275460
+sol_275475
+sol_275490
+sol_275505
+sol_275520
+sol_275535
+sol_275550
+sol_275565
+sol_275580
+sol_275595
+sol_275610
+sol_275625
+sol_275640
+sol_275655
+sol_275670
+sol_275685
+sol_275700
+sol_275715
+sol_275730
+sol_275745
+sol_275760
+sol_275775
+sol_275790
+sol_275805
+sol_275820
+sol_275835
+sol_275850
+sol_275865
+sol_275880
+sol_275895
+sol_275910
+sol_275925
+sol_275940
+sol_275955
+sol_275970
+sol_275985
+sol_276000
+sol_276015
+sol_276030
+sol_276045
+sol_276060
+sol_276075
+sol_276090
+sol_276105
+sol_276120
+sol_276135
+sol_276150
+sol_276165
+sol_276180
+sol_276195
+sol_276765
+sol_276780
+sol_276795
+sol_276810
+sol_276825
+sol_276840
+sol_276855
+sol_276870
+sol_276885
+sol_276900
+sol_276915
+sol_276930
+sol_276945
+sol_276960
+sol_276975
+sol_276990
+sol_277005
+sol_277020
+sol_277035
+sol_277050
+sol_277065
+sol_277080
+sol_277095
+sol_277110
+sol_277125
+sol_277140
+sol_277155
+sol_277170
+sol_277185
+sol_277200
+sol_277215
+sol_277230
+sol_277245
+sol_277260
+sol_277275
+sol_277290
+sol_277305
+sol_277320
+sol_277335
+sol_277350
+sol_277365
+sol_277380
+sol_277395
+sol_277410
+sol_277425
+sol_277440
+sol_277455
+sol_277470
+sol_277485
+sol_277500
+sol_277515
+sol_277530
+sol_277545
+sol_277560
+sol_277575
+sol_277590
+sol_277605
+sol_277620
+sol_277635
+sol_278205
+sol_278220
+sol_278235
+sol_278250
+sol_278265
+sol_278280
+sol_278295
+sol_278310
+sol_278325
+sol_278340
+sol_278355
+sol_278370
+sol_278385
+sol_278400
+sol_278415
+sol_278430
+sol_278445
+sol_278460
+sol_278475
+sol_278490
+sol_278505
+sol_278520
+sol_278535
+sol_278550
+sol_278565
+sol_278580
+sol_278595
+sol_278610
+sol_278625
+sol_278640
+sol_278655
+sol_278670
+sol_278685
+sol_278700
+sol_278715
+sol_278730
+sol_278745
+sol_278760
+sol_278775
+sol_278790
+sol_278805
+sol_278820
+sol_278835
+sol_278850
+sol_278865
+sol_278880
+sol_278895
+sol_278910
+sol_278925
+sol_278940
+sol_278955
+sol_278970
+sol_278985
+sol_279000
+sol_279015
+sol_279030
+sol_279045
+sol_279060
+sol_279075
+sol_279645
+sol_279660
+sol_279675
+sol_279690
+sol_279705
+sol_279720
+sol_279735
+sol_279750
+sol_279765
+sol_279780
+sol_279795
+sol_279810
+sol_279825
+sol_279840
+sol_279855
+sol_279870
+sol_279885
+sol_279900
+sol_279915
+sol_279930
+sol_279945
+sol_279960
+sol_279975
+sol_279990
+sol_280005
+sol_280020
+sol_280035
+sol_280050
+sol_280065
+sol_280080
+sol_280095
+sol_280110
+sol_280125
+sol_280140
+sol_280155
+sol_280170
+sol_280185
+sol_280200
+sol_280215
+sol_280230
+sol_280245
+sol_280260
+sol_280275
+sol_280290
+sol_280305
+sol_280320
+sol_280335
+sol_280350
+sol_280365
+sol_280380
+sol_280395
+sol_280410
+sol_280425
+sol_280440
+sol_280455
+sol_280470
+sol_280485
+sol_280500
+sol_280515
+sol_281100
+sol_281115
+sol_281130
+sol_281145
+sol_281160
+sol_281175
+sol_281190
+sol_281205
+sol_281220
+sol_281235
+sol_281250
+sol_281265
+sol_281280
+sol_281295
+sol_281310
+sol_281325
+sol_281340
+sol_281355
+sol_281370
+sol_281385
+sol_281400
+sol_281415
+sol_281430
+sol_281445
+sol_281460
+sol_281475
+sol_281490
+sol_281505
+sol_281520
+sol_281535
+sol_281550
+sol_281565
+sol_281580
+sol_281595
+sol_281610
+sol_281625
+sol_281640
+sol_281655
+sol_281670
+sol_281685
+sol_281700
+sol_281715
+sol_281730
+sol_281745
+sol_281760
+sol_281775
+sol_281790
+sol_281805
+sol_281820
+sol_281835
+sol_281850
+sol_281865
+sol_281880
+sol_281895
+sol_281910
+sol_281925
+sol_281940
+sol_281955
+sol_282540
+sol_282555
+sol_282570
+sol_282585
+sol_282600
+sol_282615
+sol_282630
+sol_282645
+sol_282660
+sol_282675
+sol_282690
+sol_282705
+sol_282720
+sol_282735
+sol_282750
+sol_282765
+sol_282780
+sol_282795
+sol_282810
+sol_282825
+sol_282840
+sol_282855
+sol_282870
+sol_282885
+sol_282900
+sol_282915
+sol_282930
+sol_282945
+sol_282960
+sol_282975
+sol_282990
+sol_283005
+sol_283020
+sol_283035
+sol_283050
+sol_283065
+sol_283080
+sol_283095
+sol_283110
+sol_283125
+sol_283140
+sol_283155
+sol_283170
+sol_283185
+sol_283200
+sol_283215
+sol_283230
+sol_283245
+sol_283260
+sol_283275
+sol_283290
+sol_283305
+sol_283320
+sol_283335
+sol_283350
+sol_283365
+sol_283380
+sol_283395
+sol_283980
+sol_283995
+sol_284010
+sol_284025
+sol_284040
+sol_284055
+sol_284070
+sol_284085
+sol_284100
+sol_284115
+sol_284130
+sol_284145
+sol_284160
+sol_284175
+sol_284190
+sol_284205
+sol_284220
+sol_284235
+sol_284250
+sol_284265
+sol_284280
+sol_284295
+sol_284310
+sol_284325
+sol_284340
+sol_284355
+sol_284370
+sol_284385
+sol_284400
+sol_284415
+sol_284430
+sol_284445
+sol_284460
+sol_284475
+sol_284490
+sol_284505
+sol_284520
+sol_284535
+sol_284550
+sol_284565
+sol_284580
+sol_284595
+sol_284610
+sol_284625
+sol_284640
+sol_284655
+sol_284670
+sol_284685
+sol_284700
+sol_284715
+sol_284730
+sol_284745
+sol_284760
+sol_284775
+sol_284790
+sol_284805
+sol_284820
+sol_284835
+sol_285420
+sol_285435
+sol_285450
+sol_285465
+sol_285480
+sol_285495
+sol_285510
+sol_285525
+sol_285540
+sol_285555
+sol_285570
+sol_285585
+sol_285600
+sol_285615
+sol_285630
+sol_285645
+sol_285660
+sol_285675
+sol_285690
+sol_285705
+sol_285720
+sol_285735
+sol_285750
+sol_285765
+sol_285780
+sol_285795
+sol_285810
+sol_285825
+sol_285840
+sol_285855
+sol_285870
+sol_285885
+sol_285900
+sol_285915
+sol_285930
+sol_285945
+sol_285960
+sol_285975
+sol_285990
+sol_286005
+sol_286020
+sol_286035
+sol_286050
+sol_286065
+sol_286080
+sol_286095
+sol_286110
+sol_286125
+sol_286140
+sol_286155
+sol_286170
+sol_286185
+sol_286200
+sol_286215
+sol_286230
+sol_286245
+sol_286260
+sol_286275
+sol_286860
+sol_286875
+sol_286890
+sol_286905
+sol_286920
+sol_286935
+sol_286950
+sol_286965
+sol_286980
+sol_286995
+sol_287010
+sol_287025
+sol_287040
+sol_287055
+sol_287070
+sol_287085
+sol_287100
+sol_287115
+sol_287130
+sol_287145
+sol_287160
+sol_287175
+sol_287190
+sol_287205
+sol_287220
+sol_287235
+sol_287250
+sol_287265
+sol_287280
+sol_287295
+sol_287310
+sol_287325
+sol_287340
+sol_287355
+sol_287370
+sol_287385
+sol_287400
+sol_287415
+sol_287430
+sol_287445
+sol_287460
+sol_287475
+sol_287490
+sol_287505
+sol_287520
+sol_287535
+sol_287550
+sol_287565
+sol_287580
+sol_287595
+sol_287610
+sol_287625
+sol_287640
+sol_287655
+sol_287670
+sol_287685
+sol_287700
+sol_287715
+sol_288300
+sol_288315
+sol_288330
+sol_288345
+sol_288360
+sol_288375
+sol_288390
+sol_288405
+sol_288420
+sol_288435
+sol_288450
+sol_288465
+sol_288480
+sol_288495
+sol_288510
+sol_288525
+sol_288540
+sol_288555
+sol_288570
+sol_288585
+sol_288600
+sol_288615
+sol_288630
+sol_288645
+sol_288660
+sol_288675
+sol_288690
+sol_288705
+sol_288720
+sol_288735
+sol_288750
+sol_288765
+sol_288780
+sol_288795
+sol_288810
+sol_288825
+sol_288840
+sol_288855
+sol_288870
+sol_288885
+sol_288900
+sol_288915
+sol_288930
+sol_288945
+sol_288960
+sol_288975
+sol_288990
+sol_289005
+sol_289020
+sol_289035
+sol_289050
+sol_289065
+sol_289080
+sol_289095
+sol_289110
+sol_289125
+sol_289140
+sol_289155
+sol_289740
+sol_289755
+sol_289770
+sol_289785
+sol_289800
+sol_289815
+sol_289830
+sol_289845
+sol_289860
+sol_289875
+sol_289890
+sol_289905
+sol_289920
+sol_289935
+sol_289950
+sol_289965
+sol_289980
+sol_289995
+sol_290010
+sol_290025
+sol_290040
+sol_290055
+sol_290070
+sol_290085
+sol_290100
+sol_290115
+sol_290130
+sol_290145
+sol_290160
+sol_290175
+sol_290190
+sol_290205
+sol_290220
+sol_290235
+sol_290250
+sol_290265
+sol_290280
+sol_290295
+sol_290310
+sol_290325
+sol_290340
+sol_290355
+sol_290370
+sol_290385
+sol_290400
+sol_290415
+sol_290430
+sol_290445
+sol_290460
+sol_290475
+sol_290490
+sol_290505
+sol_290520
+sol_290535
+sol_290550
+sol_290565
+sol_290580
+sol_290595
+sol_291180
+sol_291195
+sol_291210
+sol_291225
+sol_291240
+sol_291255
+sol_291270
+sol_291285
+sol_291300
+sol_291315
+sol_291330
+sol_291345
+sol_291360
+sol_291375
+sol_291390
+sol_291405
+sol_291420
+sol_291435
+sol_291450
+sol_291465
+sol_291480
+sol_291495
+sol_291510
+sol_291525
+sol_291540
+sol_291555
+sol_291570
+sol_291585
+sol_291600
+sol_291615
+sol_291630
+sol_291645
+sol_291660
+sol_291675
+sol_291690
+sol_291705
+sol_291720
+sol_291735
+sol_291750
+sol_291765
+sol_291780
+sol_291795
+sol_291810
+sol_291825
+sol_291840
+sol_291855
+sol_291870
+sol_291885
+sol_291900
+sol_291915
+sol_291930
+sol_291945
+sol_291960
+sol_291975
+sol_291990
+sol_292005
+sol_292020
+sol_292035
+sol_292620
+sol_292635
+sol_292650
+sol_292665
+sol_292680
+sol_292695
+sol_292710
+sol_292725
+sol_292740
+sol_292755
+sol_292770
+sol_292785
+sol_292800
+sol_292815
+sol_292830
+sol_292845
+sol_292860
+sol_292875
+sol_292890
+sol_292905
+sol_292920
+sol_292935
+sol_292950
+sol_292965
+sol_292980
+sol_292995
+sol_293010
+sol_293025
+sol_293040
+sol_293055
+sol_293070
+sol_293085
+sol_293100
+sol_293115
+sol_293130
+sol_293145
+sol_293160
+sol_293175
+sol_293190
+sol_293205
+sol_293220
+sol_293235
+sol_293250
+sol_293265
+sol_293280
+sol_293295
+sol_293310
+sol_293325
+sol_293340
+sol_293355
+sol_293370
+sol_293385
+sol_293400
+sol_293415
+sol_293430
+sol_293445
+sol_293460
+sol_293475
+sol_294060
+sol_294075
+sol_294090
+sol_294105
+sol_294120
+sol_294135
+sol_294150
+sol_294165
+sol_294180
+sol_294195
+sol_294210
+sol_294225
+sol_294240
+sol_294255
+sol_294270
+sol_294285
+sol_294300
+sol_294315
+sol_294330
+sol_294345
+sol_294360
+sol_294375
+sol_294390
+sol_294405
+sol_294420
+sol_294435
+sol_294450
+sol_294465
+sol_294480
+sol_294495
+sol_294510
+sol_294525
+sol_294540
+sol_294555
+sol_294570
+sol_294585
+sol_294600
+sol_294615
+sol_294630
+sol_294645
+sol_294660
+sol_294675
+sol_294690
+sol_294705
+sol_294720
+sol_294735
+sol_294750
+sol_294765
+sol_294780
+sol_294795
+sol_294810
+sol_294825
+sol_294840
+sol_294855
+sol_294870
+sol_294885
+sol_294900
+sol_294915
+sol_295500
+sol_295515
+sol_295530
+sol_295545
+sol_295560
+sol_295575
+sol_295590
+sol_295605
+sol_295620
+sol_295635
+sol_295650
+sol_295665
+sol_295680
+sol_295695
+sol_295710
+sol_295725
+sol_295740
+sol_295755
+sol_295770
+sol_295785
+sol_295800
+sol_295815
+sol_295830
+sol_295845
+sol_295860
+sol_295875
+sol_295890
+sol_295905
+sol_295920
+sol_295935
+sol_295950
+sol_295965
+sol_295980
+sol_295995
+sol_296010
+sol_296025
+sol_296040
+sol_296055
+sol_296070
+sol_296085
+sol_296100
+sol_296115
+sol_296130
+sol_296145
+sol_296160
+sol_296175
+sol_296190
+sol_296205
+sol_296220
+sol_296235
+sol_296250
+sol_296265
+sol_296280
+sol_296295
+sol_296310
+sol_296325
+sol_296340
+sol_296355
+sol_296940
+sol_296955
+sol_296970
+sol_296985
+sol_297000
+sol_297015
+sol_297030
+sol_297045
+sol_297060
+sol_297075
+sol_297090
+sol_297105
+sol_297120
+sol_297135
+sol_297150
+sol_297165
+sol_297180
+sol_297195
+sol_297210
+sol_297225
+sol_297240
+sol_297255
+sol_297270
+sol_297285
+sol_297300
+sol_297315
+sol_297330
+sol_297345
+sol_297360
+sol_297375
+sol_297390
+sol_297405
+sol_297420
+sol_297435
+sol_297450
+sol_297465
+sol_297480
+sol_297495
+sol_297510
+sol_297525
+sol_297540
+sol_297555
+sol_297570
+sol_297585
+sol_297600
+sol_297615
+sol_297630
+sol_297645
+sol_297660
+sol_297675
+sol_297690
+sol_297705
+sol_297720
+sol_297735
+sol_297750
+sol_297765
+sol_297780
+sol_297795
+sol_298380
+sol_298395
+sol_298410
+sol_298425
+sol_298440
+sol_298455
+sol_298470
+sol_298485
+sol_298500
+sol_298515
+sol_298530
+sol_298545
+sol_298560
+sol_298575
+sol_298590
+sol_298605
+sol_298620
+sol_298635
+sol_298650
+sol_298665
+sol_298680
+sol_298695
+sol_298710
+sol_298725
+sol_298740
+sol_298755
+sol_298770
+sol_298785
+sol_298800
+sol_298815
+sol_298830
+sol_298845
+sol_298860
+sol_298875
+sol_298890
+sol_298905
+sol_298920
+sol_298935
+sol_298950
+sol_298965
+sol_298980
+sol_298995
+sol_299010
+sol_299025
+sol_299040
+sol_299055
+sol_299070
+sol_299085
+sol_299100
+sol_299115
+sol_299130
+sol_299145
+sol_299160
+sol_299175
+sol_299190
+sol_299205
+sol_299220
+sol_299235
+sol_299820
+sol_299835
+sol_299850
+sol_299865
+sol_299880
+sol_299895
+sol_299910
+sol_299925
+sol_299940
+sol_299955
+sol_299970
+sol_299985
+sol_300000
+sol_300015
+sol_300030
+sol_300045
+sol_300060
+sol_300075
+sol_300090
+sol_300105
+sol_300120
+sol_300135
+sol_300150
+sol_300165
+sol_300180
+sol_300195
+sol_300210
+sol_300225
+sol_300240
+sol_300255
+sol_300270
+sol_300285
+sol_300300
+sol_300315
+sol_300330
+sol_300345
+sol_300360
+sol_300375
+sol_300390
+sol_300405
+sol_300420
+sol_300435
+sol_300450
+sol_300465
+sol_300480
+sol_300495
+sol_300510
+sol_300525
+sol_300540
+sol_300555
+sol_300570
+sol_300585
+sol_300600
+sol_300615
+sol_300630
+sol_300645
+sol_300660
+sol_301260
+sol_301275
+sol_301290
+sol_301305
+sol_301320
+sol_301335
+sol_301350
+sol_301365
+sol_301380
+sol_301395
+sol_301410
+sol_301425
+sol_301440
+sol_301455
+sol_301470
+sol_301485
+sol_301500
+sol_301515
+sol_301530
+sol_301545
+sol_301560
+sol_301575
+sol_301590
+sol_301605
+sol_301620
+sol_301635
+sol_301650
+sol_301665
+sol_301680
+sol_301695
+sol_301710
+sol_301725
+sol_301740
+sol_301755
+sol_301770
+sol_301785
+sol_301800
+sol_301815
+sol_301830
+sol_301845
+sol_301860
+sol_301875
+sol_301890
+sol_301905
+sol_301920
+sol_301935
+sol_301950
+sol_301965
+sol_301980
+sol_301995
+sol_302010
+sol_302025
+sol_302040
+sol_302055
+sol_302070
+sol_302085
+sol_302100
+sol_302700
+sol_302715
+sol_302730
+sol_302745
+sol_302760
+sol_302775
+sol_302790
+sol_302805
+sol_302820
+sol_302835
+sol_302850
+sol_302865
+sol_302880
+sol_302895
+sol_302910
+sol_302925
+sol_302940
+sol_302955
+sol_302970
+sol_302985
+sol_303000
+sol_303015
+sol_303030
+sol_303045
+sol_303060
+sol_303075
+sol_303090
+sol_303105
+sol_303120
+sol_303135
+sol_303150
+sol_303165
+sol_303180
+sol_303195
+sol_303210
+sol_303225
+sol_303240
+sol_303255
+sol_303270
+sol_303285
+sol_303300
+sol_303315
+sol_303330
+sol_303345
+sol_303360
+sol_303375
+sol_303390
+sol_303405
+sol_303420
+sol_303435
+sol_303450
+sol_303465
+sol_303480
+sol_303495
+sol_303510
+sol_303525
+sol_303540
+sol_304140
+sol_304155
+sol_304170
+sol_304185
+sol_304200
+sol_304215
+sol_304230
+sol_304245
+sol_304260
+sol_304275
+sol_304290
+sol_304305
+sol_304320
+sol_304335
+sol_304350
+sol_304365
+sol_304380
+sol_304395
+sol_304410
+sol_304425
+sol_304440
+sol_304455
+sol_304470
+sol_304485
+sol_304500
+sol_304515
+sol_304530
+sol_304545
+sol_304560
+sol_304575
+sol_304590
+sol_304605
+sol_304620
+sol_304635
+sol_304650
+sol_304665
+sol_304680
+sol_304695
+sol_304710
+sol_304725
+sol_304740
+sol_304755
+sol_304770
+sol_304785
+sol_304800
+sol_304815
+sol_304830
+sol_304845
+sol_304860
+sol_304875
+sol_304890
+sol_304905
+sol_304920
+sol_304935
+sol_304950
+sol_304965
+sol_304980
+sol_305595
+sol_305610
+sol_305625
+sol_305640
+sol_305655
+sol_305670
+sol_305685
+sol_305700
+sol_305715
+sol_305730
+sol_305745
+sol_305760
+sol_305775
+sol_305790
+sol_305805
+sol_305820
+sol_305835
+sol_305850
+sol_305865
+sol_305880
+sol_305895
+sol_305910
+sol_305925
+sol_305940
+sol_305955
+sol_305970
+sol_305985
+sol_306000
+sol_306015
+sol_306030
+sol_306045
+sol_306060
+sol_306075
+sol_306090
+sol_306105
+sol_306120
+sol_306135
+sol_306150
+sol_306165
+sol_306180
+sol_306195
+sol_306210
+sol_306225
+sol_306240
+sol_306255
+sol_306270
+sol_306285
+sol_306300
+sol_306315
+sol_306330
+sol_306345
+sol_306360
+sol_306375
+sol_306390
+sol_306405
+sol_306420
+sol_307035
+sol_307050
+sol_307065
+sol_307080
+sol_307095
+sol_307110
+sol_307125
+sol_307140
+sol_307155
+sol_307170
+sol_307185
+sol_307200
+sol_307215
+sol_307230
+sol_307245
+sol_307260
+sol_307275
+sol_307290
+sol_307305
+sol_307320
+sol_307335
+sol_307350
+sol_307365
+sol_307380
+sol_307395
+sol_307410
+sol_307425
+sol_307440
+sol_307455
+sol_307470
+sol_307485
+sol_307500
+sol_307515
+sol_307530
+sol_307545
+sol_307560
+sol_307575
+sol_307590
+sol_307605
+sol_307620
+sol_307635
+sol_307650
+sol_307665
+sol_307680
+sol_307695
+sol_307710
+sol_307725
+sol_307740
+sol_307755
+sol_307770
+sol_307785
+sol_307800
+sol_307815
+sol_307830
+sol_307845
+sol_307860
+sol_308475
+sol_308490
+sol_308505
+sol_308520
+sol_308535
+sol_308550
+sol_308565
+sol_308580
+sol_308595
+sol_308610
+sol_308625
+sol_308640
+sol_308655
+sol_308670
+sol_308685
+sol_308700
+sol_308715
+sol_308730
+sol_308745
+sol_308760
+sol_308775
+sol_308790
+sol_308805
+sol_308820
+sol_308835
+sol_308850
+sol_308865
+sol_308880
+sol_308895
+sol_308910
+sol_308925
+sol_308940
+sol_308955
+sol_308970
+sol_308985
+sol_309000
+sol_309015
+sol_309030
+sol_309045
+sol_309060
+sol_309075
+sol_309090
+sol_309105
+sol_309120
+sol_309135
+sol_309150
+sol_309165
+sol_309180
+sol_309195
+sol_309210
+sol_309225
+sol_309240
+sol_309255
+sol_309270
+sol_309285
+sol_309300
+sol_309915
+sol_309930
+sol_309945
+sol_309960
+sol_309975
+sol_309990
+sol_310005
+sol_310020
+sol_310035
+sol_310050
+sol_310065
+sol_310080
+sol_310095
+sol_310110
+sol_310125
+sol_310140
+sol_310155
+sol_310170
+sol_310185
+sol_310200
+sol_310215
+sol_310230
+sol_310245
+sol_310260
+sol_310275
+sol_310290
+sol_310305
+sol_310320
+sol_310335
+sol_310350
+sol_310365
+sol_310380
+sol_310395
+sol_310410
+sol_310425
+sol_310440
+sol_310455
+sol_310470
+sol_310485
+sol_310500
+sol_310515
+sol_310530
+sol_310545
+sol_310560
+sol_310575
+sol_310590
+sol_310605
+sol_310620
+sol_310635
+sol_310650
+sol_310665
+sol_310680
+sol_310695
+sol_310710
+sol_310725
+sol_310740
+sol_311355
+sol_311370
+sol_311385
+sol_311400
+sol_311415
+sol_311430
+sol_311445
+sol_311460
+sol_311475
+sol_311490
+sol_311505
+sol_311520
+sol_311535
+sol_311550
+sol_311565
+sol_311580
+sol_311595
+sol_311610
+sol_311625
+sol_311640
+sol_311655
+sol_311670
+sol_311685
+sol_311700
+sol_311715
+sol_311730
+sol_311745
+sol_311760
+sol_311775
+sol_311790
+sol_311805
+sol_311820
+sol_311835
+sol_311850
+sol_311865
+sol_311880
+sol_311895
+sol_311910
+sol_311925
+sol_311940
+sol_311955
+sol_311970
+sol_311985
+sol_312000
+sol_312015
+sol_312030
+sol_312045
+sol_312060
+sol_312075
+sol_312090
+sol_312105
+sol_312120
+sol_312135
+sol_312150
+sol_312165
+sol_312180
+sol_312795
+sol_312810
+sol_312825
+sol_312840
+sol_312855
+sol_312870
+sol_312885
+sol_312900
+sol_312915
+sol_312930
+sol_312945
+sol_312960
+sol_312975
+sol_312990
+sol_313005
+sol_313020
+sol_313035
+sol_313050
+sol_313065
+sol_313080
+sol_313095
+sol_313110
+sol_313125
+sol_313140
+sol_313155
+sol_313170
+sol_313185
+sol_313200
+sol_313215
+sol_313230
+sol_313245
+sol_313260
+sol_313275
+sol_313290
+sol_313305
+sol_313320
+sol_313335
+sol_313350
+sol_313365
+sol_313380
+sol_313395
+sol_313410
+sol_313425
+sol_313440
+sol_313455
+sol_313470
+sol_313485
+sol_313500
+sol_313515
+sol_313530
+sol_313545
+sol_313560
+sol_313575
+sol_313590
+sol_313605
+sol_313620
+sol_314235
+sol_314250
+sol_314265
+sol_314280
+sol_314295
+sol_314310
+sol_314325
+sol_314340
+sol_314355
+sol_314370
+sol_314385
+sol_314400
+sol_314415
+sol_314430
+sol_314445
+sol_314460
+sol_314475
+sol_314490
+sol_314505
+sol_314520
+sol_314535
+sol_314550
+sol_314565
+sol_314580
+sol_314595
+sol_314610
+sol_314625
+sol_314640
+sol_314655
+sol_314670
+sol_314685
+sol_314700
+sol_314715
+sol_314730
+sol_314745
+sol_314760
+sol_314775
+sol_314790
+sol_314805
+sol_314820
+sol_314835
+sol_314850
+sol_314865
+sol_314880
+sol_314895
+sol_314910
+sol_314925
+sol_314940
+sol_314955
+sol_314970
+sol_314985
+sol_315000
+sol_315015
+sol_315030
+sol_315045
+sol_315060
+sol_315675
+sol_315690
+sol_315705
+sol_315720
+sol_315735
+sol_315750
+sol_315765
+sol_315780
+sol_315795
+sol_315810
+sol_315825
+sol_315840
+sol_315855
+sol_315870
+sol_315885
+sol_315900
+sol_315915
+sol_315930
+sol_315945
+sol_315960
+sol_315975
+sol_315990
+sol_316005
+sol_316020
+sol_316035
+sol_316050
+sol_316065
+sol_316080
+sol_316095
+sol_316110
+sol_316125
+sol_316140
+sol_316155
+sol_316170
+sol_316185
+sol_316200
+sol_316215
+sol_316230
+sol_316245
+sol_316260
+sol_316275
+sol_316290
+sol_316305
+sol_316320
+sol_316335
+sol_316350
+sol_316365
+sol_316380
+sol_316395
+sol_316410
+sol_316425
+sol_316440
+sol_316455
+sol_316470
+sol_316485
+sol_316500
+sol_317115
+sol_317130
+sol_317145
+sol_317160
+sol_317175
+sol_317190
+sol_317205
+sol_317220
+sol_317235
+sol_317250
+sol_317265
+sol_317280
+sol_317295
+sol_317310
+sol_317325
+sol_317340
+sol_317355
+sol_317370
+sol_317385
+sol_317400
+sol_317415
+sol_317430
+sol_317445
+sol_317460
+sol_317475
+sol_317490
+sol_317505
+sol_317520
+sol_317535
+sol_317550
+sol_317565
+sol_317580
+sol_317595
+sol_317610
+sol_317625
+sol_317640
+sol_317655
+sol_317670
+sol_317685
+sol_317700
+sol_317715
+sol_317730
+sol_317745
+sol_317760
+sol_317775
+sol_317790
+sol_317805
+sol_317820
+sol_317835
+sol_317850
+sol_317865
+sol_317880
+sol_317895
+sol_317910
+sol_317925
+sol_317940
+sol_318555
+sol_318570
+sol_318585
+sol_318600
+sol_318615
+sol_318630
+sol_318645
+sol_318660
+sol_318675
+sol_318690
+sol_318705
+sol_318720
+sol_318735
+sol_318750
+sol_318765
+sol_318780
+sol_318795
+sol_318810
+sol_318825
+sol_318840
+sol_318855
+sol_318870
+sol_318885
+sol_318900
+sol_318915
+sol_318930
+sol_318945
+sol_318960
+sol_318975
+sol_318990
+sol_319005
+sol_319020
+sol_319035
+sol_319050
+sol_319065
+sol_319080
+sol_319095
+sol_319110
+sol_319125
+sol_319140
+sol_319155
+sol_319170
+sol_319185
+sol_319200
+sol_319215
+sol_319230
+sol_319245
+sol_319260
+sol_319275
+sol_319290
+sol_319305
+sol_319320
+sol_319335
+sol_319350
+sol_319365
+sol_319380
+sol_319995
+sol_320010
+sol_320025
+sol_320040
+sol_320055
+sol_320070
+sol_320085
+sol_320100
+sol_320115
+sol_320130
+sol_320145
+sol_320160
+sol_320175
+sol_320190
+sol_320205
+sol_320220
+sol_320235
+sol_320250
+sol_320265
+sol_320280
+sol_320295
+sol_320310
+sol_320325
+sol_320340
+sol_320355
+sol_320370
+sol_320385
+sol_320400
+sol_320415
+sol_320430
+sol_320445
+sol_320460
+sol_320475
+sol_320490
+sol_320505
+sol_320520
+sol_320535
+sol_320550
+sol_320565
+sol_320580
+sol_320595
+sol_320610
+sol_320625
+sol_320640
+sol_320655
+sol_320670
+sol_320685
+sol_320700
+sol_320715
+sol_320730
+sol_320745
+sol_320760
+sol_320775
+sol_320790
+sol_320805
+sol_321435
+sol_321450
+sol_321465
+sol_321480
+sol_321495
+sol_321510
+sol_321525
+sol_321540
+sol_321555
+sol_321570
+sol_321585
+sol_321600
+sol_321615
+sol_321630
+sol_321645
+sol_321660
+sol_321675
+sol_321690
+sol_321705
+sol_321720
+sol_321735
+sol_321750
+sol_321765
+sol_321780
+sol_321795
+sol_321810
+sol_321825
+sol_321840
+sol_321855
+sol_321870
+sol_321885
+sol_321900
+sol_321915
+sol_321930
+sol_321945
+sol_321960
+sol_321975
+sol_321990
+sol_322005
+sol_322020
+sol_322035
+sol_322050
+sol_322065
+sol_322080
+sol_322095
+sol_322110
+sol_322125
+sol_322140
+sol_322155
+sol_322170
+sol_322185
+sol_322200
+sol_322215
+sol_322230
+sol_322245
+sol_322875
+sol_322890
+sol_322905
+sol_322920
+sol_322935
+sol_322950
+sol_322965
+sol_322980
+sol_322995
+sol_323010
+sol_323025
+sol_323040
+sol_323055
+sol_323070
+sol_323085
+sol_323100
+sol_323115
+sol_323130
+sol_323145
+sol_323160
+sol_323175
+sol_323190
+sol_323205
+sol_323220
+sol_323235
+sol_323250
+sol_323265
+sol_323280
+sol_323295
+sol_323310
+sol_323325
+sol_323340
+sol_323355
+sol_323370
+sol_323385
+sol_323400
+sol_323415
+sol_323430
+sol_323445
+sol_323460
+sol_323475
+sol_323490
+sol_323505
+sol_323520
+sol_323535
+sol_323550
+sol_323565
+sol_323580
+sol_323595
+sol_323610
+sol_323625
+sol_323640
+sol_323655
+sol_323670
+sol_323685
+sol_324315
+sol_324330
+sol_324345
+sol_324360
+sol_324375
+sol_324390
+sol_324405
+sol_324420
+sol_324435
+sol_324450
+sol_324465
+sol_324480
+sol_324495
+sol_324510
+sol_324525
+sol_324540
+sol_324555
+sol_324570
+sol_324585
+sol_324600
+sol_324615
+sol_324630
+sol_324645
+sol_324660
+sol_324675
+sol_324690
+sol_324705
+sol_324720
+sol_324735
+sol_324750
+sol_324765
+sol_324780
+sol_324795
+sol_324810
+sol_324825
+sol_324840
+sol_324855
+sol_324870
+sol_324885
+sol_324900
+sol_324915
+sol_324930
+sol_324945
+sol_324960
+sol_324975
+sol_324990
+sol_325005
+sol_325020
+sol_325035
+sol_325050
+sol_325065
+sol_325080
+sol_325095
+sol_325110
+sol_325125
+sol_325755
+sol_325770
+sol_325785
+sol_325800
+sol_325815
+sol_325830
+sol_325845
+sol_325860
+sol_325875
+sol_325890
+sol_325905
+sol_325920
+sol_325935
+sol_325950
+sol_325965
+sol_325980
+sol_325995
+sol_326010
+sol_326025
+sol_326040
+sol_326055
+sol_326070
+sol_326085
+sol_326100
+sol_326115
+sol_326130
+sol_326145
+sol_326160
+sol_326175
+sol_326190
+sol_326205
+sol_326220
+sol_326235
+sol_326250
+sol_326265
+sol_326280
+sol_326295
+sol_326310
+sol_326325
+sol_326340
+sol_326355
+sol_326370
+sol_326385
+sol_326400
+sol_326415
+sol_326430
+sol_326445
+sol_326460
+sol_326475
+sol_326490
+sol_326505
+sol_326520
+sol_326535
+sol_326550
+sol_326565
+sol_327195
+sol_327210
+sol_327225
+sol_327240
+sol_327255
+sol_327270
+sol_327285
+sol_327300
+sol_327315
+sol_327330
+sol_327345
+sol_327360
+sol_327375
+sol_327390
+sol_327405
+sol_327420
+sol_327435
+sol_327450
+sol_327465
+sol_327480
+sol_327495
+sol_327510
+sol_327525
+sol_327540
+sol_327555
+sol_327570
+sol_327585
+sol_327600
+sol_327615
+sol_327630
+sol_327645
+sol_327660
+sol_327675
+sol_327690
+sol_327705
+sol_327720
+sol_327735
+sol_327750
+sol_327765
+sol_327780
+sol_327795
+sol_327810
+sol_327825
+sol_327840
+sol_327855
+sol_327870
+sol_327885
+sol_327900
+sol_327915
+sol_327930
+sol_327945
+sol_327960
+sol_327975
+sol_327990
+sol_328005
+sol_328650
+sol_328665
+sol_328680
+sol_328695
+sol_328710
+sol_328725
+sol_328740
+sol_328755
+sol_328770
+sol_328785
+sol_328800
+sol_328815
+sol_328830
+sol_328845
+sol_328860
+sol_328875
+sol_328890
+sol_328905
+sol_328920
+sol_328935
+sol_328950
+sol_328965
+sol_328980
+sol_328995
+sol_329010
+sol_329025
+sol_329040
+sol_329055
+sol_329070
+sol_329085
+sol_329100
+sol_329115
+sol_329130
+sol_329145
+sol_329160
+sol_329175
+sol_329190
+sol_329205
+sol_329220
+sol_329235
+sol_329250
+sol_329265
+sol_329280
+sol_329295
+sol_329310
+sol_329325
+sol_329340
+sol_329355
+sol_329370
+sol_329385
+sol_329400
+sol_329415
+sol_329430
+sol_329445
+sol_330090
+sol_330105
+sol_330120
+sol_330135
+sol_330150
+sol_330165
+sol_330180
+sol_330195
+sol_330210
+sol_330225
+sol_330240
+sol_330255
+sol_330270
+sol_330285
+sol_330300
+sol_330315
+sol_330330
+sol_330345
+sol_330360
+sol_330375
+sol_330390
+sol_330405
+sol_330420
+sol_330435
+sol_330450
+sol_330465
+sol_330480
+sol_330495
+sol_330510
+sol_330525
+sol_330540
+sol_330555
+sol_330570
+sol_330585
+sol_330600
+sol_330615
+sol_330630
+sol_330645
+sol_330660
+sol_330675
+sol_330690
+sol_330705
+sol_330720
+sol_330735
+sol_330750
+sol_330765
+sol_330780
+sol_330795
+sol_330810
+sol_330825
+sol_330840
+sol_330855
+sol_330870
+sol_330885
+sol_331530
+sol_331545
+sol_331560
+sol_331575
+sol_331590
+sol_331605
+sol_331620
+sol_331635
+sol_331650
+sol_331665
+sol_331680
+sol_331695
+sol_331710
+sol_331725
+sol_331740
+sol_331755
+sol_331770
+sol_331785
+sol_331800
+sol_331815
+sol_331830
+sol_331845
+sol_331860
+sol_331875
+sol_331890
+sol_331905
+sol_331920
+sol_331935
+sol_331950
+sol_331965
+sol_331980
+sol_331995
+sol_332010
+sol_332025
+sol_332040
+sol_332055
+sol_332070
+sol_332085
+sol_332100
+sol_332115
+sol_332130
+sol_332145
+sol_332160
+sol_332175
+sol_332190
+sol_332205
+sol_332220
+sol_332235
+sol_332250
+sol_332265
+sol_332280
+sol_332295
+sol_332310
+sol_332325
+sol_332970
+sol_332985
+sol_333000
+sol_333015
+sol_333030
+sol_333045
+sol_333060
+sol_333075
+sol_333090
+sol_333105
+sol_333120
+sol_333135
+sol_333150
+sol_333165
+sol_333180
+sol_333195
+sol_333210
+sol_333225
+sol_333240
+sol_333255
+sol_333270
+sol_333285
+sol_333300
+sol_333315
+sol_333330
+sol_333345
+sol_333360
+sol_333375
+sol_333390
+sol_333405
+sol_333420
+sol_333435
+sol_333450
+sol_333465
+sol_333480
+sol_333495
+sol_333510
+sol_333525
+sol_333540
+sol_333555
+sol_333570
+sol_333585
+sol_333600
+sol_333615
+sol_333630
+sol_333645
+sol_333660
+sol_333675
+sol_333690
+sol_333705
+sol_333720
+sol_333735
+sol_333750
+sol_333765
+sol_334410
+sol_334425
+sol_334440
+sol_334455
+sol_334470
+sol_334485
+sol_334500
+sol_334515
+sol_334530
+sol_334545
+sol_334560
+sol_334575
+sol_334590
+sol_334605
+sol_334620
+sol_334635
+sol_334650
+sol_334665
+sol_334680
+sol_334695
+sol_334710
+sol_334725
+sol_334740
+sol_334755
+sol_334770
+sol_334785
+sol_334800
+sol_334815
+sol_334830
+sol_334845
+sol_334860
+sol_334875
+sol_334890
+sol_334905
+sol_334920
+sol_334935
+sol_334950
+sol_334965
+sol_334980
+sol_334995
+sol_335010
+sol_335025
+sol_335040
+sol_335055
+sol_335070
+sol_335085
+sol_335100
+sol_335115
+sol_335130
+sol_335145
+sol_335160
+sol_335175
+sol_335190
+sol_335205
+sol_335850
+sol_335865
+sol_335880
+sol_335895
+sol_335910
+sol_335925
+sol_335940
+sol_335955
+sol_335970
+sol_335985
+sol_336000
+sol_336015
+sol_336030
+sol_336045
+sol_336060
+sol_336075
+sol_336090
+sol_336105
+sol_336120
+sol_336135
+sol_336150
+sol_336165
+sol_336180
+sol_336195
+sol_336210
+sol_336225
+sol_336240
+sol_336255
+sol_336270
+sol_336285
+sol_336300
+sol_336315
+sol_336330
+sol_336345
+sol_336360
+sol_336375
+sol_336390
+sol_336405
+sol_336420
+sol_336435
+sol_336450
+sol_336465
+sol_336480
+sol_336495
+sol_336510
+sol_336525
+sol_336540
+sol_336555
+sol_336570
+sol_336585
+sol_336600
+sol_336615
+sol_336630
+sol_337290
+sol_337305
+sol_337320
+sol_337335
+sol_337350
+sol_337365
+sol_337380
+sol_337395
+sol_337410
+sol_337425
+sol_337440
+sol_337455
+sol_337470
+sol_337485
+sol_337500
+sol_337515
+sol_337530
+sol_337545
+sol_337560
+sol_337575
+sol_337590
+sol_337605
+sol_337620
+sol_337635
+sol_337650
+sol_337665
+sol_337680
+sol_337695
+sol_337710
+sol_337725
+sol_337740
+sol_337755
+sol_337770
+sol_337785
+sol_337800
+sol_337815
+sol_337830
+sol_337845
+sol_337860
+sol_337875
+sol_337890
+sol_337905
+sol_337920
+sol_337935
+sol_337950
+sol_337965
+sol_337980
+sol_337995
+sol_338010
+sol_338025
+sol_338040
+sol_338055
+sol_338070
+sol_338730
+sol_338745
+sol_338760
+sol_338775
+sol_338790
+sol_338805
+sol_338820
+sol_338835
+sol_338850
+sol_338865
+sol_338880
+sol_338895
+sol_338910
+sol_338925
+sol_338940
+sol_338955
+sol_338970
+sol_338985
+sol_339000
+sol_339015
+sol_339030
+sol_339045
+sol_339060
+sol_339075
+sol_339090
+sol_339105
+sol_339120
+sol_339135
+sol_339150
+sol_339165
+sol_339180
+sol_339195
+sol_339210
+sol_339225
+sol_339240
+sol_339255
+sol_339270
+sol_339285
+sol_339300
+sol_339315
+sol_339330
+sol_339345
+sol_339360
+sol_339375
+sol_339390
+sol_339405
+sol_339420
+sol_339435
+sol_339450
+sol_339465
+sol_339480
+sol_339495
+sol_339510
+sol_340170
+sol_340185
+sol_340200
+sol_340215
+sol_340230
+sol_340245
+sol_340260
+sol_340275
+sol_340290
+sol_340305
+sol_340320
+sol_340335
+sol_340350
+sol_340365
+sol_340380
+sol_340395
+sol_340410
+sol_340425
+sol_340440
+sol_340455
+sol_340470
+sol_340485
+sol_340500
+sol_340515
+sol_340530
+sol_340545
+sol_340560
+sol_340575
+sol_340590
+sol_340605
+sol_340620
+sol_340635
+sol_340650
+sol_340665
+sol_340680
+sol_340695
+sol_340710
+sol_340725
+sol_340740
+sol_340755
+sol_340770
+sol_340785
+sol_340800
+sol_340815
+sol_340830
+sol_340845
+sol_340860
+sol_340875
+sol_340890
+sol_340905
+sol_340920
+sol_340935
+sol_340950
+sol_341610
+sol_341625
+sol_341640
+sol_341655
+sol_341670
+sol_341685
+sol_341700
+sol_341715
+sol_341730
+sol_341745
+sol_341760
+sol_341775
+sol_341790
+sol_341805
+sol_341820
+sol_341835
+sol_341850
+sol_341865
+sol_341880
+sol_341895
+sol_341910
+sol_341925
+sol_341940
+sol_341955
+sol_341970
+sol_341985
+sol_342000
+sol_342015
+sol_342030
+sol_342045
+sol_342060
+sol_342075
+sol_342090
+sol_342105
+sol_342120
+sol_342135
+sol_342150
+sol_342165
+sol_342180
+sol_342195
+sol_342210
+sol_342225
+sol_342240
+sol_342255
+sol_342270
+sol_342285
+sol_342300
+sol_342315
+sol_342330
+sol_342345
+sol_342360
+sol_342375
+sol_342390
+sol_343050
+sol_343065
+sol_343080
+sol_343095
+sol_343110
+sol_343125
+sol_343140
+sol_343155
+sol_343170
+sol_343185
+sol_343200
+sol_343215
+sol_343230
+sol_343245
+sol_343260
+sol_343275
+sol_343290
+sol_343305
+sol_343320
+sol_343335
+sol_343350
+sol_343365
+sol_343380
+sol_343395
+sol_343410
+sol_343425
+sol_343440
+sol_343455
+sol_343470
+sol_343485
+sol_343500
+sol_343515
+sol_343530
+sol_343545
+sol_343560
+sol_343575
+sol_343590
+sol_343605
+sol_343620
+sol_343635
+sol_343650
+sol_343665
+sol_343680
+sol_343695
+sol_343710
+sol_343725
+sol_343740
+sol_343755
+sol_343770
+sol_343785
+sol_343800
+sol_343815
+sol_343830
+sol_344490
+sol_344505
+sol_344520
+sol_344535
+sol_344550
+sol_344565
+sol_344580
+sol_344595
+sol_344610
+sol_344625
+sol_344640
+sol_344655
+sol_344670
+sol_344685
+sol_344700
+sol_344715
+sol_344730
+sol_344745
+sol_344760
+sol_344775
+sol_344790
+sol_344805
+sol_344820
+sol_344835
+sol_344850
+sol_344865
+sol_344880
+sol_344895
+sol_344910
+sol_344925
+sol_344940
+sol_344955
+sol_344970
+sol_344985
+sol_345000
+sol_345015
+sol_345030
+sol_345045
+sol_345060
+sol_345075
+sol_345090
+sol_345105
+sol_345120
+sol_345135
+sol_345150
+sol_345165
+sol_345180
+sol_345195
+sol_345210
+sol_345225
+sol_345240
+sol_345255
+sol_345270
+sol_345930
+sol_345945
+sol_345960
+sol_345975
+sol_345990
+sol_346005
+sol_346020
+sol_346035
+sol_346050
+sol_346065
+sol_346080
+sol_346095
+sol_346110
+sol_346125
+sol_346140
+sol_346155
+sol_346170
+sol_346185
+sol_346200
+sol_346215
+sol_346230
+sol_346245
+sol_346260
+sol_346275
+sol_346290
+sol_346305
+sol_346320
+sol_346335
+sol_346350
+sol_346365
+sol_346380
+sol_346395
+sol_346410
+sol_346425
+sol_346440
+sol_346455
+sol_346470
+sol_346485
+sol_346500
+sol_346515
+sol_346530
+sol_346545
+sol_346560
+sol_346575
+sol_346590
+sol_346605
+sol_346620
+sol_346635
+sol_346650
+sol_346665
+sol_346680
+sol_346695
+sol_346710
+sol_347370
+sol_347385
+sol_347400
+sol_347415
+sol_347430
+sol_347445
+sol_347460
+sol_347475
+sol_347490
+sol_347505
+sol_347520
+sol_347535
+sol_347550
+sol_347565
+sol_347580
+sol_347595
+sol_347610
+sol_347625
+sol_347640
+sol_347655
+sol_347670
+sol_347685
+sol_347700
+sol_347715
+sol_347730
+sol_347745
+sol_347760
+sol_347775
+sol_347790
+sol_347805
+sol_347820
+sol_347835
+sol_347850
+sol_347865
+sol_347880
+sol_347895
+sol_347910
+sol_347925
+sol_347940
+sol_347955
+sol_347970
+sol_347985
+sol_348000
+sol_348015
+sol_348030
+sol_348045
+sol_348060
+sol_348075
+sol_348090
+sol_348105
+sol_348120
+sol_348135
+sol_348150
+sol_348810
+sol_348825
+sol_348840
+sol_348855
+sol_348870
+sol_348885
+sol_348900
+sol_348915
+sol_348930
+sol_348945
+sol_348960
+sol_348975
+sol_348990
+sol_349005
+sol_349020
+sol_349035
+sol_349050
+sol_349065
+sol_349080
+sol_349095
+sol_349110
+sol_349125
+sol_349140
+sol_349155
+sol_349170
+sol_349185
+sol_349200
+sol_349215
+sol_349230
+sol_349245
+sol_349260
+sol_349275
+sol_349290
+sol_349305
+sol_349320
+sol_349335
+sol_349350
+sol_349365
+sol_349380
+sol_349395
+sol_349410
+sol_349425
+sol_349440
+sol_349455
+sol_349470
+sol_349485
+sol_349500
+sol_349515
+sol_349530
+sol_349545
+sol_349560
+sol_349575
+sol_349590
+sol_350250
+sol_350265
+sol_350280
+sol_350295
+sol_350310
+sol_350325
+sol_350340
+sol_350355
+sol_350370
+sol_350385
+sol_350400
+sol_350415
+sol_350430
+sol_350445
+sol_350460
+sol_350475
+sol_350490
+sol_350505
+sol_350520
+sol_350535
+sol_350550
+sol_350565
+sol_350580
+sol_350595
+sol_350610
+sol_350625
+sol_350640
+sol_350655
+sol_350670
+sol_350685
+sol_350700
+sol_350715
+sol_350730
+sol_350745
+sol_350760
+sol_350775
+sol_350790
+sol_350805
+sol_350820
+sol_350835
+sol_350850
+sol_350865
+sol_350880
+sol_350895
+sol_350910
+sol_350925
+sol_350940
+sol_350955
+sol_350970
+sol_350985
+sol_351000
+sol_351015
+sol_351705
+sol_351720
+sol_351735
+sol_351750
+sol_351765
+sol_351780
+sol_351795
+sol_351810
+sol_351825
+sol_351840
+sol_351855
+sol_351870
+sol_351885
+sol_351900
+sol_351915
+sol_351930
+sol_351945
+sol_351960
+sol_351975
+sol_351990
+sol_352005
+sol_352020
+sol_352035
+sol_352050
+sol_352065
+sol_352080
+sol_352095
+sol_352110
+sol_352125
+sol_352140
+sol_352155
+sol_352170
+sol_352185
+sol_352200
+sol_352215
+sol_352230
+sol_352245
+sol_352260
+sol_352275
+sol_352290
+sol_352305
+sol_352320
+sol_352335
+sol_352350
+sol_352365
+sol_352380
+sol_352395
+sol_352410
+sol_352425
+sol_352440
+sol_352455
+sol_353145
+sol_353160
+sol_353175
+sol_353190
+sol_353205
+sol_353220
+sol_353235
+sol_353250
+sol_353265
+sol_353280
+sol_353295
+sol_353310
+sol_353325
+sol_353340
+sol_353355
+sol_353370
+sol_353385
+sol_353400
+sol_353415
+sol_353430
+sol_353445
+sol_353460
+sol_353475
+sol_353490
+sol_353505
+sol_353520
+sol_353535
+sol_353550
+sol_353565
+sol_353580
+sol_353595
+sol_353610
+sol_353625
+sol_353640
+sol_353655
+sol_353670
+sol_353685
+sol_353700
+sol_353715
+sol_353730
+sol_353745
+sol_353760
+sol_353775
+sol_353790
+sol_353805
+sol_353820
+sol_353835
+sol_353850
+sol_353865
+sol_353880
+sol_353895
+sol_354585
+sol_354600
+sol_354615
+sol_354630
+sol_354645
+sol_354660
+sol_354675
+sol_354690
+sol_354705
+sol_354720
+sol_354735
+sol_354750
+sol_354765
+sol_354780
+sol_354795
+sol_354810
+sol_354825
+sol_354840
+sol_354855
+sol_354870
+sol_354885
+sol_354900
+sol_354915
+sol_354930
+sol_354945
+sol_354960
+sol_354975
+sol_354990
+sol_355005
+sol_355020
+sol_355035
+sol_355050
+sol_355065
+sol_355080
+sol_355095
+sol_355110
+sol_355125
+sol_355140
+sol_355155
+sol_355170
+sol_355185
+sol_355200
+sol_355215
+sol_355230
+sol_355245
+sol_355260
+sol_355275
+sol_355290
+sol_355305
+sol_355320
+sol_355335
+sol_356025
+sol_356040
+sol_356055
+sol_356070
+sol_356085
+sol_356100
+sol_356115
+sol_356130
+sol_356145
+sol_356160
+sol_356175
+sol_356190
+sol_356205
+sol_356220
+sol_356235
+sol_356250
+sol_356265
+sol_356280
+sol_356295
+sol_356310
+sol_356325
+sol_356340
+sol_356355
+sol_356370
+sol_356385
+sol_356400
+sol_356415
+sol_356430
+sol_356445
+sol_356460
+sol_356475
+sol_356490
+sol_356505
+sol_356520
+sol_356535
+sol_356550
+sol_356565
+sol_356580
+sol_356595
+sol_356610
+sol_356625
+sol_356640
+sol_356655
+sol_356670
+sol_356685
+sol_356700
+sol_356715
+sol_356730
+sol_356745
+sol_356760
+sol_356775
+sol_357465
+sol_357480
+sol_357495
+sol_357510
+sol_357525
+sol_357540
+sol_357555
+sol_357570
+sol_357585
+sol_357600
+sol_357615
+sol_357630
+sol_357645
+sol_357660
+sol_357675
+sol_357690
+sol_357705
+sol_357720
+sol_357735
+sol_357750
+sol_357765
+sol_357780
+sol_357795
+sol_357810
+sol_357825
+sol_357840
+sol_357855
+sol_357870
+sol_357885
+sol_357900
+sol_357915
+sol_357930
+sol_357945
+sol_357960
+sol_357975
+sol_357990
+sol_358005
+sol_358020
+sol_358035
+sol_358050
+sol_358065
+sol_358080
+sol_358095
+sol_358110
+sol_358125
+sol_358140
+sol_358155
+sol_358170
+sol_358185
+sol_358200
+sol_358215
+sol_358905
+sol_358920
+sol_358935
+sol_358950
+sol_358965
+sol_358980
+sol_358995
+sol_359010
+sol_359025
+sol_359040
+sol_359055
+sol_359070
+sol_359085
+sol_359100
+sol_359115
+sol_359130
+sol_359145
+sol_359160
+sol_359175
+sol_359190
+sol_359205
+sol_359220
+sol_359235
+sol_359250
+sol_359265
+sol_359280
+sol_359295
+sol_359310
+sol_359325
+sol_359340
+sol_359355
+sol_359370
+sol_359385
+sol_359400
+sol_359415
+sol_359430
+sol_359445
+sol_359460
+sol_359475
+sol_359490
+sol_359505
+sol_359520
+sol_359535
+sol_359550
+sol_359565
+sol_359580
+sol_359595
+sol_359610
+sol_359625
+sol_359640
+sol_359655
+sol_360345
+sol_360360
+sol_360375
+sol_360390
+sol_360405
+sol_360420
+sol_360435
+sol_360450
+sol_360465
+sol_360480
+sol_360495
+sol_360510
+sol_360525
+sol_360540
+sol_360555
+sol_360570
+sol_360585
+sol_360600
+sol_360615
+sol_360630
+sol_360645
+sol_360660
+sol_360675
+sol_360690
+sol_360705
+sol_360720
+sol_360735
+sol_360750
+sol_360765
+sol_360780
+sol_360795
+sol_360810
+sol_360825
+sol_360840
+sol_360855
+sol_360870
+sol_360885
+sol_360900
+sol_360915
+sol_360930
+sol_360945
+sol_360960
+sol_360975
+sol_360990
+sol_361005
+sol_361020
+sol_361035
+sol_361050
+sol_361065
+sol_361080
+sol_361095
+sol_361785
+sol_361800
+sol_361815
+sol_361830
+sol_361845
+sol_361860
+sol_361875
+sol_361890
+sol_361905
+sol_361920
+sol_361935
+sol_361950
+sol_361965
+sol_361980
+sol_361995
+sol_362010
+sol_362025
+sol_362040
+sol_362055
+sol_362070
+sol_362085
+sol_362100
+sol_362115
+sol_362130
+sol_362145
+sol_362160
+sol_362175
+sol_362190
+sol_362205
+sol_362220
+sol_362235
+sol_362250
+sol_362265
+sol_362280
+sol_362295
+sol_362310
+sol_362325
+sol_362340
+sol_362355
+sol_362370
+sol_362385
+sol_362400
+sol_362415
+sol_362430
+sol_362445
+sol_362460
+sol_362475
+sol_362490
+sol_362505
+sol_362520
+sol_362535
+sol_363225
+sol_363240
+sol_363255
+sol_363270
+sol_363285
+sol_363300
+sol_363315
+sol_363330
+sol_363345
+sol_363360
+sol_363375
+sol_363390
+sol_363405
+sol_363420
+sol_363435
+sol_363450
+sol_363465
+sol_363480
+sol_363495
+sol_363510
+sol_363525
+sol_363540
+sol_363555
+sol_363570
+sol_363585
+sol_363600
+sol_363615
+sol_363630
+sol_363645
+sol_363660
+sol_363675
+sol_363690
+sol_363705
+sol_363720
+sol_363735
+sol_363750
+sol_363765
+sol_363780
+sol_363795
+sol_363810
+sol_363825
+sol_363840
+sol_363855
+sol_363870
+sol_363885
+sol_363900
+sol_363915
+sol_363930
+sol_363945
+sol_363960
+sol_364665
+sol_364680
+sol_364695
+sol_364710
+sol_364725
+sol_364740
+sol_364755
+sol_364770
+sol_364785
+sol_364800
+sol_364815
+sol_364830
+sol_364845
+sol_364860
+sol_364875
+sol_364890
+sol_364905
+sol_364920
+sol_364935
+sol_364950
+sol_364965
+sol_364980
+sol_364995
+sol_365010
+sol_365025
+sol_365040
+sol_365055
+sol_365070
+sol_365085
+sol_365100
+sol_365115
+sol_365130
+sol_365145
+sol_365160
+sol_365175
+sol_365190
+sol_365205
+sol_365220
+sol_365235
+sol_365250
+sol_365265
+sol_365280
+sol_365295
+sol_365310
+sol_365325
+sol_365340
+sol_365355
+sol_365370
+sol_365385
+sol_365400
+sol_366105
+sol_366120
+sol_366135
+sol_366150
+sol_366165
+sol_366180
+sol_366195
+sol_366210
+sol_366225
+sol_366240
+sol_366255
+sol_366270
+sol_366285
+sol_366300
+sol_366315
+sol_366330
+sol_366345
+sol_366360
+sol_366375
+sol_366390
+sol_366405
+sol_366420
+sol_366435
+sol_366450
+sol_366465
+sol_366480
+sol_366495
+sol_366510
+sol_366525
+sol_366540
+sol_366555
+sol_366570
+sol_366585
+sol_366600
+sol_366615
+sol_366630
+sol_366645
+sol_366660
+sol_366675
+sol_366690
+sol_366705
+sol_366720
+sol_366735
+sol_366750
+sol_366765
+sol_366780
+sol_366795
+sol_366810
+sol_366825
+sol_366840
+sol_367545
+sol_367560
+sol_367575
+sol_367590
+sol_367605
+sol_367620
+sol_367635
+sol_367650
+sol_367665
+sol_367680
+sol_367695
+sol_367710
+sol_367725
+sol_367740
+sol_367755
+sol_367770
+sol_367785
+sol_367800
+sol_367815
+sol_367830
+sol_367845
+sol_367860
+sol_367875
+sol_367890
+sol_367905
+sol_367920
+sol_367935
+sol_367950
+sol_367965
+sol_367980
+sol_367995
+sol_368010
+sol_368025
+sol_368040
+sol_368055
+sol_368070
+sol_368085
+sol_368100
+sol_368115
+sol_368130
+sol_368145
+sol_368160
+sol_368175
+sol_368190
+sol_368205
+sol_368220
+sol_368235
+sol_368250
+sol_368265
+sol_368280
+sol_368985
+sol_369000
+sol_369015
+sol_369030
+sol_369045
+sol_369060
+sol_369075
+sol_369090
+sol_369105
+sol_369120
+sol_369135
+sol_369150
+sol_369165
+sol_369180
+sol_369195
+sol_369210
+sol_369225
+sol_369240
+sol_369255
+sol_369270
+sol_369285
+sol_369300
+sol_369315
+sol_369330
+sol_369345
+sol_369360
+sol_369375
+sol_369390
+sol_369405
+sol_369420
+sol_369435
+sol_369450
+sol_369465
+sol_369480
+sol_369495
+sol_369510
+sol_369525
+sol_369540
+sol_369555
+sol_369570
+sol_369585
+sol_369600
+sol_369615
+sol_369630
+sol_369645
+sol_369660
+sol_369675
+sol_369690
+sol_369705
+sol_369720
+sol_370425
+sol_370440
+sol_370455
+sol_370470
+sol_370485
+sol_370500
+sol_370515
+sol_370530
+sol_370545
+sol_370560
+sol_370575
+sol_370590
+sol_370605
+sol_370620
+sol_370635
+sol_370650
+sol_370665
+sol_370680
+sol_370695
+sol_370710
+sol_370725
+sol_370740
+sol_370755
+sol_370770
+sol_370785
+sol_370800
+sol_370815
+sol_370830
+sol_370845
+sol_370860
+sol_370875
+sol_370890
+sol_370905
+sol_370920
+sol_370935
+sol_370950
+sol_370965
+sol_370980
+sol_370995
+sol_371010
+sol_371025
+sol_371040
+sol_371055
+sol_371070
+sol_371085
+sol_371100
+sol_371115
+sol_371130
+sol_371145
+sol_371160
+sol_371865
+sol_371880
+sol_371895
+sol_371910
+sol_371925
+sol_371940
+sol_371955
+sol_371970
+sol_371985
+sol_372000
+sol_372015
+sol_372030
+sol_372045
+sol_372060
+sol_372075
+sol_372090
+sol_372105
+sol_372120
+sol_372135
+sol_372150
+sol_372165
+sol_372180
+sol_372195
+sol_372210
+sol_372225
+sol_372240
+sol_372255
+sol_372270
+sol_372285
+sol_372300
+sol_372315
+sol_372330
+sol_372345
+sol_372360
+sol_372375
+sol_372390
+sol_372405
+sol_372420
+sol_372435
+sol_372450
+sol_372465
+sol_372480
+sol_372495
+sol_372510
+sol_372525
+sol_372540
+sol_372555
+sol_372570
+sol_372585
+sol_372600
+sol_373305
+sol_373320
+sol_373335
+sol_373350
+sol_373365
+sol_373380
+sol_373395
+sol_373410
+sol_373425
+sol_373440
+sol_373455
+sol_373470
+sol_373485
+sol_373500
+sol_373515
+sol_373530
+sol_373545
+sol_373560
+sol_373575
+sol_373590
+sol_373605
+sol_373620
+sol_373635
+sol_373650
+sol_373665
+sol_373680
+sol_373695
+sol_373710
+sol_373725
+sol_373740
+sol_373755
+sol_373770
+sol_373785
+sol_373800
+sol_373815
+sol_373830
+sol_373845
+sol_373860
+sol_373875
+sol_373890
+sol_373905
+sol_373920
+sol_373935
+sol_373950
+sol_373965
+sol_373980
+sol_373995
+sol_374010
+sol_374025
+sol_374040
+sol_374745
+sol_374760
+sol_374775
+sol_374790
+sol_374805
+sol_374820
+sol_374835
+sol_374850
+sol_374865
+sol_374880
+sol_374895
+sol_374910
+sol_374925
+sol_374940
+sol_374955
+sol_374970
+sol_374985
+sol_375000
+sol_375015
+sol_375030
+sol_375045
+sol_375060
+sol_375075
+sol_375090
+sol_375105
+sol_375120
+sol_375135
+sol_375150
+sol_375165
+sol_375180
+sol_375195
+sol_375210
+sol_375225
+sol_375240
+sol_375255
+sol_375270
+sol_375285
+sol_375300
+sol_375315
+sol_375330
+sol_375345
+sol_375360
+sol_375375
+sol_375390
+sol_375405
+sol_375420
+sol_375435
+sol_375450
+sol_375465
+sol_375480
+sol_376200
+sol_376215
+sol_376230
+sol_376245
+sol_376260
+sol_376275
+sol_376290
+sol_376305
+sol_376320
+sol_376335
+sol_376350
+sol_376365
+sol_376380
+sol_376395
+sol_376410
+sol_376425
+sol_376440
+sol_376455
+sol_376470
+sol_376485
+sol_376500
+sol_376515
+sol_376530
+sol_376545
+sol_376560
+sol_376575
+sol_376590
+sol_376605
+sol_376620
+sol_376635
+sol_376650
+sol_376665
+sol_376680
+sol_376695
+sol_376710
+sol_376725
+sol_376740
+sol_376755
+sol_376770
+sol_376785
+sol_376800
+sol_376815
+sol_376830
+sol_376845
+sol_376860
+sol_376875
+sol_376890
+sol_376905
+sol_377640
+sol_377655
+sol_377670
+sol_377685
+sol_377700
+sol_377715
+sol_377730
+sol_377745
+sol_377760
+sol_377775
+sol_377790
+sol_377805
+sol_377820
+sol_377835
+sol_377850
+sol_377865
+sol_377880
+sol_377895
+sol_377910
+sol_377925
+sol_377940
+sol_377955
+sol_377970
+sol_377985
+sol_378000
+sol_378015
+sol_378030
+sol_378045
+sol_378060
+sol_378075
+sol_378090
+sol_378105
+sol_378120
+sol_378135
+sol_378150
+sol_378165
+sol_378180
+sol_378195
+sol_378210
+sol_378225
+sol_378240
+sol_378255
+sol_378270
+sol_378285
+sol_378300
+sol_378315
+sol_378330
+sol_378345
+sol_379080
+sol_379095
+sol_379110
+sol_379125
+sol_379140
+sol_379155
+sol_379170
+sol_379185
+sol_379200
+sol_379215
+sol_379230
+sol_379245
+sol_379260
+sol_379275
+sol_379290
+sol_379305
+sol_379320
+sol_379335
+sol_379350
+sol_379365
+sol_379380
+sol_379395
+sol_379410
+sol_379425
+sol_379440
+sol_379455
+sol_379470
+sol_379485
+sol_379500
+sol_379515
+sol_379530
+sol_379545
+sol_379560
+sol_379575
+sol_379590
+sol_379605
+sol_379620
+sol_379635
+sol_379650
+sol_379665
+sol_379680
+sol_379695
+sol_379710
+sol_379725
+sol_379740
+sol_379755
+sol_379770
+sol_379785
+sol_380520
+sol_380535
+sol_380550
+sol_380565
+sol_380580
+sol_380595
+sol_380610
+sol_380625
+sol_380640
+sol_380655
+sol_380670
+sol_380685
+sol_380700
+sol_380715
+sol_380730
+sol_380745
+sol_380760
+sol_380775
+sol_380790
+sol_380805
+sol_380820
+sol_380835
+sol_380850
+sol_380865
+sol_380880
+sol_380895
+sol_380910
+sol_380925
+sol_380940
+sol_380955
+sol_380970
+sol_380985
+sol_381000
+sol_381015
+sol_381030
+sol_381045
+sol_381060
+sol_381075
+sol_381090
+sol_381105
+sol_381120
+sol_381135
+sol_381150
+sol_381165
+sol_381180
+sol_381195
+sol_381210
+sol_381225
+sol_381960
+sol_381975
+sol_381990
+sol_382005
+sol_382020
+sol_382035
+sol_382050
+sol_382065
+sol_382080
+sol_382095
+sol_382110
+sol_382125
+sol_382140
+sol_382155
+sol_382170
+sol_382185
+sol_382200
+sol_382215
+sol_382230
+sol_382245
+sol_382260
+sol_382275
+sol_382290
+sol_382305
+sol_382320
+sol_382335
+sol_382350
+sol_382365
+sol_382380
+sol_382395
+sol_382410
+sol_382425
+sol_382440
+sol_382455
+sol_382470
+sol_382485
+sol_382500
+sol_382515
+sol_382530
+sol_382545
+sol_382560
+sol_382575
+sol_382590
+sol_382605
+sol_382620
+sol_382635
+sol_382650
+sol_382665
+sol_383400
+sol_383415
+sol_383430
+sol_383445
+sol_383460
+sol_383475
+sol_383490
+sol_383505
+sol_383520
+sol_383535
+sol_383550
+sol_383565
+sol_383580
+sol_383595
+sol_383610
+sol_383625
+sol_383640
+sol_383655
+sol_383670
+sol_383685
+sol_383700
+sol_383715
+sol_383730
+sol_383745
+sol_383760
+sol_383775
+sol_383790
+sol_383805
+sol_383820
+sol_383835
+sol_383850
+sol_383865
+sol_383880
+sol_383895
+sol_383910
+sol_383925
+sol_383940
+sol_383955
+sol_383970
+sol_383985
+sol_384000
+sol_384015
+sol_384030
+sol_384045
+sol_384060
+sol_384075
+sol_384090
+sol_384105
+sol_384840
+sol_384855
+sol_384870
+sol_384885
+sol_384900
+sol_384915
+sol_384930
+sol_384945
+sol_384960
+sol_384975
+sol_384990
+sol_385005
+sol_385020
+sol_385035
+sol_385050
+sol_385065
+sol_385080
+sol_385095
+sol_385110
+sol_385125
+sol_385140
+sol_385155
+sol_385170
+sol_385185
+sol_385200
+sol_385215
+sol_385230
+sol_385245
+sol_385260
+sol_385275
+sol_385290
+sol_385305
+sol_385320
+sol_385335
+sol_385350
+sol_385365
+sol_385380
+sol_385395
+sol_385410
+sol_385425
+sol_385440
+sol_385455
+sol_385470
+sol_385485
+sol_385500
+sol_385515
+sol_385530
+sol_385545
+sol_386280
+sol_386295
+sol_386310
+sol_386325
+sol_386340
+sol_386355
+sol_386370
+sol_386385
+sol_386400
+sol_386415
+sol_386430
+sol_386445
+sol_386460
+sol_386475
+sol_386490
+sol_386505
+sol_386520
+sol_386535
+sol_386550
+sol_386565
+sol_386580
+sol_386595
+sol_386610
+sol_386625
+sol_386640
+sol_386655
+sol_386670
+sol_386685
+sol_386700
+sol_386715
+sol_386730
+sol_386745
+sol_386760
+sol_386775
+sol_386790
+sol_386805
+sol_386820
+sol_386835
+sol_386850
+sol_386865
+sol_386880
+sol_386895
+sol_386910
+sol_386925
+sol_386940
+sol_386955
+sol_386970
+sol_386985
+sol_387720
+sol_387735
+sol_387750
+sol_387765
+sol_387780
+sol_387795
+sol_387810
+sol_387825
+sol_387840
+sol_387855
+sol_387870
+sol_387885
+sol_387900
+sol_387915
+sol_387930
+sol_387945
+sol_387960
+sol_387975
+sol_387990
+sol_388005
+sol_388020
+sol_388035
+sol_388050
+sol_388065
+sol_388080
+sol_388095
+sol_388110
+sol_388125
+sol_388140
+sol_388155
+sol_388170
+sol_388185
+sol_388200
+sol_388215
+sol_388230
+sol_388245
+sol_388260
+sol_388275
+sol_388290
+sol_388305
+sol_388320
+sol_388335
+sol_388350
+sol_388365
+sol_388380
+sol_388395
+sol_388410
+sol_388425
+sol_389160
+sol_389175
+sol_389190
+sol_389205
+sol_389220
+sol_389235
+sol_389250
+sol_389265
+sol_389280
+sol_389295
+sol_389310
+sol_389325
+sol_389340
+sol_389355
+sol_389370
+sol_389385
+sol_389400
+sol_389415
+sol_389430
+sol_389445
+sol_389460
+sol_389475
+sol_389490
+sol_389505
+sol_389520
+sol_389535
+sol_389550
+sol_389565
+sol_389580
+sol_389595
+sol_389610
+sol_389625
+sol_389640
+sol_389655
+sol_389670
+sol_389685
+sol_389700
+sol_389715
+sol_389730
+sol_389745
+sol_389760
+sol_389775
+sol_389790
+sol_389805
+sol_389820
+sol_389835
+sol_389850
+sol_390600
+sol_390615
+sol_390630
+sol_390645
+sol_390660
+sol_390675
+sol_390690
+sol_390705
+sol_390720
+sol_390735
+sol_390750
+sol_390765
+sol_390780
+sol_390795
+sol_390810
+sol_390825
+sol_390840
+sol_390855
+sol_390870
+sol_390885
+sol_390900
+sol_390915
+sol_390930
+sol_390945
+sol_390960
+sol_390975
+sol_390990
+sol_391005
+sol_391020
+sol_391035
+sol_391050
+sol_391065
+sol_391080
+sol_391095
+sol_391110
+sol_391125
+sol_391140
+sol_391155
+sol_391170
+sol_391185
+sol_391200
+sol_391215
+sol_391230
+sol_391245
+sol_391260
+sol_391275
+sol_391290
+sol_392040
+sol_392055
+sol_392070
+sol_392085
+sol_392100
+sol_392115
+sol_392130
+sol_392145
+sol_392160
+sol_392175
+sol_392190
+sol_392205
+sol_392220
+sol_392235
+sol_392250
+sol_392265
+sol_392280
+sol_392295
+sol_392310
+sol_392325
+sol_392340
+sol_392355
+sol_392370
+sol_392385
+sol_392400
+sol_392415
+sol_392430
+sol_392445
+sol_392460
+sol_392475
+sol_392490
+sol_392505
+sol_392520
+sol_392535
+sol_392550
+sol_392565
+sol_392580
+sol_392595
+sol_392610
+sol_392625
+sol_392640
+sol_392655
+sol_392670
+sol_392685
+sol_392700
+sol_392715
+sol_392730
+sol_393480
+sol_393495
+sol_393510
+sol_393525
+sol_393540
+sol_393555
+sol_393570
+sol_393585
+sol_393600
+sol_393615
+sol_393630
+sol_393645
+sol_393660
+sol_393675
+sol_393690
+sol_393705
+sol_393720
+sol_393735
+sol_393750
+sol_393765
+sol_393780
+sol_393795
+sol_393810
+sol_393825
+sol_393840
+sol_393855
+sol_393870
+sol_393885
+sol_393900
+sol_393915
+sol_393930
+sol_393945
+sol_393960
+sol_393975
+sol_393990
+sol_394005
+sol_394020
+sol_394035
+sol_394050
+sol_394065
+sol_394080
+sol_394095
+sol_394110
+sol_394125
+sol_394140
+sol_394155
+sol_394170
+sol_394920
+sol_394935
+sol_394950
+sol_394965
+sol_394980
+sol_394995
+sol_395010
+sol_395025
+sol_395040
+sol_395055
+sol_395070
+sol_395085
+sol_395100
+sol_395115
+sol_395130
+sol_395145
+sol_395160
+sol_395175
+sol_395190
+sol_395205
+sol_395220
+sol_395235
+sol_395250
+sol_395265
+sol_395280
+sol_395295
+sol_395310
+sol_395325
+sol_395340
+sol_395355
+sol_395370
+sol_395385
+sol_395400
+sol_395415
+sol_395430
+sol_395445
+sol_395460
+sol_395475
+sol_395490
+sol_395505
+sol_395520
+sol_395535
+sol_395550
+sol_395565
+sol_395580
+sol_395595
+sol_395610
+sol_396360
+sol_396375
+sol_396390
+sol_396405
+sol_396420
+sol_396435
+sol_396450
+sol_396465
+sol_396480
+sol_396495
+sol_396510
+sol_396525
+sol_396540
+sol_396555
+sol_396570
+sol_396585
+sol_396600
+sol_396615
+sol_396630
+sol_396645
+sol_396660
+sol_396675
+sol_396690
+sol_396705
+sol_396720
+sol_396735
+sol_396750
+sol_396765
+sol_396780
+sol_396795
+sol_396810
+sol_396825
+sol_396840
+sol_396855
+sol_396870
+sol_396885
+sol_396900
+sol_396915
+sol_396930
+sol_396945
+sol_396960
+sol_396975
+sol_396990
+sol_397005
+sol_397020
+sol_397035
+sol_397050
+sol_397815
+sol_397830
+sol_397845
+sol_397860
+sol_397875
+sol_397890
+sol_397905
+sol_397920
+sol_397935
+sol_397950
+sol_397965
+sol_397980
+sol_397995
+sol_398010
+sol_398025
+sol_398040
+sol_398055
+sol_398070
+sol_398085
+sol_398100
+sol_398115
+sol_398130
+sol_398145
+sol_398160
+sol_398175
+sol_398190
+sol_398205
+sol_398220
+sol_398235
+sol_398250
+sol_398265
+sol_398280
+sol_398295
+sol_398310
+sol_398325
+sol_398340
+sol_398355
+sol_398370
+sol_398385
+sol_398400
+sol_398415
+sol_398430
+sol_398445
+sol_398460
+sol_398475
+sol_398490
+sol_399255
+sol_399270
+sol_399285
+sol_399300
+sol_399315
+sol_399330
+sol_399345
+sol_399360
+sol_399375
+sol_399390
+sol_399405
+sol_399420
+sol_399435
+sol_399450
+sol_399465
+sol_399480
+sol_399495
+sol_399510
+sol_399525
+sol_399540
+sol_399555
+sol_399570
+sol_399585
+sol_399600
+sol_399615
+sol_399630
+sol_399645
+sol_399660
+sol_399675
+sol_399690
+sol_399705
+sol_399720
+sol_399735
+sol_399750
+sol_399765
+sol_399780
+sol_399795
+sol_399810
+sol_399825
+sol_399840
+sol_399855
+sol_399870
+sol_399885
+sol_399900
+sol_399915
+sol_399930
+sol_400695
+sol_400710
+sol_400725
+sol_400740
+sol_400755
+sol_400770
+sol_400785
+sol_400800
+sol_400815
+sol_400830
+sol_400845
+sol_400860
+sol_400875
+sol_400890
+sol_400905
+sol_400920
+sol_400935
+sol_400950
+sol_400965
+sol_400980
+sol_400995
+sol_401010
+sol_401025
+sol_401040
+sol_401055
+sol_401070
+sol_401085
+sol_401100
+sol_401115
+sol_401130
+sol_401145
+sol_401160
+sol_401175
+sol_401190
+sol_401205
+sol_401220
+sol_401235
+sol_401250
+sol_401265
+sol_401280
+sol_401295
+sol_401310
+sol_401325
+sol_401340
+sol_401355
+sol_401370
+sol_402135
+sol_402150
+sol_402165
+sol_402180
+sol_402195
+sol_402210
+sol_402225
+sol_402240
+sol_402255
+sol_402270
+sol_402285
+sol_402300
+sol_402315
+sol_402330
+sol_402345
+sol_402360
+sol_402375
+sol_402390
+sol_402405
+sol_402420
+sol_402435
+sol_402450
+sol_402465
+sol_402480
+sol_402495
+sol_402510
+sol_402525
+sol_402540
+sol_402555
+sol_402570
+sol_402585
+sol_402600
+sol_402615
+sol_402630
+sol_402645
+sol_402660
+sol_402675
+sol_402690
+sol_402705
+sol_402720
+sol_402735
+sol_402750
+sol_402765
+sol_402780
+sol_402795
+sol_402810
+sol_403575
+sol_403590
+sol_403605
+sol_403620
+sol_403635
+sol_403650
+sol_403665
+sol_403680
+sol_403695
+sol_403710
+sol_403725
+sol_403740
+sol_403755
+sol_403770
+sol_403785
+sol_403800
+sol_403815
+sol_403830
+sol_403845
+sol_403860
+sol_403875
+sol_403890
+sol_403905
+sol_403920
+sol_403935
+sol_403950
+sol_403965
+sol_403980
+sol_403995
+sol_404010
+sol_404025
+sol_404040
+sol_404055
+sol_404070
+sol_404085
+sol_404100
+sol_404115
+sol_404130
+sol_404145
+sol_404160
+sol_404175
+sol_404190
+sol_404205
+sol_404220
+sol_404235
+sol_405015
+sol_405030
+sol_405045
+sol_405060
+sol_405075
+sol_405090
+sol_405105
+sol_405120
+sol_405135
+sol_405150
+sol_405165
+sol_405180
+sol_405195
+sol_405210
+sol_405225
+sol_405240
+sol_405255
+sol_405270
+sol_405285
+sol_405300
+sol_405315
+sol_405330
+sol_405345
+sol_405360
+sol_405375
+sol_405390
+sol_405405
+sol_405420
+sol_405435
+sol_405450
+sol_405465
+sol_405480
+sol_405495
+sol_405510
+sol_405525
+sol_405540
+sol_405555
+sol_405570
+sol_405585
+sol_405600
+sol_405615
+sol_405630
+sol_405645
+sol_405660
+sol_405675
+sol_406455
+sol_406470
+sol_406485
+sol_406500
+sol_406515
+sol_406530
+sol_406545
+sol_406560
+sol_406575
+sol_406590
+sol_406605
+sol_406620
+sol_406635
+sol_406650
+sol_406665
+sol_406680
+sol_406695
+sol_406710
+sol_406725
+sol_406740
+sol_406755
+sol_406770
+sol_406785
+sol_406800
+sol_406815
+sol_406830
+sol_406845
+sol_406860
+sol_406875
+sol_406890
+sol_406905
+sol_406920
+sol_406935
+sol_406950
+sol_406965
+sol_406980
+sol_406995
+sol_407010
+sol_407025
+sol_407040
+sol_407055
+sol_407070
+sol_407085
+sol_407100
+sol_407115
+sol_407895
+sol_407910
+sol_407925
+sol_407940
+sol_407955
+sol_407970
+sol_407985
+sol_408000
+sol_408015
+sol_408030
+sol_408045
+sol_408060
+sol_408075
+sol_408090
+sol_408105
+sol_408120
+sol_408135
+sol_408150
+sol_408165
+sol_408180
+sol_408195
+sol_408210
+sol_408225
+sol_408240
+sol_408255
+sol_408270
+sol_408285
+sol_408300
+sol_408315
+sol_408330
+sol_408345
+sol_408360
+sol_408375
+sol_408390
+sol_408405
+sol_408420
+sol_408435
+sol_408450
+sol_408465
+sol_408480
+sol_408495
+sol_408510
+sol_408525
+sol_408540
+sol_408555
+sol_409335
+sol_409350
+sol_409365
+sol_409380
+sol_409395
+sol_409410
+sol_409425
+sol_409440
+sol_409455
+sol_409470
+sol_409485
+sol_409500
+sol_409515
+sol_409530
+sol_409545
+sol_409560
+sol_409575
+sol_409590
+sol_409605
+sol_409620
+sol_409635
+sol_409650
+sol_409665
+sol_409680
+sol_409695
+sol_409710
+sol_409725
+sol_409740
+sol_409755
+sol_409770
+sol_409785
+sol_409800
+sol_409815
+sol_409830
+sol_409845
+sol_409860
+sol_409875
+sol_409890
+sol_409905
+sol_409920
+sol_409935
+sol_409950
+sol_409965
+sol_409980
+sol_409995
+sol_410775
+sol_410790
+sol_410805
+sol_410820
+sol_410835
+sol_410850
+sol_410865
+sol_410880
+sol_410895
+sol_410910
+sol_410925
+sol_410940
+sol_410955
+sol_410970
+sol_410985
+sol_411000
+sol_411015
+sol_411030
+sol_411045
+sol_411060
+sol_411075
+sol_411090
+sol_411105
+sol_411120
+sol_411135
+sol_411150
+sol_411165
+sol_411180
+sol_411195
+sol_411210
+sol_411225
+sol_411240
+sol_411255
+sol_411270
+sol_411285
+sol_411300
+sol_411315
+sol_411330
+sol_411345
+sol_411360
+sol_411375
+sol_411390
+sol_411405
+sol_411420
+sol_411435
+sol_412215
+sol_412230
+sol_412245
+sol_412260
+sol_412275
+sol_412290
+sol_412305
+sol_412320
+sol_412335
+sol_412350
+sol_412365
+sol_412380
+sol_412395
+sol_412410
+sol_412425
+sol_412440
+sol_412455
+sol_412470
+sol_412485
+sol_412500
+sol_412515
+sol_412530
+sol_412545
+sol_412560
+sol_412575
+sol_412590
+sol_412605
+sol_412620
+sol_412635
+sol_412650
+sol_412665
+sol_412680
+sol_412695
+sol_412710
+sol_412725
+sol_412740
+sol_412755
+sol_412770
+sol_412785
+sol_412800
+sol_412815
+sol_412830
+sol_412845
+sol_412860
+sol_412875
+sol_413655
+sol_413670
+sol_413685
+sol_413700
+sol_413715
+sol_413730
+sol_413745
+sol_413760
+sol_413775
+sol_413790
+sol_413805
+sol_413820
+sol_413835
+sol_413850
+sol_413865
+sol_413880
+sol_413895
+sol_413910
+sol_413925
+sol_413940
+sol_413955
+sol_413970
+sol_413985
+sol_414000
+sol_414015
+sol_414030
+sol_414045
+sol_414060
+sol_414075
+sol_414090
+sol_414105
+sol_414120
+sol_414135
+sol_414150
+sol_414165
+sol_414180
+sol_414195
+sol_414210
+sol_414225
+sol_414240
+sol_414255
+sol_414270
+sol_414285
+sol_414300
+sol_414315
+sol_415095
+sol_415110
+sol_415125
+sol_415140
+sol_415155
+sol_415170
+sol_415185
+sol_415200
+sol_415215
+sol_415230
+sol_415245
+sol_415260
+sol_415275
+sol_415290
+sol_415305
+sol_415320
+sol_415335
+sol_415350
+sol_415365
+sol_415380
+sol_415395
+sol_415410
+sol_415425
+sol_415440
+sol_415455
+sol_415470
+sol_415485
+sol_415500
+sol_415515
+sol_415530
+sol_415545
+sol_415560
+sol_415575
+sol_415590
+sol_415605
+sol_415620
+sol_415635
+sol_415650
+sol_415665
+sol_415680
+sol_415695
+sol_415710
+sol_415725
+sol_415740
+sol_415755
+sol_416535
+sol_416550
+sol_416565
+sol_416580
+sol_416595
+sol_416610
+sol_416625
+sol_416640
+sol_416655
+sol_416670
+sol_416685
+sol_416700
+sol_416715
+sol_416730
+sol_416745
+sol_416760
+sol_416775
+sol_416790
+sol_416805
+sol_416820
+sol_416835
+sol_416850
+sol_416865
+sol_416880
+sol_416895
+sol_416910
+sol_416925
+sol_416940
+sol_416955
+sol_416970
+sol_416985
+sol_417000
+sol_417015
+sol_417030
+sol_417045
+sol_417060
+sol_417075
+sol_417090
+sol_417105
+sol_417120
+sol_417135
+sol_417150
+sol_417165
+sol_417180
+sol_417195
+sol_417975
+sol_417990
+sol_418005
+sol_418020
+sol_418035
+sol_418050
+sol_418065
+sol_418080
+sol_418095
+sol_418110
+sol_418125
+sol_418140
+sol_418155
+sol_418170
+sol_418185
+sol_418200
+sol_418215
+sol_418230
+sol_418245
+sol_418260
+sol_418275
+sol_418290
+sol_418305
+sol_418320
+sol_418335
+sol_418350
+sol_418365
+sol_418380
+sol_418395
+sol_418410
+sol_418425
+sol_418440
+sol_418455
+sol_418470
+sol_418485
+sol_418500
+sol_418515
+sol_418530
+sol_418545
+sol_418560
+sol_418575
+sol_418590
+sol_418605
+sol_418620
+sol_419430
+sol_419445
+sol_419460
+sol_419475
+sol_419490
+sol_419505
+sol_419520
+sol_419535
+sol_419550
+sol_419565
+sol_419580
+sol_419595
+sol_419610
+sol_419625
+sol_419640
+sol_419655
+sol_419670
+sol_419685
+sol_419700
+sol_419715
+sol_419730
+sol_419745
+sol_419760
+sol_419775
+sol_419790
+sol_419805
+sol_419820
+sol_419835
+sol_419850
+sol_419865
+sol_419880
+sol_419895
+sol_419910
+sol_419925
+sol_419940
+sol_419955
+sol_419970
+sol_419985
+sol_420000
+sol_420015
+sol_420030
+sol_420045
+sol_420060
+sol_420870
+sol_420885
+sol_420900
+sol_420915
+sol_420930
+sol_420945
+sol_420960
+sol_420975
+sol_420990
+sol_421005
+sol_421020
+sol_421035
+sol_421050
+sol_421065
+sol_421080
+sol_421095
+sol_421110
+sol_421125
+sol_421140
+sol_421155
+sol_421170
+sol_421185
+sol_421200
+sol_421215
+sol_421230
+sol_421245
+sol_421260
+sol_421275
+sol_421290
+sol_421305
+sol_421320
+sol_421335
+sol_421350
+sol_421365
+sol_421380
+sol_421395
+sol_421410
+sol_421425
+sol_421440
+sol_421455
+sol_421470
+sol_421485
+sol_421500
+sol_422310
+sol_422325
+sol_422340
+sol_422355
+sol_422370
+sol_422385
+sol_422400
+sol_422415
+sol_422430
+sol_422445
+sol_422460
+sol_422475
+sol_422490
+sol_422505
+sol_422520
+sol_422535
+sol_422550
+sol_422565
+sol_422580
+sol_422595
+sol_422610
+sol_422625
+sol_422640
+sol_422655
+sol_422670
+sol_422685
+sol_422700
+sol_422715
+sol_422730
+sol_422745
+sol_422760
+sol_422775
+sol_422790
+sol_422805
+sol_422820
+sol_422835
+sol_422850
+sol_422865
+sol_422880
+sol_422895
+sol_422910
+sol_422925
+sol_422940
+sol_423750
+sol_423765
+sol_423780
+sol_423795
+sol_423810
+sol_423825
+sol_423840
+sol_423855
+sol_423870
+sol_423885
+sol_423900
+sol_423915
+sol_423930
+sol_423945
+sol_423960
+sol_423975
+sol_423990
+sol_424005
+sol_424020
+sol_424035
+sol_424050
+sol_424065
+sol_424080
+sol_424095
+sol_424110
+sol_424125
+sol_424140
+sol_424155
+sol_424170
+sol_424185
+sol_424200
+sol_424215
+sol_424230
+sol_424245
+sol_424260
+sol_424275
+sol_424290
+sol_424305
+sol_424320
+sol_424335
+sol_424350
+sol_424365
+sol_424380
+sol_425190
+sol_425205
+sol_425220
+sol_425235
+sol_425250
+sol_425265
+sol_425280
+sol_425295
+sol_425310
+sol_425325
+sol_425340
+sol_425355
+sol_425370
+sol_425385
+sol_425400
+sol_425415
+sol_425430
+sol_425445
+sol_425460
+sol_425475
+sol_425490
+sol_425505
+sol_425520
+sol_425535
+sol_425550
+sol_425565
+sol_425580
+sol_425595
+sol_425610
+sol_425625
+sol_425640
+sol_425655
+sol_425670
+sol_425685
+sol_425700
+sol_425715
+sol_425730
+sol_425745
+sol_425760
+sol_425775
+sol_425790
+sol_425805
+sol_425820
+sol_426630
+sol_426645
+sol_426660
+sol_426675
+sol_426690
+sol_426705
+sol_426720
+sol_426735
+sol_426750
+sol_426765
+sol_426780
+sol_426795
+sol_426810
+sol_426825
+sol_426840
+sol_426855
+sol_426870
+sol_426885
+sol_426900
+sol_426915
+sol_426930
+sol_426945
+sol_426960
+sol_426975
+sol_426990
+sol_427005
+sol_427020
+sol_427035
+sol_427050
+sol_427065
+sol_427080
+sol_427095
+sol_427110
+sol_427125
+sol_427140
+sol_427155
+sol_427170
+sol_427185
+sol_427200
+sol_427215
+sol_427230
+sol_427245
+sol_427260
+sol_428070
+sol_428085
+sol_428100
+sol_428115
+sol_428130
+sol_428145
+sol_428160
+sol_428175
+sol_428190
+sol_428205
+sol_428220
+sol_428235
+sol_428250
+sol_428265
+sol_428280
+sol_428295
+sol_428310
+sol_428325
+sol_428340
+sol_428355
+sol_428370
+sol_428385
+sol_428400
+sol_428415
+sol_428430
+sol_428445
+sol_428460
+sol_428475
+sol_428490
+sol_428505
+sol_428520
+sol_428535
+sol_428550
+sol_428565
+sol_428580
+sol_428595
+sol_428610
+sol_428625
+sol_428640
+sol_428655
+sol_428670
+sol_428685
+sol_428700
+sol_429510
+sol_429525
+sol_429540
+sol_429555
+sol_429570
+sol_429585
+sol_429600
+sol_429615
+sol_429630
+sol_429645
+sol_429660
+sol_429675
+sol_429690
+sol_429705
+sol_429720
+sol_429735
+sol_429750
+sol_429765
+sol_429780
+sol_429795
+sol_429810
+sol_429825
+sol_429840
+sol_429855
+sol_429870
+sol_429885
+sol_429900
+sol_429915
+sol_429930
+sol_429945
+sol_429960
+sol_429975
+sol_429990
+sol_430005
+sol_430020
+sol_430035
+sol_430050
+sol_430065
+sol_430080
+sol_430095
+sol_430110
+sol_430125
+sol_430140
+sol_430950
+sol_430965
+sol_430980
+sol_430995
+sol_431010
+sol_431025
+sol_431040
+sol_431055
+sol_431070
+sol_431085
+sol_431100
+sol_431115
+sol_431130
+sol_431145
+sol_431160
+sol_431175
+sol_431190
+sol_431205
+sol_431220
+sol_431235
+sol_431250
+sol_431265
+sol_431280
+sol_431295
+sol_431310
+sol_431325
+sol_431340
+sol_431355
+sol_431370
+sol_431385
+sol_431400
+sol_431415
+sol_431430
+sol_431445
+sol_431460
+sol_431475
+sol_431490
+sol_431505
+sol_431520
+sol_431535
+sol_431550
+sol_431565
+sol_431580
+sol_432390
+sol_432405
+sol_432420
+sol_432435
+sol_432450
+sol_432465
+sol_432480
+sol_432495
+sol_432510
+sol_432525
+sol_432540
+sol_432555
+sol_432570
+sol_432585
+sol_432600
+sol_432615
+sol_432630
+sol_432645
+sol_432660
+sol_432675
+sol_432690
+sol_432705
+sol_432720
+sol_432735
+sol_432750
+sol_432765
+sol_432780
+sol_432795
+sol_432810
+sol_432825
+sol_432840
+sol_432855
+sol_432870
+sol_432885
+sol_432900
+sol_432915
+sol_432930
+sol_432945
+sol_432960
+sol_432975
+sol_432990
+sol_433005
+sol_433020
+sol_433830
+sol_433845
+sol_433860
+sol_433875
+sol_433890
+sol_433905
+sol_433920
+sol_433935
+sol_433950
+sol_433965
+sol_433980
+sol_433995
+sol_434010
+sol_434025
+sol_434040
+sol_434055
+sol_434070
+sol_434085
+sol_434100
+sol_434115
+sol_434130
+sol_434145
+sol_434160
+sol_434175
+sol_434190
+sol_434205
+sol_434220
+sol_434235
+sol_434250
+sol_434265
+sol_434280
+sol_434295
+sol_434310
+sol_434325
+sol_434340
+sol_434355
+sol_434370
+sol_434385
+sol_434400
+sol_434415
+sol_434430
+sol_434445
+sol_435270
+sol_435285
+sol_435300
+sol_435315
+sol_435330
+sol_435345
+sol_435360
+sol_435375
+sol_435390
+sol_435405
+sol_435420
+sol_435435
+sol_435450
+sol_435465
+sol_435480
+sol_435495
+sol_435510
+sol_435525
+sol_435540
+sol_435555
+sol_435570
+sol_435585
+sol_435600
+sol_435615
+sol_435630
+sol_435645
+sol_435660
+sol_435675
+sol_435690
+sol_435705
+sol_435720
+sol_435735
+sol_435750
+sol_435765
+sol_435780
+sol_435795
+sol_435810
+sol_435825
+sol_435840
+sol_435855
+sol_435870
+sol_435885
+sol_436710
+sol_436725
+sol_436740
+sol_436755
+sol_436770
+sol_436785
+sol_436800
+sol_436815
+sol_436830
+sol_436845
+sol_436860
+sol_436875
+sol_436890
+sol_436905
+sol_436920
+sol_436935
+sol_436950
+sol_436965
+sol_436980
+sol_436995
+sol_437010
+sol_437025
+sol_437040
+sol_437055
+sol_437070
+sol_437085
+sol_437100
+sol_437115
+sol_437130
+sol_437145
+sol_437160
+sol_437175
+sol_437190
+sol_437205
+sol_437220
+sol_437235
+sol_437250
+sol_437265
+sol_437280
+sol_437295
+sol_437310
+sol_437325
+sol_438150
+sol_438165
+sol_438180
+sol_438195
+sol_438210
+sol_438225
+sol_438240
+sol_438255
+sol_438270
+sol_438285
+sol_438300
+sol_438315
+sol_438330
+sol_438345
+sol_438360
+sol_438375
+sol_438390
+sol_438405
+sol_438420
+sol_438435
+sol_438450
+sol_438465
+sol_438480
+sol_438495
+sol_438510
+sol_438525
+sol_438540
+sol_438555
+sol_438570
+sol_438585
+sol_438600
+sol_438615
+sol_438630
+sol_438645
+sol_438660
+sol_438675
+sol_438690
+sol_438705
+sol_438720
+sol_438735
+sol_438750
+sol_438765
+sol_439605
+sol_439620
+sol_439635
+sol_439650
+sol_439665
+sol_439680
+sol_439695
+sol_439710
+sol_439725
+sol_439740
+sol_439755
+sol_439770
+sol_439785
+sol_439800
+sol_439815
+sol_439830
+sol_439845
+sol_439860
+sol_439875
+sol_439890
+sol_439905
+sol_439920
+sol_439935
+sol_439950
+sol_439965
+sol_439980
+sol_439995
+sol_440010
+sol_440025
+sol_440040
+sol_440055
+sol_440070
+sol_440085
+sol_440100
+sol_440115
+sol_440130
+sol_440145
+sol_440160
+sol_440175
+sol_440190
+sol_440205
+sol_441045
+sol_441060
+sol_441075
+sol_441090
+sol_441105
+sol_441120
+sol_441135
+sol_441150
+sol_441165
+sol_441180
+sol_441195
+sol_441210
+sol_441225
+sol_441240
+sol_441255
+sol_441270
+sol_441285
+sol_441300
+sol_441315
+sol_441330
+sol_441345
+sol_441360
+sol_441375
+sol_441390
+sol_441405
+sol_441420
+sol_441435
+sol_441450
+sol_441465
+sol_441480
+sol_441495
+sol_441510
+sol_441525
+sol_441540
+sol_441555
+sol_441570
+sol_441585
+sol_441600
+sol_441615
+sol_441630
+sol_441645
+sol_442485
+sol_442500
+sol_442515
+sol_442530
+sol_442545
+sol_442560
+sol_442575
+sol_442590
+sol_442605
+sol_442620
+sol_442635
+sol_442650
+sol_442665
+sol_442680
+sol_442695
+sol_442710
+sol_442725
+sol_442740
+sol_442755
+sol_442770
+sol_442785
+sol_442800
+sol_442815
+sol_442830
+sol_442845
+sol_442860
+sol_442875
+sol_442890
+sol_442905
+sol_442920
+sol_442935
+sol_442950
+sol_442965
+sol_442980
+sol_442995
+sol_443010
+sol_443025
+sol_443040
+sol_443055
+sol_443070
+sol_443085
+sol_443925
+sol_443940
+sol_443955
+sol_443970
+sol_443985
+sol_444000
+sol_444015
+sol_444030
+sol_444045
+sol_444060
+sol_444075
+sol_444090
+sol_444105
+sol_444120
+sol_444135
+sol_444150
+sol_444165
+sol_444180
+sol_444195
+sol_444210
+sol_444225
+sol_444240
+sol_444255
+sol_444270
+sol_444285
+sol_444300
+sol_444315
+sol_444330
+sol_444345
+sol_444360
+sol_444375
+sol_444390
+sol_444405
+sol_444420
+sol_444435
+sol_444450
+sol_444465
+sol_444480
+sol_444495
+sol_444510
+sol_444525
+sol_445365
+sol_445380
+sol_445395
+sol_445410
+sol_445425
+sol_445440
+sol_445455
+sol_445470
+sol_445485
+sol_445500
+sol_445515
+sol_445530
+sol_445545
+sol_445560
+sol_445575
+sol_445590
+sol_445605
+sol_445620
+sol_445635
+sol_445650
+sol_445665
+sol_445680
+sol_445695
+sol_445710
+sol_445725
+sol_445740
+sol_445755
+sol_445770
+sol_445785
+sol_445800
+sol_445815
+sol_445830
+sol_445845
+sol_445860
+sol_445875
+sol_445890
+sol_445905
+sol_445920
+sol_445935
+sol_445950
+sol_445965
+sol_446805
+sol_446820
+sol_446835
+sol_446850
+sol_446865
+sol_446880
+sol_446895
+sol_446910
+sol_446925
+sol_446940
+sol_446955
+sol_446970
+sol_446985
+sol_447000
+sol_447015
+sol_447030
+sol_447045
+sol_447060
+sol_447075
+sol_447090
+sol_447105
+sol_447120
+sol_447135
+sol_447150
+sol_447165
+sol_447180
+sol_447195
+sol_447210
+sol_447225
+sol_447240
+sol_447255
+sol_447270
+sol_447285
+sol_447300
+sol_447315
+sol_447330
+sol_447345
+sol_447360
+sol_447375
+sol_447390
+sol_447405
+sol_448245
+sol_448260
+sol_448275
+sol_448290
+sol_448305
+sol_448320
+sol_448335
+sol_448350
+sol_448365
+sol_448380
+sol_448395
+sol_448410
+sol_448425
+sol_448440
+sol_448455
+sol_448470
+sol_448485
+sol_448500
+sol_448515
+sol_448530
+sol_448545
+sol_448560
+sol_448575
+sol_448590
+sol_448605
+sol_448620
+sol_448635
+sol_448650
+sol_448665
+sol_448680
+sol_448695
+sol_448710
+sol_448725
+sol_448740
+sol_448755
+sol_448770
+sol_448785
+sol_448800
+sol_448815
+sol_448830
+sol_448845
+sol_449685
+sol_449700
+sol_449715
+sol_449730
+sol_449745
+sol_449760
+sol_449775
+sol_449790
+sol_449805
+sol_449820
+sol_449835
+sol_449850
+sol_449865
+sol_449880
+sol_449895
+sol_449910
+sol_449925
+sol_449940
+sol_449955
+sol_449970
+sol_449985
+sol_450000
+sol_450015
+sol_450030
+sol_450045
+sol_450060
+sol_450075
+sol_450090
+sol_450105
+sol_450120
+sol_450135
+sol_450150
+sol_450165
+sol_450180
+sol_450195
+sol_450210
+sol_450225
+sol_450240
+sol_450255
+sol_450270
+sol_450285
+sol_451125
+sol_451140
+sol_451155
+sol_451170
+sol_451185
+sol_451200
+sol_451215
+sol_451230
+sol_451245
+sol_451260
+sol_451275
+sol_451290
+sol_451305
+sol_451320
+sol_451335
+sol_451350
+sol_451365
+sol_451380
+sol_451395
+sol_451410
+sol_451425
+sol_451440
+sol_451455
+sol_451470
+sol_451485
+sol_451500
+sol_451515
+sol_451530
+sol_451545
+sol_451560
+sol_451575
+sol_451590
+sol_451605
+sol_451620
+sol_451635
+sol_451650
+sol_451665
+sol_451680
+sol_451695
+sol_451710
+sol_451725
+sol_452565
+sol_452580
+sol_452595
+sol_452610
+sol_452625
+sol_452640
+sol_452655
+sol_452670
+sol_452685
+sol_452700
+sol_452715
+sol_452730
+sol_452745
+sol_452760
+sol_452775
+sol_452790
+sol_452805
+sol_452820
+sol_452835
+sol_452850
+sol_452865
+sol_452880
+sol_452895
+sol_452910
+sol_452925
+sol_452940
+sol_452955
+sol_452970
+sol_452985
+sol_453000
+sol_453015
+sol_453030
+sol_453045
+sol_453060
+sol_453075
+sol_453090
+sol_453105
+sol_453120
+sol_453135
+sol_453150
+sol_453165
+sol_454005
+sol_454020
+sol_454035
+sol_454050
+sol_454065
+sol_454080
+sol_454095
+sol_454110
+sol_454125
+sol_454140
+sol_454155
+sol_454170
+sol_454185
+sol_454200
+sol_454215
+sol_454230
+sol_454245
+sol_454260
+sol_454275
+sol_454290
+sol_454305
+sol_454320
+sol_454335
+sol_454350
+sol_454365
+sol_454380
+sol_454395
+sol_454410
+sol_454425
+sol_454440
+sol_454455
+sol_454470
+sol_454485
+sol_454500
+sol_454515
+sol_454530
+sol_454545
+sol_454560
+sol_454575
+sol_454590
+sol_455445
+sol_455460
+sol_455475
+sol_455490
+sol_455505
+sol_455520
+sol_455535
+sol_455550
+sol_455565
+sol_455580
+sol_455595
+sol_455610
+sol_455625
+sol_455640
+sol_455655
+sol_455670
+sol_455685
+sol_455700
+sol_455715
+sol_455730
+sol_455745
+sol_455760
+sol_455775
+sol_455790
+sol_455805
+sol_455820
+sol_455835
+sol_455850
+sol_455865
+sol_455880
+sol_455895
+sol_455910
+sol_455925
+sol_455940
+sol_455955
+sol_455970
+sol_455985
+sol_456000
+sol_456015
+sol_456030
+sol_456885
+sol_456900
+sol_456915
+sol_456930
+sol_456945
+sol_456960
+sol_456975
+sol_456990
+sol_457005
+sol_457020
+sol_457035
+sol_457050
+sol_457065
+sol_457080
+sol_457095
+sol_457110
+sol_457125
+sol_457140
+sol_457155
+sol_457170
+sol_457185
+sol_457200
+sol_457215
+sol_457230
+sol_457245
+sol_457260
+sol_457275
+sol_457290
+sol_457305
+sol_457320
+sol_457335
+sol_457350
+sol_457365
+sol_457380
+sol_457395
+sol_457410
+sol_457425
+sol_457440
+sol_457455
+sol_457470
+sol_458340
+sol_458355
+sol_458370
+sol_458385
+sol_458400
+sol_458415
+sol_458430
+sol_458445
+sol_458460
+sol_458475
+sol_458490
+sol_458505
+sol_458520
+sol_458535
+sol_458550
+sol_458565
+sol_458580
+sol_458595
+sol_458610
+sol_458625
+sol_458640
+sol_458655
+sol_458670
+sol_458685
+sol_458700
+sol_458715
+sol_458730
+sol_458745
+sol_458760
+sol_458775
+sol_458790
+sol_458805
+sol_458820
+sol_458835
+sol_458850
+sol_458865
+sol_458880
+sol_458895
+sol_458910
+sol_459780
+sol_459795
+sol_459810
+sol_459825
+sol_459840
+sol_459855
+sol_459870
+sol_459885
+sol_459900
+sol_459915
+sol_459930
+sol_459945
+sol_459960
+sol_459975
+sol_459990
+sol_460005
+sol_460020
+sol_460035
+sol_460050
+sol_460065
+sol_460080
+sol_460095
+sol_460110
+sol_460125
+sol_460140
+sol_460155
+sol_460170
+sol_460185
+sol_460200
+sol_460215
+sol_460230
+sol_460245
+sol_460260
+sol_460275
+sol_460290
+sol_460305
+sol_460320
+sol_460335
+sol_460350
+sol_461220
+sol_461235
+sol_461250
+sol_461265
+sol_461280
+sol_461295
+sol_461310
+sol_461325
+sol_461340
+sol_461355
+sol_461370
+sol_461385
+sol_461400
+sol_461415
+sol_461430
+sol_461445
+sol_461460
+sol_461475
+sol_461490
+sol_461505
+sol_461520
+sol_461535
+sol_461550
+sol_461565
+sol_461580
+sol_461595
+sol_461610
+sol_461625
+sol_461640
+sol_461655
+sol_461670
+sol_461685
+sol_461700
+sol_461715
+sol_461730
+sol_461745
+sol_461760
+sol_461775
+sol_461790
+sol_462660
+sol_462675
+sol_462690
+sol_462705
+sol_462720
+sol_462735
+sol_462750
+sol_462765
+sol_462780
+sol_462795
+sol_462810
+sol_462825
+sol_462840
+sol_462855
+sol_462870
+sol_462885
+sol_462900
+sol_462915
+sol_462930
+sol_462945
+sol_462960
+sol_462975
+sol_462990
+sol_463005
+sol_463020
+sol_463035
+sol_463050
+sol_463065
+sol_463080
+sol_463095
+sol_463110
+sol_463125
+sol_463140
+sol_463155
+sol_463170
+sol_463185
+sol_463200
+sol_463215
+sol_463230
+sol_464100
+sol_464115
+sol_464130
+sol_464145
+sol_464160
+sol_464175
+sol_464190
+sol_464205
+sol_464220
+sol_464235
+sol_464250
+sol_464265
+sol_464280
+sol_464295
+sol_464310
+sol_464325
+sol_464340
+sol_464355
+sol_464370
+sol_464385
+sol_464400
+sol_464415
+sol_464430
+sol_464445
+sol_464460
+sol_464475
+sol_464490
+sol_464505
+sol_464520
+sol_464535
+sol_464550
+sol_464565
+sol_464580
+sol_464595
+sol_464610
+sol_464625
+sol_464640
+sol_464655
+sol_464670
+sol_465540
+sol_465555
+sol_465570
+sol_465585
+sol_465600
+sol_465615
+sol_465630
+sol_465645
+sol_465660
+sol_465675
+sol_465690
+sol_465705
+sol_465720
+sol_465735
+sol_465750
+sol_465765
+sol_465780
+sol_465795
+sol_465810
+sol_465825
+sol_465840
+sol_465855
+sol_465870
+sol_465885
+sol_465900
+sol_465915
+sol_465930
+sol_465945
+sol_465960
+sol_465975
+sol_465990
+sol_466005
+sol_466020
+sol_466035
+sol_466050
+sol_466065
+sol_466080
+sol_466095
+sol_466110
+sol_466980
+sol_466995
+sol_467010
+sol_467025
+sol_467040
+sol_467055
+sol_467070
+sol_467085
+sol_467100
+sol_467115
+sol_467130
+sol_467145
+sol_467160
+sol_467175
+sol_467190
+sol_467205
+sol_467220
+sol_467235
+sol_467250
+sol_467265
+sol_467280
+sol_467295
+sol_467310
+sol_467325
+sol_467340
+sol_467355
+sol_467370
+sol_467385
+sol_467400
+sol_467415
+sol_467430
+sol_467445
+sol_467460
+sol_467475
+sol_467490
+sol_467505
+sol_467520
+sol_467535
+sol_467550
+sol_468420
+sol_468435
+sol_468450
+sol_468465
+sol_468480
+sol_468495
+sol_468510
+sol_468525
+sol_468540
+sol_468555
+sol_468570
+sol_468585
+sol_468600
+sol_468615
+sol_468630
+sol_468645
+sol_468660
+sol_468675
+sol_468690
+sol_468705
+sol_468720
+sol_468735
+sol_468750
+sol_468765
+sol_468780
+sol_468795
+sol_468810
+sol_468825
+sol_468840
+sol_468855
+sol_468870
+sol_468885
+sol_468900
+sol_468915
+sol_468930
+sol_468945
+sol_468960
+sol_468975
+sol_468990
+sol_469860
+sol_469875
+sol_469890
+sol_469905
+sol_469920
+sol_469935
+sol_469950
+sol_469965
+sol_469980
+sol_469995
+sol_470010
+sol_470025
+sol_470040
+sol_470055
+sol_470070
+sol_470085
+sol_470100
+sol_470115
+sol_470130
+sol_470145
+sol_470160
+sol_470175
+sol_470190
+sol_470205
+sol_470220
+sol_470235
+sol_470250
+sol_470265
+sol_470280
+sol_470295
+sol_470310
+sol_470325
+sol_470340
+sol_470355
+sol_470370
+sol_470385
+sol_470400
+sol_470415
+sol_470430
+sol_471300
+sol_471315
+sol_471330
+sol_471345
+sol_471360
+sol_471375
+sol_471390
+sol_471405
+sol_471420
+sol_471435
+sol_471450
+sol_471465
+sol_471480
+sol_471495
+sol_471510
+sol_471525
+sol_471540
+sol_471555
+sol_471570
+sol_471585
+sol_471600
+sol_471615
+sol_471630
+sol_471645
+sol_471660
+sol_471675
+sol_471690
+sol_471705
+sol_471720
+sol_471735
+sol_471750
+sol_471765
+sol_471780
+sol_471795
+sol_471810
+sol_471825
+sol_471840
+sol_471855
+sol_471870
+sol_472740
+sol_472755
+sol_472770
+sol_472785
+sol_472800
+sol_472815
+sol_472830
+sol_472845
+sol_472860
+sol_472875
+sol_472890
+sol_472905
+sol_472920
+sol_472935
+sol_472950
+sol_472965
+sol_472980
+sol_472995
+sol_473010
+sol_473025
+sol_473040
+sol_473055
+sol_473070
+sol_473085
+sol_473100
+sol_473115
+sol_473130
+sol_473145
+sol_473160
+sol_473175
+sol_473190
+sol_473205
+sol_473220
+sol_473235
+sol_473250
+sol_473265
+sol_473280
+sol_473295
+sol_473310
+sol_474180
+sol_474195
+sol_474210
+sol_474225
+sol_474240
+sol_474255
+sol_474270
+sol_474285
+sol_474300
+sol_474315
+sol_474330
+sol_474345
+sol_474360
+sol_474375
+sol_474390
+sol_474405
+sol_474420
+sol_474435
+sol_474450
+sol_474465
+sol_474480
+sol_474495
+sol_474510
+sol_474525
+sol_474540
+sol_474555
+sol_474570
+sol_474585
+sol_474600
+sol_474615
+sol_474630
+sol_474645
+sol_474660
+sol_474675
+sol_474690
+sol_474705
+sol_474720
+sol_474735
+sol_474750
+sol_475620
+sol_475635
+sol_475650
+sol_475665
+sol_475680
+sol_475695
+sol_475710
+sol_475725
+sol_475740
+sol_475755
+sol_475770
+sol_475785
+sol_475800
+sol_475815
+sol_475830
+sol_475845
+sol_475860
+sol_475875
+sol_475890
+sol_475905
+sol_475920
+sol_475935
+sol_475950
+sol_475965
+sol_475980
+sol_475995
+sol_476010
+sol_476025
+sol_476040
+sol_476055
+sol_476070
+sol_476085
+sol_476100
+sol_476115
+sol_476130
+sol_476145
+sol_476160
+sol_476175
+sol_476190
+sol_477075
+sol_477090
+sol_477105
+sol_477120
+sol_477135
+sol_477150
+sol_477165
+sol_477180
+sol_477195
+sol_477210
+sol_477225
+sol_477240
+sol_477255
+sol_477270
+sol_477285
+sol_477300
+sol_477315
+sol_477330
+sol_477345
+sol_477360
+sol_477375
+sol_477390
+sol_477405
+sol_477420
+sol_477435
+sol_477450
+sol_477465
+sol_477480
+sol_477495
+sol_477510
+sol_477525
+sol_477540
+sol_477555
+sol_477570
+sol_477585
+sol_477600
+sol_477615
+sol_477630
+sol_478515
+sol_478530
+sol_478545
+sol_478560
+sol_478575
+sol_478590
+sol_478605
+sol_478620
+sol_478635
+sol_478650
+sol_478665
+sol_478680
+sol_478695
+sol_478710
+sol_478725
+sol_478740
+sol_478755
+sol_478770
+sol_478785
+sol_478800
+sol_478815
+sol_478830
+sol_478845
+sol_478860
+sol_478875
+sol_478890
+sol_478905
+sol_478920
+sol_478935
+sol_478950
+sol_478965
+sol_478980
+sol_478995
+sol_479010
+sol_479025
+sol_479040
+sol_479055
+sol_479070
+sol_479955
+sol_479970
+sol_479985
+sol_480000
+sol_480015
+sol_480030
+sol_480045
+sol_480060
+sol_480075
+sol_480090
+sol_480105
+sol_480120
+sol_480135
+sol_480150
+sol_480165
+sol_480180
+sol_480195
+sol_480210
+sol_480225
+sol_480240
+sol_480255
+sol_480270
+sol_480285
+sol_480300
+sol_480315
+sol_480330
+sol_480345
+sol_480360
+sol_480375
+sol_480390
+sol_480405
+sol_480420
+sol_480435
+sol_480450
+sol_480465
+sol_480480
+sol_480495
+sol_480510
+sol_481395
+sol_481410
+sol_481425
+sol_481440
+sol_481455
+sol_481470
+sol_481485
+sol_481500
+sol_481515
+sol_481530
+sol_481545
+sol_481560
+sol_481575
+sol_481590
+sol_481605
+sol_481620
+sol_481635
+sol_481650
+sol_481665
+sol_481680
+sol_481695
+sol_481710
+sol_481725
+sol_481740
+sol_481755
+sol_481770
+sol_481785
+sol_481800
+sol_481815
+sol_481830
+sol_481845
+sol_481860
+sol_481875
+sol_481890
+sol_481905
+sol_481920
+sol_481935
+sol_481950
+sol_482835
+sol_482850
+sol_482865
+sol_482880
+sol_482895
+sol_482910
+sol_482925
+sol_482940
+sol_482955
+sol_482970
+sol_482985
+sol_483000
+sol_483015
+sol_483030
+sol_483045
+sol_483060
+sol_483075
+sol_483090
+sol_483105
+sol_483120
+sol_483135
+sol_483150
+sol_483165
+sol_483180
+sol_483195
+sol_483210
+sol_483225
+sol_483240
+sol_483255
+sol_483270
+sol_483285
+sol_483300
+sol_483315
+sol_483330
+sol_483345
+sol_483360
+sol_483375
+sol_483390
+sol_484275
+sol_484290
+sol_484305
+sol_484320
+sol_484335
+sol_484350
+sol_484365
+sol_484380
+sol_484395
+sol_484410
+sol_484425
+sol_484440
+sol_484455
+sol_484470
+sol_484485
+sol_484500
+sol_484515
+sol_484530
+sol_484545
+sol_484560
+sol_484575
+sol_484590
+sol_484605
+sol_484620
+sol_484635
+sol_484650
+sol_484665
+sol_484680
+sol_484695
+sol_484710
+sol_484725
+sol_484740
+sol_484755
+sol_484770
+sol_484785
+sol_484800
+sol_484815
+sol_484830
+sol_485715
+sol_485730
+sol_485745
+sol_485760
+sol_485775
+sol_485790
+sol_485805
+sol_485820
+sol_485835
+sol_485850
+sol_485865
+sol_485880
+sol_485895
+sol_485910
+sol_485925
+sol_485940
+sol_485955
+sol_485970
+sol_485985
+sol_486000
+sol_486015
+sol_486030
+sol_486045
+sol_486060
+sol_486075
+sol_486090
+sol_486105
+sol_486120
+sol_486135
+sol_486150
+sol_486165
+sol_486180
+sol_486195
+sol_486210
+sol_486225
+sol_486240
+sol_486255
+sol_486270
+sol_487155
+sol_487170
+sol_487185
+sol_487200
+sol_487215
+sol_487230
+sol_487245
+sol_487260
+sol_487275
+sol_487290
+sol_487305
+sol_487320
+sol_487335
+sol_487350
+sol_487365
+sol_487380
+sol_487395
+sol_487410
+sol_487425
+sol_487440
+sol_487455
+sol_487470
+sol_487485
+sol_487500
+sol_487515
+sol_487530
+sol_487545
+sol_487560
+sol_487575
+sol_487590
+sol_487605
+sol_487620
+sol_487635
+sol_487650
+sol_487665
+sol_487680
+sol_487695
+sol_487710
+sol_488595
+sol_488610
+sol_488625
+sol_488640
+sol_488655
+sol_488670
+sol_488685
+sol_488700
+sol_488715
+sol_488730
+sol_488745
+sol_488760
+sol_488775
+sol_488790
+sol_488805
+sol_488820
+sol_488835
+sol_488850
+sol_488865
+sol_488880
+sol_488895
+sol_488910
+sol_488925
+sol_488940
+sol_488955
+sol_488970
+sol_488985
+sol_489000
+sol_489015
+sol_489030
+sol_489045
+sol_489060
+sol_489075
+sol_489090
+sol_489105
+sol_489120
+sol_489135
+sol_489150
+sol_490035
+sol_490050
+sol_490065
+sol_490080
+sol_490095
+sol_490110
+sol_490125
+sol_490140
+sol_490155
+sol_490170
+sol_490185
+sol_490200
+sol_490215
+sol_490230
+sol_490245
+sol_490260
+sol_490275
+sol_490290
+sol_490305
+sol_490320
+sol_490335
+sol_490350
+sol_490365
+sol_490380
+sol_490395
+sol_490410
+sol_490425
+sol_490440
+sol_490455
+sol_490470
+sol_490485
+sol_490500
+sol_490515
+sol_490530
+sol_490545
+sol_490560
+sol_490575
+sol_490590
+sol_491475
+sol_491490
+sol_491505
+sol_491520
+sol_491535
+sol_491550
+sol_491565
+sol_491580
+sol_491595
+sol_491610
+sol_491625
+sol_491640
+sol_491655
+sol_491670
+sol_491685
+sol_491700
+sol_491715
+sol_491730
+sol_491745
+sol_491760
+sol_491775
+sol_491790
+sol_491805
+sol_491820
+sol_491835
+sol_491850
+sol_491865
+sol_491880
+sol_491895
+sol_491910
+sol_491925
+sol_491940
+sol_491955
+sol_491970
+sol_491985
+sol_492000
+sol_492015
+sol_492030
+sol_492915
+sol_492930
+sol_492945
+sol_492960
+sol_492975
+sol_492990
+sol_493005
+sol_493020
+sol_493035
+sol_493050
+sol_493065
+sol_493080
+sol_493095
+sol_493110
+sol_493125
+sol_493140
+sol_493155
+sol_493170
+sol_493185
+sol_493200
+sol_493215
+sol_493230
+sol_493245
+sol_493260
+sol_493275
+sol_493290
+sol_493305
+sol_493320
+sol_493335
+sol_493350
+sol_493365
+sol_493380
+sol_493395
+sol_493410
+sol_493425
+sol_493440
+sol_493455
+sol_493470
+sol_494355
+sol_494370
+sol_494385
+sol_494400
+sol_494415
+sol_494430
+sol_494445
+sol_494460
+sol_494475
+sol_494490
+sol_494505
+sol_494520
+sol_494535
+sol_494550
+sol_494565
+sol_494580
+sol_494595
+sol_494610
+sol_494625
+sol_494640
+sol_494655
+sol_494670
+sol_494685
+sol_494700
+sol_494715
+sol_494730
+sol_494745
+sol_494760
+sol_494775
+sol_494790
+sol_494805
+sol_494820
+sol_494835
+sol_494850
+sol_494865
+sol_494880
+sol_494895
+sol_494910
+sol_495795
+sol_495810
+sol_495825
+sol_495840
+sol_495855
+sol_495870
+sol_495885
+sol_495900
+sol_495915
+sol_495930
+sol_495945
+sol_495960
+sol_495975
+sol_495990
+sol_496005
+sol_496020
+sol_496035
+sol_496050
+sol_496065
+sol_496080
+sol_496095
+sol_496110
+sol_496125
+sol_496140
+sol_496155
+sol_496170
+sol_496185
+sol_496200
+sol_496215
+sol_496230
+sol_496245
+sol_496260
+sol_496275
+sol_496290
+sol_496305
+sol_496320
+sol_496335
+sol_496350
+sol_497235
+sol_497250
+sol_497265
+sol_497280
+sol_497295
+sol_497310
+sol_497325
+sol_497340
+sol_497355
+sol_497370
+sol_497385
+sol_497400
+sol_497415
+sol_497430
+sol_497445
+sol_497460
+sol_497475
+sol_497490
+sol_497505
+sol_497520
+sol_497535
+sol_497550
+sol_497565
+sol_497580
+sol_497595
+sol_497610
+sol_497625
+sol_497640
+sol_497655
+sol_497670
+sol_497685
+sol_497700
+sol_497715
+sol_497730
+sol_497745
+sol_497760
+sol_497775
+sol_497790
+sol_498675
+sol_498690
+sol_498705
+sol_498720
+sol_498735
+sol_498750
+sol_498765
+sol_498780
+sol_498795
+sol_498810
+sol_498825
+sol_498840
+sol_498855
+sol_498870
+sol_498885
+sol_498900
+sol_498915
+sol_498930
+sol_498945
+sol_498960
+sol_498975
+sol_498990
+sol_499005
+sol_499020
+sol_499035
+sol_499050
+sol_499065
+sol_499080
+sol_499095
+sol_499110
+sol_499125
+sol_499140
+sol_499155
+sol_499170
+sol_499185
+sol_499200
+sol_499215
+sol_499230
+sol_500115
+sol_500130
+sol_500145
+sol_500160
+sol_500175
+sol_500190
+sol_500205
+sol_500220
+sol_500235
+sol_500250
+sol_500265
+sol_500280
+sol_500295
+sol_500310
+sol_500325
+sol_500340
+sol_500355
+sol_500370
+sol_500385
+sol_500400
+sol_500415
+sol_500430
+sol_500445
+sol_500460
+sol_500475
+sol_500490
+sol_500505
+sol_500520
+sol_500535
+sol_500550
+sol_500565
+sol_500580
+sol_500595
+sol_500610
+sol_500625
+sol_500640
+sol_500655
+sol_500670
+sol_501570
+sol_501585
+sol_501600
+sol_501615
+sol_501630
+sol_501645
+sol_501660
+sol_501675
+sol_501690
+sol_501705
+sol_501720
+sol_501735
+sol_501750
+sol_501765
+sol_501780
+sol_501795
+sol_501810
+sol_501825
+sol_501840
+sol_501855
+sol_501870
+sol_501885
+sol_501900
+sol_501915
+sol_501930
+sol_501945
+sol_501960
+sol_501975
+sol_501990
+sol_502005
+sol_502020
+sol_502035
+sol_502050
+sol_502065
+sol_502080
+sol_502095
+sol_502110
+sol_503010
+sol_503025
+sol_503040
+sol_503055
+sol_503070
+sol_503085
+sol_503100
+sol_503115
+sol_503130
+sol_503145
+sol_503160
+sol_503175
+sol_503190
+sol_503205
+sol_503220
+sol_503235
+sol_503250
+sol_503265
+sol_503280
+sol_503295
+sol_503310
+sol_503325
+sol_503340
+sol_503355
+sol_503370
+sol_503385
+sol_503400
+sol_503415
+sol_503430
+sol_503445
+sol_503460
+sol_503475
+sol_503490
+sol_503505
+sol_503520
+sol_503535
+sol_503550
+sol_504450
+sol_504465
+sol_504480
+sol_504495
+sol_504510
+sol_504525
+sol_504540
+sol_504555
+sol_504570
+sol_504585
+sol_504600
+sol_504615
+sol_504630
+sol_504645
+sol_504660
+sol_504675
+sol_504690
+sol_504705
+sol_504720
+sol_504735
+sol_504750
+sol_504765
+sol_504780
+sol_504795
+sol_504810
+sol_504825
+sol_504840
+sol_504855
+sol_504870
+sol_504885
+sol_504900
+sol_504915
+sol_504930
+sol_504945
+sol_504960
+sol_504975
+sol_504990
+sol_505890
+sol_505905
+sol_505920
+sol_505935
+sol_505950
+sol_505965
+sol_505980
+sol_505995
+sol_506010
+sol_506025
+sol_506040
+sol_506055
+sol_506070
+sol_506085
+sol_506100
+sol_506115
+sol_506130
+sol_506145
+sol_506160
+sol_506175
+sol_506190
+sol_506205
+sol_506220
+sol_506235
+sol_506250
+sol_506265
+sol_506280
+sol_506295
+sol_506310
+sol_506325
+sol_506340
+sol_506355
+sol_506370
+sol_506385
+sol_506400
+sol_506415
+sol_506430
+sol_507330
+sol_507345
+sol_507360
+sol_507375
+sol_507390
+sol_507405
+sol_507420
+sol_507435
+sol_507450
+sol_507465
+sol_507480
+sol_507495
+sol_507510
+sol_507525
+sol_507540
+sol_507555
+sol_507570
+sol_507585
+sol_507600
+sol_507615
+sol_507630
+sol_507645
+sol_507660
+sol_507675
+sol_507690
+sol_507705
+sol_507720
+sol_507735
+sol_507750
+sol_507765
+sol_507780
+sol_507795
+sol_507810
+sol_507825
+sol_507840
+sol_507855
+sol_507870
+sol_508770
+sol_508785
+sol_508800
+sol_508815
+sol_508830
+sol_508845
+sol_508860
+sol_508875
+sol_508890
+sol_508905
+sol_508920
+sol_508935
+sol_508950
+sol_508965
+sol_508980
+sol_508995
+sol_509010
+sol_509025
+sol_509040
+sol_509055
+sol_509070
+sol_509085
+sol_509100
+sol_509115
+sol_509130
+sol_509145
+sol_509160
+sol_509175
+sol_509190
+sol_509205
+sol_509220
+sol_509235
+sol_509250
+sol_509265
+sol_509280
+sol_509295
+sol_509310
+sol_510210
+sol_510225
+sol_510240
+sol_510255
+sol_510270
+sol_510285
+sol_510300
+sol_510315
+sol_510330
+sol_510345
+sol_510360
+sol_510375
+sol_510390
+sol_510405
+sol_510420
+sol_510435
+sol_510450
+sol_510465
+sol_510480
+sol_510495
+sol_510510
+sol_510525
+sol_510540
+sol_510555
+sol_510570
+sol_510585
+sol_510600
+sol_510615
+sol_510630
+sol_510645
+sol_510660
+sol_510675
+sol_510690
+sol_510705
+sol_510720
+sol_510735
+sol_510750
+sol_511650
+sol_511665
+sol_511680
+sol_511695
+sol_511710
+sol_511725
+sol_511740
+sol_511755
+sol_511770
+sol_511785
+sol_511800
+sol_511815
+sol_511830
+sol_511845
+sol_511860
+sol_511875
+sol_511890
+sol_511905
+sol_511920
+sol_511935
+sol_511950
+sol_511965
+sol_511980
+sol_511995
+sol_512010
+sol_512025
+sol_512040
+sol_512055
+sol_512070
+sol_512085
+sol_512100
+sol_512115
+sol_512130
+sol_512145
+sol_512160
+sol_512175
+sol_512190
+sol_513090
+sol_513105
+sol_513120
+sol_513135
+sol_513150
+sol_513165
+sol_513180
+sol_513195
+sol_513210
+sol_513225
+sol_513240
+sol_513255
+sol_513270
+sol_513285
+sol_513300
+sol_513315
+sol_513330
+sol_513345
+sol_513360
+sol_513375
+sol_513390
+sol_513405
+sol_513420
+sol_513435
+sol_513450
+sol_513465
+sol_513480
+sol_513495
+sol_513510
+sol_513525
+sol_513540
+sol_513555
+sol_513570
+sol_513585
+sol_513600
+sol_513615
+sol_513630
+sol_514530
+sol_514545
+sol_514560
+sol_514575
+sol_514590
+sol_514605
+sol_514620
+sol_514635
+sol_514650
+sol_514665
+sol_514680
+sol_514695
+sol_514710
+sol_514725
+sol_514740
+sol_514755
+sol_514770
+sol_514785
+sol_514800
+sol_514815
+sol_514830
+sol_514845
+sol_514860
+sol_514875
+sol_514890
+sol_514905
+sol_514920
+sol_514935
+sol_514950
+sol_514965
+sol_514980
+sol_514995
+sol_515010
+sol_515025
+sol_515040
+sol_515055
+sol_515070
+sol_515970
+sol_515985
+sol_516000
+sol_516015
+sol_516030
+sol_516045
+sol_516060
+sol_516075
+sol_516090
+sol_516105
+sol_516120
+sol_516135
+sol_516150
+sol_516165
+sol_516180
+sol_516195
+sol_516210
+sol_516225
+sol_516240
+sol_516255
+sol_516270
+sol_516285
+sol_516300
+sol_516315
+sol_516330
+sol_516345
+sol_516360
+sol_516375
+sol_516390
+sol_516405
+sol_516420
+sol_516435
+sol_516450
+sol_516465
+sol_516480
+sol_516495
+sol_516510
+sol_517410
+sol_517425
+sol_517440
+sol_517455
+sol_517470
+sol_517485
+sol_517500
+sol_517515
+sol_517530
+sol_517545
+sol_517560
+sol_517575
+sol_517590
+sol_517605
+sol_517620
+sol_517635
+sol_517650
+sol_517665
+sol_517680
+sol_517695
+sol_517710
+sol_517725
+sol_517740
+sol_517755
+sol_517770
+sol_517785
+sol_517800
+sol_517815
+sol_517830
+sol_517845
+sol_517860
+sol_517875
+sol_517890
+sol_517905
+sol_517920
+sol_517935
+sol_517950
+sol_518850
+sol_518865
+sol_518880
+sol_518895
+sol_518910
+sol_518925
+sol_518940
+sol_518955
+sol_518970
+sol_518985
+sol_519000
+sol_519015
+sol_519030
+sol_519045
+sol_519060
+sol_519075
+sol_519090
+sol_519105
+sol_519120
+sol_519135
+sol_519150
+sol_519165
+sol_519180
+sol_519195
+sol_519210
+sol_519225
+sol_519240
+sol_519255
+sol_519270
+sol_519285
+sol_519300
+sol_519315
+sol_519330
+sol_519345
+sol_519360
+sol_519375
+sol_519390
+sol_520290
+sol_520305
+sol_520320
+sol_520335
+sol_520350
+sol_520365
+sol_520380
+sol_520395
+sol_520410
+sol_520425
+sol_520440
+sol_520455
+sol_520470
+sol_520485
+sol_520500
+sol_520515
+sol_520530
+sol_520545
+sol_520560
+sol_520575
+sol_520590
+sol_520605
+sol_520620
+sol_520635
+sol_520650
+sol_520665
+sol_520680
+sol_520695
+sol_520710
+sol_520725
+sol_520740
+sol_520755
+sol_520770
+sol_520785
+sol_520800
+sol_520815
+sol_520830
+sol_521730
+sol_521745
+sol_521760
+sol_521775
+sol_521790
+sol_521805
+sol_521820
+sol_521835
+sol_521850
+sol_521865
+sol_521880
+sol_521895
+sol_521910
+sol_521925
+sol_521940
+sol_521955
+sol_521970
+sol_521985
+sol_522000
+sol_522015
+sol_522030
+sol_522045
+sol_522060
+sol_522075
+sol_522090
+sol_522105
+sol_522120
+sol_522135
+sol_522150
+sol_522165
+sol_522180
+sol_522195
+sol_522210
+sol_522225
+sol_522240
+sol_522255
+sol_522270
+sol_523170
+sol_523185
+sol_523200
+sol_523215
+sol_523230
+sol_523245
+sol_523260
+sol_523275
+sol_523290
+sol_523305
+sol_523320
+sol_523335
+sol_523350
+sol_523365
+sol_523380
+sol_523395
+sol_523410
+sol_523425
+sol_523440
+sol_523455
+sol_523470
+sol_523485
+sol_523500
+sol_523515
+sol_523530
+sol_523545
+sol_523560
+sol_523575
+sol_523590
+sol_523605
+sol_523620
+sol_523635
+sol_523650
+sol_523665
+sol_523680
+sol_523695
+sol_523710
+sol_524610
+sol_524625
+sol_524640
+sol_524655
+sol_524670
+sol_524685
+sol_524700
+sol_524715
+sol_524730
+sol_524745
+sol_524760
+sol_524775
+sol_524790
+sol_524805
+sol_524820
+sol_524835
+sol_524850
+sol_524865
+sol_524880
+sol_524895
+sol_524910
+sol_524925
+sol_524940
+sol_524955
+sol_524970
+sol_524985
+sol_525000
+sol_525015
+sol_525030
+sol_525045
+sol_525060
+sol_525075
+sol_525090
+sol_525105
+sol_525120
+sol_525135
+sol_525150
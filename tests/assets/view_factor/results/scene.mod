@@ -0,0 +1,23 @@
+TestRoom_1_2492204b..Face0_mod
+TestRoom_1_2492204b..Face1_mod
+Aperture_ffcc8509_mod
+TestRoom_1_2492204b..Face2_mod
+TestRoom_1_2492204b..Face3_mod
+Aperture_29aef02f_mod
+TestRoom_1_2492204b..Face4_mod
+TestRoom_1_2492204b..Face5_mod
+TestRoom_1_2492204b..Face6_mod
+Aperture_33746b1c_mod
+Aperture_e46655d7_mod
+TestRoom_2_a24ca58e..Face0_mod
+TestRoom_2_a24ca58e..Face1_mod
+TestRoom_2_a24ca58e..Face2_mod
+TestRoom_2_a24ca58e..Face3_mod
+Aperture_29066d2a_mod
+Aperture_d79b0ebb_mod
+TestRoom_2_a24ca58e..Face4_mod
+TestRoom_2_a24ca58e..Face5_mod
+Aperture_233e0f2a_mod
+TestRoom_2_a24ca58e..Face6_mod
+shade_plastic_mod
+sky_glow_mod
\ No newline at end of file
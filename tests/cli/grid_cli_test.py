@@ -84,6 +84,10 @@ def test_from_rooms():
     assert len(new_grids) == 2
     assert all(isinstance(sg, SensorGrid) for sg in new_grids)
 
+    result = runner.invoke(from_rooms, [input_hb_model, '--cpu-count', '2'])
+    assert result.exit_code == 0
+    assert json.loads(result.output) == sg_dict
+
 
 def test_from_rooms_radial():
     runner = CliRunner()
@@ -107,3 +111,20 @@ def test_from_face3ds():
     new_grids = [SensorGrid.from_dict(sg) for sg in sg_dict]
     assert len(new_grids) == 1
     assert all(isinstance(sg, SensorGrid) for sg in new_grids)
+
+
+def test_merge_grid_index():
+    base_name = 'sensor_grid_merge'
+    input_folder = './tests/assets/grid'
+    output_folder = './tests/assets/temp'
+    runner = CliRunner()
+    result = runner.invoke(
+        merge_grid, [input_folder, base_name, '--folder', output_folder, '--index']
+    )
+    assert result.exit_code == 0
+    pts_file = os.path.join(output_folder, base_name + '.pts')
+    assert os.path.isfile(pts_file + '.idx')
+    grid = SensorGrid.from_file(pts_file)
+    sub_grid = SensorGrid.from_file(pts_file, start_line=12, end_line=15)
+    assert sub_grid.sensors == grid.sensors[12:16]
+    os.remove(pts_file + '.idx')
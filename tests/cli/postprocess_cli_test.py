@@ -6,9 +6,9 @@ from click.testing import CliRunner
 
 from ladybug.futil import nukedir
 
-from honeybee_radiance.cli.postprocess import annual_irradiance, leed_illuminance, \
-    daylight_fatcor_config, point_in_time_config, cumulative_radiation_config, \
-    direct_sun_hours_config, sky_view_config
+from honeybee_radiance.cli.postprocess import annual_irradiance, annual_bundle, \
+    leed_illuminance, daylight_fatcor_config, point_in_time_config, \
+    cumulative_radiation_config, direct_sun_hours_config, sky_view_config
 
 
 def test_annual_irradiance():
@@ -39,6 +39,42 @@ def test_annual_irradiance_epw():
     nukedir(result_dir, rmdir=True)
 
 
+def test_annual_irradiance_parallel():
+    runner = CliRunner()
+    input_folder = './tests/assets/irrad_result'
+    wea_file = './tests/assets/wea/denver.wea'
+    sub_folder = 'parallel_metrics'
+    result_dir = os.path.join(input_folder, sub_folder)
+    cmd_args = [input_folder, wea_file, '--sub-folder', sub_folder, '--cpu-count', 2]
+
+    result = runner.invoke(annual_irradiance, cmd_args)
+    assert result.exit_code == 0
+    peak_file = os.path.join(result_dir, 'peak_irradiance', 'TestRoom_2.res')
+    with open(peak_file) as inf:
+        assert len(inf.readlines()) == 4
+    nukedir(result_dir, rmdir=True)
+
+
+def test_annual_bundle():
+    runner = CliRunner()
+    input_folder = './tests/assets/irrad_result'
+    wea_file = './tests/assets/wea/denver.wea'
+    sub_folder = 'bundle_metrics'
+    result_dir = os.path.join(input_folder, sub_folder)
+    cmd_args = [input_folder, '--threshold', 1, '--electric-lighting',
+                '--wea', wea_file, '--sub-folder', sub_folder, '--cpu-count', 2]
+
+    result = runner.invoke(annual_bundle, cmd_args)
+    assert result.exit_code == 0
+    assert os.path.isfile(os.path.join(result_dir, 'annual_daylight', 'da',
+                                       'TestRoom_1.da'))
+    assert os.path.isfile(os.path.join(result_dir, 'annual_irradiance',
+                                       'cumulative_radiation', 'TestRoom_2.res'))
+    with open(os.path.join(result_dir, 'electric_lighting', 'schedules.csv')) as inf:
+        assert len(inf.readlines()) == 8760
+    nukedir(result_dir, rmdir=True)
+
+
 def test_leed_illuminance():
     runner = CliRunner()
     input_folder = './tests/assets/leed'
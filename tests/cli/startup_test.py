@@ -0,0 +1,75 @@
+"""Test that the CLI only imports the modules of the commands that are used."""
+from click.testing import CliRunner
+from honeybee_radiance.cli import radiance, _SUBCOMMANDS
+
+import subprocess
+import sys
+import json
+import re
+
+IMPORTED_MODULES = """
+import sys
+import honeybee_radiance
+before = set(sys.modules)
+{}
+print(json.dumps(sorted(set(sys.modules) - before)))
+"""
+
+
+def _imported_modules(code):
+    """Get the modules that are imported by code after importing honeybee_radiance.
+    """
+    code = 'import json\n' + IMPORTED_MODULES.format(code)
+    output = subprocess.check_output([sys.executable, '-c', code])
+    return json.loads(output.decode('utf-8').strip().splitlines()[-1])
+
+
+def _import_time(code):
+    """Get the cumulative import time in microseconds for each imported module."""
+    process = subprocess.Popen(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    _, err = process.communicate()
+    times = {}
+    for line in err.decode('utf-8').splitlines():
+        match = re.match(r'import time:\s+\d+ \|\s+(\d+) \|\s+(\S+)', line)
+        if match:
+            times[match.group(2)] = int(match.group(1))
+    return times
+
+
+def test_lazy_subcommands():
+    """Test that importing the CLI does not import the modules of the sub-commands."""
+    modules = _imported_modules('import honeybee_radiance.cli')
+    for import_path in _SUBCOMMANDS.values():
+        assert import_path.split(':')[0] not in modules
+
+    modules = _imported_modules(
+        'from honeybee_radiance.cli import radiance\n'
+        'radiance.get_command(None, "post-process")')
+    assert 'honeybee_radiance.cli.postprocess' in modules
+    assert 'honeybee_radiance.cli.sky' not in modules
+    assert 'honeybee_radiance.cli.translate' not in modules
+
+
+def test_subcommands():
+    """Test that all of the lazy sub-commands can be loaded."""
+    runner = CliRunner()
+    result = runner.invoke(radiance, ['--help'])
+    assert result.exit_code == 0
+    for cmd_name in _SUBCOMMANDS:
+        assert cmd_name in result.output
+        assert radiance.get_command(None, cmd_name) is not None
+        cmd_result = runner.invoke(radiance, [cmd_name, '--help'])
+        assert cmd_result.exit_code == 0
+    assert radiance.get_command(None, 'not-a-command') is None
+
+
+def test_import_time():
+    """Test that the CLI adds little to the time it takes to import the library."""
+    times = _import_time('import honeybee_radiance.cli')
+    if 'honeybee_radiance.cli' not in times:
+        return  # the interpreter does not support -X importtime
+    cli_time = times['honeybee_radiance.cli'] - times['honeybee_radiance']
+    # importing all of the commands takes several times longer than this
+    assert cli_time < 0.1 * times['honeybee_radiance'] + 20000
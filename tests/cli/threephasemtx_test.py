@@ -1,5 +1,6 @@
 """Test cli threephase module."""
 import os
+import json
 
 from click.testing import CliRunner
 
@@ -7,6 +8,7 @@ from ladybug.futil import nukedir, preparedir
 
 from honeybee_radiance.cli.threephase import three_phase_calc
 from honeybee_radiance.cli.threephase import three_phase_rmtxop
+from honeybee_radiance.cli.threephase import three_phase_combinations
 
 
 def test_three_phase_calc():
@@ -41,3 +43,57 @@ def test_three_phase_rmtxop():
     assert result.exit_code == 0
     assert os.path.isfile("./tests/assets/temp/three_phase.res")
     nukedir(output_folder)
+
+
+def test_three_phase_combinations(tmpdir):
+    runner = CliRunner()
+    sender_info = [
+        {'identifier': 'sender_1', 'aperture_groups': ['south', 'east']},
+        {'identifier': 'sender_2', 'aperture_groups': ['west', 'south']}
+    ]
+    receiver_info = [
+        {'identifier': 'room_1', 'full_id': 'room_1', 'aperture_groups': ['south']},
+        {'identifier': 'room_2', 'full_id': 'floor/room_2',
+         'aperture_groups': ['west', 'east']}
+    ]
+    states_info = {
+        apt: [{'identifier': '{}_{}'.format(apt, i), 'tmtx': 'state_{}.xml'.format(i)}
+              for i in range(2)]
+        for apt in ('south', 'east', 'west')
+    }
+    input_files = []
+    for name, data in (('sender', sender_info), ('receiver', receiver_info),
+                       ('states', states_info)):
+        input_files.append(str(tmpdir.join('{}.json'.format(name))))
+        with open(input_files[-1], 'w') as outf:
+            json.dump(data, outf)
+    folder = str(tmpdir.join('output'))
+
+    result = runner.invoke(three_phase_combinations, input_files + ['--folder', folder])
+    assert result.exit_code == 0
+    with open(os.path.join(folder, '3phase_multiplication_info.json')) as inf:
+        combinations = json.load(inf)
+    assert len(combinations) == 6
+    assert combinations[0] == {
+        'identifier': 'room_1..south_0', 'light_path': 'south', 'grid_id': 'room_1',
+        'state_id': 'south_0', 'tmtx': 'state_0.xml',
+        'vmtx': 'room_1..white_glow_south.vtmx', 'dmtx': 'sender_1.dmtx'
+    }
+    assert [c['dmtx'] for c in combinations[2::2]] == ['sender_2.dmtx', 'sender_1.dmtx']
+    with open(os.path.join(folder, '3phase_results_info.json')) as inf:
+        results_info = json.load(inf)
+    assert results_info['floor/room_2'] == \
+        {'west': ['west_0', 'west_1'], 'east': ['east_0', 'east_1']}
+
+    result = runner.invoke(
+        three_phase_combinations,
+        input_files + ['--folder', folder, '--output-format', 'ndjson'])
+    assert result.exit_code == 0
+    with open(os.path.join(folder, '3phase_multiplication_info.ndjson')) as inf:
+        assert [json.loads(line) for line in inf] == combinations
+
+    receiver_info[0]['aperture_groups'].append('north')
+    with open(input_files[1], 'w') as outf:
+        json.dump(receiver_info, outf)
+    result = runner.invoke(three_phase_combinations, input_files + ['--folder', folder])
+    assert result.exit_code == 1
@@ -0,0 +1,30 @@
+import pytest
+
+import honeybee_radiance.postprocess.electriclight as electriclight
+from honeybee_radiance.postprocess.electriclight import daylight_control_schedules, \
+    _dimming_from_ill, _dimming_array
+
+
+@pytest.mark.parametrize('off_at_min', [True, False])
+def test_dimming_array(off_at_min):
+    np = pytest.importorskip('numpy')
+    values = [[0, 0.2, 0.21, 100.5, 299.9], [300, 300.1, 1000, 150, 0.1]]
+    dimming = _dimming_array(np.array(values), 300, 0.3, 0.2, off_at_min)
+    assert dimming.tolist() == [
+        [_dimming_from_ill(val, 300, 0.3, 0.2, off_at_min) for val in row]
+        for row in values
+    ]
+
+
+def test_daylight_control_schedules_python_fallback(monkeypatch):
+    folder = './tests/assets/irrad_result'
+    schedules, schedule_ids = daylight_control_schedules(
+        folder, ill_setpoint=0.5, min_light_out=0.1, cpu_count=2)
+    monkeypatch.setattr(electriclight, 'np', None)
+    py_schedules, py_schedule_ids = daylight_control_schedules(
+        folder, ill_setpoint=0.5, min_light_out=0.1)
+
+    assert schedule_ids == py_schedule_ids
+    assert len(schedules) == 2
+    assert all(len(sch) == 8760 for sch in schedules)
+    assert schedules == py_schedules
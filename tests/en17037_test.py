@@ -0,0 +1,39 @@
+import os
+
+from ladybug.futil import nukedir
+
+import honeybee_radiance.postprocess.en17037 as en17037
+from honeybee_radiance.postprocess.en17037 import _daylight_autonomy_by_thresholds, \
+    en17037_to_folder, _daylight_autonomy
+
+
+def test_daylight_autonomy_by_thresholds():
+    values = [0, 100, 100.5, 300, 250, 500, 750, 751, 1200, 80, 300, 20]
+    occ_pattern = [1, 1, 1, 1, 0, 1, 1, 1, 1, 0, 1]
+    thresholds = [100, 300, 500, 750, 0]
+
+    results = _daylight_autonomy_by_thresholds(values, occ_pattern, thresholds, 9)
+    assert results == [_daylight_autonomy(values, occ_pattern, threshold, 9)
+                       for threshold in thresholds]
+    assert results[0] == round(100.0 * 7 / 9, 2)
+
+
+def test_en17037_to_folder_python_fallback(monkeypatch):
+    input_folder = './tests/assets/irrad_result'
+    schedule = [1] * 4380 + [0] * 4380
+    en17037_to_folder(input_folder, schedule, sub_folder='en_numpy')
+    monkeypatch.setattr(en17037, 'np', None)
+    metrics_folder = en17037_to_folder(input_folder, schedule, sub_folder='en_python')
+
+    for level in ('minimum', 'medium', 'high'):
+        for target in ('minimum_illuminance', 'target_illuminance'):
+            for metric in ('da', 'sda'):
+                rel_path = os.path.join(target, level, metric, 'TestRoom_1.%s' % metric)
+                with open(os.path.join(input_folder, 'en_numpy', rel_path)) as inf:
+                    numpy_result = inf.read()
+                with open(os.path.join(metrics_folder, rel_path)) as inf:
+                    assert inf.read() == numpy_result
+        assert os.path.isfile(os.path.join(
+            metrics_folder, 'target_illuminance', level, 'da', 'grids_info.json'))
+    nukedir(os.path.join(input_folder, 'en_numpy'), rmdir=True)
+    nukedir(metrics_folder, rmdir=True)
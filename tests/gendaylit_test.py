@@ -0,0 +1,45 @@
+import pytest
+
+import honeybee_radiance.lightsource._gendaylit as _gendaylit
+from honeybee_radiance.lightsource._gendaylit import gendaylit, gendaylit_batch, \
+    sky_luminance_perez
+
+ALTITUDES = [-3.5, 0, 5.2, 12.8, 33.3, 61.0, 88.5, 45.0, 20.0, 72.4]
+HOYS = [6, 7.5, 8, 130, 2000.25, 4100, 4211, 6000, 7000.5, 8759]
+DIRECT = [0, 300, 0, 120.5, 650, 900, 850, 10, 400, 0]
+DIFFUSE = [0, 50, 80, 0, 120, 95, 100, 300, 0, 0]
+
+
+@pytest.mark.parametrize('use_numpy', [True, False])
+@pytest.mark.parametrize('output_type', [0, 1, 2])
+def test_gendaylit_batch(monkeypatch, use_numpy, output_type):
+    if not use_numpy:
+        monkeypatch.setattr(_gendaylit, 'np', None)
+    for leap_year in (False, True):
+        expected = [
+            gendaylit(alt, hoy, dnr, dhr, output_type, leap_year)
+            for alt, hoy, dnr, dhr in zip(ALTITUDES, HOYS, DIRECT, DIFFUSE)
+        ]
+        values = gendaylit_batch(
+            ALTITUDES, HOYS, DIRECT, DIFFUSE, output_type, leap_year)
+        assert values == expected
+    assert values[0] == values[2] == 0
+    assert all(v > 0 for v in values[3:9])
+    assert gendaylit_batch([], [], [], []) == []
+
+
+@pytest.mark.parametrize('use_numpy', [True, False])
+def test_gendaylit_batch_invalid(monkeypatch, use_numpy):
+    if not use_numpy:
+        monkeypatch.setattr(_gendaylit, 'np', None)
+    with pytest.raises(ValueError):
+        gendaylit_batch([30, 30], [12, 13], [100, -10], [50, -5])
+    with pytest.raises(ValueError):
+        gendaylit_batch([30, 30], [12, 13], [100, 130000], [50, 50])
+
+
+def test_sky_luminance_perez():
+    lv_mod, normalization = sky_luminance_perez(40, 4.2, 0.2)
+    assert len(lv_mod) == 145
+    assert all(lv > 0 for lv in lv_mod)
+    assert normalization > 0
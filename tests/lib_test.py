@@ -0,0 +1,71 @@
+import os
+
+from honeybee_radiance.lib._lazylib import LazyLibrary, library_signature, \
+    read_cache, write_cache
+from honeybee_radiance.lib._loadmodifiers import _loaded_modifiers
+from honeybee_radiance.lib._loadmodifiersets import _loaded_modifier_sets
+from honeybee_radiance.lib.modifiers import modifier_by_identifier, MODIFIERS, \
+    generic_wall
+from honeybee_radiance.lib.modifiersets import modifier_set_by_identifier, \
+    MODIFIER_SETS
+from honeybee_radiance.mutil import dict_to_modifier
+
+import pytest
+
+
+def test_lazy_library():
+    """Test that objects of a LazyLibrary are created upon their first lookup."""
+    lib = LazyLibrary(dict_to_modifier, lambda mod: mod.to_dict())
+    lib.add_dict('wall', generic_wall.to_dict())
+    lib['black'] = modifier_by_identifier('black')
+
+    assert len(lib) == 2
+    assert list(lib) == ['wall', 'black']
+    assert 'wall' in lib
+    assert not lib.is_loaded('wall')
+    assert lib.is_loaded('black')
+    assert lib.to_dicts()[0] == ['wall', generic_wall.to_dict()]
+
+    wall = lib['wall']
+    assert wall == generic_wall
+    assert lib.is_loaded('wall')
+    assert lib['wall'] is wall
+    with pytest.raises(KeyError):
+        lib['ceiling']
+
+
+def test_library_cache(tmpdir):
+    """Test that the library cache is only used when the library has not changed."""
+    lib_folder = str(tmpdir.mkdir('modifiers'))
+    mat_file = os.path.join(lib_folder, 'user_library.mat')
+    with open(mat_file, 'w') as outf:
+        outf.write(generic_wall.to_radiance())
+    cache_file = os.path.join(str(tmpdir), 'cache.json')
+
+    signature = library_signature([lib_folder])
+    assert read_cache(cache_file, signature) is None
+    write_cache(cache_file, signature, {'modifiers': [['wall', {'type': 'Plastic'}]]})
+    assert read_cache(cache_file, signature)['modifiers'] == \
+        [['wall', {'type': 'Plastic'}]]
+
+    with open(os.path.join(lib_folder, 'other_library.mat'), 'w') as outf:
+        outf.write(generic_wall.to_radiance())
+    new_signature = library_signature([lib_folder])
+    assert new_signature != signature
+    assert read_cache(cache_file, new_signature) is None
+
+
+def test_library_lookup():
+    """Test looking up objects in the library."""
+    assert len(MODIFIERS) == len(_loaded_modifiers)
+    assert len(MODIFIER_SETS) == len(_loaded_modifier_sets)
+    for mod_id in MODIFIERS:
+        assert modifier_by_identifier(mod_id).identifier == mod_id
+    for mod_set_id in MODIFIER_SETS:
+        mod_set = modifier_set_by_identifier(mod_set_id)
+        assert mod_set.identifier == mod_set_id
+        for mod in mod_set.modified_modifiers_unique:
+            assert _loaded_modifiers[mod.identifier] is mod
+
+    with pytest.raises(ValueError):
+        modifier_by_identifier('not_a_modifier')
@@ -0,0 +1,138 @@
+import os
+import math
+
+from ladybug_geometry.geometry3d import Point3D
+from honeybee_radiance_command.ies2rad import Ies2rad
+from honeybee_radiance.luminaire import Luminaire, LuminaireZone, LuminaireInstance, \
+    CustomLamp, calc_cct, planckian_locus, planckian_table, color_coordinates, \
+    generate_scenes
+import honeybee_radiance.luminaire as luminaire_module
+
+import pytest
+
+
+def test_planckian_locus():
+    """Test that the Planckian locus is only calculated once."""
+    locus = planckian_locus()
+    assert planckian_locus() is locus
+    assert locus[0][0] == pytest.approx(1010)
+    assert locus[-1][0] >= 100000
+    assert all(t_1 < t_2 for (t_1, _, _), (t_2, _, _) in zip(locus, locus[1:]))
+
+    table = planckian_table(0.2, 0.3)
+    assert len(table) == len(locus)
+    assert table[0][:3] == locus[0]
+    assert table[0][4] == 1
+    assert table[0][3] == pytest.approx(
+        ((0.2 - locus[0][1]) ** 2 + (0.3 - locus[0][2]) ** 2) ** 0.5)
+
+
+@pytest.mark.parametrize('cct', [2700, 3200, 4000, 6500])
+def test_calc_cct(cct):
+    """Test that the CCT of a blackbody is found on the locus."""
+    lamp = CustomLamp.from_color_temperature('lamp', cct)
+    x, y = lamp.white_xy
+    calc_temp, duv = calc_cct(x, y, 1931)
+    assert calc_temp == pytest.approx(cct, rel=0.02)
+    assert abs(duv) < 0.002
+
+    u, v = color_coordinates(x, y, 1931)[1960]
+    assert calc_cct(u, v, 1960)[0] == pytest.approx(calc_temp, rel=1e-6)
+
+
+def test_from_xy_coordinates():
+    lamp = CustomLamp.from_xy_coordinates('warm', 0.44, 0.403)
+    assert lamp.metadata['CCT'] == pytest.approx(2950, rel=0.02)
+    lamp = CustomLamp.from_xy_coordinates('green', 0.2, 0.7)
+    assert lamp.metadata['CCT'] == 'NA'
+
+
+IES_CONTENT = """IESNA:LM-63-2002
+[LUMINAIRE] Test Downlight
+TILT=NONE
+1 1000 1 3 1 1 2 0.1 0.1 0
+1 1 50
+0 45 90
+0
+1000 800 0
+"""
+
+
+def test_generate_scenes(tmpdir, monkeypatch):
+    """Test that ies2rad only runs once for each unique luminaire."""
+    outnames = []
+
+    def fake_run(command, env=None, cwd=None):
+        outname = command.options.o.value
+        outnames.append(outname)
+        for ext in ('.rad', '.dat'):
+            out_file = os.path.join(cwd, command.options.p.value, outname + ext)
+            with open(out_file, 'w') as outf:
+                outf.write(outname)
+    monkeypatch.setattr(Ies2rad, 'run', fake_run)
+
+    zone = LuminaireZone([LuminaireInstance((0, 0, 3))])
+    luminaires = [
+        Luminaire(IES_CONTENT, 'light_{}'.format(i), zone.duplicate())
+        for i in range(4)]
+    luminaires[3].light_loss_factor = 0.8
+    folder = str(tmpdir)
+    monkeypatch.chdir(folder)
+    scenes = generate_scenes(
+        luminaires, libdir=folder, prefdir='ies', units='m', cpu_count=2)
+    dat_files = [f for f in os.listdir(os.path.join(folder, 'ies')) if f.endswith('.dat')]
+    assert len(dat_files) == 2
+    assert luminaires[0].ies2rad_outname('ies', 'm') == \
+        luminaires[1].ies2rad_outname('ies', 'm')
+    assert luminaires[0].ies2rad_outname('ies', 'm') != \
+        luminaires[3].ies2rad_outname('ies', 'm')
+    assert luminaires[0].ies2rad_outname('ies', 'm') != \
+        luminaires[0].ies2rad_outname('ies', 'ft')
+    for luminaire, scene in zip(luminaires, scenes):
+        assert os.path.basename(scene) == '{}.rad'.format(luminaire.identifier)
+        with open(scene) as inf:
+            assert luminaire.ies2rad_outname('ies', 'm') in inf.read()
+
+    # the output of the earlier export is reused
+    outnames[:] = []
+    generate_scenes(luminaires, libdir=folder, prefdir='ies', units='m')
+    assert outnames == []
+    luminaires[2].candela_multiplier = 2
+    generate_scenes(luminaires, libdir=folder, prefdir='ies', units='m')
+    assert outnames == [luminaires[2].ies2rad_outname('ies', 'm')]
+
+
+@pytest.mark.parametrize('use_numpy', [True, False])
+def test_generate_photometric_web(monkeypatch, use_numpy):
+    """Test the photometric web of a luminaire with quadrant symmetry."""
+    if not use_numpy:
+        monkeypatch.setattr(luminaire_module, 'np', None)
+    content = IES_CONTENT.replace('1 1000 1 3 1 1 2', '1 1000 1 3 3 1 2') \
+        .replace('\n0\n1000 800 0\n', '\n0 45 90\n1000 800 0\n900 700 0\n500 400 0\n')
+    luminaire = Luminaire(content, 'light')
+    web = luminaire.generate_photometric_web()
+    assert len(web['horizontal_angles']) == 9
+    assert web['horizontal_angles'][-1] == pytest.approx(2 * math.pi)
+    assert len(web['points']) == 9
+    assert all(len(row) == 3 for row in web['points'])
+    assert web['points'][0][0] == Point3D(0, 0, -0.1)
+    assert web['points'][4][1].x == pytest.approx(-0.08 * math.sin(math.pi / 4))
+    assert web['points'][6][1].y == pytest.approx(-web['points'][2][1].y)
+    assert web['points'][6][1].z == web['points'][2][1].z
+
+    coords = luminaire.generate_photometric_web(as_coordinates=True)
+    assert coords['points'] == [[tuple(pt) for pt in row] for row in web['points']]
+    web = luminaire.generate_photometric_web(normalize=False)
+    assert web['points'][0][0].z == pytest.approx(-100)
+
+
+def test_photometric_data_cache():
+    """Test that the photometric data is parsed again when the IES content changes."""
+    luminaire = Luminaire(IES_CONTENT, 'light')
+    luminaire.parse_photometric_data()
+    assert luminaire.candela_values == [[1000, 800, 0]]
+    luminaire.ies_content = IES_CONTENT.replace('1000 800 0', '2000 800 0')
+    assert luminaire.candela_values == [[2000, 800, 0]]
+    web = luminaire.generate_photometric_web(normalize=False)
+    assert luminaire.max_candela == 2000
+    assert web['points'][0][0].z == pytest.approx(-200)
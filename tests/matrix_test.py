@@ -0,0 +1,141 @@
+import os
+import struct
+
+import pytest
+
+from honeybee_radiance.reader import build_line_index
+from honeybee_radiance.postprocess.matrix import matrix_header, matrix_rows, \
+    matrix_to_array, matrix_array_chunks
+
+
+def _write_binary_matrix(file_path, rows, fmt='float', big_endian=False, ncomp=1):
+    """Write a binary Radiance matrix with a header for testing."""
+    code = 'f' if fmt == 'float' else 'd'
+    order = '>' if big_endian else '<'
+    header = '#?RADIANCE\nrmtxop -f{}\nNROWS={}\nNCOLS={}\nNCOMP={}\n' \
+        'BigEndian={}\nFORMAT={}\n\n'.format(
+            code, len(rows), len(rows[0]) // ncomp, ncomp, int(big_endian), fmt)
+    folder = os.path.dirname(file_path)
+    if not os.path.isdir(folder):
+        os.makedirs(folder)
+    with open(file_path, 'wb') as outf:
+        outf.write(header.encode('ascii'))
+        for row in rows:
+            outf.write(struct.pack(order + code * len(row), *row))
+
+
+def test_ascii_matrix_without_header():
+    ill_file = './tests/assets/irrad_result/TestRoom_1.ill'
+    header = matrix_header(ill_file)
+    assert header['format'] == 'ascii'
+    assert header['offset'] == 0
+    rows = list(matrix_rows(ill_file))
+    assert len(rows) == 4
+    with open(ill_file) as inf:
+        assert rows[0] == [float(v) for v in inf.readline().split()]
+
+
+@pytest.mark.parametrize('fmt,big_endian', [
+    ('float', False), ('double', False), ('double', True)
+])
+def test_binary_matrix(fmt, big_endian):
+    mtx_file = './tests/assets/temp/binary_{}_{}.mtx'.format(fmt, int(big_endian))
+    rows = [[0.5, 1.25, 300.0], [2.0, 0.0, 1000.5]]
+    _write_binary_matrix(mtx_file, rows, fmt, big_endian)
+
+    header = matrix_header(mtx_file)
+    assert header['nrows'] == 2
+    assert header['ncols'] == 3
+    assert header['ncomp'] == 1
+    assert header['format'] == fmt
+    assert header['big_endian'] is big_endian
+    assert list(matrix_rows(mtx_file)) == rows
+    os.remove(mtx_file)
+
+
+@pytest.mark.parametrize('fmt', ['ascii', 'float', 'double'])
+def test_rgb_matrix(fmt):
+    """Test that the components of RGB matrices follow one another in each row."""
+    np = pytest.importorskip('numpy')
+    mtx_file = './tests/assets/temp/rgb_{}.mtx'.format(fmt)
+    # two rows with two columns of red, green and blue values
+    rows = [[1.0, 2.0, 3.0, 4.0, 5.0, 6.0], [7.0, 8.0, 9.0, 10.0, 11.0, 12.0]]
+    if fmt == 'ascii':
+        with open(mtx_file, 'w') as outf:
+            outf.write('#?RADIANCE\nNROWS=2\nNCOLS=2\nNCOMP=3\nFORMAT=ascii\n\n')
+            for row in rows:
+                outf.write('\t'.join(str(v) for v in row) + '\n')
+    else:
+        _write_binary_matrix(mtx_file, rows, fmt, ncomp=3)
+
+    header = matrix_header(mtx_file)
+    assert (header['ncols'], header['ncomp']) == (2, 3)
+    assert list(matrix_rows(mtx_file)) == rows
+    array = matrix_to_array(mtx_file)
+    assert array.shape == (2, 6)
+    assert np.array_equal(array.reshape(2, 2, 3)[:, 1], [[4, 5, 6], [10, 11, 12]])
+    chunks = list(matrix_array_chunks(mtx_file, chunk_size=1))
+    assert [chunk.tolist() for chunk in chunks] == [[row] for row in rows]
+    del array, chunks
+    os.remove(mtx_file)
+
+
+def test_invalid_ncomp():
+    pytest.importorskip('numpy')
+    mtx_file = './tests/assets/temp/invalid_ncomp.mtx'
+    with open(mtx_file, 'w') as outf:
+        outf.write('#?RADIANCE\nNROWS=1\nNCOLS=2\nNCOMP=0\nFORMAT=ascii\n\n1 2\n')
+    with pytest.raises(ValueError):
+        matrix_header(mtx_file)
+
+    # the rows must have NCOLS * NCOMP values
+    with open(mtx_file, 'w') as outf:
+        outf.write('#?RADIANCE\nNROWS=1\nNCOLS=2\nNCOMP=3\nFORMAT=ascii\n\n1 2\n')
+    with pytest.raises(ValueError):
+        matrix_to_array(mtx_file)
+    with pytest.raises(ValueError):
+        list(matrix_array_chunks(mtx_file))
+    os.remove(mtx_file)
+
+
+def test_matrix_to_array():
+    np = pytest.importorskip('numpy')
+    mtx_file = './tests/assets/temp/binary_array.mtx'
+    rows = [[0.5, 1.25, 300.0], [2.0, 0.0, 1000.5], [3.0, 4.0, 5.0]]
+    _write_binary_matrix(mtx_file, rows, 'float')
+
+    array = matrix_to_array(mtx_file)
+    assert array.shape == (3, 3)
+    assert array.tolist() == rows
+    chunks = list(matrix_array_chunks(mtx_file, chunk_size=2))
+    assert [c.shape[0] for c in chunks] == [2, 1]
+    assert np.concatenate(chunks).tolist() == rows
+    del array, chunks
+
+    ill_file = './tests/assets/irrad_result/TestRoom_1.ill'
+    assert matrix_to_array(ill_file).tolist() == list(matrix_rows(ill_file))
+    os.remove(mtx_file)
+
+
+def test_matrix_row_range():
+    mtx_file = './tests/assets/temp/binary_range.mtx'
+    rows = [[float(i), i * 0.5] for i in range(7)]
+    _write_binary_matrix(mtx_file, rows, 'double')
+    assert list(matrix_rows(mtx_file, 2, 4)) == rows[2:5]
+    assert list(matrix_rows(mtx_file, 5)) == rows[5:]
+    assert list(matrix_rows(mtx_file, 6, 10)) == rows[6:]
+    os.remove(mtx_file)
+
+    ill_file = './tests/assets/temp/indexed_result.ill'
+    with open('./tests/assets/irrad_result/TestRoom_1.ill') as inf:
+        content = inf.read()
+    with open(ill_file, 'w') as outf:
+        outf.write('#?RADIANCE\nNROWS=4\nNCOLS=4393\nNCOMP=1\nFORMAT=ascii\n\n')
+        outf.write(content)
+    all_rows = list(matrix_rows(ill_file))
+    assert len(all_rows) == 4
+    build_line_index(ill_file, step=2)
+    assert list(matrix_rows(ill_file, 1, 2)) == all_rows[1:3]
+    assert list(matrix_rows(ill_file, 3)) == all_rows[3:]
+    os.remove(ill_file)
+    os.remove(ill_file + '.idx')
@@ -15,6 +15,7 @@ from honeybee_radiance.dynamic import RadianceSubFaceState, RadianceShadeState,
 from honeybee_radiance.modifierset import ModifierSet
 from honeybee_radiance.modifier import Modifier
 from honeybee_radiance.modifier.material import Plastic, Glass, Trans, BSDF
+import honeybee_radiance.writer as writer
 
 from honeybee_radiance_folder.folder import ModelFolder
 from ladybug.futil import nukedir
@@ -53,6 +54,73 @@ def test_radiance_properties():
     assert len(model.properties.radiance.modifier_sets) == 0
 
 
+def test_modifiers_cache():
+    """Test that the collected modifiers are updated when the model changes."""
+    room = Room.from_box('TinyHouseRoom', 5, 10, 3)
+    room[3].apertures_by_ratio(0.4, 0.01)
+    model = Model('TinyHouse', [room])
+    assert model.properties.radiance.face_modifiers == []
+    assert model.properties.radiance.shade_modifiers == []
+
+    # changing a modifier assignment must update the modifiers
+    painted = Plastic.from_single_reflectance('PaintedWall', 0.6)
+    room[1].properties.radiance.modifier = painted
+    assert model.properties.radiance.face_modifiers == [painted]
+    assert painted in model.properties.radiance.modifiers
+    room[1].properties.radiance.modifier_blk = painted
+    assert painted in model.properties.radiance.blk_modifiers
+
+    # adding objects to the model must update the modifiers
+    fritted = Glass.from_single_transmittance('FrittedGlass', 0.35)
+    shade = Shade('Awning', Face3D([Point3D(0, 0, 3), Point3D(0, -1, 3),
+                                    Point3D(5, -1, 3), Point3D(5, 0, 3)]))
+    shade.properties.radiance.modifier = fritted
+    model.add_shade(shade)
+    assert model.properties.radiance.shade_modifiers == [fritted]
+    room2 = Room.from_box('SecondRoom', 5, 10, 3, origin=Point3D(5, 0, 0))
+    room2[1].properties.radiance.modifier = fritted
+    model.add_room(room2)
+    assert model.properties.radiance.face_modifiers == [painted, fritted]
+
+    # the returned lists must not change the cached modifiers
+    model.properties.radiance.face_modifiers.append(shade)
+    assert len(model.properties.radiance.face_modifiers) == 2
+
+
+def test_modifiers_order():
+    """Test that unique modifiers are collected in the order they are assigned."""
+    mods = [Plastic.from_single_reflectance('Mod{}'.format(i), 0.1 * i)
+            for i in range(1, 6)]
+    room = Room.from_box('TinyHouseRoom', 5, 10, 3)
+    for face, mod in zip(room.faces, mods + mods[::-1]):
+        face.properties.radiance.modifier = mod
+    model = Model('TinyHouse', [room])
+    assert model.properties.radiance.face_modifiers == mods
+
+
+@pytest.mark.parametrize('cpu_count', [1, 2])
+def test_generate_room_sensor_grids(cpu_count):
+    """Test the generate_room_sensor_grids methods."""
+    rooms = [
+        Room.from_box('Room_{}'.format(i), 5, 10, 3, origin=Point3D(5 * i, 0, 0))
+        for i in range(3)]
+    model = Model('TinyHouse', rooms)
+    sgs = model.properties.radiance.generate_room_sensor_grids(
+        0.5, offset=0.8, wall_offset=1.1, cpu_count=cpu_count)
+    assert [sg.room_identifier for sg in sgs] == ['Room_0', 'Room_1', 'Room_2']
+    expected = rooms[1].properties.radiance.generate_sensor_grid(
+        0.5, offset=0.8, wall_offset=1.1)
+    assert sgs[1].to_dict() == expected.to_dict()
+
+    sgs = model.properties.radiance.generate_room_sensor_grids(
+        2, wall_offset=3, rooms=rooms[:2], cpu_count=cpu_count)
+    assert sgs == []
+    sgs = model.properties.radiance.generate_room_sensor_grids_radial(
+        1, dir_count=4, rooms=rooms[1:], cpu_count=cpu_count)
+    assert [sg.room_identifier for sg in sgs] == ['Room_1', 'Room_2']
+    assert len(sgs[0].sensors) == 50 * 4
+
+
 def test_generate_exterior_face_sensor_grid():
     """Test the generate_exterior_face_sensor_grid method."""
     room = Room.from_box('ShoeBoxZone', 5, 10, 3)
@@ -915,6 +983,96 @@ def test_writer_to_rad_folder_sensor_grids_views():
     nukedir(folder, rmdir=True)
 
 
+def _read_folder(folder):
+    """Get a dictionary with the content of each file in a folder."""
+    content = {}
+    for root, _, files in os.walk(folder):
+        for f_name in files:
+            file_path = os.path.join(root, f_name)
+            with open(file_path) as inf:
+                content[os.path.relpath(file_path, folder)] = inf.read()
+    return content
+
+
+def test_writer_to_rad_folder_parallel():
+    """Test the Model to.rad_folder method with several processes."""
+    model_file = './tests/assets/model/model_complete_multiroom_radiance.hbjson'
+    model = Model.from_hbjson(model_file)
+
+    folder = os.path.abspath('./tests/assets/model/rad_folder_serial')
+    model.to.rad_folder(model, folder)
+    parallel_folder = os.path.abspath('./tests/assets/model/rad_folder_parallel')
+    model.to.rad_folder(model, parallel_folder, cpu_count=2)
+
+    assert _read_folder(folder) == _read_folder(parallel_folder)
+
+    # clean up the folders
+    nukedir(folder, rmdir=True)
+    nukedir(parallel_folder, rmdir=True)
+
+
+def test_writer_to_rad_folder_incremental(monkeypatch):
+    """Test the Model to.rad_folder method with incremental updates."""
+    room = Room.from_box('Tiny_House_Zone', 5, 10, 3)
+    garage = Room.from_box('Tiny_Garage', 5, 10, 3, origin=Point3D(5, 0, 0))
+    room[3].apertures_by_ratio(0.4, 0.01)
+    Room.solve_adjacency([room, garage], 0.01)
+    room_grid = room.properties.radiance.generate_sensor_grid(0.5, 0.5, 1)
+    garage_grid = garage.properties.radiance.generate_sensor_grid(0.5, 0.5, 1)
+    model = Model('Tiny_House', [room, garage])
+    model.properties.radiance.sensor_grids = [room_grid, garage_grid]
+
+    folder = os.path.abspath('./tests/assets/model/rad_folder_incremental')
+    model.to.rad_folder(model, folder, incremental=True)
+    model_folder = ModelFolder(folder)
+    assert os.path.isfile(os.path.join(model_folder.model_folder(True), '_manifest.json'))
+    scene_dir = model_folder.scene_folder(full=True)
+    grid_dir = model_folder.grid_folder(full=True)
+    envelope_file = os.path.join(scene_dir, 'envelope.rad')
+    room_grid_file = os.path.join(grid_dir, 'Tiny_House_Zone.pts')
+    garage_grid_file = os.path.join(grid_dir, 'Tiny_Garage.pts')
+    old_time = os.path.getmtime(envelope_file) - 100
+    for file_path in (envelope_file, room_grid_file, garage_grid_file):
+        os.utime(file_path, (old_time, old_time))
+
+    # record the identifiers of the static geometry that is translated
+    translated = []
+    static_geometry_strings = writer._static_geometry_strings
+
+    def record_translated(geo_data, *args):
+        translated.extend(item[0] for item in geo_data)
+        return static_geometry_strings(geo_data, *args)
+    monkeypatch.setattr(writer, '_static_geometry_strings', record_translated)
+
+    # only the sensor grid that changed should be rewritten
+    garage_grid.move(Vector3D(0, 0, 0.25))
+    model.properties.radiance.sensor_grids = [garage_grid]
+    model.to.rad_folder(model, folder, incremental=True)
+    assert translated == []
+    assert os.path.getmtime(envelope_file) == old_time
+    assert os.path.getmtime(garage_grid_file) != old_time
+    assert not os.path.isfile(room_grid_file)
+
+    # only the geometry that changed should be translated
+    awning = Shade('Awning', Face3D(
+        [Point3D(0, 0, 3), Point3D(5, 0, 3), Point3D(5, -2, 3), Point3D(0, -2, 3)]))
+    model.add_shade(awning)
+    model.to.rad_folder(model, folder, incremental=True)
+    assert translated == ['Awning']
+    assert os.path.getmtime(envelope_file) == old_time
+
+    # the result should match a full export of the model
+    full_folder = os.path.abspath('./tests/assets/model/rad_folder_full')
+    model.to.rad_folder(model, full_folder)
+    incremental_content = _read_folder(folder)
+    incremental_content.pop(os.path.join('model', '_manifest.json'))
+    assert incremental_content == _read_folder(full_folder)
+
+    # clean up the folders
+    nukedir(folder, rmdir=True)
+    nukedir(full_folder, rmdir=True)
+
+
 def test_check_duplicate_sensor_grid_identifiers():
     """Test the check_duplicate_sensor_grid_identifiers method."""
     input_hb_model = './tests/assets/model/duplicate_sensor_grid_model.hbjson'
@@ -0,0 +1,100 @@
+import math
+import os
+import struct
+from collections import OrderedDict
+
+import pytest
+
+from honeybee.room import Room
+
+import honeybee_radiance.dynamic.multiphase as multiphase
+from honeybee_radiance.dynamic.multiphase import cluster_orientation, \
+    aperture_view_factor_mean, _agglomerative_clustering_complete, \
+    _rmse_from_vectors
+
+
+@pytest.mark.parametrize('use_numpy', [True, False])
+def test_agglomerative_clustering_complete(monkeypatch, use_numpy):
+    if not use_numpy:
+        monkeypatch.setattr(multiphase, 'np', None)
+    positions = [0, 0.1, 0.25, 1.0, 1.05]
+    distances = [[abs(p_1 - p_2) for p_2 in positions] for p_1 in positions]
+    names = ['ap_{}'.format(i) for i in range(len(positions))]
+
+    groups = _agglomerative_clustering_complete(distances, names, 0.3)
+    assert groups == [[['ap_0', 'ap_1'], 'ap_2'], ['ap_3', 'ap_4']]
+    assert names == ['ap_{}'.format(i) for i in range(len(positions))]
+    assert distances[0][0] == 0
+    assert _agglomerative_clustering_complete(distances, names, 0.01) == names
+    assert _agglomerative_clustering_complete(distances, names, 2) == \
+        [[[['ap_0', 'ap_1'], 'ap_2'], ['ap_3', 'ap_4']]]
+
+
+def test_agglomerative_clustering_ties():
+    """Test that tied distances are merged in the same order with and without NumPy.
+    """
+    heights = [0, 3, 0, 3, 6, 0, 6, 3]
+    distances = [[abs(z_1 - z_2) for z_2 in heights] for z_1 in heights]
+    groups = _agglomerative_clustering_complete(distances, list(range(8)), 3.5)
+    multiphase_np, multiphase.np = multiphase.np, None
+    try:
+        py_groups = _agglomerative_clustering_complete(distances, list(range(8)), 3.5)
+    finally:
+        multiphase.np = multiphase_np
+    assert groups == py_groups
+    assert groups == [[[0, 5], 2], [[[1, 7], 3], [4, 6]]]
+
+
+def test_rmse_from_vectors():
+    vectors = [[0.1, 0.2, 0.3], [0.1, 0.2, 0.3], [0.3, 0.2, 0.1]]
+    rmse = _rmse_from_vectors(vectors)
+    assert rmse[0][1] == rmse[1][0] == 0
+    assert rmse[0][2] == rmse[2][0] == pytest.approx((0.08 / 3) ** 0.5)
+    assert all(rmse[i][i] == 0 for i in range(3))
+
+
+def test_cluster_orientation_vertical_tolerance():
+    room = Room.from_box('Tower', 5, 5, 12)
+    room[1].apertures_by_ratio_rectangle(0.3, 1, 0.5, 1, 3)
+    room[3].apertures_by_ratio_rectangle(0.3, 1, 0.5, 1, 3)
+    apertures = room[1].apertures + room[3].apertures
+
+    groups = cluster_orientation({}, apertures, room_based=False)
+    assert len(groups) == 2
+    groups = cluster_orientation(
+        {}, apertures, room_based=False, vertical_tolerance=2)
+    assert len(groups) == sum(len(set(round(ap.center.z, 3) for ap in face.apertures))
+                              for face in (room[1], room[3]))
+
+
+@pytest.mark.parametrize('use_numpy', [True, False])
+def test_aperture_view_factor_mean(tmpdir, monkeypatch, use_numpy):
+    if not use_numpy:
+        monkeypatch.setattr(multiphase, 'np', None)
+    rows = [[0.01 * (r + 1) * (c + 2) + 0.1 * (r % 3) for c in range(6)]
+            for r in range(7)]
+    ap_dict = OrderedDict([('ap_0', {'sensor_count': 3}), ('ap_1', {'sensor_count': 0}),
+                           ('ap_2', {'sensor_count': 4})])
+    expected = OrderedDict()
+    view_facs = [[v / math.pi for v in row[::3]] for row in rows]
+    for ap_id, ap in ap_dict.items():
+        ap_facs = view_facs[:ap['sensor_count']]
+        view_facs = view_facs[ap['sensor_count']:]
+        expected[ap_id] = [sum(patch) / len(patch) for patch in zip(*ap_facs)]
+
+    ascii_file = os.path.join(str(tmpdir), 'ascii.mtx')
+    with open(ascii_file, 'w') as outf:
+        outf.write('#?RADIANCE\nNCOMP=3\nFORMAT=ascii\n\n')
+        for row in rows:
+            outf.write('\t'.join(repr(v) for v in row) + '\n')
+    binary_file = os.path.join(str(tmpdir), 'binary.mtx')
+    with open(binary_file, 'wb') as outf:
+        outf.write(b'#?RADIANCE\nNROWS=7\nNCOLS=2\nNCOMP=3\nFORMAT=double\n\n')
+        for row in rows:
+            outf.write(struct.pack('=6d', *row))
+
+    for mtx_file in (ascii_file, binary_file):
+        ap_means = aperture_view_factor_mean(mtx_file, ap_dict)
+        assert list(ap_means) == ['ap_0', 'ap_1', 'ap_2']
+        assert ap_means == expected
+        assert ap_means['ap_1'] == []
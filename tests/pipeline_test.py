@@ -0,0 +1,58 @@
+import os
+
+from ladybug.futil import nukedir
+
+from honeybee_radiance.postprocess.pipeline import annual_bundle_to_folder, \
+    AnnualDaylightReducer, EN17037Reducer, DaylightControlReducer, \
+    AnnualIrradianceReducer
+from honeybee_radiance.postprocess.annualdaylight import metrics_to_folder
+from honeybee_radiance.postprocess.en17037 import en17037_to_folder
+from honeybee_radiance.postprocess.electriclight import daylight_control_schedules
+
+
+def _read(file_path):
+    with open(file_path) as inf:
+        return inf.read()
+
+
+def test_annual_bundle_to_folder():
+    folder = os.path.abspath('./tests/assets/irrad_result')
+    en_schedule = [1] * 4380 + [0] * 4380
+    reducers = [
+        AnnualDaylightReducer(threshold=0.3, min_t=0.1, max_t=0.8),
+        EN17037Reducer(en_schedule),
+        DaylightControlReducer(ill_setpoint=0.5, min_light_out=0.1),
+        AnnualIrradianceReducer('./tests/assets/wea/denver.wea')
+    ]
+    bundle_folder = annual_bundle_to_folder(folder, reducers, sub_folder='bundle')
+    metrics_folder = metrics_to_folder(
+        folder, threshold=0.3, min_t=0.1, max_t=0.8, sub_folder='separate')
+    en17037_folder = en17037_to_folder(folder, en_schedule, sub_folder='en_separate')
+    schedules, _ = daylight_control_schedules(
+        folder, ill_setpoint=0.5, min_light_out=0.1)
+
+    for grid in ('TestRoom_1', 'TestRoom_2'):
+        for metric, ext in (('da', 'da'), ('cda', 'cda'), ('udi_upper', 'udi')):
+            rel_path = os.path.join(metric, '%s.%s' % (grid, ext))
+            assert _read(os.path.join(bundle_folder, 'annual_daylight', rel_path)) == \
+                _read(os.path.join(metrics_folder, rel_path))
+        for rel_path in (os.path.join('target_illuminance', 'high', 'da'),
+                         os.path.join('minimum_illuminance', 'minimum', 'sda')):
+            ext = rel_path[-3:] if rel_path.endswith('sda') else 'da'
+            file_name = '%s.%s' % (grid, ext)
+            assert _read(os.path.join(bundle_folder, 'en17037', rel_path, file_name)) \
+                == _read(os.path.join(en17037_folder, rel_path, file_name))
+        peak_file = os.path.join(
+            bundle_folder, 'annual_irradiance', 'peak_irradiance', '%s.res' % grid)
+        assert len(_read(peak_file).split()) == 4
+
+    assert os.path.isfile(
+        os.path.join(bundle_folder, 'annual_daylight', 'da', 'vis_metadata.json'))
+    assert os.path.isfile(os.path.join(bundle_folder, 'en17037', 'config.json'))
+    schedule_lines = _read(
+        os.path.join(bundle_folder, 'electric_lighting', 'schedules.csv')).split()
+    assert schedule_lines == \
+        [','.join([str(v) for v in line]) for line in zip(*schedules)]
+
+    for sub_folder in ('bundle', 'separate', 'en_separate'):
+        nukedir(os.path.join(folder, sub_folder), rmdir=True)
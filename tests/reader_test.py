@@ -1,3 +1,5 @@
+import os
+
 import honeybee_radiance.reader as reader
 from .rad_string_collection import frit, microshade, metal_cone
 import pytest
@@ -47,3 +49,116 @@ def test_parse_header():
     with pytest.raises(ValueError):
         filepath = './tests/assets/klemsfull.xml'
         reader.parse_header(filepath)
+
+
+def test_sensor_count_from_file():
+    """Test counting the sensors of a file with comments and empty lines."""
+    pts_file = './tests/assets/temp/sensor_count.pts'
+    if not os.path.isdir(os.path.dirname(pts_file)):
+        os.makedirs(os.path.dirname(pts_file))
+    with open(pts_file, 'w') as outf:
+        outf.write('# header\n0 0 0 0 0 1\n\n   \n 1 1 1 0 0 1\n'
+                   '#0 0 0 0 0 1\n2 2 2 0 0 1')
+    assert reader.sensor_count_from_file(pts_file) == 3
+    os.remove(pts_file)
+
+    assert reader.sensor_count_from_file('./tests/assets/test_points.pts') == 3
+
+
+@pytest.mark.parametrize('start_line,end_line', [
+    (None, None), (0, 4), (2, None), (5, 11), (10, 3)
+])
+def test_sensor_values_from_file(start_line, end_line):
+    """Test loading sensor values for a range of lines in a file."""
+    pts_file = './tests/assets/grid/sensor_grid_split.pts'
+    values = reader.sensor_values_from_file(pts_file, start_line, end_line)
+    with open(pts_file) as inf:
+        lines = inf.readlines()
+    start = start_line or 0
+    end = len(lines) if end_line is None else end_line + 1
+    expected = [float(v) for l in lines[start:end] if l[0] != '#' for v in l.split()]
+    assert list(values) == expected
+
+
+def test_line_index():
+    """Test reading lines from a file using a line index."""
+    pts_file = './tests/assets/temp/indexed_grid.pts'
+    if not os.path.isdir(os.path.dirname(pts_file)):
+        os.makedirs(os.path.dirname(pts_file))
+    with open('./tests/assets/grid/sensor_grid_split.pts') as inf:
+        lines = inf.readlines()
+    with open(pts_file, 'w') as outf:
+        outf.writelines(lines)
+
+    assert reader.load_line_index(pts_file) is None
+    index = reader.build_line_index(pts_file, step=4)
+    assert index['line_count'] == len(lines)
+    assert reader.load_line_index(pts_file) == index
+    for line in (0, 3, 4, 9, len(lines) - 1, len(lines) + 2):
+        with reader.open_at_line(pts_file, line) as inf:
+            assert inf.readlines() == lines[line:]
+    assert list(reader.sensor_values_from_file(pts_file, 5, 10)) == \
+        [float(v) for l in lines[5:11] for v in l.split()]
+
+    # an outdated index must be ignored
+    with open(pts_file, 'w') as outf:
+        outf.writelines(lines[2:])
+    assert reader.load_line_index(pts_file) is None
+    with reader.open_at_line(pts_file, 9) as inf:
+        assert inf.readlines() == lines[11:]
+    os.remove(pts_file)
+    os.remove(reader.line_index_path(pts_file))
+
+
+def test_comments_and_commands():
+    rad_string = '''
+# a comment with (unbalanced parentheses
+!xform -n shifted -t 0 0 1 \\
+    other_file.rad
+void plastic wall_mat 0 0 5 0.5 0.5 0.5 0 0  # end of line comment
+void alias wall_alias wall_mat
+wall_mat polygon wall
+0
+0
+9 0 0 0
+  1 0 0
+  1 1 0
+!rtrace -h
+'''
+    objects = reader.parse_from_string(rad_string)
+    assert objects == (
+        'void plastic wall_mat 0 0 5 0.5 0.5 0.5 0 0',
+        'void alias wall_alias wall_mat',
+        'wall_mat polygon wall 0 0 9 0 0 0 1 0 0 1 1 0'
+    )
+
+
+def test_primitives_on_one_line():
+    rad_string = 'void light sol_1 0 0 3 1e6 1e6 1e6 sol_1 source sun_1 0 0 4 0 0 1 0.533'
+    objects = reader.parse_from_string(rad_string)
+    assert objects == (
+        'void light sol_1 0 0 3 1e6 1e6 1e6', 'sol_1 source sun_1 0 0 4 0 0 1 0.533')
+    dicts = reader.string_to_dicts(rad_string)
+    assert len(dicts) == 1
+    assert dicts[0]['modifier']['identifier'] == 'sol_1'
+
+
+def test_parse_from_lines():
+    lines = iter(frit.splitlines())
+    objects = reader.parse_from_lines(lines)
+    assert next(objects) == 'void glass glass_alt_mat 0 0 3 0.96 0.96 0.96'
+    assert len(list(objects)) == 2
+
+
+def test_string_to_dicts_dependencies():
+    dicts = reader.string_to_dicts(frit)
+    assert len(dicts) == 1
+    mirror = dicts[0]
+    assert mirror['identifier'] == 'glass_mat'
+    assert mirror['modifier']['identifier'] == 'glass_angular_effect'
+    assert mirror['modifier']['values'][0] == \
+        ['A1+(1-A1)', '(exp(-5.85 Rdot)-0.00287989916)']
+    assert [dep['identifier'] for dep in mirror['dependencies']] == ['glass_alt_mat']
+
+    with pytest.raises(ValueError):
+        reader.string_to_dicts('missing_mat polygon wall 0 0 9 0 0 0 1 0 0 1 1 0')
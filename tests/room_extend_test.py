@@ -1,8 +1,11 @@
 """Tests the features that honeybee_radiance adds to honeybee_core Room."""
 from honeybee.room import Room
 from honeybee.door import Door
+from honeybee.facetype import Wall
 
-from honeybee_radiance.properties.room import RoomRadianceProperties
+from honeybee_radiance.properties.room import RoomRadianceProperties, \
+    wall_offset_pattern
+import honeybee_radiance.properties.room as room_properties
 from honeybee_radiance.modifierset import ModifierSet
 from honeybee_radiance.modifier import Modifier
 from honeybee_radiance.modifier.material import Plastic, Glass
@@ -76,6 +79,29 @@ def test_generate_sensor_grid():
     assert len(sg.sensors) == 50
 
 
+@pytest.mark.parametrize('use_numpy', [True, False])
+def test_generate_sensor_grid_wall_offset(monkeypatch, use_numpy):
+    """Test the generate_sensor_grid method with a wall_offset."""
+    if not use_numpy:
+        monkeypatch.setattr(room_properties, 'np', None)
+    room = Room.from_box('ShoeBoxZone', 5, 10, 3)
+    sg = room.properties.radiance.generate_sensor_grid(0.5, wall_offset=0.5)
+    assert len(sg.sensors) == 8 * 18
+    sg = room.properties.radiance.generate_sensor_grid(0.5, wall_offset=1.1)
+    assert len(sg.sensors) == 6 * 16
+    assert room.properties.radiance.generate_sensor_grid(1, wall_offset=3) is None
+
+    room = Room.from_box('ShoeBoxZone', 5, 10, 3, 30, Point3D(1000, -500, 0))
+    walls = [f.geometry for f in room.faces if isinstance(f.type, Wall)]
+    points = room.generate_grid(0.5, None, 1).face_centroids
+    pattern = wall_offset_pattern(points, walls, 1.1)
+    assert 0 < pattern.count(True) < len(points)
+    for pt, in_pattern in zip(points, pattern):
+        min_dist = min(wall.plane.distance_to_point(pt) for wall in walls)
+        assert in_pattern == (min_dist > 1.1)
+    assert wall_offset_pattern(points, [], 1.1) == [True] * len(points)
+
+
 def test_generate_exterior_face_grid():
     """Test the generate_exterior_face_grid method."""
     room = Room.from_box('ShoeBoxZone', 5, 10, 3)
@@ -1,5 +1,6 @@
 """Test SensorGrid class."""
 from honeybee_radiance.sensor import Sensor
+import honeybee_radiance.sensorgrid as sensorgrid
 from honeybee_radiance.sensorgrid import SensorGrid
 import ladybug_geometry.geometry3d.pointvector as pv
 from ladybug_geometry.geometry3d.plane import Plane
@@ -216,3 +217,60 @@ def test_split_grid():
         assert info[i]['count'] == 4
 
     assert info[-1]['count'] == 1
+
+
+@pytest.mark.parametrize('use_numpy', [True, False])
+def test_raw_values_transforms(monkeypatch, use_numpy):
+    """Test that transforming an array-backed grid matches the Sensor objects."""
+    if not use_numpy:
+        monkeypatch.setattr(sensorgrid, 'np', None)
+    values = [1, 0, 2, 2, 0, 0, 0.5, 3.2, -1, 0, 0.707, 0.707]
+    array_grid = SensorGrid.from_raw_values('sg_1', values)
+    sensor_grid = SensorGrid(
+        'sg_1', [Sensor(values[i:i + 3], values[i + 3:i + 6]) for i in (0, 6)])
+    assert array_grid == sensor_grid
+
+    for grid in (array_grid, sensor_grid):
+        grid.move(pv.Vector3D(10, 20, 30))
+        grid.rotate(pv.Vector3D(0, 1, 1), 35, pv.Point3D(0, 3, 20))
+        grid.rotate_xy(-72, pv.Point3D(1, 5, 0))
+        grid.reflect(Plane(pv.Vector3D(1, 1, 0).normalize(), pv.Point3D(2, 0, 0)))
+        grid.scale(2)
+        grid.scale(0.3, pv.Point3D(4, 1, 2))
+    assert array_grid._sensors is None
+    assert list(array_grid.positions) == list(sensor_grid.positions)
+    assert list(array_grid.directions) == list(sensor_grid.directions)
+    assert array_grid.to_radiance() == sensor_grid.to_radiance()
+    assert array_grid.to_dict() == sensor_grid.to_dict()
+    assert hash(array_grid) == hash(sensor_grid)
+
+
+def test_raw_values_lazy_sensors():
+    """Test that Sensor objects are only created once they are requested."""
+    sg = SensorGrid.from_raw_values('sg_1', [0, 0, 0, 0, 0, 1, 0, 0, 10, 0, 0, 1])
+    assert sg.count == 2
+    assert list(sg.raw_values) == [0, 0, 0, 0, 0, 1, 0, 0, 10, 0, 0, 1]
+    assert sg.duplicate()._sensors is None
+    assert sg._sensors is None
+
+    assert sg[1] == sensors[1]
+    assert sg._values is None
+    sg[1].move(pv.Vector3D(0, 0, 5))
+    assert sg[1].pos == (0, 0, 15)
+    assert list(sg.raw_values) == [0, 0, 0, 0, 0, 1, 0, 0, 15, 0, 0, 1]
+
+
+def test_split_grid_sensor_objects():
+    """Test that splitting array-backed and Sensor-backed grids gives the same files."""
+    array_grid = SensorGrid.from_file('./tests/assets/grid/sensor_grid_split.pts')
+    sensor_grid = SensorGrid('sensor_grid_split', array_grid.sensors)
+    array_grid = SensorGrid.from_file('./tests/assets/grid/sensor_grid_split.pts')
+    folder = './tests/assets/temp'
+    array_info = array_grid.to_files(folder, 3, 'array_grid')
+    sensor_info = sensor_grid.to_files(folder, 3, 'sensor_grid')
+    for array_file, sensor_file in zip(array_info, sensor_info):
+        assert array_file['count'] == sensor_file['count']
+        with open(array_file['full_path']) as inf:
+            array_content = inf.read()
+        with open(sensor_file['full_path']) as inf:
+            assert inf.read() == array_content
@@ -0,0 +1,124 @@
+import os
+import json
+import struct
+
+import pytest
+
+from ladybug.location import Location
+from ladybug.futil import nukedir
+
+from honeybee_radiance.postprocess.solartracking import post_process_solar_tracking, \
+    _track_grid
+from honeybee_radiance.postprocess.matrix import matrix_rows
+
+
+def _state_rows(state, sensor_count=3, hour_count=5):
+    return [[float('{}{}{}'.format(state + 1, pt, hr)) for hr in range(hour_count)]
+            for pt in range(sensor_count)]
+
+
+def test_track_grid_ascii_and_binary():
+    folder = './tests/assets/temp/tracking_grid'
+    if not os.path.isdir(folder):
+        os.makedirs(folder)
+    mtx_to_use = [0, 1, 2, 1, -1]
+    expected = [
+        [_state_rows(mtx_to_use[hr] % 3)[pt][hr] for hr in range(5)] for pt in range(3)
+    ]
+
+    ascii_files, binary_files = [], []
+    for state in range(3):
+        rows = _state_rows(state)
+        ascii_file = os.path.join(folder, 'state_{}.ill'.format(state))
+        with open(ascii_file, 'w') as outf:
+            for row in rows:
+                outf.write('\t'.join(str(v) for v in row) + '\n')
+        ascii_files.append(ascii_file)
+        binary_file = os.path.join(folder, 'state_{}.mtx'.format(state))
+        with open(binary_file, 'wb') as outf:
+            outf.write(b'#?RADIANCE\nNROWS=3\nNCOLS=5\nNCOMP=1\nFORMAT=double\n\n')
+            for row in rows:
+                outf.write(struct.pack('=5d', *row))
+        binary_files.append(binary_file)
+
+    ascii_result = os.path.join(folder, 'tracking.ill')
+    _track_grid(ascii_files, mtx_to_use, ascii_result)
+    assert list(matrix_rows(ascii_result)) == expected
+
+    binary_result = os.path.join(folder, 'tracking.mtx')
+    _track_grid(binary_files, mtx_to_use, binary_result)
+    assert list(matrix_rows(binary_result)) == expected
+    nukedir(folder, rmdir=True)
+
+
+def _write_binary_state(file_path, rows, ncomp=1, fmt='double'):
+    code = 'd' if fmt == 'double' else 'f'
+    with open(file_path, 'wb') as outf:
+        outf.write('#?RADIANCE\nNROWS={}\nNCOLS=5\nNCOMP={}\nFORMAT={}\n\n'.format(
+            len(rows), ncomp, fmt).encode('ascii'))
+        for row in rows:
+            values = [v for v in row for _ in range(ncomp)]
+            outf.write(struct.pack('={}{}'.format(len(values), code), *values))
+
+
+def test_track_grid_invalid_states():
+    folder = './tests/assets/temp/tracking_grid_invalid'
+    if not os.path.isdir(folder):
+        os.makedirs(folder)
+    mtx_to_use = [0, 1, 0, 1, 0]
+    files = [os.path.join(folder, 'state_{}.mtx'.format(i)) for i in range(2)]
+    result = os.path.join(folder, 'tracking.mtx')
+
+    # binary files with several components for each value
+    for state, file_path in enumerate(files):
+        _write_binary_state(file_path, _state_rows(state), ncomp=3)
+    with pytest.raises(ValueError, match='NCOMP=3'):
+        _track_grid(files, mtx_to_use, result)
+
+    # binary files with different formats
+    _write_binary_state(files[0], _state_rows(0), fmt='double')
+    _write_binary_state(files[1], _state_rows(1), fmt='float')
+    with pytest.raises(ValueError, match='FORMAT'):
+        _track_grid(files, mtx_to_use, result)
+
+    # binary files with a different number of rows
+    _write_binary_state(files[1], _state_rows(1)[:2])
+    with pytest.raises(ValueError, match='NROWS'):
+        _track_grid(files, mtx_to_use, result)
+
+    # ascii files where one state has fewer rows
+    for state, file_path in enumerate(files):
+        with open(file_path, 'w') as outf:
+            for row in _state_rows(state, sensor_count=3 - state):
+                outf.write('\t'.join(str(v) for v in row) + '\n')
+    with pytest.raises(ValueError, match='fewer rows'):
+        _track_grid(files, mtx_to_use, result)
+    nukedir(folder, rmdir=True)
+
+
+def test_post_process_solar_tracking():
+    folder = './tests/assets/temp/tracking_folder'
+    sun_up_hours = [12.5, 13.5, 14.5, 15.5, 16.5]
+    state_folders = []
+    for state in range(3):
+        state_folder = os.path.join(folder, 'state_{}'.format(state))
+        if not os.path.isdir(state_folder):
+            os.makedirs(state_folder)
+        with open(os.path.join(state_folder, 'grids_info.json'), 'w') as outf:
+            json.dump([{'full_id': 'grid', 'count': 3}], outf)
+        with open(os.path.join(state_folder, 'grid.ill'), 'w') as outf:
+            for row in _state_rows(state):
+                outf.write('\t'.join(str(v) for v in row) + '\n')
+        state_folders.append(state_folder)
+    sun_up_file = os.path.join(folder, 'sun-up-hours.txt')
+    with open(sun_up_file, 'w') as outf:
+        outf.write('\n'.join(str(h) for h in sun_up_hours))
+
+    dest_folder = os.path.join(folder, 'final')
+    post_process_solar_tracking(
+        state_folders, sun_up_file, Location(), tracking_increment=30,
+        destination_folder=dest_folder)
+    rows = list(matrix_rows(os.path.join(dest_folder, 'grid.ill')))
+    assert len(rows) == 3
+    assert all(len(row) == 5 for row in rows)
+    nukedir(folder, rmdir=True)
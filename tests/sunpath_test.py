@@ -1,5 +1,7 @@
 """Test SensorGrid class."""
-from honeybee_radiance.lightsource.sunpath import Sunpath
+from honeybee_radiance.lightsource.sunpath import Sunpath, sun_positions, \
+    clear_sun_positions_cache
+import honeybee_radiance.lightsource.sunpath as sunpath_module
 from ladybug.sunpath import Sunpath as LBSunpath
 from ladybug.wea import Wea
 from ladybug.location import Location
@@ -161,3 +163,58 @@ def test_split_modifiers():
             for count, _ in enumerate(inf):
                 pass
         assert count == sun_count[sp_count]
+
+
+@pytest.mark.parametrize('north', [0, 25])
+@pytest.mark.parametrize('leap_year', [False, True])
+@pytest.mark.parametrize('use_numpy', [True, False])
+def test_sun_positions(north, leap_year, use_numpy, monkeypatch):
+    if not use_numpy:
+        monkeypatch.setattr(sunpath_module, 'np', None)
+    clear_sun_positions_cache()
+    hoys = AnalysisPeriod(6, 21, 0, 6, 24, 23, timestep=6, is_leap_year=leap_year).hoys
+    altitudes, sun_vectors = sun_positions(location, north, hoys, leap_year)
+    lb_sp = LBSunpath.from_location(location, north)
+    lb_sp.is_leap_year = leap_year
+    for hoy, altitude, sun_vector in zip(hoys, altitudes, sun_vectors):
+        sun = lb_sp.calculate_sun_from_hoy(hoy)
+        assert altitude == sun.altitude
+        assert tuple(sun_vector) == tuple(sun.sun_vector)
+
+    assert sun_positions(location, north, hoys, leap_year) == (altitudes, sun_vectors)
+    assert sun_positions(location, north, hoys[6::6], leap_year)[0] == altitudes[6::6]
+    assert len(sun_positions(location)[0]) == 8760
+
+
+def test_sun_positions_uncached_hours():
+    clear_sun_positions_cache()
+    hoys = [12, 12.3456, 8760 + 12]
+    altitudes, sun_vectors = sun_positions(location, 0, hoys, leap_year=True)
+    lb_sp = LBSunpath.from_location(location)
+    lb_sp.is_leap_year = True
+    for hoy, altitude, sun_vector in zip(hoys, altitudes, sun_vectors):
+        sun = lb_sp.calculate_sun_from_hoy(hoy)
+        assert altitude == sun.altitude
+        assert sun_vector == sun.sun_vector
+    # the hour that is not on a whole minute does not change the cached timestep
+    assert list(sunpath_module._SUN_POSITIONS_CACHE) == [
+        (location.latitude, location.longitude, location.time_zone, 0, 1, True)]
+    clear_sun_positions_cache()
+
+
+def test_sun_positions_cache(monkeypatch):
+    clear_sun_positions_cache()
+    sun_positions(location, 0, [12, 13.5])
+    sun_positions(location, 0, [12, 14])
+    assert len(sunpath_module._SUN_POSITIONS_CACHE) == 2
+    clear_sun_positions_cache()
+    assert len(sunpath_module._SUN_POSITIONS_CACHE) == 0
+
+    # the oldest positions are removed when the cache is full
+    monkeypatch.setattr(sunpath_module, 'SUN_POSITIONS_CACHE_SIZE', 8760 * 2 * 4)
+    sun_positions(location, 0, [12])
+    sun_positions(location, 10, [12])
+    sun_positions(location, 0, [12.5])
+    assert list(sunpath_module._SUN_POSITIONS_CACHE) == [
+        (location.latitude, location.longitude, location.time_zone, 0, 2, False)]
+    clear_sun_positions_cache()
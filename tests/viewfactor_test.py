@@ -0,0 +1,58 @@
+import math
+import os
+import struct
+
+import pytest
+
+import honeybee_radiance.postprocess.viewfactor as viewfactor
+from honeybee_radiance.postprocess.viewfactor import sensor_view_factors, \
+    view_factors_to_files
+
+RAY_COUNT = 6
+ROWS = [[0.01 * (r + 1) * (c + 2) + 0.1 * (r % 3) for c in range(4)]
+        for r in range(RAY_COUNT * 5)]
+
+
+def _expected_view_factors():
+    view_facs = []
+    for st in range(0, len(ROWS), RAY_COUNT):
+        sens_rows = ROWS[st:st + RAY_COUNT]
+        view_facs.append(
+            [sum(sens_facs) / (math.pi * RAY_COUNT) for sens_facs in zip(*sens_rows)])
+    return view_facs
+
+
+def _write_matrices(folder):
+    ascii_file = os.path.join(folder, 'ascii.mtx')
+    with open(ascii_file, 'w') as outf:
+        for row in ROWS:
+            outf.write('\t'.join(repr(v) for v in row) + '\n')
+    binary_file = os.path.join(folder, 'binary.mtx')
+    with open(binary_file, 'wb') as outf:
+        outf.write(
+            b'#?RADIANCE\nNROWS=%d\nNCOLS=4\nNCOMP=1\nFORMAT=double\n\n' % len(ROWS))
+        for row in ROWS:
+            outf.write(struct.pack('=4d', *row))
+    return ascii_file, binary_file
+
+
+@pytest.mark.parametrize('use_numpy', [True, False])
+def test_sensor_view_factors(tmpdir, monkeypatch, use_numpy):
+    if not use_numpy:
+        monkeypatch.setattr(viewfactor, 'np', None)
+    expected = _expected_view_factors()
+    for mtx_file in _write_matrices(str(tmpdir)):
+        assert list(sensor_view_factors(mtx_file, RAY_COUNT)) == expected
+
+
+def test_view_factors_to_files(tmpdir):
+    np = pytest.importorskip('numpy')
+    _, binary_file = _write_matrices(str(tmpdir))
+    csv_file = os.path.join(str(tmpdir), 'view_factor.csv')
+    npy_file = os.path.join(str(tmpdir), 'view_factor.npy')
+    view_factors_to_files(binary_file, RAY_COUNT, csv_file, npy_file)
+
+    expected = _expected_view_factors()
+    with open(csv_file) as inf:
+        assert inf.read().split() == [','.join(str(v) for v in row) for row in expected]
+    assert np.load(npy_file).tolist() == expected